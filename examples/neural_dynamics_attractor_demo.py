@@ -78,6 +78,23 @@ def main() -> None:
     for row in core_p.W:
         print(" ", [round(v, 4) for v in row])
 
+    print("\n=== Basin of attraction: 100 x 100 grid of starts in one batch ===")
+    grid = [-1.0 + 2.0 * i / 99 for i in range(100)]
+    starts = [[a, b] for a in grid for b in grid]
+    finals, converged_at = core.run_batch(starts, steps=4000, stop_tol=1e-7)
+    basins = {}
+    for x in (finals.round(3) + 0.0).tolist():  # + 0.0 folds -0.0 into 0.0
+        basins[tuple(x)] = basins.get(tuple(x), 0) + 1
+    for state, count in sorted(basins.items(), key=lambda kv: -kv[1]):
+        print(" ", list(state), "<-", count, "starts")
+    print("not converged:", int((converged_at < 0).sum()))
+
+    print("\n=== Fixed points solved directly (Newton from 200 starts) ===")
+    for point in core.fixed_points(num_starts=200, seed=0):
+        eig = [round(v, 3) for v in point.eigenvalues.real.tolist()]
+        print(" ", [round(v, 4) for v in point.x.tolist()], point.stability, "eig:", eig,
+              "<-", point.count, "starts")
+
 
 if __name__ == "__main__":
     main()
@@ -26,57 +26,110 @@ License: MIT
 __version__ = "2.0.3"
 __author__ = "GNJz (Qquarts)"
 
-from .core import (
-    CognitiveKernel,
-    CognitiveConfig,
-    create_kernel,
-)
-from .cognitive_modes import (
-    CognitiveMode,
-    CognitiveModePresets,
-    ModeConfig,
-)
-
-# 엔진 접근 (고급 사용자용)
-from .engines import (
-    PanoramaMemoryEngine,
-    PanoramaConfig,
-    MemoryRankEngine,
-    MemoryRankConfig,
-    MemoryNodeAttributes,
-    PFCEngine,
-    PFCConfig,
-    Action,
-    BasalGangliaEngine,
-    BasalGangliaConfig,
-    DynamicsEngine,
-    DynamicsConfig,
-    DynamicsState,
-    ContinuousDynamicsConfig,
-    NeuralDynamicsCore,
-    HebbianPlasticityConfig,
-    hebbian_update,
-    IrrationalAlgebraEngine,
-    IrrationalAlgebraConfig,
-    IrrationalAlgebraSnapshot,
-    IrrationalConstant,
-    IrrationalObservation,
-    AlgebraicInvariant,
-)
-
-# Vector DB 통합 (선택적)
-try:
-    from .vector_integration import VectorDBBackend
-    VECTOR_DB_AVAILABLE = True
-except ImportError:
-    VECTOR_DB_AVAILABLE = False
-    VectorDBBackend = None
+import importlib
+from typing import Any, Dict, List
+
+# 공개 이름 → 정의 모듈 (PEP 562 지연 로딩)
+# `import cognitive_kernel`은 NumPy/엔진을 불러오지 않고, 이름에 처음 접근할 때
+# 해당 모듈만 임포트한다.
+_LAZY_ATTRS: Dict[str, str] = {
+    # 메인 클래스
+    "CognitiveKernel": ".core",
+    "CognitiveConfig": ".core",
+    "MemoryArrays": ".core",
+    "create_kernel": ".core",
+    "AsyncCognitiveKernel": ".async_kernel",
+    "SessionManager": ".session_manager",
+    "run_mode_sweep": ".sweep",
+    "SweepResult": ".sweep",
+    # 인지 모드
+    "CognitiveMode": ".cognitive_modes",
+    "CognitiveModePresets": ".cognitive_modes",
+    "ModeConfig": ".cognitive_modes",
+    # 엔진 접근 (고급 사용자용)
+    "PanoramaMemoryEngine": ".engines",
+    "PanoramaConfig": ".engines",
+    "MemoryRankEngine": ".engines",
+    "MemoryRankConfig": ".engines",
+    "MemoryNodeAttributes": ".engines",
+    "PFCEngine": ".engines",
+    "PFCConfig": ".engines",
+    "Action": ".engines",
+    "BasalGangliaEngine": ".engines",
+    "BasalGangliaConfig": ".engines",
+    "RetentionEngine": ".engines",
+    "RetentionConfig": ".engines",
+    "DynamicsEngine": ".engines",
+    "DynamicsConfig": ".engines",
+    "DynamicsState": ".engines",
+    "ContinuousDynamicsConfig": ".engines",
+    "NeuralDynamicsCore": ".engines",
+    "CSRMatrix": ".engines",
+    "HebbianPlasticityConfig": ".engines",
+    "hebbian_update": ".engines",
+    "hebbian_update_inplace": ".engines",
+    "hebbian_update_batch": ".engines",
+    "FixedPoint": ".engines",
+    "FixedPointConfig": ".engines",
+    "find_fixed_points": ".engines",
+    "IrrationalAlgebraEngine": ".engines",
+    "IrrationalAlgebraConfig": ".engines",
+    "IrrationalAlgebraSnapshot": ".engines",
+    "IrrationalConstant": ".engines",
+    "IrrationalObservation": ".engines",
+    "AlgebraicInvariant": ".engines",
+}
+
+
+def _load_vector_db() -> None:
+    # Vector DB 통합 (선택적)
+    try:
+        from .vector_integration import VectorDBBackend
+        available = True
+    except ImportError:
+        VectorDBBackend = None
+        available = False
+    globals()["VectorDBBackend"] = VectorDBBackend
+    globals()["VECTOR_DB_AVAILABLE"] = available
+
+
+def _import_submodule(name: str) -> Any:
+    # `패키지.하위모듈` 속성 접근 (import 문 없이 접근해도 모듈을 적재)
+    if not name.startswith("__"):
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+        globals()[name] = value  # 이후 접근은 일반 전역 조회
+        return value
+    if name in ("VectorDBBackend", "VECTOR_DB_AVAILABLE"):
+        _load_vector_db()
+        return globals()[name]
+    return _import_submodule(name)
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # 메인 클래스
     "CognitiveKernel",
     "CognitiveConfig",
+    "MemoryArrays",
     "create_kernel",
+    "AsyncCognitiveKernel",
+    "SessionManager",
+    "run_mode_sweep",
+    "SweepResult",
     # 버전
     "__version__",
     "__author__",
@@ -95,13 +148,21 @@ __all__ = [
     "Action",
     "BasalGangliaEngine",
     "BasalGangliaConfig",
+    "RetentionEngine",
+    "RetentionConfig",
     "DynamicsEngine",
     "DynamicsConfig",
     "DynamicsState",
     "ContinuousDynamicsConfig",
     "NeuralDynamicsCore",
+    "CSRMatrix",
     "HebbianPlasticityConfig",
     "hebbian_update",
+    "hebbian_update_inplace",
+    "hebbian_update_batch",
+    "FixedPoint",
+    "FixedPointConfig",
+    "find_fixed_points",
     "IrrationalAlgebraEngine",
     "IrrationalAlgebraConfig",
     "IrrationalAlgebraSnapshot",
@@ -0,0 +1,190 @@
+"""
+⚡ Async Cognitive Kernel
+
+asyncio 서버용 CognitiveKernel 파사드.
+
+- 모든 커널 연산은 세션 전용 단일 워커 실행기에서 수행 (이벤트 루프 비차단,
+  요청 순서 보존, 커널 내부 상태는 한 스레드에서만 변경)
+- save()는 실행기에서 파일 내용을 스냅샷한 뒤 별도 I/O 워커에서 기록
+- 같은 그래프 세대(generation)의 동시 recall()은 한 번만 계산해 결과 공유
+
+사용 예시:
+    from cognitive_kernel.async_kernel import AsyncCognitiveKernel
+
+    async with await AsyncCognitiveKernel.open("my_brain") as kernel:
+        await kernel.remember("meeting", {"topic": "project"}, importance=0.9)
+        memories = await kernel.recall(k=5)
+        decision = await kernel.decide(["rest", "work"])
+
+Author: GNJz (Qquarts)
+Version: 2.0.3+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .core import CognitiveKernel, CognitiveConfig
+from .cognitive_modes import CognitiveMode
+from .validators import validate_k
+
+
+class AsyncCognitiveKernel:
+    """
+    ⚡ asyncio용 CognitiveKernel 파사드
+
+    그래프 세대(generation)는 이 파사드가 제출한 쓰기 연산
+    (remember, learn_from_reward, set_mode, load, clear) 수다.
+    recall()은 (세대, k)가 같은 진행 중인 계산에 합류하므로, 쓰기 이후에
+    요청된 recall은 항상 그 쓰기가 반영된 결과를 받는다.
+    """
+
+    def __init__(self, kernel: CognitiveKernel):
+        """
+        Args:
+            kernel: 감쌀 CognitiveKernel (이후 직접 호출하지 말 것)
+        """
+        self.kernel = kernel
+        name = kernel.session_name
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"ck-{name}")
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"ck-{name}-io")
+        self._generation = 0
+        self._recall_inflight: Dict[Tuple[int, int], "asyncio.Future[List[Dict[str, Any]]]"] = {}
+        self.coalesced_recalls = 0
+
+    @classmethod
+    async def open(
+        cls,
+        session_name: str = "default",
+        config: Optional[CognitiveConfig] = None,
+        auto_load: bool = True,
+        mode: Optional[CognitiveMode] = None,
+    ) -> "AsyncCognitiveKernel":
+        """커널 생성/세션 로드를 실행기에서 수행 (파일 읽기로 루프를 막지 않음)"""
+        loop = asyncio.get_running_loop()
+        kernel = await loop.run_in_executor(
+            None,
+            functools.partial(CognitiveKernel, session_name, config, auto_load, mode),
+        )
+        return cls(kernel)
+
+    @property
+    def generation(self) -> int:
+        """제출된 쓰기 연산 수 (recall 공유 키)"""
+        return self._generation
+
+    def _submit(self, func: Callable, *args, **kwargs) -> "asyncio.Future[Any]":
+        # 호출 즉시 실행기 큐에 넣는다 (요청 순서 = 실행 순서)
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def _submit_write(self, func: Callable, *args, **kwargs) -> "asyncio.Future[Any]":
+        # 세대는 제출 시점에 올린다 (이후 recall이 이전 계산에 합류하지 않도록)
+        self._generation += 1
+        return self._submit(func, *args, **kwargs)
+
+    # ==================================================================
+    # 핵심 API
+    # ==================================================================
+
+    async def remember(self, *args, **kwargs) -> str:
+        """기억 저장 (CognitiveKernel.remember와 동일한 인자)"""
+        return await self._submit_write(self.kernel.remember, *args, **kwargs)
+
+    async def recall(self, k: int = 5) -> List[Dict[str, Any]]:
+        """
+        중요한 기억 회상 (Top-k)
+
+        같은 세대/k로 진행 중인 회상이 있으면 그 결과를 공유한다.
+        반환되는 기억은 호출자별 깊은 복사본이다 (content 등 중첩 값도 공유하지 않음).
+        """
+        validate_k(k)
+        key = (self._generation, k)
+        future = self._recall_inflight.get(key)
+        if future is None:
+            future = self._submit(self.kernel.recall, k)
+            self._recall_inflight[key] = future
+            future.add_done_callback(
+                lambda _f, key=key: self._recall_inflight.pop(key, None)
+            )
+        else:
+            self.coalesced_recalls += 1
+        memories = await asyncio.shield(future)
+        return copy.deepcopy(memories)
+
+    async def decide(self, *args, **kwargs) -> Dict[str, Any]:
+        """의사결정 (CognitiveKernel.decide와 동일한 인자)"""
+        return await self._submit(self.kernel.decide, *args, **kwargs)
+
+    async def decide_batch(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        """여러 옵션 집합 의사결정 (CognitiveKernel.decide_batch와 동일한 인자)"""
+        return await self._submit(self.kernel.decide_batch, *args, **kwargs)
+
+    async def learn_from_reward(self, *args, **kwargs) -> Any:
+        """보상 학습 (CognitiveKernel.learn_from_reward와 동일한 인자)"""
+        return await self._submit_write(self.kernel.learn_from_reward, *args, **kwargs)
+
+    async def set_mode(self, mode: CognitiveMode | str) -> None:
+        """인지 모드 변경"""
+        await self._submit_write(self.kernel.set_mode, mode)
+
+    async def status(self) -> Dict[str, Any]:
+        """현재 상태 조회"""
+        return await self._submit(self.kernel.status)
+
+    async def clear(self) -> None:
+        """모든 기억 삭제 (주의!)"""
+        await self._submit_write(self.kernel.clear)
+
+    # ==================================================================
+    # 영속성
+    # ==================================================================
+
+    async def save(self) -> Dict[str, int]:
+        """
+        세션 저장
+
+        파일 내용은 커널 실행기에서 스냅샷하고, 디스크 쓰기는 I/O 워커에서
+        수행한다 (스냅샷 이후의 연산은 쓰기를 기다리지 않음). 기록이 실패하거나
+        스냅샷 이후 변경이 있으면 커널은 변경된 상태로 남는다.
+        """
+        files, stats, version = await self._submit(self.kernel._snapshot_files)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._io_executor, self.kernel._write_files, files)
+        self.kernel._mark_saved(version)
+        return stats
+
+    async def load(self) -> Dict[str, int]:
+        """세션 로드"""
+        return await self._submit_write(self.kernel.load)
+
+    # ==================================================================
+    # 수명 관리
+    # ==================================================================
+
+    async def aclose(self, save: bool = True) -> None:
+        """변경 사항 저장 후 실행기 종료"""
+        if save and self.kernel._is_dirty:
+            await self.save()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._shutdown)
+
+    def _shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+        self._io_executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncCognitiveKernel":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+        return False
+
+    def __repr__(self) -> str:
+        return f"AsyncCognitiveKernel({self.kernel!r}, generation={self._generation})"
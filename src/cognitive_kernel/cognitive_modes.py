@@ -41,6 +41,10 @@ class CognitiveMode(Enum):
     ALZHEIMER = "alzheimer"   # 알츠하이머: 코어 소실 + 루프 붕괴 (빠른 붕괴)
 
 
+# 모드별 공유 설정 (CognitiveModePresets.shared_config)
+_SHARED_CONFIGS: Dict[CognitiveMode, "ModeConfig"] = {}
+
+
 @dataclass
 class ModeConfig:
     """모드별 파라미터 설정"""
@@ -502,4 +506,16 @@ class CognitiveModePresets:
             return CognitiveModePresets.alzheimer()
         else:
             raise ValueError(f"Unknown mode: {mode}")
-
+    
+    @staticmethod
+    def shared_config(mode: CognitiveMode) -> ModeConfig:
+        """
+        모드 설정 공유 인스턴스 반환 (프로세스당 모드별 1개)
+        
+        여러 세션이 같은 객체를 공유하므로 읽기 전용으로 다룰 것.
+        수정이 필요하면 get_config()로 새 인스턴스를 받는다.
+        """
+        config = _SHARED_CONFIGS.get(mode)
+        if config is None:
+            config = _SHARED_CONFIGS.setdefault(mode, CognitiveModePresets.get_config(mode))
+        return config
@@ -0,0 +1,93 @@
+"""
+🔒 Concurrency Utilities
+
+커널 공유 상태 보호용 동기화 도구.
+
+- ReadWriteLock: 다수 읽기 / 단일 쓰기 잠금 (쓰기 우선)
+
+사용 예시:
+    lock = ReadWriteLock()
+
+    with lock.read_locked():
+        ...  # 여러 스레드가 동시에 진입 가능
+
+    with lock.write_locked():
+        ...  # 단독 진입 (진행 중인 읽기가 끝날 때까지 대기)
+
+Author: GNJz (Qquarts)
+Version: 2.0.3+
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class ReadWriteLock:
+    """
+    다수 읽기 / 단일 쓰기 잠금
+
+    쓰기 대기자가 있으면 새 읽기는 대기한다 (쓰기 기아 방지).
+    재진입을 지원하지 않으므로 같은 스레드에서 중첩 획득하지 말 것.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    def acquire_read(self) -> None:
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """읽기 잠금 컨텍스트"""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """쓰기 잠금 컨텍스트"""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+    @property
+    def readers(self) -> int:
+        """현재 읽기 보유자 수"""
+        return self._readers
+
+    def __repr__(self) -> str:
+        return f"ReadWriteLock(readers={self._readers}, writer={self._writer})"
@@ -33,28 +33,37 @@ Version: 2.0.1
 
 from __future__ import annotations
 
+import dataclasses
+import itertools
 import json
 import math
+import os
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
+
+import numpy as np
 
 # 엔진 임포트
 from .engines.panorama import PanoramaMemoryEngine, PanoramaConfig
 from .engines.memoryrank import MemoryRankEngine, MemoryRankConfig, MemoryNodeAttributes
-from .engines.pfc import PFCEngine, PFCConfig, Action
+from .engines.pfc import PFCEngine, PFCConfig, Action, ActionArrays
 from .engines.basal_ganglia import BasalGangliaEngine, BasalGangliaConfig
 from .engines.thalamus import ThalamusEngine, ThalamusConfig
 from .engines.amygdala import AmygdalaEngine, AmygdalaConfig
 from .engines.hypothalamus import HypothalamusEngine, HypothalamusConfig
 from .engines.dynamics import DynamicsEngine, DynamicsConfig
+from .engines.retention import RetentionEngine, RetentionConfig
 
 # 모드 임포트
 from .cognitive_modes import CognitiveMode, CognitiveModePresets, ModeConfig
 
 # 예외 및 검증
-from .exceptions import ValidationError, ModeError, DecisionError, MemoryError
+from .exceptions import ValidationError, ModeError, DecisionError, MemoryError, ConfigurationError
+from .profiling import PipelineProfiler
+from .concurrency import ReadWriteLock
 from .validators import (
     validate_importance,
     validate_emotion,
@@ -78,6 +87,10 @@ try:
         CoreStrengthStep,
         TorqueGenerationStep,
         UtilityRecalculationStep,
+        UtilityEvaluationStep,
+        TorqueDecisionStep,
+        KeywordExtractionStep,
+        HabitLookupStep,
         ResultAssemblyStep,
     )
     PIPELINE_AVAILABLE = True
@@ -86,6 +99,44 @@ except ImportError:
     DecisionPipeline = None
 
 
+# 커널 엔진 속성 (지연 생성 순서)
+ENGINE_NAMES = (
+    "panorama", "memoryrank", "pfc", "basal_ganglia",
+    "thalamus", "amygdala", "hypothalamus", "dynamics",
+)
+
+
+class _LazyEngine:
+    """
+    첫 접근 시 엔진을 생성하는 속성 (kernel._build_<이름>() 호출)
+    
+    생성된 엔진은 인스턴스 __dict__에 저장되어 이후 접근은 일반 속성
+    조회와 같다. 생성은 커널의 엔진 잠금 아래에서 한 번만 수행하고
+    (이중 확인), 저장 직후 kernel._engine_stored(이름)를 호출한다.
+    """
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with instance._engine_lock:
+            engine = instance.__dict__.get(self.name)
+            if engine is None:
+                engine = getattr(instance, f"_build_{self.name}")()
+                instance.__dict__[self.name] = engine
+                instance._engine_stored(self.name)
+        return engine
+
+
+# 커널 시드 시퀀스에서 파생하는 난수 스트림 (이름별 고정 번호: 엔진 생성 순서와 무관)
+RNG_STREAMS = ("edges", "pfc", "basal_ganglia", "hypothalamus", "spawn")
+
+# 옵션 이름 키워드 추출 시 제거할 동사 (모든 세션 공유)
+_KEYWORD_STOP_WORDS = frozenset({"choose", "select", "do", "pick", "take", "make"})
+
+
 @dataclass
 class CognitiveConfig:
     """Cognitive Kernel 설정"""
@@ -104,6 +155,23 @@ class CognitiveConfig:
     # PageRank 설정
     damping: float = 0.85
     
+    # 파이프라인 계측 (kernel.status()["pipeline_profile"]로 조회)
+    profile_pipeline: bool = False
+    profile_allocations: bool = False  # tracemalloc 할당량 측정 (느림)
+    
+    # 파이프라인 실행기 ("sequential" 또는 "threads": 독립 단계 동시 실행)
+    pipeline_executor: str = "sequential"
+    
+    # 커널 난수 시드 (정수 또는 np.random.SeedSequence, None이면 매번 다른 결과)
+    # 엣지 소실 마스크와 PFC/BasalGanglia/Hypothalamus 난수는 이 시퀀스의 독립 자식 스트림
+    seed: Optional[Union[int, np.random.SeedSequence]] = None
+    
+    # 엣지 소실 마스크를 그래프 세대마다 한 번만 추출해 재사용 (False면 회상마다 다시 추출)
+    cache_edge_mask: bool = False
+    
+    # 기억 보존 정책 (None이면 자동 정리 없음, apply_retention()은 언제든 호출 가능)
+    retention: Optional[RetentionConfig] = None
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "storage_dir": self.storage_dir,
@@ -112,9 +180,53 @@ class CognitiveConfig:
             "working_memory_capacity": self.working_memory_capacity,
             "recency_half_life": self.recency_half_life,
             "damping": self.damping,
+            "profile_pipeline": self.profile_pipeline,
+            "profile_allocations": self.profile_allocations,
+            "pipeline_executor": self.pipeline_executor,
+            "seed": (
+                {"entropy": self.seed.entropy, "spawn_key": list(self.seed.spawn_key)}
+                if isinstance(self.seed, np.random.SeedSequence) else self.seed
+            ),
+            "cache_edge_mask": self.cache_edge_mask,
+            "retention": dataclasses.asdict(self.retention) if self.retention else None,
         }
 
 
+@dataclass
+class MemoryArrays:
+    """
+    열 지향 회상 결과 (recall_arrays() 반환값)
+    
+    recall()의 기억 딕셔너리 리스트와 같은 내용을 필드별 열로 담는다.
+    importances/timestamps는 배열이라 코어 강도 등을 반복문 없이 계산할 수 있다.
+    """
+    
+    ids: List[str]
+    event_types: List[str]
+    contents: List[Any]
+    importances: np.ndarray  # (N,) MemoryRank 점수 (중요도 순)
+    timestamps: np.ndarray  # (N,)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """recall()과 같은 기억 딕셔너리 리스트로 변환"""
+        return [
+            {
+                "id": memory_id,
+                "event_type": event_type,
+                "content": content,
+                "importance": importance,
+                "timestamp": timestamp,
+            }
+            for memory_id, event_type, content, importance, timestamp in zip(
+                self.ids, self.event_types, self.contents,
+                self.importances.tolist(), self.timestamps.tolist(),
+            )
+        ]
+
+
 class CognitiveKernel:
     """
     🧠 Cognitive Kernel - 통합 인지 엔진
@@ -159,23 +271,54 @@ class CognitiveKernel:
         
         # 모드 설정
         self.mode = mode or CognitiveMode.NORMAL
-        self.mode_config = CognitiveModePresets.get_config(self.mode)
+        self.mode_config = CognitiveModePresets.shared_config(self.mode)
+        self._mode_config_overrides: Dict[str, Any] = {}  # set_mode(overrides=...) (저장 대상)
         
         # 저장 경로 설정
         self.storage_path = Path(self.config.storage_dir) / session_name
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
-        # 엔진 초기화
+        # 동시성: 공유 기억 상태는 읽기/쓰기 잠금, 결정 상태(PFC/BG/동역학)는
+        # 결정 잠금으로 보호. 잠금 순서는 항상 결정 잠금 → 읽기/쓰기 잠금.
+        self._lock = ReadWriteLock()
+        self._decision_lock = threading.RLock()
+        self._graph_lock = threading.Lock()
+        self._graph_seq = itertools.count(1)
+        self._published_graph_seq = 0
+        self._graph_generation = 0
+        
+        # 난수: 커널 시드 시퀀스의 자식 스트림을 엔진마다 하나씩 (전역 random 미사용)
+        seed = self.config.seed
+        self._seed_seq = (
+            seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        )
+        self._spawn_seq = self._stream_seed("spawn")
+        self._spawn_lock = threading.Lock()
+        
+        # 엣지 소실(Loop Integrity Decay) 마스크: 커널 전용 난수 생성기,
+        # 그래프 세대마다 한 번 뽑아 재사용 ((세대, 엣지 수, 소실률), 마스크)
+        self._rng = np.random.default_rng(self._stream_seed("edges"))
+        self._edge_mask: Optional[Tuple[Tuple[int, int, float], np.ndarray]] = None
+        
+        # 엔진 초기화 (첫 접근 시 생성, 엔진 잠금 아래 한 번만)
+        self._engine_lock = threading.RLock()
+        self._pending_q_values: Optional[Dict[str, Dict[str, float]]] = None
         self._init_engines()
         
         # 상태
         self._event_count = 0
         self._is_dirty = False
+        # 변경 번호: 스냅샷 이후 변경이 없을 때만 저장 완료 시 깨끗한 상태로 표시
+        self._mutations = itertools.count(1)
+        self._dirty_version = 0
         self._edges: List[Tuple[str, str, float]] = []
         
         # 파이프라인 (선택적, None이면 기본 파이프라인 사용)
         self._pipeline: Optional[DecisionPipeline] = pipeline
         self._pipeline_available = PIPELINE_AVAILABLE
+        self._profiler: Optional[PipelineProfiler] = None
+        if self.config.profile_pipeline:
+            self.enable_profiling(self.config.profile_allocations)
         
         # 동역학 상태는 이제 DynamicsEngine 내부로 이동됨
         # self._entropy_history → self.dynamics.state.entropy_history
@@ -190,70 +333,159 @@ class CognitiveKernel:
             self.load()
     
     def _init_engines(self):
-        """엔진 초기화 (모드 설정 적용)"""
-        # Panorama (시간축 기억)
-        self.panorama = PanoramaMemoryEngine(PanoramaConfig(
-            recency_half_life=self.config.recency_half_life,
-        ))
-        
-        # MemoryRank (중요도 랭킹)
-        self.memoryrank = MemoryRankEngine(MemoryRankConfig(
-            damping=self.mode_config.damping,
-            local_weight_boost=self.mode_config.local_weight_boost,
-        ))
+        """
+        엔진 초기화 (지연 생성)
         
-        # PFC (의사결정)
-        self.pfc = PFCEngine(PFCConfig(
-            working_memory_capacity=self.mode_config.working_memory_capacity,
-            decision_temperature=self.mode_config.decision_temperature,
-        ))
+        생성된 엔진을 버리기만 하고, 각 엔진은 첫 속성 접근 때
+        _build_<이름>()으로 현재 모드 설정을 적용해 만든다.
+        remember/recall만 쓰는 세션은 Panorama/MemoryRank만 생성된다.
+        """
+        for name in ENGINE_NAMES:
+            self.__dict__.pop(name, None)
         
-        # BasalGanglia (습관 학습)
-        self.basal_ganglia = BasalGangliaEngine(BasalGangliaConfig(
-            tau=self.mode_config.tau,
-            impulsivity=self.mode_config.impulsivity,
-            patience=self.mode_config.patience,
-        ))
+        # 클래스 참조 저장
+        self._MemoryNodeAttributes = MemoryNodeAttributes
+        self._Action = Action
+    
+    def _engine_stored(self, name: str) -> None:
+        """엔진 잠금 보유 상태에서 호출: 생성된 엔진이 __dict__에 저장된 직후 처리"""
+        if name == "basal_ganglia":
+            # 로드된 Q-값은 이제 엔진이 보유 (저장 전에 비우면 스냅샷이 빈 Q-값을 볼 수 있음)
+            self._pending_q_values = None
+    
+    @property
+    def engines_loaded(self) -> List[str]:
+        """현재 생성되어 있는 엔진 이름"""
+        return [name for name in ENGINE_NAMES if name in self.__dict__]
+    
+    def _mode_overrides(self, engine_name: str) -> Dict[str, Any]:
+        """엔진 설정 중 인지 모드가 정하는 필드 (생성/모드 변경 공용)"""
+        mc = self.mode_config
+        if engine_name == "memoryrank":
+            return {"damping": mc.damping, "local_weight_boost": mc.local_weight_boost}
+        if engine_name == "pfc":
+            return {
+                "working_memory_capacity": mc.working_memory_capacity,
+                "decision_temperature": mc.decision_temperature,
+            }
+        if engine_name == "basal_ganglia":
+            return {"tau": mc.tau, "impulsivity": mc.impulsivity, "patience": mc.patience}
+        if engine_name == "thalamus":
+            return {"gate_threshold": mc.gate_threshold, "max_channels": mc.max_channels}
+        if engine_name == "dynamics":
+            return {
+                "core_decay_rate": mc.core_decay_rate,
+                "memory_update_failure": mc.memory_update_failure,
+                "loop_integrity_decay": mc.loop_integrity_decay,
+                # 시간축 분리 (치매/알츠하이머)
+                "old_memory_decay_rate": mc.old_memory_decay_rate,
+                "new_memory_decay_rate": mc.new_memory_decay_rate,
+                "memory_age_threshold": mc.memory_age_threshold,
+            }
+        return {}
+    
+    def _apply_mode_config(self) -> None:
+        """
+        생성된 엔진에 현재 모드 설정을 제자리 적용
         
-        # Thalamus (입력 필터링) - 모드에 따라 게이팅 조절
-        self.thalamus = ThalamusEngine(ThalamusConfig(
-            gate_threshold=self.mode_config.gate_threshold,
-            max_channels=self.mode_config.max_channels,
+        설정 객체만 새로 만들어 교체하므로 기억/그래프 엣지/Working Memory/
+        Q-테이블/동역학 히스토리는 그대로 유지된다. 아직 생성되지 않은
+        엔진은 생성 시 현재 모드 설정을 사용한다.
+        """
+        for name in self.engines_loaded:
+            overrides = self._mode_overrides(name)
+            if not overrides:
+                continue
+            engine = self.__dict__[name]
+            config = dataclasses.replace(engine.config, **overrides)
+            if hasattr(config, "validate"):
+                config.validate()
+            engine.config = config
+        
+        # 줄어든 Working Memory 용량은 즉시 반영 (낮은 relevance부터 제거)
+        pfc = self.__dict__.get("pfc")
+        if pfc is not None:
+            capacity = pfc.config.working_memory_capacity
+            if len(pfc._working_memory) > capacity:
+                pfc._working_memory.sort(key=lambda slot: slot.relevance, reverse=True)
+                del pfc._working_memory[capacity:]
+    
+    # Panorama (시간축 기억)
+    panorama = _LazyEngine()
+    
+    def _build_panorama(self) -> PanoramaMemoryEngine:
+        return PanoramaMemoryEngine(PanoramaConfig(
+            recency_half_life=self.config.recency_half_life,
         ))
-        
-        # Amygdala (감정/위협)
-        # AmygdalaConfig는 novelty_sensitivity를 직접 지원하지 않음
-        # 모드별 설정은 엔진 내부에서 처리
-        self.amygdala = AmygdalaEngine(AmygdalaConfig())
-        
-        # Hypothalamus (에너지/스트레스)
-        # HypothalamusConfig는 stress_baseline을 직접 지원하지 않음
-        # 모드별 설정은 엔진 내부에서 처리
-        self.hypothalamus = HypothalamusEngine(HypothalamusConfig())
-        
-        # Dynamics Engine (동역학 엔진)
+    
+    # MemoryRank (중요도 랭킹)
+    memoryrank = _LazyEngine()
+    
+    def _build_memoryrank(self) -> MemoryRankEngine:
+        return MemoryRankEngine(MemoryRankConfig(**self._mode_overrides("memoryrank")))
+    
+    # PFC (의사결정)
+    pfc = _LazyEngine()
+    
+    def _build_pfc(self) -> PFCEngine:
+        return PFCEngine(PFCConfig(**self._mode_overrides("pfc")), seed=self._stream_seed("pfc"))
+    
+    # BasalGanglia (습관 학습)
+    basal_ganglia = _LazyEngine()
+    
+    def _build_basal_ganglia(self) -> BasalGangliaEngine:
+        engine = BasalGangliaEngine(
+            BasalGangliaConfig(**self._mode_overrides("basal_ganglia")),
+            seed=self._stream_seed("basal_ganglia"),
+        )
+        # 엔진 생성 전에 로드된 Q-값 적용 (비우는 것은 엔진 저장 후 _engine_stored에서)
+        q_data = self._pending_q_values
+        if q_data is not None:
+            self._apply_q_values(engine, q_data)
+        return engine
+    
+    # Thalamus (입력 필터링) - 모드에 따라 게이팅 조절
+    thalamus = _LazyEngine()
+    
+    def _build_thalamus(self) -> ThalamusEngine:
+        return ThalamusEngine(ThalamusConfig(**self._mode_overrides("thalamus")))
+    
+    # Amygdala (감정/위협)
+    # AmygdalaConfig는 novelty_sensitivity를 직접 지원하지 않음
+    # 모드별 설정은 엔진 내부에서 처리
+    amygdala = _LazyEngine()
+    
+    def _build_amygdala(self) -> AmygdalaEngine:
+        return AmygdalaEngine(AmygdalaConfig())
+    
+    # Hypothalamus (에너지/스트레스)
+    # HypothalamusConfig는 stress_baseline을 직접 지원하지 않음
+    # 모드별 설정은 엔진 내부에서 처리
+    hypothalamus = _LazyEngine()
+    
+    def _build_hypothalamus(self) -> HypothalamusEngine:
+        return HypothalamusEngine(HypothalamusConfig(), seed=self._stream_seed("hypothalamus"))
+    
+    # Dynamics Engine (동역학 엔진)
+    dynamics = _LazyEngine()
+    
+    def _build_dynamics(self) -> DynamicsEngine:
         dynamics_config = DynamicsConfig(
             base_gamma=0.3,
             omega=0.05,
-            core_decay_rate=self.mode_config.core_decay_rate,
-            memory_update_failure=self.mode_config.memory_update_failure,
-            loop_integrity_decay=self.mode_config.loop_integrity_decay,
             entropy_threshold_ratio=0.8,
             core_distress_threshold=0.3,
             history_size=100,
             memory_alpha=0.5,
-            # 시간축 분리 (치매/알츠하이머)
-            old_memory_decay_rate=self.mode_config.old_memory_decay_rate,
-            new_memory_decay_rate=self.mode_config.new_memory_decay_rate,
-            memory_age_threshold=self.mode_config.memory_age_threshold,
+            **self._mode_overrides("dynamics"),
         )
-        self.dynamics = DynamicsEngine(dynamics_config)
-        
-        # 클래스 참조 저장
-        self._MemoryNodeAttributes = MemoryNodeAttributes
-        self._Action = Action
+        return DynamicsEngine(dynamics_config)
     
-    def set_mode(self, mode: CognitiveMode | str) -> None:
+    def set_mode(
+        self,
+        mode: CognitiveMode | str,
+        overrides: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """
         인지 모드 변경
         
@@ -262,16 +494,20 @@ class CognitiveKernel:
                 - 문자열인 경우: 대소문자 무시, 예: "adhd", "ASD", "dementia"
                 - 허용 모드: NORMAL, ADHD, ASD, PTSD, PANIC, EPILEPSY, OCD, IED,
                            DEPRESSION, BIPOLAR, DEMENTIA, ALZHEIMER
+            overrides: 프리셋 위에 덮어쓸 ModeConfig 필드 (예: {"tau": 0.8})
         
         Raises:
-            ModeError: 유효하지 않은 모드인 경우
+            ModeError: 유효하지 않은 모드이거나 overrides에 없는 필드가 있는 경우
         
         Example:
             >>> kernel.set_mode(CognitiveMode.ADHD)
             >>> kernel.set_mode("adhd")  # 대소문자 무시
             >>> kernel.set_mode("ASD")
+            >>> kernel.set_mode("adhd", overrides={"decision_temperature": 0.5})
         
-        모드를 변경하면 엔진들이 자동으로 재초기화됩니다.
+        엔진을 다시 만들지 않고 모드가 정하는 설정 필드만 제자리에서 바꾼다.
+        기억, 그래프 엣지, Working Memory, Q-테이블, 동역학 히스토리는 유지되고
+        MemoryRank 랭킹만 무효화되어 다음 회상 때 새 설정으로 재계산된다.
         """
         # 문자열 모드 지원 (대소문자 무시)
         if isinstance(mode, str):
@@ -289,11 +525,42 @@ class CognitiveKernel:
                 f"mode must be CognitiveMode enum or string, got {type(mode).__name__}"
             )
         
+        mode_config = self._resolve_mode_config(mode, overrides)
+        
+        with self._decision_lock, self._lock.write_locked():
+            self._switch_mode(mode, mode_config, overrides)
+    
+    @staticmethod
+    def _resolve_mode_config(
+        mode: CognitiveMode, overrides: Optional[Dict[str, Any]]
+    ) -> ModeConfig:
+        """모드 프리셋 + overrides (없는 필드면 ModeError)"""
+        mode_config = CognitiveModePresets.shared_config(mode)
+        if overrides:
+            unknown = set(overrides) - {f.name for f in dataclasses.fields(ModeConfig)}
+            if unknown:
+                raise ModeError(f"Unknown ModeConfig fields: {', '.join(sorted(unknown))}")
+            mode_config = dataclasses.replace(mode_config, **overrides)
+        return mode_config
+    
+    def _switch_mode(
+        self,
+        mode: CognitiveMode,
+        mode_config: ModeConfig,
+        overrides: Optional[Dict[str, Any]],
+    ) -> None:
+        """결정 잠금 + 쓰기 잠금 보유 상태에서 호출: 모드 교체 (set_mode/load 공용)"""
         self.mode = mode
-        self.mode_config = CognitiveModePresets.get_config(mode)
+        self.mode_config = mode_config
+        self._mode_config_overrides = dict(overrides or {})
         
-        # 엔진 재초기화
-        self._init_engines()
+        # 엔진 설정만 교체 (학습 상태 유지), 랭킹은 다음 회상 때 새 설정으로 재계산
+        self._apply_mode_config()
+        self._invalidate_graph()
+        
+        # 같은 엔진을 계속 쓰므로 파이프라인은 유지, 재사용 캐시만 비움
+        if self._pipeline is not None:
+            self._pipeline.clear_cache()
     
     def set_pipeline(self, pipeline: DecisionPipeline) -> None:
         """
@@ -304,6 +571,8 @@ class CognitiveKernel:
         """
         if not PIPELINE_AVAILABLE:
             raise ImportError("Pipeline module not available")
+        if self._profiler is not None and pipeline.profiler is None:
+            pipeline.profiler = self._profiler
         self._pipeline = pipeline
     
     def get_default_pipeline(self) -> DecisionPipeline:
@@ -313,6 +582,7 @@ class CognitiveKernel:
         
         return DecisionPipeline([
             MemoryLoadStep(self, self.config.working_memory_capacity),
+            KeywordExtractionStep(self._extract_keywords),  # 회상과 독립
             WorkingMemoryStep(self.pfc),
             ActionCreationStep(
                 self.pfc,
@@ -320,18 +590,53 @@ class CognitiveKernel:
                 self._extract_keywords,
                 alpha=0.5,
             ),
-            PFCDecisionStep(self.pfc),
+            UtilityEvaluationStep(self.pfc),  # 선택 없이 효용/확률만
             EntropyCalculationStep(self.dynamics),  # DynamicsEngine 사용
             CoreStrengthStep(self.dynamics, self),  # DynamicsEngine 사용
-            TorqueGenerationStep(self.dynamics, self.mode),  # DynamicsEngine 사용
-            UtilityRecalculationStep(
-                self.pfc,
-                self._calculate_memory_relevance,
-                self._extract_keywords,
-                alpha=0.5,
-            ),
+            TorqueGenerationStep(self.dynamics, kernel=self),  # 실행 시점 모드로 DynamicsEngine 사용
+            TorqueDecisionStep(self.pfc),  # 토크 반영 후 PFC 결정 1회
+            HabitLookupStep(self.basal_ganglia),  # 엔트로피/토크와 독립
             ResultAssemblyStep(self.pfc, self.basal_ganglia),
-        ])
+        ], profiler=self._profiler, executor=self.config.pipeline_executor)
+    
+    def enable_profiling(self, track_allocations: bool = False) -> PipelineProfiler:
+        """
+        파이프라인 단계별 계측 켜기
+        
+        Args:
+            track_allocations: True면 tracemalloc으로 할당량도 측정
+        
+        Returns:
+            연결된 PipelineProfiler (이미 켜져 있으면 기존 계측기)
+        """
+        if self._profiler is None or self._profiler.track_allocations != track_allocations:
+            self.disable_profiling()
+            self._profiler = PipelineProfiler(track_allocations=track_allocations)
+        if self._pipeline is not None:
+            self._pipeline.profiler = self._profiler
+        return self._profiler
+    
+    def disable_profiling(self) -> None:
+        """파이프라인 계측 끄기 (집계 결과 폐기)"""
+        if self._profiler is None:
+            return
+        if self._pipeline is not None and self._pipeline.profiler is self._profiler:
+            self._pipeline.profiler = None
+        self._profiler.close()
+        self._profiler = None
+    
+    def dump_pipeline_profile(self, path: str) -> Dict[str, Any]:
+        """
+        파이프라인 계측 결과를 JSON 파일로 저장
+        
+        Raises:
+            ConfigurationError: 계측이 꺼져 있는 경우
+        """
+        if self._profiler is None:
+            raise ConfigurationError(
+                "Pipeline profiling is disabled. Call enable_profiling() first."
+            )
+        return self._profiler.dump(path)
     
     # ==================================================================
     # 핵심 인터페이스 - 간단하게 사용
@@ -371,26 +676,40 @@ class CognitiveKernel:
         
         timestamp = time.time()
         
-        # Panorama에 이벤트 저장
-        event_id = self.panorama.append_event(
-            timestamp=timestamp,
-            event_type=event_type,
-            payload=content or {},
-            importance=importance,
-        )
-        
-        # 연관 관계 저장 (MemoryRank 그래프용)
-        if related_to:
-            for related_id in related_to:
-                self._edges.append((related_id, event_id, importance))
-                self._edges.append((event_id, related_id, importance * 0.5))  # 양방향 (비대칭)
+        with self._lock.write_locked():
+            # Panorama에 이벤트 저장
+            event_id = self.panorama.append_event(
+                timestamp=timestamp,
+                event_type=event_type,
+                payload=content or {},
+                importance=importance,
+            )
         
-        # 메타데이터 저장
-        self._event_count += 1
-        self._is_dirty = True
+            # 연관 관계 저장 (MemoryRank 그래프용)
+            if related_to:
+                for related_id in related_to:
+                    self._edges.append((related_id, event_id, importance))
+                    self._edges.append((event_id, related_id, importance * 0.5))  # 양방향 (비대칭)
+        
+            # 메타데이터 저장
+            self._event_count += 1
+            self._mark_dirty()
+            self._graph_generation += 1
+            auto_save = (
+                self.config.auto_save
+                and self._event_count % self.config.auto_save_interval == 0
+            )
+            retention = self.config.retention
+            run_retention = (
+                retention is not None
+                and retention.check_interval > 0
+                and self._event_count % retention.check_interval == 0
+            )
         
-        # 자동 저장 체크
-        if self.config.auto_save and self._event_count % self.config.auto_save_interval == 0:
+        # 보존 정책/자동 저장 체크 (쓰기 잠금 해제 후, 정리된 상태를 저장)
+        if run_retention:
+            self.apply_retention()
+        if auto_save:
             self.save()
         
         return event_id
@@ -410,29 +729,56 @@ class CognitiveKernel:
             >>> for m in memories:
             ...     print(f"{m['event_type']}: {m['importance']:.2f}")
         """
+        return self.recall_arrays(k).to_dicts()
+    
+    def recall_arrays(self, k: int = 5) -> MemoryArrays:
+        """
+        중요한 기억 회상 (Top-k, 열 지향)
+        
+        recall()과 같은 기억을 MemoryArrays로 반환한다.
+        
+        Args:
+            k: 회상할 기억 수
+            
+        Returns:
+            중요도 순으로 정렬된 MemoryArrays
+            
+        Example:
+            >>> memories = kernel.recall_arrays(k=100)
+            >>> kernel.dynamics.calculate_core_strength_arrays(
+            ...     memories.importances, memories.timestamps)
+        """
         # 입력 검증 (먼저 실행)
         validate_k(k)
         
-        # MemoryRank 그래프 구축
-        self._rebuild_graph()
+        # MemoryRank 그래프 구축 (새 스냅샷, 다른 읽기를 막지 않음)
+        memoryrank = self._rebuild_graph()
         
         # Top-k 조회
-        top_memories = self.memoryrank.get_top_memories(k)
+        top_memories = memoryrank.get_top_memories(k)
         
         # 이벤트 정보 추가
-        results = []
+        ids: List[str] = []
+        event_types: List[str] = []
+        contents: List[Any] = []
+        importances: List[float] = []
+        timestamps: List[float] = []
         for event_id, score in top_memories:
             event = self.panorama.get_event(event_id)
             if event:
-                results.append({
-                    "id": event.id,
-                    "event_type": event.event_type,
-                    "content": event.payload,
-                    "importance": score,
-                    "timestamp": event.timestamp,
-                })
-        
-        return results
+                ids.append(event.id)
+                event_types.append(event.event_type)
+                contents.append(event.payload)
+                importances.append(score)
+                timestamps.append(event.timestamp)
+        
+        return MemoryArrays(
+            ids=ids,
+            event_types=event_types,
+            contents=contents,
+            importances=np.array(importances, dtype=float),
+            timestamps=np.array(timestamps, dtype=float),
+        )
     
     def decide(
         self,
@@ -467,12 +813,140 @@ class CognitiveKernel:
         # 입력 검증 (먼저 실행)
         validate_options(options)
         
-        # 파이프라인 패턴 사용
-        if use_pipeline and PIPELINE_AVAILABLE:
-            return self._decide_with_pipeline(options, context, use_habit, external_torque)
+        # 결정 상태(Working Memory, 세차 위상 등)는 한 번에 한 결정만 변경
+        with self._decision_lock:
+            # 파이프라인 패턴 사용
+            if use_pipeline and PIPELINE_AVAILABLE:
+                return self._decide_with_pipeline(options, context, use_habit, external_torque)
+            
+            # 레거시 방식 (기존 코드)
+            return self._decide_legacy(options, context, use_habit, external_torque)
+    
+    def decide_batch(
+        self,
+        option_sets: List[List[str]],
+        contexts: Optional[List[Optional[str]]] = None,
+        use_habit: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 독립 옵션 집합에 대한 일괄 의사결정
+        
+        기본 파이프라인과 같은 수식을 사용하되:
+        - 기억 회상(MemoryRank)과 Working Memory 로드/감쇠는 한 번만 수행
+        - 기억 관련성은 고유 옵션 이름마다 한 번만 계산
+        - 효용/softmax/엔트로피/토크/선택은 패딩된 (B, K) 배열로 한 번에 계산
+        - 세차 위상은 항목 순서대로 decide()를 반복 호출한 것과 같이 진행
         
-        # 레거시 방식 (기존 코드)
-        return self._decide_legacy(options, context, use_habit, external_torque)
+        각 항목은 토크 반영 후 한 번만 샘플링하므로, 같은 난수 시드에서도
+        decide() 루프와 선택 결과가 다를 수 있다 (확률 분포/엔트로피는 동일).
+        
+        Args:
+            option_sets: 옵션 리스트의 리스트
+            contexts: 항목별 상황 컨텍스트 (None이면 습관 조회 생략)
+            use_habit: True면 습관 학습 결과도 반영
+            
+        Returns:
+            입력 순서대로의 결정 결과 리스트 (decide()와 같은 형식)
+            
+        Example:
+            >>> results = kernel.decide_batch([["rest", "work"], ["read", "walk", "sleep"]])
+            >>> [r["action"] for r in results]
+        """
+        if not isinstance(option_sets, list):
+            raise ValidationError(
+                f"option_sets must be list, got {type(option_sets).__name__}"
+            )
+        for i, options in enumerate(option_sets):
+            validate_options(options, f"option_sets[{i}]")
+        
+        batch_size = len(option_sets)
+        if contexts is None:
+            contexts = [None] * batch_size
+        elif not isinstance(contexts, list) or len(contexts) != batch_size:
+            raise ValidationError("contexts must be a list with the same length as option_sets")
+        if batch_size == 0:
+            return []
+        
+        with self._decision_lock:
+            return self._decide_batch(option_sets, contexts, use_habit)
+    
+    def _decide_batch(
+        self,
+        option_sets: List[List[str]],
+        contexts: List[Optional[str]],
+        use_habit: bool,
+    ) -> List[Dict[str, Any]]:
+        """decide_batch() 본체 (검증 완료, 결정 잠금 보유 상태)"""
+        from .pipeline import build_decision_result
+        
+        batch_size = len(option_sets)
+        
+        # 1. 공유 회상 → Working Memory (한 번만)
+        memories = self.recall(k=self.config.working_memory_capacity)
+        self.pfc.load_from_memoryrank([(m["id"], m["importance"]) for m in memories])
+        self.pfc.update_decay()
+        
+        # 2. 패딩된 보상 배열 (고유 옵션별 관련성 1회 계산)
+        memory_texts = self._memory_texts(memories)
+        lengths = np.array([len(options) for options in option_sets], dtype=int)
+        width = int(lengths.max())
+        rewards = np.zeros((batch_size, width), dtype=float)
+        phase_index = np.zeros((batch_size, width), dtype=int)
+        reward_cache: Dict[str, float] = {}
+        for b, options in enumerate(option_sets):
+            # 중복 옵션은 decide()와 같이 마지막 위치의 위상을 공유
+            last_position = {opt: i for i, opt in enumerate(options)}
+            for i, opt in enumerate(options):
+                reward = reward_cache.get(opt)
+                if reward is None:
+                    relevance = self._relevance_from_texts(self._extract_keywords(opt), memory_texts)
+                    reward = 0.5 + 0.5 * relevance
+                    reward_cache[opt] = reward
+                rewards[b, i] = reward
+                phase_index[b, i] = last_position[opt]
+        costs = np.full((batch_size, width), 0.2)
+        risks = np.full((batch_size, width), 0.1)
+        
+        # 3. 토크 없는 평가 → 엔트로피 / 코어 강도 / 절규
+        _, base_probabilities = self.pfc.evaluate_padded(rewards, costs, risks, lengths)
+        entropies = self.dynamics.calculate_entropy_batch(base_probabilities)
+        core_strength = self.dynamics.calculate_core_strength(
+            memories,
+            memory_update_failure=self.mode_config.memory_update_failure,
+            alpha=self.dynamics.config.memory_alpha,
+        )
+        distress = self.dynamics.check_cognitive_distress_batch(entropies, core_strength, lengths)
+        
+        # 4. 회전 토크 (항목별 위상 진행) → 토크 반영 결정
+        torque = self.dynamics.generate_torque_batch(
+            lengths, entropies, self.mode, phase_index=phase_index,
+        )
+        decisions = self.pfc.decide_padded(
+            rewards + torque, costs, risks, lengths, names=option_sets,
+        )
+        
+        # 5. 결과 조립 (습관 조회는 항목별)
+        results = []
+        for b, options in enumerate(option_sets):
+            entropy = float(entropies[b])
+            self.dynamics.update_history(entropy, core_strength)
+            
+            habit_action = None
+            if use_habit and contexts[b]:
+                habit_action = self.basal_ganglia.select_action(contexts[b], options)
+            
+            results.append(build_decision_result(
+                options=options,
+                probabilities=decisions[b].probabilities.tolist(),
+                pfc_result=decisions[b].result,
+                entropy=entropy,
+                core_strength=core_strength,
+                habit_action=habit_action,
+                cognitive_distress=bool(distress[b]),
+                distress_message=self.dynamics.DISTRESS_MESSAGE if distress[b] else "",
+            ))
+        
+        return results
     
     def _decide_with_pipeline(
         self,
@@ -547,12 +1021,10 @@ class CognitiveKernel:
                 risk=0.1,
             ))
         
-        # PFC 결정
-        pfc_result = self.pfc.process(actions)
-        
-        # 전체 확률 분포 계산 (엔트로피 계산용)
-        utilities = [self.pfc.evaluate_action(a) for a in actions]
-        probabilities = self.pfc.softmax_probabilities(utilities)
+        # PFC 결정 (전체 확률 분포는 결정에 쓰인 배열을 그대로 사용)
+        decision = self.pfc.process_arrays(ActionArrays.from_actions(actions))
+        pfc_result = decision.result
+        probabilities = decision.probabilities.tolist()
         probability_distribution = {
             opt: prob for opt, prob in zip(options, probabilities)
         }
@@ -638,9 +1110,9 @@ class CognitiveKernel:
                 ))
             
             # PFC 재결정
-            pfc_result = self.pfc.process(actions)
-            utilities = [self.pfc.evaluate_action(a) for a in actions]
-            probabilities = self.pfc.softmax_probabilities(utilities)
+            decision = self.pfc.process_arrays(ActionArrays.from_actions(actions))
+            pfc_result = decision.result
+            probabilities = decision.probabilities.tolist()
             probability_distribution = {
                 opt: prob for opt, prob in zip(options, probabilities)
             }
@@ -661,121 +1133,6 @@ class CognitiveKernel:
             "conflict": pfc_result.action.name != habit_action if (pfc_result.action and habit_action) else False,
         }
     
-    def _decide_with_pipeline(
-        self,
-        options: List[str],
-        context: Optional[str] = None,
-        use_habit: bool = True,
-        external_torque: Optional[Dict[str, float]] = None,
-    ) -> Dict[str, Any]:
-        """파이프라인 패턴을 사용한 의사결정"""
-        from .pipeline import (
-            DecisionPipeline,
-            PipelineContext,
-            MemoryLoadStep,
-            WorkingMemoryStep,
-            ActionCreationStep,
-            PFCDecisionStep,
-            EntropyCalculationStep,
-            CoreStrengthStep,
-            TorqueGenerationStep,
-            UtilityRecalculationStep,
-            ResultAssemblyStep,
-        )
-        
-        # 파이프라인 가져오기 (없으면 기본 파이프라인 생성)
-        if self._pipeline is None:
-            self._pipeline = DecisionPipeline([
-                MemoryLoadStep(self, self.config.working_memory_capacity),
-                WorkingMemoryStep(self.pfc),
-                ActionCreationStep(
-                    self.pfc,
-                    self._calculate_memory_relevance,
-                    self._extract_keywords,
-                    alpha=0.5,
-                ),
-                PFCDecisionStep(self.pfc),
-                EntropyCalculationStep(self.dynamics),  # DynamicsEngine 사용
-                CoreStrengthStep(self.dynamics, self),  # DynamicsEngine 사용
-                TorqueGenerationStep(self.dynamics, self.mode),  # DynamicsEngine 사용
-                UtilityRecalculationStep(
-                    self.pfc,
-                    self._calculate_memory_relevance,
-                    self._extract_keywords,
-                    alpha=0.5,
-                ),
-                ResultAssemblyStep(self.pfc, self.basal_ganglia),
-            ])
-        
-        # 컨텍스트 생성
-        pipeline_context = PipelineContext(
-            options=options,
-            metadata={"context": context, "use_habit": use_habit, "external_torque": external_torque},
-        )
-        
-        # 파이프라인 실행
-        pipeline_context = self._pipeline.execute(pipeline_context)
-        
-        # 위상 업데이트 (DynamicsEngine 내부에서 처리됨)
-        # 히스토리 업데이트 (DynamicsEngine 내부에서 처리됨)
-        self.dynamics.update_history(
-            pipeline_context.entropy,
-            pipeline_context.core_strength,
-        )
-        
-        return pipeline_context.result or {}
-    
-    def set_pipeline(self, pipeline: Any) -> None:
-        """
-        커스텀 파이프라인 설정
-        
-        Args:
-            pipeline: DecisionPipeline 인스턴스
-        """
-        if not self._pipeline_available:
-            raise ImportError("Pipeline module not available. Install required dependencies.")
-        self._pipeline = pipeline
-    
-    def get_default_pipeline(self) -> Any:
-        """기본 파이프라인 생성"""
-        if not self._pipeline_available:
-            raise ImportError("Pipeline module not available. Install required dependencies.")
-        
-        from .pipeline import (
-            DecisionPipeline,
-            MemoryLoadStep,
-            WorkingMemoryStep,
-            ActionCreationStep,
-            PFCDecisionStep,
-            EntropyCalculationStep,
-            CoreStrengthStep,
-            TorqueGenerationStep,
-            UtilityRecalculationStep,
-            ResultAssemblyStep,
-        )
-        
-        return DecisionPipeline([
-            MemoryLoadStep(self, self.config.working_memory_capacity),
-            WorkingMemoryStep(self.pfc),
-            ActionCreationStep(
-                self.pfc,
-                self._calculate_memory_relevance,
-                self._extract_keywords,
-                alpha=0.5,
-            ),
-            PFCDecisionStep(self.pfc),
-            EntropyCalculationStep(self.dynamics),  # DynamicsEngine 사용
-            CoreStrengthStep(self.dynamics, self),  # DynamicsEngine 사용
-            TorqueGenerationStep(self.dynamics, self.mode),  # DynamicsEngine 사용
-            UtilityRecalculationStep(
-                self.pfc,
-                self._calculate_memory_relevance,
-                self._extract_keywords,
-                alpha=0.5,
-            ),
-            ResultAssemblyStep(self.pfc, self.basal_ganglia),
-        ])
-    
     def learn_from_reward(
         self,
         context: str,
@@ -793,8 +1150,9 @@ class CognitiveKernel:
         Example:
             >>> kernel.learn_from_reward("tired", "rest", reward=0.8)
         """
-        self.basal_ganglia.update(context, action, reward)
-        self._is_dirty = True
+        with self._decision_lock:
+            self.basal_ganglia.update(context, action, reward)
+            self._mark_dirty()
     
     def _extract_keywords(self, option_name: str) -> List[str]:
         """
@@ -807,7 +1165,7 @@ class CognitiveKernel:
         keywords = []
         for part in option_name.replace("_", " ").replace("-", " ").split():
             # "choose", "select", "do" 같은 동사 제거
-            if part.lower() not in ["choose", "select", "do", "pick", "take", "make"]:
+            if part.lower() not in _KEYWORD_STOP_WORDS:
                 keywords.append(part.lower())
         return keywords if keywords else [option_name.lower()]
     
@@ -828,9 +1186,12 @@ class CognitiveKernel:
         """
         if not memories or not option_keywords:
             return 0.0
-        
-        total_relevance = 0.0
-        
+        return self._relevance_from_texts(option_keywords, self._memory_texts(memories))
+    
+    @staticmethod
+    def _memory_texts(memories: List[Dict[str, Any]]) -> List[Tuple[str, float]]:
+        """기억별 (소문자 내용 문자열, 중요도) 리스트 (관련성 계산용)"""
+        texts = []
         for mem in memories:
             # 기억 내용을 문자열로 변환
             content = mem.get("content", {})
@@ -839,7 +1200,21 @@ class CognitiveKernel:
                 content_text = " ".join(str(v) for v in content.values()).lower()
             else:
                 content_text = str(content).lower()
-            
+            texts.append((content_text, mem.get("importance", 0.0)))
+        return texts
+    
+    @staticmethod
+    def _relevance_from_texts(
+        option_keywords: List[str],
+        memory_texts: List[Tuple[str, float]],
+    ) -> float:
+        """_memory_texts 결과에 대한 관련성 계산 (_calculate_memory_relevance 참조)"""
+        if not memory_texts or not option_keywords:
+            return 0.0
+        
+        total_relevance = 0.0
+        
+        for content_text, importance in memory_texts:
             # 키워드 매칭 점수 계산
             match_score = 0.0
             for keyword in option_keywords:
@@ -848,31 +1223,52 @@ class CognitiveKernel:
                     match_score += 1.0 / len(option_keywords)
             
             # 관련성 = 중요도 × 매칭 점수
-            importance = mem.get("importance", 0.0)
             total_relevance += importance * match_score
         
         # 정규화 (0~1 범위로)
         return min(1.0, total_relevance)
     
-    def _rebuild_graph(self):
-        """MemoryRank 그래프 재구축"""
-        events = self.panorama.get_all_events()
+    def _rebuild_graph(self) -> MemoryRankEngine:
+        """
+        MemoryRank 그래프 재구축 (copy-on-write)
         
-        # 이벤트가 없으면 종료
-        if not events:
-            return
+        읽기 잠금 안에서는 이벤트/엣지 스냅샷만 뜨고, 그래프 구축과
+        PageRank는 잠금 밖의 새 엔진에서 계산한 뒤 self.memoryrank로 발행한다.
+        재구축 중에도 다른 읽기는 기존 엔진을 그대로 사용한다.
         
-        # 엣지가 없으면 시간 순서로 연결
-        if not self._edges:
-            if len(events) > 1:
-                for i in range(len(events) - 1):
-                    self._edges.append((events[i].id, events[i+1].id, 0.5))
-            elif len(events) == 1:
-                # 이벤트가 1개뿐이면 자기 자신으로 연결
-                self._edges.append((events[0].id, events[0].id, 0.5))
+        Returns:
+            이번 재구축 결과 엔진 (이벤트가 없으면 현재 엔진)
+        """
+        with self._lock.read_locked():
+            events = self.panorama.get_all_events()
+            
+            # 이벤트가 없으면 종료
+            if not events:
+                return self.memoryrank
+            
+            # 엣지가 없으면 시간 순서로 연결 (최초 1회)
+            with self._graph_lock:
+                if not self._edges:
+                    if len(events) > 1:
+                        for i in range(len(events) - 1):
+                            self._edges.append((events[i].id, events[i+1].id, 0.5))
+                    elif len(events) == 1:
+                        # 이벤트가 1개뿐이면 자기 자신으로 연결
+                        self._edges.append((events[0].id, events[0].id, 0.5))
+                edges = list(self._edges)
+                
+                # Loop Integrity Decay (알츠하이머: 엣지 소실)
+                loop_integrity_decay = self.mode_config.loop_integrity_decay
+                if loop_integrity_decay > 0:
+                    edges = list(itertools.compress(
+                        edges, self._edge_keep_mask(len(edges), loop_integrity_decay)
+                    ))
+            
+            recency_scores = self.panorama.get_recency_scores()
+            current = self.memoryrank
+            seq = next(self._graph_seq)
         
         # 노드 속성 생성
-        recency_scores = self.panorama.get_recency_scores()
         node_attrs = {}
         
         for event in events:
@@ -885,20 +1281,133 @@ class CognitiveKernel:
         
         # 그래프 구축
         # local_weight_boost는 MemoryRankConfig에서 처리됨
+        if not (edges and node_attrs):
+            return current
+        
+        memoryrank = MemoryRankEngine(current.config)
+        memoryrank.build_graph(edges, node_attrs)
+        memoryrank.calculate_importance()
+        
+        # 발행 (엔진 교체 이후에 시작된 재구축보다 오래된 결과는 발행하지 않음)
+        with self._graph_lock:
+            if seq > self._published_graph_seq:
+                self.memoryrank = memoryrank
+                self._published_graph_seq = seq
+        return memoryrank
+    
+    def apply_retention(self, config: Optional[RetentionConfig] = None) -> Dict[str, int]:
+        """
+        기억 보존 정책 적용 (망각 + 그래프 압축)
+        
+        MemoryRank 점수와 Panorama 감쇠 중요도로 오래되고 중요도 낮은 기억을
+        삭제하고, 삭제된 기억에 닿는 엣지(및 max_events로 밀려난 기억의 남은
+        엣지)를 지운 뒤 같은 방향 중복 엣지를 병합한다. 모든 연결을 잃은 보존
+        기억은 시간 순 이웃과 다시 잇는다. 다음 save()는 줄어든
+        상태만 기록하므로 디스크 사용량도 함께 줄어든다.
+        
+        Args:
+            config: 보존 정책 (None이면 CognitiveConfig.retention, 그것도 없으면 기본값)
+            
+        Returns:
+            정리 통계 (examined, pruned, protected, edges_removed, edges_merged,
+            edges_relinked, events, edges)
+            
+        Example:
+            >>> kernel.apply_retention(RetentionConfig(min_age=30 * 86400, max_memories=10000))
+        """
+        engine = RetentionEngine(config or self.config.retention)
+        
+        # 현재 랭킹 (잠금 밖에서 계산). 랭킹 재구축은 이 시점 이후의 이벤트를
+        # 포함하므로, 정리 대상은 재구축 전에 있던 기억으로 한정한다
+        with self._lock.read_locked():
+            ranked_ids = {event.id for event in self.panorama.get_all_events()}
+        memoryrank = self._rebuild_graph()
+        ranks = memoryrank.get_rank_vector() if memoryrank._M is not None else {}
+        now = time.time()
+        
+        with self._lock.write_locked():
+            # 랭킹 이후 추가된 기억은 랭크 0으로 취급되지 않도록 이번 정리에서 제외
+            events = [e for e in self.panorama.get_all_events() if e.id in ranked_ids]
+            plan = engine.plan(events, self.panorama.get_importance_scores(now), ranks, now)
+            pruned = self.panorama.remove_events(plan.prune_ids)
+            
+            edge_count = len(self._edges)
+            edges, edges_removed, relinked = engine.compact_edges(
+                self._edges, [e.id for e in self.panorama.get_all_events()]
+            )
+            changed = pruned > 0 or len(edges) != edge_count
+            if changed:
+                with self._graph_lock:
+                    self._edges = edges
+                self._mark_dirty()
+                self._invalidate_graph()
+            stats = {
+                "examined": plan.examined,
+                "pruned": pruned,
+                "protected": plan.protected,
+                "edges_removed": edges_removed,
+                "edges_merged": edge_count - edges_removed + relinked - len(edges),
+                "edges_relinked": relinked,
+                "events": len(self.panorama),
+                "edges": len(edges),
+            }
+        
+        # 삭제된 노드가 없는 그래프를 바로 발행 (저장 시 오래된 노드 기록 방지)
+        if changed:
+            self._rebuild_graph()
+        return stats
+    
+    def _stream_seed(self, name: str) -> np.random.SeedSequence:
+        """커널 시드 시퀀스의 이름별 자식 (같은 시드면 같은 스트림)"""
+        root = self._seed_seq
+        return np.random.SeedSequence(
+            root.entropy,
+            spawn_key=tuple(root.spawn_key) + (RNG_STREAMS.index(name),),
+            pool_size=root.pool_size,
+        )
+    
+    def spawn_seeds(self, n: int) -> List[np.random.SeedSequence]:
+        """
+        병렬 시뮬레이션용 독립 시드 n개 생성
+        
+        커널 시드 시퀀스의 "spawn" 스트림에서 차례로 파생하므로, 같은 시드의
+        커널에서 같은 순서로 호출하면 같은 시드를 얻는다. 결과는
+        NeuralDynamicsCore(seed=...), CognitiveConfig(seed=...) 등에 그대로 전달할
+        수 있고 프로세스/스레드마다 서로 겹치지 않는 스트림을 준다.
+        
+        Args:
+            n: 생성할 시드 수
         
-        # Loop Integrity Decay (알츠하이머: 엣지 소실)
-        edges_to_use = self._edges
-        if self.mode_config.loop_integrity_decay > 0:
-            import random
-            # 엣지 소실 확률 적용
-            edges_to_use = [
-                edge for edge in self._edges
-                if random.random() > self.mode_config.loop_integrity_decay
-            ]
+        Returns:
+            np.random.SeedSequence 리스트
+        """
+        if n < 0:
+            raise ValidationError(f"n must be >= 0, got {n}")
+        with self._spawn_lock:
+            return self._spawn_seq.spawn(n)
+    
+    def _edge_keep_mask(self, num_edges: int, loop_integrity_decay: float) -> np.ndarray:
+        """
+        _graph_lock 보유 상태에서 호출: 엣지별 유지 여부 (Bernoulli 마스크)
         
-        if edges_to_use and node_attrs:
-            self.memoryrank.build_graph(edges_to_use, node_attrs)
-            self.memoryrank.calculate_importance()
+        기본은 재구축(회상)마다 새로 추출한다. config.cache_edge_mask가 켜져 있으면
+        같은 그래프 세대 안의 재구축은 같은 마스크를 재사용하므로, 새 기억이나
+        모드 변경이 없으면 회상마다 같은 그래프를 얻는다.
+        """
+        key = (self._graph_generation, num_edges, loop_integrity_decay)
+        if (
+            not self.config.cache_edge_mask
+            or self._edge_mask is None
+            or self._edge_mask[0] != key
+        ):
+            self._edge_mask = (key, self._rng.random(num_edges) > loop_integrity_decay)
+        return self._edge_mask[1]
+    
+    def _invalidate_graph(self) -> None:
+        """쓰기 잠금 보유 상태에서 호출: 진행 중인 재구축 결과 발행 차단"""
+        with self._graph_lock:
+            self._published_graph_seq = next(self._graph_seq)
+        self._graph_generation += 1
     
     # ==================================================================
     # 영속성 (장기 기억의 핵심)
@@ -911,42 +1420,88 @@ class CognitiveKernel:
         Returns:
             저장 통계
         """
-        stats = {}
+        with self._lock.read_locked():
+            files, stats, version = self._snapshot_files()
+        self._write_files(files)
+        self._mark_saved(version)
+        return stats
+    
+    def _mark_dirty(self) -> None:
+        """저장되지 않은 변경 표시 (변경 번호 갱신)"""
+        self._dirty_version = next(self._mutations)
+        self._is_dirty = True
+    
+    def _mark_saved(self, version: int) -> None:
+        """
+        _write_files() 성공 후 호출: 스냅샷(version) 이후 변경이 없으면 깨끗한 상태로 표시
         
-        # Panorama 저장
-        panorama_path = self.storage_path / "panorama.json"
-        stats["events"] = self.panorama.save_to_json(str(panorama_path))
+        기록이 실패하면 호출되지 않으므로 변경 사항은 다음 저장 대상으로 남는다.
+        """
+        if self._dirty_version == version:
+            self._is_dirty = False
+    
+    def _snapshot_files(self) -> Tuple[Dict[str, str], Dict[str, int], int]:
+        """
+        저장할 파일 내용을 직렬화 (디스크 쓰기 없음)
         
-        # MemoryRank 저장
-        if self.memoryrank._M is not None:
-            memoryrank_path = self.storage_path / "memoryrank.json"
-            result = self.memoryrank.save_to_json(str(memoryrank_path))
-            stats["nodes"] = result["nodes"]
+        반환된 문자열은 이후 상태 변경과 무관한 스냅샷이므로
+        다른 스레드에서 _write_files()로 기록할 수 있다. 기록이 끝나면
+        함께 반환된 변경 번호로 _mark_saved()를 호출한다.
         
-        # Edges 저장
-        edges_path = self.storage_path / "edges.json"
-        edges_path.write_text(json.dumps(self._edges, indent=2))
+        Returns:
+            ({파일 이름: 내용}, 저장 통계, 스냅샷 시점의 변경 번호)
+        """
+        from .engines.panorama.persistence import PanoramaPersistence
+        from .engines.memoryrank.persistence import MemoryRankPersistence
+        
+        files: Dict[str, str] = {}
+        stats: Dict[str, int] = {}
+        version = self._dirty_version
+        
+        # Panorama
+        panorama_data = PanoramaPersistence(self.panorama).to_dict()
+        files["panorama.json"] = json.dumps(panorama_data, indent=2, ensure_ascii=False)
+        stats["events"] = panorama_data["event_count"]
+        
+        # MemoryRank (발행된 스냅샷)
+        memoryrank = self.memoryrank
+        if memoryrank._M is not None:
+            memoryrank_data = MemoryRankPersistence(memoryrank).to_dict()
+            files["memoryrank.json"] = json.dumps(memoryrank_data, indent=2, ensure_ascii=False)
+            stats["nodes"] = memoryrank_data["node_count"]
+        
+        # Edges
+        files["edges.json"] = json.dumps(self._edges, indent=2)
         stats["edges"] = len(self._edges)
         
-        # BasalGanglia Q-values 저장
-        q_path = self.storage_path / "q_values.json"
-        q_data = {}
-        if hasattr(self.basal_ganglia, '_q_table'):
-            q_data = {k: dict(v) for k, v in self.basal_ganglia._q_table.items()}
-        q_path.write_text(json.dumps(q_data, indent=2))
-        
-        # 메타데이터 저장
-        meta_path = self.storage_path / "meta.json"
-        meta_path.write_text(json.dumps({
+        # BasalGanglia Q-values (엔진을 만들지 않았으면 로드된 값 그대로)
+        # 대기 Q-값을 엔진보다 먼저 읽는다: 엔진은 저장된 뒤에야 대기 값을 비우므로
+        # 대기 값이 비어 있으면 엔진이 이미 __dict__에 있다
+        q_data = self._pending_q_values or {}
+        basal_ganglia = self.__dict__.get("basal_ganglia")
+        if basal_ganglia is not None and hasattr(basal_ganglia, '_q_table'):
+            q_data = {k: dict(v) for k, v in basal_ganglia._q_table.items()}
+        files["q_values.json"] = json.dumps(q_data, indent=2)
+        
+        # 메타데이터
+        files["meta.json"] = json.dumps({
             "session_name": self.session_name,
             "event_count": self._event_count,
             "last_saved": time.time(),
             "config": self.config.to_dict(),
             "mode": self.mode.value,
-        }, indent=2))
+            "mode_overrides": self._mode_config_overrides,
+        }, indent=2)
         
-        self._is_dirty = False
-        return stats
+        return files, stats, version
+    
+    def _write_files(self, files: Dict[str, str]) -> None:
+        """스냅샷 파일 기록 (임시 파일에 쓴 뒤 교체)"""
+        for name, text in files.items():
+            path = self.storage_path / name
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_text(text)
+            os.replace(tmp_path, path)
     
     def load(self) -> Dict[str, int]:
         """
@@ -955,6 +1510,13 @@ class CognitiveKernel:
         Returns:
             로드 통계
         """
+        with self._decision_lock, self._lock.write_locked():
+            stats = self._load_files()
+            self._invalidate_graph()
+        return stats
+    
+    def _load_files(self) -> Dict[str, int]:
+        """세션 파일 로드 (잠금 보유 상태에서 호출)"""
         stats = {}
         
         # Panorama 로드
@@ -978,29 +1540,43 @@ class CognitiveKernel:
         q_path = self.storage_path / "q_values.json"
         if q_path.exists():
             q_data = json.loads(q_path.read_text())
-            if hasattr(self.basal_ganglia, '_q_table'):
-                from collections import defaultdict
-                self.basal_ganglia._q_table = defaultdict(
-                    lambda: defaultdict(float),
-                    {k: defaultdict(float, v) for k, v in q_data.items()}
-                )
+            with self._engine_lock:
+                basal_ganglia = self.__dict__.get("basal_ganglia")
+                if basal_ganglia is not None:
+                    self._apply_q_values(basal_ganglia, q_data)
+                else:
+                    # 엔진은 첫 사용 때 생성하면서 적용
+                    self._pending_q_values = q_data
         
         # 메타데이터 로드
         meta_path = self.storage_path / "meta.json"
         if meta_path.exists():
             meta = json.loads(meta_path.read_text())
             self._event_count = meta.get("event_count", 0)
-            # 모드 복구 (선택적)
+            # 모드 복구 (선택적): 이미 생성된 엔진에도 저장된 모드/overrides 적용
             if "mode" in meta:
+                overrides = meta.get("mode_overrides") or {}
                 try:
-                    self.mode = CognitiveMode(meta["mode"])
-                    self.mode_config = CognitiveModePresets.get_config(self.mode)
-                except ValueError:
+                    mode = CognitiveMode(meta["mode"])
+                    mode_config = self._resolve_mode_config(mode, overrides)
+                except (ValueError, ModeError):
                     pass
+                else:
+                    self._switch_mode(mode, mode_config, overrides)
         
         self._is_dirty = False
         return stats
     
+    @staticmethod
+    def _apply_q_values(basal_ganglia: BasalGangliaEngine, q_data: Dict[str, Dict[str, float]]) -> None:
+        """저장된 Q-값을 BasalGanglia 엔진에 적용"""
+        if hasattr(basal_ganglia, '_q_table'):
+            from collections import defaultdict
+            basal_ganglia._q_table = defaultdict(
+                lambda: defaultdict(float),
+                {k: defaultdict(float, v) for k, v in q_data.items()}
+            )
+    
     def _session_exists(self) -> bool:
         """세션 파일 존재 여부"""
         return (self.storage_path / "meta.json").exists()
@@ -1025,19 +1601,26 @@ class CognitiveKernel:
     
     def status(self) -> Dict[str, Any]:
         """현재 상태 조회"""
-        status_dict = {
-            "session_name": self.session_name,
-            "storage_path": str(self.storage_path),
-            "event_count": len(self.panorama),
-            "edge_count": len(self._edges),
-            "is_dirty": self._is_dirty,
-            "auto_save": self.config.auto_save,
-            "mode": self.mode.value,
-            "pipeline_enabled": self._pipeline is not None,
-        }
+        with self._lock.read_locked():
+            status_dict = {
+                "session_name": self.session_name,
+                "storage_path": str(self.storage_path),
+                "event_count": len(self.panorama),
+                "edge_count": len(self._edges),
+                "is_dirty": self._is_dirty,
+                "auto_save": self.config.auto_save,
+                "mode": self.mode.value,
+                "pipeline_enabled": self._pipeline is not None,
+            }
+            status_dict["graph_generation"] = self._graph_generation
+            status_dict["engines_loaded"] = self.engines_loaded
+        
+        if self._profiler is not None:
+            status_dict["pipeline_profile"] = self._profiler.snapshot()
         
-        # Dynamics Engine 상태 추가
-        dynamics_status = self.dynamics.get_status()
+        # Dynamics Engine 상태 추가 (생성되지 않았으면 모드 설정 값만, 조회로 생성하지 않음)
+        dynamics = self.__dict__.get("dynamics")
+        dynamics_status = dynamics.get_status() if dynamics is not None else {}
         status_dict["dynamics"] = {
             **dynamics_status,
             "core_decay_rate": self.mode_config.core_decay_rate,
@@ -1049,10 +1632,12 @@ class CognitiveKernel:
     
     def clear(self):
         """모든 기억 삭제 (주의!)"""
-        self.panorama.clear()
-        self._edges.clear()
-        self._event_count = 0
-        self._is_dirty = True
+        with self._lock.write_locked():
+            self.panorama.clear()
+            self._edges.clear()
+            self._event_count = 0
+            self._mark_dirty()
+            self._invalidate_graph()
     
     def __repr__(self) -> str:
         return f"CognitiveKernel(session='{self.session_name}', events={len(self.panorama)}, mode={self.mode.value})"
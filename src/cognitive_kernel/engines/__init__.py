@@ -12,29 +12,79 @@ Engines:
 - amygdala: 감정/공포 (Rescorla-Wagner)
 - hypothalamus: 에너지/스트레스 (HPA Dynamics)
 - thalamus: 감각 게이팅 (Salience Filtering)
+- retention: 기억 보존/망각 정책 (Bounded Forgetting)
 """
 
-from .panorama import PanoramaMemoryEngine, PanoramaConfig
-from .memoryrank import MemoryRankEngine, MemoryRankConfig, MemoryNodeAttributes
-from .pfc import PFCEngine, PFCConfig, Action
-from .basal_ganglia import BasalGangliaEngine, BasalGangliaConfig
-from .dynamics import (
-    DynamicsEngine,
-    DynamicsConfig,
-    DynamicsState,
-    ContinuousDynamicsConfig,
-    NeuralDynamicsCore,
-    HebbianPlasticityConfig,
-    hebbian_update,
-)
-from .irrational_algebra import (
-    IrrationalAlgebraEngine,
-    IrrationalAlgebraConfig,
-    IrrationalAlgebraSnapshot,
-    IrrationalConstant,
-    IrrationalObservation,
-    AlgebraicInvariant,
-)
+import importlib
+from typing import Any, Dict, List
+
+# 공개 이름 → 서브패키지 (PEP 562 지연 로딩: 사용하는 엔진만 임포트)
+_LAZY_ATTRS: Dict[str, str] = {
+    # Panorama
+    'PanoramaMemoryEngine': '.panorama',
+    'PanoramaConfig': '.panorama',
+    # MemoryRank
+    'MemoryRankEngine': '.memoryrank',
+    'MemoryRankConfig': '.memoryrank',
+    'MemoryNodeAttributes': '.memoryrank',
+    # PFC
+    'PFCEngine': '.pfc',
+    'PFCConfig': '.pfc',
+    'Action': '.pfc',
+    # BasalGanglia
+    'BasalGangliaEngine': '.basal_ganglia',
+    'BasalGangliaConfig': '.basal_ganglia',
+    # Retention
+    'RetentionEngine': '.retention',
+    'RetentionConfig': '.retention',
+    # Dynamics
+    'DynamicsEngine': '.dynamics',
+    'DynamicsConfig': '.dynamics',
+    'DynamicsState': '.dynamics',
+    'RingBuffer': '.dynamics',
+    'ContinuousDynamicsConfig': '.dynamics',
+    'NeuralDynamicsCore': '.dynamics',
+    'CSRMatrix': '.dynamics',
+    'HebbianPlasticityConfig': '.dynamics',
+    'hebbian_update': '.dynamics',
+    'hebbian_update_inplace': '.dynamics',
+    'hebbian_update_batch': '.dynamics',
+    'FixedPoint': '.dynamics',
+    'FixedPointConfig': '.dynamics',
+    'find_fixed_points': '.dynamics',
+    # Irrational Algebra
+    'IrrationalAlgebraEngine': '.irrational_algebra',
+    'IrrationalAlgebraConfig': '.irrational_algebra',
+    'IrrationalAlgebraSnapshot': '.irrational_algebra',
+    'IrrationalConstant': '.irrational_algebra',
+    'IrrationalObservation': '.irrational_algebra',
+    'AlgebraicInvariant': '.irrational_algebra',
+}
+
+
+def _import_submodule(name: str) -> Any:
+    # `패키지.하위모듈` 속성 접근 (import 문 없이 접근해도 모듈을 적재)
+    if not name.startswith("__"):
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        return _import_submodule(name)
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Panorama
@@ -51,14 +101,24 @@ __all__ = [
     # BasalGanglia
     'BasalGangliaEngine',
     'BasalGangliaConfig',
+    # Retention
+    'RetentionEngine',
+    'RetentionConfig',
     # Dynamics
     'DynamicsEngine',
     'DynamicsConfig',
     'DynamicsState',
+    'RingBuffer',
     'ContinuousDynamicsConfig',
     'NeuralDynamicsCore',
+    'CSRMatrix',
     'HebbianPlasticityConfig',
     'hebbian_update',
+    'hebbian_update_inplace',
+    'hebbian_update_batch',
+    'FixedPoint',
+    'FixedPointConfig',
+    'find_fixed_points',
     # Irrational Algebra
     'IrrationalAlgebraEngine',
     'IrrationalAlgebraConfig',
@@ -58,6 +58,44 @@ from .config import AmygdalaConfig
 from .data_types import EmotionState, ThreatSignal, FearMemory
 
 
+# 부정어 패턴 (모든 엔진 공유)
+_NEGATIONS_STRICT = (
+    '안 ', '않아', '않는', '않다', '않을', '않고', '않겠',
+    '못 ', '못하', '아니', '아닌', '없어', '없다',
+    '싶지 않', '싶지않', '하지 않', '하지않', '안 할', '안할',
+    'not ', "don't", "doesn't", "didn't", "won't", "wouldn't",
+    'never ', 'no ', "isn't", "aren't", "can't", "cannot",
+)
+
+# 키워드 표별 전처리 결과 캐시: id(표) → (표, 전처리 결과)
+# 표 자체를 함께 보관해 id가 재사용되지 않도록 한다. 기본 표를 쓰는 모든
+# 세션이 같은 항목을 공유한다.
+_COMPILED_THREAT_KEYWORDS: Dict[int, Tuple[Dict, Tuple]] = {}
+_COMPILED_CACHE_SIZE = 64
+
+
+def _compile_threat_keywords(table: Dict) -> Tuple:
+    """
+    위협 키워드 표 전처리 (공백 제거 형태를 미리 계산)
+
+    표는 등록 후 변경하지 않는다고 가정한다 (변경하려면 새 딕셔너리를 넘길 것).
+
+    Returns:
+        ((category, info, ((word, word_no_space), ...)), ...)
+    """
+    entry = _COMPILED_THREAT_KEYWORDS.get(id(table))
+    if entry is not None and entry[0] is table:
+        return entry[1]
+    compiled = tuple(
+        (category, info, tuple((word, word.replace(' ', '')) for word in info['words']))
+        for category, info in table.items()
+    )
+    if len(_COMPILED_THREAT_KEYWORDS) >= _COMPILED_CACHE_SIZE:
+        _COMPILED_THREAT_KEYWORDS.clear()
+    _COMPILED_THREAT_KEYWORDS[id(table)] = (table, compiled)
+    return compiled
+
+
 class AmygdalaEngine:
     """
     편도체 엔진
@@ -142,21 +180,11 @@ class AmygdalaEngine:
         text_lower = input_text.lower()
         text_no_space = text_lower.replace(' ', '')
         
-        # 부정어 패턴
-        negations_strict = [
-            '안 ', '않아', '않는', '않다', '않을', '않고', '않겠',
-            '못 ', '못하', '아니', '아닌', '없어', '없다',
-            '싶지 않', '싶지않', '하지 않', '하지않', '안 할', '안할',
-            'not ', "don't", "doesn't", "didn't", "won't", "wouldn't",
-            'never ', 'no ', "isn't", "aren't", "can't", "cannot",
-        ]
-        
         threat_scores = defaultdict(float)
         detected_words = []
         
-        for category, info in self.config.threat_keywords.items():
-            for word in info['words']:
-                word_no_space = word.replace(' ', '')
+        for category, info, words in _compile_threat_keywords(self.config.threat_keywords):
+            for word, word_no_space in words:
                 if word in text_lower or word_no_space in text_no_space:
                     # 부정어 체크
                     idx = text_lower.find(word)
@@ -168,8 +196,8 @@ class AmygdalaEngine:
                         context_pre = text_lower[max(0, idx-5):idx]
                         context_post = text_lower[idx:idx+len(word)+8]
                     
-                    has_negation_pre = any(neg in context_pre for neg in negations_strict)
-                    has_negation_post = any(neg in context_post for neg in negations_strict)
+                    has_negation_pre = any(neg in context_pre for neg in _NEGATIONS_STRICT)
+                    has_negation_post = any(neg in context_post for neg in _NEGATIONS_STRICT)
                     
                     if (has_negation_pre or has_negation_post) and category != 'self_harm':
                         continue  # 부정문이므로 위협 아님
@@ -14,6 +14,66 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 
 
+# 기본 표는 모듈 로드 시 한 번만 만들고 모든 설정 인스턴스가 공유한다
+# (세션마다 같은 표를 다시 만들지 않음). 사용자 정의가 필요하면 수정하지 말고
+# threat_keywords/emotion_map에 새 딕셔너리를 넘길 것.
+
+# 기본 위협 키워드
+DEFAULT_THREAT_KEYWORDS: Dict = {
+    'danger': {
+        'words': ['위험', '죽고', '죽어', '죽을', '죽겠', '살인', '폭력', '공격', 
+                 '위협', '무서', '두려', '공포', '겁나', '끔찍',
+                 'danger', 'kill', 'death', 'die', 'attack', 'threat', 
+                 'fear', 'scary', 'terrify', 'horror'],
+        'weight': 1.0,
+        'type': 'direct_threat'
+    },
+    'social': {
+        'words': ['싫어', '미워', '혐오', '거부', '배신', '따돌림', '무시', 
+                 '왕따', '욕', '비난', '모욕',
+                 'hate', 'reject', 'betray', 'ignore', 'bully', 'insult'],
+        'weight': 0.7,
+        'type': 'social_threat'
+    },
+    'loss': {
+        'words': ['잃어', '잃었', '손해', '실패', '망했', '끝났', '이별', '헤어',
+                 '포기', '그만', '떠나',
+                 'lose', 'lost', 'loss', 'fail', 'end', 'goodbye', 'leave'],
+        'weight': 0.6,
+        'type': 'loss_threat'
+    },
+    'uncertainty': {
+        'words': ['불안', '걱정', '초조', '불확실', '혼란', '막막', '답답',
+                 'anxious', 'worry', 'nervous', 'uncertain', 'confused'],
+        'weight': 0.8,
+        'type': 'uncertainty'
+    },
+    'self_harm': {
+        'words': ['자살', '자해', '죽고싶', '죽고 싶', '살기싫', '살기 싫',
+                 '사라지고싶', '사라지고 싶', '없어지고싶',
+                 'suicide', 'self-harm', 'kill myself', 'want to die'],
+        'weight': 1.5,
+        'type': 'self_harm'
+    }
+}
+
+# 기본 감정 맵 (Russell's Circumplex Model)
+DEFAULT_EMOTION_MAP: Dict = {
+    'excited': {'valence': 0.8, 'arousal': 0.8, 'words': ['신나', '흥분', '설레', 'excited', 'thrilled']},
+    'happy': {'valence': 0.9, 'arousal': 0.5, 'words': ['행복', '기쁘', '좋아', '웃', 'happy', 'glad', 'joy']},
+    'love': {'valence': 1.0, 'arousal': 0.6, 'words': ['사랑', '애정', '좋아해', 'love', 'adore']},
+    'calm': {'valence': 0.5, 'arousal': 0.2, 'words': ['평화', '편안', '차분', 'calm', 'peaceful', 'relaxed']},
+    'content': {'valence': 0.6, 'arousal': 0.3, 'words': ['만족', '충족', 'content', 'satisfied']},
+    'angry': {'valence': -0.8, 'arousal': 0.9, 'words': ['화나', '화가', '분노', '짜증', '열받', '빡치', 'angry', 'furious', 'mad']},
+    'fear': {'valence': -0.9, 'arousal': 0.8, 'words': ['무서', '두려', '공포', '겁', 'fear', 'scared', 'terrified']},
+    'anxious': {'valence': -0.6, 'arousal': 0.7, 'words': ['불안', '걱정', '초조', 'anxious', 'worried', 'nervous']},
+    'sad': {'valence': -0.8, 'arousal': 0.3, 'words': ['슬프', '우울', '눈물', '울', 'sad', 'depressed', 'cry']},
+    'tired': {'valence': -0.3, 'arousal': 0.1, 'words': ['피곤', '지쳤', '힘들', 'tired', 'exhausted']},
+    'bored': {'valence': -0.2, 'arousal': 0.2, 'words': ['지루', '심심', 'bored', 'boring']},
+    'neutral': {'valence': 0.0, 'arousal': 0.3, 'words': []},
+}
+
+
 @dataclass
 class AmygdalaConfig:
     """
@@ -56,61 +116,12 @@ class AmygdalaConfig:
             self.emotion_map = self._get_default_emotion_map()
     
     def _get_default_threat_keywords(self) -> Dict:
-        """기본 위협 키워드"""
-        return {
-            'danger': {
-                'words': ['위험', '죽고', '죽어', '죽을', '죽겠', '살인', '폭력', '공격', 
-                         '위협', '무서', '두려', '공포', '겁나', '끔찍',
-                         'danger', 'kill', 'death', 'die', 'attack', 'threat', 
-                         'fear', 'scary', 'terrify', 'horror'],
-                'weight': 1.0,
-                'type': 'direct_threat'
-            },
-            'social': {
-                'words': ['싫어', '미워', '혐오', '거부', '배신', '따돌림', '무시', 
-                         '왕따', '욕', '비난', '모욕',
-                         'hate', 'reject', 'betray', 'ignore', 'bully', 'insult'],
-                'weight': 0.7,
-                'type': 'social_threat'
-            },
-            'loss': {
-                'words': ['잃어', '잃었', '손해', '실패', '망했', '끝났', '이별', '헤어',
-                         '포기', '그만', '떠나',
-                         'lose', 'lost', 'loss', 'fail', 'end', 'goodbye', 'leave'],
-                'weight': 0.6,
-                'type': 'loss_threat'
-            },
-            'uncertainty': {
-                'words': ['불안', '걱정', '초조', '불확실', '혼란', '막막', '답답',
-                         'anxious', 'worry', 'nervous', 'uncertain', 'confused'],
-                'weight': 0.8,
-                'type': 'uncertainty'
-            },
-            'self_harm': {
-                'words': ['자살', '자해', '죽고싶', '죽고 싶', '살기싫', '살기 싫',
-                         '사라지고싶', '사라지고 싶', '없어지고싶',
-                         'suicide', 'self-harm', 'kill myself', 'want to die'],
-                'weight': 1.5,
-                'type': 'self_harm'
-            }
-        }
+        """기본 위협 키워드 (모든 인스턴스가 공유하는 읽기 전용 표)"""
+        return DEFAULT_THREAT_KEYWORDS
     
     def _get_default_emotion_map(self) -> Dict:
-        """기본 감정 맵 (Russell's Circumplex Model)"""
-        return {
-            'excited': {'valence': 0.8, 'arousal': 0.8, 'words': ['신나', '흥분', '설레', 'excited', 'thrilled']},
-            'happy': {'valence': 0.9, 'arousal': 0.5, 'words': ['행복', '기쁘', '좋아', '웃', 'happy', 'glad', 'joy']},
-            'love': {'valence': 1.0, 'arousal': 0.6, 'words': ['사랑', '애정', '좋아해', 'love', 'adore']},
-            'calm': {'valence': 0.5, 'arousal': 0.2, 'words': ['평화', '편안', '차분', 'calm', 'peaceful', 'relaxed']},
-            'content': {'valence': 0.6, 'arousal': 0.3, 'words': ['만족', '충족', 'content', 'satisfied']},
-            'angry': {'valence': -0.8, 'arousal': 0.9, 'words': ['화나', '화가', '분노', '짜증', '열받', '빡치', 'angry', 'furious', 'mad']},
-            'fear': {'valence': -0.9, 'arousal': 0.8, 'words': ['무서', '두려', '공포', '겁', 'fear', 'scared', 'terrified']},
-            'anxious': {'valence': -0.6, 'arousal': 0.7, 'words': ['불안', '걱정', '초조', 'anxious', 'worried', 'nervous']},
-            'sad': {'valence': -0.8, 'arousal': 0.3, 'words': ['슬프', '우울', '눈물', '울', 'sad', 'depressed', 'cry']},
-            'tired': {'valence': -0.3, 'arousal': 0.1, 'words': ['피곤', '지쳤', '힘들', 'tired', 'exhausted']},
-            'bored': {'valence': -0.2, 'arousal': 0.2, 'words': ['지루', '심심', 'bored', 'boring']},
-            'neutral': {'valence': 0.0, 'arousal': 0.3, 'words': []},
-        }
+        """기본 감정 맵 (모든 인스턴스가 공유하는 읽기 전용 표)"""
+        return DEFAULT_EMOTION_MAP
     
     def validate(self) -> None:
         """
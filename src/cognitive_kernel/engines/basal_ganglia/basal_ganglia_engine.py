@@ -34,11 +34,12 @@ Version: 1.0.0-alpha
 
 import math
 import time
-import random
 import hashlib
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Union
 from collections import defaultdict
 
+import numpy as np
+
 from .data_types import ActionType, Action, ActionResult
 from .config import BasalGangliaConfig
 
@@ -60,17 +61,22 @@ class BasalGangliaEngine:
     
     def __init__(self, 
                  config: Optional[BasalGangliaConfig] = None,
-                 use_hash: bool = False):
+                 use_hash: bool = False,
+                 seed: Union[None, int, np.random.SeedSequence, np.random.Generator] = None):
         """
         기저핵 엔진 초기화
         
         Args:
             config: 설정 객체 (None이면 기본 설정 사용)
             use_hash: 긴 컨텍스트를 해시로 저장 (메모리 최적화)
+            seed: 탐색/선택 난수 (정수/SeedSequence/Generator, None이면 OS 엔트로피)
         """
         # 설정
         self.config = config if config else BasalGangliaConfig()
         
+        # 엔진 전용 난수 생성기 (전역 random 상태를 공유하지 않음)
+        self._rng = np.random.default_rng(seed)
+        
         # ===== Q-테이블 (상황 → 행동 → 가치) =====
         # {context: {action_name: Action}}
         self.q_table: Dict[str, Dict[str, Action]] = defaultdict(dict)
@@ -219,7 +225,7 @@ class BasalGangliaEngine:
             → 도파민이 낮으면 탐색 증가 (새로운 보상 찾기)
         """
         explore_prob = 0.1 + (1 - self.dopamine_level) * 0.2
-        return random.random() < explore_prob
+        return self._rng.random() < explore_prob
     
     def _explore(self, actions: List[Action]) -> Action:
         """
@@ -233,7 +239,7 @@ class BasalGangliaEngine:
         total = sum(weights)
         probs = [w / total for w in weights]
         
-        return random.choices(actions, weights=probs)[0]
+        return actions[self._rng.choice(len(actions), p=probs)]
     
     def _exploit(self, actions: List[Action]) -> Tuple[Action, float]:
         """
@@ -256,7 +262,7 @@ class BasalGangliaEngine:
         probs = [e / total for e in exp_values]
         
         # 선택
-        selected = random.choices(actions, weights=probs)[0]
+        selected = actions[self._rng.choice(len(actions), p=probs)]
         confidence = probs[actions.index(selected)]
         
         return selected, confidence
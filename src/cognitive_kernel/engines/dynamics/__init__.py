@@ -11,20 +11,64 @@ Author: GNJz (Qquarts)
 Version: 2.0.1+
 """
 
+import importlib
+from typing import Any, Dict
+
 from .config import DynamicsConfig
 from .models import DynamicsState
+from .ring_buffer import RingBuffer
 from .dynamics_engine import DynamicsEngine
-from .neural_dynamics import ContinuousDynamicsConfig, NeuralDynamicsCore
-from .plasticity import HebbianPlasticityConfig, hebbian_update
+
+# 연속 동역학/가소성은 첫 접근 시 임포트 (DynamicsEngine만 쓰는 경우 불필요)
+_LAZY_ATTRS: Dict[str, str] = {
+    "ContinuousDynamicsConfig": ".neural_dynamics",
+    "NeuralDynamicsCore": ".neural_dynamics",
+    "CSRMatrix": ".sparse",
+    "HebbianPlasticityConfig": ".plasticity",
+    "hebbian_update": ".plasticity",
+    "hebbian_update_inplace": ".plasticity",
+    "hebbian_update_batch": ".plasticity",
+    "FixedPoint": ".fixed_points",
+    "FixedPointConfig": ".fixed_points",
+    "find_fixed_points": ".fixed_points",
+}
+
+
+def _import_submodule(name: str) -> Any:
+    # `패키지.하위모듈` 속성 접근 (import 문 없이 접근해도 모듈을 적재)
+    if not name.startswith("__"):
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        return _import_submodule(name)
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "DynamicsConfig",
     "DynamicsState",
+    "RingBuffer",
     "DynamicsEngine",
     "ContinuousDynamicsConfig",
     "NeuralDynamicsCore",
+    "CSRMatrix",
     "HebbianPlasticityConfig",
     "hebbian_update",
+    "hebbian_update_inplace",
+    "hebbian_update_batch",
+    "FixedPoint",
+    "FixedPointConfig",
+    "find_fixed_points",
 ]
 
 __version__ = "1.0.0"
@@ -12,7 +12,9 @@ from __future__ import annotations
 
 import math
 import time
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Any, Union
+
+import numpy as np
 
 from .config import DynamicsConfig
 from .models import DynamicsState
@@ -30,6 +32,9 @@ class DynamicsEngine:
     - 상태 관리 (히스토리 포함)
     """
     
+    # 인지적 절규 메시지
+    DISTRESS_MESSAGE = "기억이 안 나..."
+    
     def __init__(self, config: Optional[DynamicsConfig] = None):
         """
         Args:
@@ -37,7 +42,7 @@ class DynamicsEngine:
         """
         self.config = config or DynamicsConfig()
         self.config.validate()
-        self.state = DynamicsState()
+        self.state = DynamicsState(history_size=self.config.history_size)
         # precession_phi 불변식 보장 (초기화 시)
         self._normalize_precession_phi()
     
@@ -74,6 +79,26 @@ class DynamicsEngine:
         self.state.entropy = entropy
         return entropy
     
+    def calculate_entropy_batch(self, probabilities: np.ndarray) -> np.ndarray:
+        """
+        행별 엔트로피 계산 (패딩된 (B, K) 확률 배열)
+        
+        패딩 위치는 확률 0이므로 합에 기여하지 않는다.
+        state.entropy에는 마지막 행의 값이 남는다.
+        
+        Args:
+            probabilities: (B, K) 확률 배열
+            
+        Returns:
+            (B,) 엔트로피 배열
+        """
+        P = np.asarray(probabilities, dtype=float)
+        safe = np.where(P > 0, P, 1.0)
+        entropies = -(P * np.log(safe)).sum(axis=1)
+        if entropies.shape[0]:
+            self.state.entropy = float(entropies[-1])
+        return entropies
+    
     def calculate_core_strength(
         self,
         memories: List[Dict[str, Any]],
@@ -134,7 +159,95 @@ class DynamicsEngine:
                 1.0, alpha * total_importance / len(memories) if memories else 0.0
             )
         
-        # 2. Core Decay (물리적 시간 붕괴 항 적용)
+        # 2. Core Decay
+        return self._apply_core_decay(current_raw_core)
+    
+    def core_strength_raw_batch(
+        self,
+        importances: Any,
+        timestamps: Any = None,
+        memory_update_failure: float = 0.0,
+        alpha: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        원시 코어 강도 배열 계산 (상태 변경 없음, Core Decay 미적용)
+        
+        calculate_core_strength()의 시간축 분리 감쇠를 마스크로 한 번에 적용한다.
+        마지막 축이 기억 축이므로 (B, N) 배열이면 에피소드 B개를 한 번에 계산.
+        
+        Args:
+            importances: (..., N) 중요도 배열
+            timestamps: importances와 같은 모양의 타임스탬프 배열
+                (None이거나 NaN인 위치는 현재 시각, 즉 나이 0)
+            memory_update_failure: 새 기억 중요도 반영 실패율 (0~1)
+            alpha: 기억 영향 계수 (None이면 config에서 가져옴)
+            now: 기준 시각 (None이면 time.time())
+            
+        Returns:
+            (...) 원시 코어 강도 배열 (0~1, 기억이 없으면 0)
+        """
+        if alpha is None:
+            alpha = self.config.memory_alpha
+        weights = np.asarray(importances, dtype=float)
+        if weights.ndim == 0:
+            raise ValueError("importances must have a memory axis")
+        count = weights.shape[-1]
+        if count == 0:
+            return np.zeros(weights.shape[:-1])
+        
+        old_rate = self.config.old_memory_decay_rate
+        new_rate = self.config.new_memory_decay_rate
+        if timestamps is not None and (old_rate > 0 or new_rate > 0):
+            ts = np.asarray(timestamps, dtype=float)
+            if ts.shape != weights.shape:
+                raise ValueError("timestamps must have the same shape as importances")
+            ages = (time.time() if now is None else now) - ts
+            ages[np.isnan(ages)] = 0.0
+            # 오래된 기억/새 기억 감쇠율을 마스크로 선택 (감쇠율 0이면 계수 1)
+            rates = np.where(ages > self.config.memory_age_threshold, old_rate, new_rate)
+            weights = weights * np.exp(-rates * ages)
+        
+        total = weights.sum(axis=-1)
+        if memory_update_failure > 0:
+            total = total * (1.0 - memory_update_failure)
+        return np.minimum(1.0, alpha * total / count)
+    
+    def calculate_core_strength_arrays(
+        self,
+        importances: Any,
+        timestamps: Any = None,
+        memory_update_failure: float = 0.0,
+        alpha: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> float:
+        """
+        코어 강도 계산 (배열 입력, Core Decay 동역학 적용)
+        
+        calculate_core_strength()와 같은 값을 기억 딕셔너리 대신
+        중요도/타임스탬프 배열(열 지향 회상 결과)에서 계산한다.
+        
+        Args:
+            importances: (N,) 중요도 배열
+            timestamps: (N,) 타임스탬프 배열 (None/NaN은 현재 시각)
+            memory_update_failure: 새 기억 중요도 반영 실패율 (0~1)
+            alpha: 기억 영향 계수 (None이면 config에서 가져옴)
+            now: 기준 시각 (None이면 time.time())
+            
+        Returns:
+            코어 강도 (0~1)
+        """
+        importances = np.asarray(importances, dtype=float)
+        if importances.ndim != 1:
+            raise ValueError("importances must be a 1-D array")
+        raw = self.core_strength_raw_batch(
+            importances, timestamps, memory_update_failure, alpha, now,
+        )
+        return self._apply_core_decay(float(raw))
+    
+    def _apply_core_decay(self, current_raw_core: float) -> float:
+        """Core Decay 적용 후 state.core_strength 갱신"""
+        # 물리적 시간 붕괴 항 적용
         # 수식: C(t) = C(0) * exp(-λ * Δt)
         if self.config.core_decay_rate > 0:
             # 초기화
@@ -193,27 +306,7 @@ class DynamicsEngine:
         if omega is None:
             omega = self.config.omega
         
-        # 모드별 gamma 조정 (독립 배포를 위해 유연하게 처리)
-        gamma = base_gamma
-        if mode is not None:
-            # 문자열 모드 처리
-            if isinstance(mode, str):
-                mode_str = mode.lower()
-                if mode_str == "adhd":
-                    gamma = base_gamma * 1.5  # ADHD: 더 강한 회전
-                elif mode_str == "asd":
-                    gamma = base_gamma * 0.5  # ASD: 약한 회전
-            # CognitiveMode 객체 처리 (선택적 의존성)
-            else:
-                try:
-                    from ...cognitive_modes import CognitiveMode
-                    if mode == CognitiveMode.ADHD:
-                        gamma = base_gamma * 1.5
-                    elif mode == CognitiveMode.ASD:
-                        gamma = base_gamma * 0.5
-                except ImportError:
-                    # CognitiveMode가 없으면 기본값 사용
-                    pass
+        gamma = self._mode_gamma(mode, base_gamma)
         
         # 이론적 최대 엔트로피 (균등 분포)
         max_entropy = math.log(len(options))
@@ -246,6 +339,88 @@ class DynamicsEngine:
         
         return auto_torque
     
+    def generate_torque_batch(
+        self,
+        lengths: Sequence[int],
+        entropies: np.ndarray,
+        mode: Optional[Union[str, Any]] = None,
+        base_gamma: Optional[float] = None,
+        omega: Optional[float] = None,
+        phase_index: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        여러 옵션 집합의 회전 토크를 한 번에 생성
+        
+        행 b는 generate_torque를 b번째로 호출한 것과 같다:
+        위상 φ_b에서 토크를 계산한 뒤 (옵션이 2개 이상이면) 위상을 ω만큼 진행.
+        
+        Args:
+            lengths: 행별 옵션 수
+            entropies: (B,) 행별 엔트로피
+            mode: 인지 모드
+            base_gamma: 기본 회전 토크 세기 (None이면 config)
+            omega: 세차 속도 (None이면 config)
+            phase_index: (B, K) 옵션별 위상 인덱스 (None이면 열 인덱스)
+            
+        Returns:
+            (B, K) 토크 배열 (패딩 위치와 옵션 1개 행은 0)
+        """
+        if base_gamma is None:
+            base_gamma = self.config.base_gamma
+        if omega is None:
+            omega = self.config.omega
+        gamma = self._mode_gamma(mode, base_gamma)
+        
+        lengths = np.asarray(lengths, dtype=int)
+        B = lengths.shape[0]
+        K = int(lengths.max()) if B else 0
+        
+        # 행별 위상: 순차 호출과 같은 연산 순서로 진행
+        phis = np.zeros(B, dtype=float)
+        strengths = np.zeros(B, dtype=float)
+        two_pi = 2 * math.pi
+        for b in range(B):
+            n = int(lengths[b])
+            if n <= 1:
+                continue
+            phis[b] = self.state.precession_phi
+            strengths[b] = gamma * (float(entropies[b]) / math.log(n))
+            self.state.precession_phi += omega
+            self.state.precession_phi %= two_pi
+            if self.state.precession_phi < 0:
+                self.state.precession_phi += two_pi
+        
+        if phase_index is None:
+            phase_index = np.broadcast_to(np.arange(K), (B, K))
+        psi = phase_index * 2 * math.pi / np.maximum(lengths, 1)[:, None]
+        valid = np.arange(K)[None, :] < lengths[:, None]
+        return strengths[:, None] * np.cos(phis[:, None] - psi) * valid
+    
+    @staticmethod
+    def _mode_gamma(mode: Optional[Union[str, Any]], base_gamma: float) -> float:
+        """모드별 gamma 조정 (독립 배포를 위해 유연하게 처리)"""
+        gamma = base_gamma
+        if mode is not None:
+            # 문자열 모드 처리
+            if isinstance(mode, str):
+                mode_str = mode.lower()
+                if mode_str == "adhd":
+                    gamma = base_gamma * 1.5  # ADHD: 더 강한 회전
+                elif mode_str == "asd":
+                    gamma = base_gamma * 0.5  # ASD: 약한 회전
+            # CognitiveMode 객체 처리 (선택적 의존성)
+            else:
+                try:
+                    from ...cognitive_modes import CognitiveMode
+                    if mode == CognitiveMode.ADHD:
+                        gamma = base_gamma * 1.5
+                    elif mode == CognitiveMode.ASD:
+                        gamma = base_gamma * 0.5
+                except ImportError:
+                    # CognitiveMode가 없으면 기본값 사용
+                    pass
+        return gamma
+    
     def check_cognitive_distress(
         self,
         entropy: float,
@@ -276,26 +451,54 @@ class DynamicsEngine:
         
         if entropy > entropy_threshold and core_strength < self.config.core_distress_threshold:
             self.state.cognitive_distress = True
-            return True, "기억이 안 나..."
+            return True, self.DISTRESS_MESSAGE
         else:
             self.state.cognitive_distress = False
             return False, ""
     
+    def check_cognitive_distress_batch(
+        self,
+        entropies: np.ndarray,
+        core_strength: float,
+        lengths: Sequence[int],
+    ) -> np.ndarray:
+        """
+        행별 인지적 절규 확인 (check_cognitive_distress의 배열 버전)
+        
+        state.cognitive_distress에는 마지막 행의 값이 남는다.
+        
+        Returns:
+            (B,) bool 배열
+        """
+        lengths = np.asarray(lengths, dtype=int)
+        max_entropy = np.log(np.maximum(lengths, 1))
+        distress = (
+            (lengths > 1)
+            & (np.asarray(entropies) > max_entropy * self.config.entropy_threshold_ratio)
+            & (core_strength < self.config.core_distress_threshold)
+        )
+        if distress.shape[0]:
+            self.state.cognitive_distress = bool(distress[-1])
+        return distress
+    
     def update_history(self, entropy: float, core_strength: float) -> None:
         """
         히스토리 업데이트
         
+        고정 용량 링 버퍼에 O(1)로 추가하며 평균/분산/EWMA를 함께 갱신한다.
+        
         Args:
             entropy: 엔트로피 값
             core_strength: 코어 강도 값
         """
-        self.state.entropy_history.append(entropy)
-        if len(self.state.entropy_history) > self.config.history_size:
-            self.state.entropy_history = self.state.entropy_history[-self.config.history_size:]
-        
-        self.state.core_strength_history.append(core_strength)
-        if len(self.state.core_strength_history) > self.config.history_size:
-            self.state.core_strength_history = self.state.core_strength_history[-self.config.history_size:]
+        history_size = self.config.history_size
+        if self.state.entropy_buffer.capacity != history_size:
+            # 설정 교체로 용량이 바뀐 경우 (최근 값 유지)
+            self.state.entropy_buffer.resize(history_size)
+            self.state.core_strength_buffer.resize(history_size)
+            self.state.history_size = history_size
+        self.state.entropy_buffer.append(entropy)
+        self.state.core_strength_buffer.append(core_strength)
     
     def reset(self) -> None:
         """상태 초기화"""
@@ -315,7 +518,9 @@ class DynamicsEngine:
             "precession_phi": self.state.precession_phi,
             "cognitive_distress": self.state.cognitive_distress,
             "persistent_core": self.state.persistent_core,
-            "entropy_history_length": len(self.state.entropy_history),
-            "core_strength_history_length": len(self.state.core_strength_history),
+            "entropy_history_length": len(self.state.entropy_buffer),
+            "core_strength_history_length": len(self.state.core_strength_buffer),
+            "entropy_stats": self.state.entropy_buffer.stats(),
+            "core_strength_stats": self.state.core_strength_buffer.stats(),
         }
 
@@ -0,0 +1,311 @@
+"""Fixed points and attractors of continuous dynamics.
+
+Solves the steady-state equation of NeuralDynamicsCore directly,
+
+    F(x) = -x + f(Wx + I + b) = 0,
+
+instead of integrating until the state stops moving. Newton iterations use
+the analytic Jacobian
+
+    J_F(x) = -Id + diag(f'(u)) W,    u = Wx + I + b,
+
+with f' taken from the activation (see get_activation_derivative). Many
+starts are solved together as a (batch, n) matrix with batched linear
+solves and a per-row backtracking line search on ||F||. The quasi-Newton
+variant ("broyden") factors the Jacobian once per start and then applies
+rank-one inverse updates, trading a few more iterations for O(n^2) work
+per iteration.
+
+Converged points are deduplicated and classified from the eigenvalues of
+the dynamics Jacobian J_F / tau:
+- "stable":   all Re(λ) < 0 (attractor)
+- "unstable": all Re(λ) > 0 (repeller)
+- "saddle":   both signs
+- "marginal": some |Re(λ)| below eig_tol (linearisation inconclusive)
+
+Noise and clip_state are ignored: the solver looks at the deterministic
+drift. Jacobians are dense n x n (a sparse W is densified), so this is
+intended for networks up to a few thousand units.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .neural_dynamics import get_activation_derivative, get_activation_inplace
+from .sparse import CSRMatrix
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .neural_dynamics import NeuralDynamicsCore
+
+METHODS = ("newton", "broyden")
+
+
+@dataclass
+class FixedPointConfig:
+    """Fixed-point solver configuration."""
+
+    method: str = "newton"  # "newton" | "broyden" (see module docstring)
+    tol: float = 1e-10  # converged when ||F(x)||_inf < tol
+    max_iter: int = 50
+    max_backtracks: int = 10  # step halvings per iteration
+    dedup_tol: float = 1e-6  # points closer than this (inf-norm) are merged
+    eig_tol: float = 1e-9  # |Re(λ)| below this counts as marginal
+    # starts solved together are chunked so chunk * n * n stays below this
+    max_jacobian_elements: int = 1 << 24
+
+    def validate(self) -> None:
+        if self.method not in METHODS:
+            raise ValueError(f"method must be one of {METHODS}, got {self.method!r}")
+        if self.tol <= 0.0:
+            raise ValueError("tol must be > 0")
+        if self.max_iter <= 0:
+            raise ValueError("max_iter must be > 0")
+        if self.max_backtracks < 0:
+            raise ValueError("max_backtracks must be >= 0")
+        if self.dedup_tol <= 0.0:
+            raise ValueError("dedup_tol must be > 0")
+        if self.eig_tol < 0.0:
+            raise ValueError("eig_tol must be >= 0")
+        if self.max_jacobian_elements <= 0:
+            raise ValueError("max_jacobian_elements must be > 0")
+
+
+@dataclass
+class FixedPoint:
+    """A distinct fixed point found by find_fixed_points()."""
+
+    x: np.ndarray  # state (n,)
+    residual: float  # ||F(x)||_inf
+    eigenvalues: np.ndarray  # eigenvalues of the dynamics Jacobian J_F / tau
+    stability: str  # "stable" | "unstable" | "saddle" | "marginal"
+    count: int  # number of starts that converged here
+
+    @property
+    def is_stable(self) -> bool:
+        return self.stability == "stable"
+
+
+class _Residual:
+    """F(x) = -x + f(Wx + c) for a batch of states, plus its Jacobian."""
+
+    def __init__(self, W: np.ndarray, c: np.ndarray, activation: str):
+        self.W = W
+        self.c = c
+        self.f = get_activation_inplace(activation)
+        self.fprime = get_activation_derivative(activation)
+        self.eye = np.eye(W.shape[0])
+
+    def __call__(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(u, f(u), F) for X (batch, n)."""
+        U = X @ self.W.T
+        U += self.c
+        FU = U.copy()
+        self.f(FU)
+        return U, FU, FU - X
+
+    def jacobian(self, U: np.ndarray, FU: np.ndarray) -> np.ndarray:
+        """J_F for each row: (batch, n, n)."""
+        J = self.fprime(U, FU)[:, :, np.newaxis] * self.W
+        J -= self.eye
+        return J
+
+
+def _solve(J: np.ndarray, R: np.ndarray) -> np.ndarray:
+    """Newton steps -J^{-1} R per row; least squares for singular rows."""
+    try:
+        return -np.linalg.solve(J, R[:, :, np.newaxis])[:, :, 0]
+    except np.linalg.LinAlgError:
+        return np.stack([-np.linalg.lstsq(j, r, rcond=None)[0] for j, r in zip(J, R)])
+
+
+def _inverse(J: np.ndarray) -> np.ndarray:
+    try:
+        return np.linalg.inv(J)
+    except np.linalg.LinAlgError:
+        return np.linalg.pinv(J)
+
+
+def _newton_chunk(
+    X: np.ndarray,
+    F: _Residual,
+    cfg: FixedPointConfig,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Solve F(x) = 0 from each row of X. Returns (X, ||F||_inf per row)."""
+    U, FU, R = F(X)
+    norm = np.linalg.norm(R, axis=1)
+    active = np.arange(len(X))
+    broyden = cfg.method == "broyden"
+    H = None  # per-row inverse Jacobians (broyden)
+    stale = np.ones(len(X), dtype=bool)  # broyden rows needing a fresh Jacobian
+
+    for _ in range(cfg.max_iter):
+        keep = np.abs(R[active]).max(axis=1) >= cfg.tol
+        active = active[keep]
+        if broyden and H is not None:
+            H = H[keep]
+        if len(active) == 0:
+            break
+
+        Xa, Ra = X[active], R[active]
+        if not broyden:
+            step = _solve(F.jacobian(U[active], FU[active]), Ra)
+        else:
+            if H is None:
+                H = np.empty((len(active), X.shape[1], X.shape[1]))
+            refresh = stale[active]
+            if refresh.any():
+                rows = active[refresh]
+                H[refresh] = _inverse(F.jacobian(U[rows], FU[rows]))
+                stale[rows] = False
+            step = -np.einsum("kij,kj->ki", H, Ra)
+
+        # backtracking: halve the step of every row whose residual grew
+        alpha = np.ones(len(active))
+        pending = np.arange(len(active))
+        for attempt in range(cfg.max_backtracks + 1):
+            Xt = Xa[pending] + alpha[pending, np.newaxis] * step[pending]
+            Ut, FUt, Rt = F(Xt)
+            nt = np.linalg.norm(Rt, axis=1)
+            ok = nt < norm[active[pending]]
+            # out of halvings: accept the smallest step anyway
+            take = ok | (attempt == cfg.max_backtracks)
+            rows = active[pending[take]]
+            X[rows], U[rows], FU[rows], R[rows] = Xt[take], Ut[take], FUt[take], Rt[take]
+            norm[rows] = nt[take]
+            if broyden:
+                stale[active[pending[~ok & take]]] = True
+            pending = pending[~take]
+            if len(pending) == 0:
+                break
+            alpha[pending] *= 0.5
+
+        if broyden:
+            # good Broyden: H += (s - H y) (s^T H) / (s^T H y)
+            s = X[active] - Xa
+            y = R[active] - Ra
+            Hy = np.einsum("kij,kj->ki", H, y)
+            sH = np.einsum("ki,kij->kj", s, H)
+            denom = np.einsum("ki,ki->k", s, Hy)
+            usable = (np.abs(denom) > 1e-300) & ~stale[active]
+            if usable.any():
+                H[usable] += (
+                    (s[usable] - Hy[usable])[:, :, np.newaxis]
+                    * sH[usable][:, np.newaxis, :]
+                    / denom[usable][:, np.newaxis, np.newaxis]
+                )
+
+    return X, np.abs(R).max(axis=1)
+
+
+def _classify(eigenvalues: np.ndarray, eig_tol: float) -> str:
+    re = eigenvalues.real
+    if np.any(np.abs(re) <= eig_tol):
+        return "marginal"
+    if np.all(re < 0.0):
+        return "stable"
+    if np.all(re > 0.0):
+        return "unstable"
+    return "saddle"
+
+
+def _default_starts(num_starts: int, n: int, activation: str, rng: np.random.Generator) -> np.ndarray:
+    """Starts drawn from the range of f (every fixed point satisfies x = f(u))."""
+    X = rng.standard_normal((num_starts, n)) * 2.0
+    get_activation_inplace(activation)(X)
+    return X
+
+
+def find_fixed_points(
+    core: "NeuralDynamicsCore",
+    X0: Optional[Sequence[Sequence[float]]] = None,
+    num_starts: int = 64,
+    I: Optional[Sequence[float]] = None,
+    config: Optional[FixedPointConfig] = None,
+    seed: Optional[int] = None,
+) -> List[FixedPoint]:
+    """Find distinct fixed points of core's dynamics from many starts.
+
+    Args:
+        core: NeuralDynamicsCore (either backend; dense or sparse W)
+        X0: initial guesses, shape (batch, n); if None, num_starts random
+            states drawn from the range of the activation
+        num_starts: number of random starts when X0 is None
+        I: constant external input (length n)
+        config: FixedPointConfig
+        seed: seed for the random starts (default: the core's generator)
+
+    Returns:
+        Distinct converged fixed points, most frequently reached first.
+        Starts that do not converge within max_iter are dropped.
+    """
+    cfg = config or FixedPointConfig()
+    cfg.validate()
+    n = core.n
+
+    W = core.W
+    if isinstance(W, CSRMatrix):
+        W = W.to_dense()
+    W = np.asarray(W, dtype=float)
+    c = np.array(core.b, dtype=float)
+    if I is not None:
+        I_arr = np.asarray(I, dtype=float)
+        if I_arr.shape != (n,):
+            raise ValueError("I must have length n")
+        c += I_arr
+
+    if X0 is None:
+        if num_starts <= 0:
+            raise ValueError("num_starts must be > 0")
+        rng = np.random.default_rng(seed) if seed is not None else core._rng
+        X = _default_starts(num_starts, n, core.config.activation, rng)
+    else:
+        X = np.array(X0, dtype=float)
+        if X.ndim != 2 or X.shape[1] != n:
+            raise ValueError("X0 must have shape (batch, n)")
+
+    F = _Residual(W, c, core.config.activation)
+    chunk = max(1, cfg.max_jacobian_elements // (n * n))
+    solved, residuals = [], []
+    for start in range(0, len(X), chunk):
+        Xc, rc = _newton_chunk(X[start:start + chunk].copy(), F, cfg)
+        solved.append(Xc)
+        residuals.append(rc)
+    if not solved:
+        return []
+    X = np.concatenate(solved)
+    residual = np.concatenate(residuals)
+    ok = residual < cfg.tol
+    X, residual = X[ok], residual[ok]
+
+    # greedy deduplication against the representatives found so far
+    reps: List[int] = []
+    counts: List[int] = []
+    for i in range(len(X)):
+        if reps:
+            dist = np.abs(X[reps] - X[i]).max(axis=1)
+            j = int(np.argmin(dist))
+            if dist[j] < cfg.dedup_tol:
+                counts[j] += 1
+                if residual[i] < residual[reps[j]]:
+                    reps[j] = i
+                continue
+        reps.append(i)
+        counts.append(1)
+
+    points = []
+    for i, count in zip(reps, counts):
+        U, FU, _ = F(X[i:i + 1])
+        eigenvalues = np.linalg.eigvals(F.jacobian(U, FU)[0]) / core.config.tau
+        points.append(FixedPoint(
+            x=X[i].copy(),
+            residual=float(residual[i]),
+            eigenvalues=eigenvalues,
+            stability=_classify(eigenvalues, cfg.eig_tol),
+            count=count,
+        ))
+    points.sort(key=lambda p: -p.count)
+    return points
@@ -9,6 +9,8 @@ Version: 2.0.1+
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+from .ring_buffer import RingBuffer
+
 
 @dataclass
 class DynamicsState:
@@ -30,9 +32,24 @@ class DynamicsState:
     # 인지적 절규 상태
     cognitive_distress: bool = False  # 인지적 절규 상태
     
-    # 히스토리
-    entropy_history: List[float] = field(default_factory=list)
-    core_strength_history: List[float] = field(default_factory=list)
+    # 히스토리 (고정 용량 링 버퍼, 누적 통계 포함)
+    history_size: int = 100
+    entropy_buffer: RingBuffer = field(init=False, repr=False)
+    core_strength_buffer: RingBuffer = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        self.entropy_buffer = RingBuffer(self.history_size)
+        self.core_strength_buffer = RingBuffer(self.history_size)
+    
+    @property
+    def entropy_history(self) -> List[float]:
+        """엔트로피 히스토리 (오래된 것부터, 리스트 복사본)"""
+        return self.entropy_buffer.tolist()
+    
+    @property
+    def core_strength_history(self) -> List[float]:
+        """코어 강도 히스토리 (오래된 것부터, 리스트 복사본)"""
+        return self.core_strength_buffer.tolist()
     
     def reset(self) -> None:
         """상태 초기화"""
@@ -42,8 +59,8 @@ class DynamicsState:
         self.persistent_core = None
         self.last_decay_time = None
         self.cognitive_distress = False
-        self.entropy_history.clear()
-        self.core_strength_history.clear()
+        self.entropy_buffer.clear()
+        self.core_strength_buffer.clear()
     
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
@@ -54,7 +71,7 @@ class DynamicsState:
             "persistent_core": self.persistent_core,
             "last_decay_time": self.last_decay_time,
             "cognitive_distress": self.cognitive_distress,
-            "entropy_history_length": len(self.entropy_history),
-            "core_strength_history_length": len(self.core_strength_history),
+            "entropy_history_length": len(self.entropy_buffer),
+            "core_strength_history_length": len(self.core_strength_buffer),
         }
 
@@ -14,8 +14,23 @@ Where:
 - f: nonlinearity
 - τ: time constant
 
+Integrators (config.integrator):
+- "euler":  Euler-Maruyama, 1 RHS evaluation per step (default)
+- "rk4":    classic 4th-order Runge-Kutta (deterministic)
+- "dopri5": adaptive Dormand-Prince 5(4) with error control (deterministic);
+            dt is the output interval, internal substeps adapt to rtol/atol
+- "heun":   stochastic Heun predictor-corrector (2nd order when noise_scale=0)
+Step/substep/rejected/RHS-evaluation counts are kept in core.stats.
+
+Fixed points can be solved for directly (Newton / quasi-Newton from many
+starts, classified by Jacobian eigenvalues) with core.fixed_points(); see
+fixed_points.py.
+
 Design goals:
-- Minimal (pure Python, no heavy deps)
+- Minimal (pure-Python reference backend)
+- Optional NumPy backend (config.backend="numpy") for large networks:
+  vectorised activations, in-place buffers reused across steps, and
+  trajectories preallocated as a (steps + 1, n) array
 - Deterministic-by-default (noise_scale=0)
 - Easy to observe attractors / convergence under continuous-time dynamics
 
@@ -25,13 +40,32 @@ Author: GNJz (Qquarts)
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Sequence
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 import math
-import random
+
+import numpy as np
+
+from .sparse import CSRMatrix, as_csr
 
 Vector = List[float]
 Matrix = List[List[float]]
 
+BACKENDS = ("python", "numpy")
+INTEGRATORS = ("euler", "rk4", "dopri5", "heun")
+
+# Dormand-Prince 5(4) tableau (autonomous RHS within a step: nodes unused)
+_DP_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+)
+_DP_B5 = (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84)
+# b5 - b4 (7th stage weight -1/40 applies to the FSAL stage f(x_next))
+_DP_E = (71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40)
+
 
 def _tanh(x: float) -> float:
     return math.tanh(x)
@@ -63,6 +97,72 @@ def get_activation(name: str) -> Callable[[float], float]:
     raise ValueError(f"Unknown activation: {name}")
 
 
+def _np_tanh(u: np.ndarray) -> None:
+    np.tanh(u, out=u)
+
+
+def _np_sigmoid(u: np.ndarray) -> None:
+    # sigmoid(u) = (1 + tanh(u/2)) / 2: stable for large |u|, no temporaries
+    u *= 0.5
+    np.tanh(u, out=u)
+    u += 1.0
+    u *= 0.5
+
+
+def _np_relu(u: np.ndarray) -> None:
+    np.maximum(u, 0.0, out=u)
+
+
+def _np_identity(u: np.ndarray) -> None:
+    pass
+
+
+_NP_ACTIVATIONS: Dict[str, Callable[[np.ndarray], None]] = {
+    "tanh": _np_tanh,
+    "sigmoid": _np_sigmoid,
+    "logistic": _np_sigmoid,
+    "relu": _np_relu,
+    "linear": _np_identity,
+    "identity": _np_identity,
+}
+
+
+# f'(u) given u and f(u) (for Jacobians: J = -I + diag(f'(u)) W)
+_NP_DERIVATIVES: Dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    "tanh": lambda u, fu: 1.0 - fu * fu,
+    "sigmoid": lambda u, fu: fu * (1.0 - fu),
+    "logistic": lambda u, fu: fu * (1.0 - fu),
+    "relu": lambda u, fu: (u > 0.0).astype(float),
+    "linear": lambda u, fu: np.ones_like(u),
+    "identity": lambda u, fu: np.ones_like(u),
+}
+
+
+def _apply_weights(W, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """W @ x for a state (n,), X @ W.T for a batch (batch, n); W dense or CSR."""
+    if isinstance(W, CSRMatrix):
+        return W.dot(x, out=out)
+    if x.ndim == 1:
+        return np.dot(W, x, out=out)
+    return np.matmul(x, W.T, out=out)
+
+
+def get_activation_inplace(name: str) -> Callable[[np.ndarray], None]:
+    """Vectorised activation applied in place to a float64 array."""
+    try:
+        return _NP_ACTIVATIONS[name.lower().strip()]
+    except KeyError:
+        raise ValueError(f"Unknown activation: {name}") from None
+
+
+def get_activation_derivative(name: str) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """Vectorised f'(u), computed from u and the already evaluated f(u)."""
+    try:
+        return _NP_DERIVATIVES[name.lower().strip()]
+    except KeyError:
+        raise ValueError(f"Unknown activation: {name}") from None
+
+
 @dataclass
 class ContinuousDynamicsConfig:
     """Configuration for continuous-time dynamics."""
@@ -77,6 +177,17 @@ class ContinuousDynamicsConfig:
     # optional clipping for numerical safety
     clip_state: Optional[float] = None  # if set, clip x to [-clip, clip]
 
+    # "python" (lists, reference) or "numpy" (ndarray states/trajectories)
+    backend: str = "python"
+
+    # "euler" | "rk4" | "dopri5" | "heun" (see module docstring)
+    integrator: str = "euler"
+
+    # dopri5 error control: per-component tolerance atol + rtol * |x|
+    rtol: float = 1e-6
+    atol: float = 1e-9
+    max_substeps: int = 10000  # dopri5 substeps allowed per output step
+
     def validate(self) -> None:
         if self.dt <= 0.0:
             raise ValueError("dt must be > 0")
@@ -86,39 +197,125 @@ class ContinuousDynamicsConfig:
             raise ValueError("noise_scale must be >= 0")
         if self.clip_state is not None and self.clip_state <= 0.0:
             raise ValueError("clip_state must be > 0 when provided")
+        if self.backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got {self.backend!r}")
+        if self.integrator not in INTEGRATORS:
+            raise ValueError(f"integrator must be one of {INTEGRATORS}, got {self.integrator!r}")
+        if self.noise_scale > 0.0 and self.integrator in ("rk4", "dopri5"):
+            raise ValueError(f"integrator {self.integrator!r} is deterministic; use 'euler' or 'heun' with noise")
+        if self.rtol <= 0.0 or self.atol <= 0.0:
+            raise ValueError("rtol and atol must be > 0")
+        if self.max_substeps <= 0:
+            raise ValueError("max_substeps must be > 0")
+
+
+@dataclass
+class IntegratorStats:
+    """Work counters accumulated by NeuralDynamicsCore (reset with reset_stats()).
+
+    - steps: output steps taken (one per step() / run() iteration; a batched
+      step counts once)
+    - substeps: accepted internal steps (== steps except for dopri5)
+    - rejected: dopri5 substeps rejected by error control
+    - rhs_evals: evaluations of -x + f(Wx + I + b)
+    """
+
+    steps: int = 0
+    substeps: int = 0
+    rejected: int = 0
+    rhs_evals: int = 0
 
 
 class NeuralDynamicsCore:
-    """Minimal continuous-time recurrent dynamics simulator."""
+    """Minimal continuous-time recurrent dynamics simulator.
+
+    With config.backend="numpy", W and b are float64 arrays, step() returns
+    an ndarray and run() returns a (steps_taken + 1, n) trajectory array (or
+    the final state). Results match the Python backend to floating-point
+    tolerance when noise_scale=0.
+
+    The NumPy backend also accepts a sparse W (CSRMatrix, or a SciPy sparse
+    matrix converted via .tocsr()); every product then costs O(nnz).
+    """
 
     def __init__(
         self,
         W: Matrix,
         b: Optional[Sequence[float]] = None,
         config: Optional[ContinuousDynamicsConfig] = None,
-        seed: Optional[int] = None,
+        seed: Union[None, int, np.random.SeedSequence, np.random.Generator] = None,
     ):
+        """
+        Args:
+            W: recurrent weights (n x n), dense or sparse (see class docstring)
+            b: bias vector (length n), defaults to zeros
+            config: ContinuousDynamicsConfig
+            seed: noise source: an int, a SeedSequence (e.g. one of
+                SeedSequence(root).spawn(k) for parallel runs) or a Generator.
+                Each core owns its generator, so cores in different threads or
+                processes draw independent, reproducible streams.
+        """
         self.config = config or ContinuousDynamicsConfig()
         self.config.validate()
+        self._numpy = self.config.backend == "numpy"
 
-        if seed is not None:
-            random.seed(seed)
-
-        self.W: Matrix = [list(row) for row in W]
-        self.n: int = len(self.W)
-        if self.n == 0:
-            raise ValueError("W must be non-empty")
-        if any(len(row) != self.n for row in self.W):
-            raise ValueError("W must be a square matrix")
+        # per-instance noise generator (never the global random state)
+        self._rng = np.random.default_rng(seed)
+        self.stats = IntegratorStats()
+        self._h: Optional[float] = None  # last accepted dopri5 substep
 
+        self.W = W
         if b is None:
-            self.b = [0.0 for _ in range(self.n)]
-        else:
-            if len(b) != self.n:
-                raise ValueError("bias vector b must have length n")
-            self.b = list(b)
+            b = [0.0] * self.n
+        elif len(b) != self.n:
+            raise ValueError("bias vector b must have length n")
+        self.b = np.array(b, dtype=float) if self._numpy else list(b)
 
         self.f = get_activation(self.config.activation)
+        self._f_inplace = get_activation_inplace(self.config.activation)
+        if self._numpy:
+            # scratch buffers reused by every step
+            self._u = np.empty(self.n)
+            self._delta = np.empty(self.n)
+
+    @property
+    def W(self):
+        return self._W
+
+    @W.setter
+    def W(self, W: Matrix) -> None:
+        n_prev = self.__dict__.get("n")
+        sparse = as_csr(W)
+        if sparse is not None:
+            # stored as given (not copied) so large networks are not duplicated
+            if not self._numpy:
+                raise ValueError("sparse W requires backend='numpy'")
+            if n_prev is not None and sparse.n != n_prev:
+                raise ValueError("W must keep its n x n shape")
+            self._W = sparse
+            self.n = sparse.n
+            return
+        if self._numpy:
+            W_arr = np.array(W, dtype=float)
+            if W_arr.ndim != 2 or W_arr.shape[0] == 0:
+                raise ValueError("W must be non-empty")
+            if W_arr.shape[0] != W_arr.shape[1]:
+                raise ValueError("W must be a square matrix")
+            if n_prev is not None and W_arr.shape[0] != n_prev:
+                raise ValueError("W must keep its n x n shape")
+            self._W = W_arr
+            self.n = W_arr.shape[0]
+            return
+        W_list: Matrix = [list(row) for row in W]
+        n = len(W_list)
+        if n == 0:
+            raise ValueError("W must be non-empty")
+        if any(len(row) != n for row in W_list):
+            raise ValueError("W must be a square matrix")
+        if n_prev is not None and n != n_prev:
+            raise ValueError("W must keep its n x n shape")
+        self._W = W_list
+        self.n = n
 
     def _matvec(self, x: Sequence[float]) -> Vector:
         out = [0.0] * self.n
@@ -130,12 +327,172 @@ class NeuralDynamicsCore:
             out[i] = s
         return out
 
+    def _as_vector(self, v: Sequence[float], name: str) -> np.ndarray:
+        arr = np.asarray(v, dtype=float)
+        if arr.shape != (self.n,):
+            raise ValueError(f"{name} must have length n")
+        return arr
+
+    def reset_stats(self) -> None:
+        """Zero the integrator work counters."""
+        self.stats = IntegratorStats()
+
+    def _rhs(self, x: np.ndarray, I: Optional[np.ndarray], W: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """(-x + f(Wx + I + b)) / tau as a new array ((n,) or (batch, n))."""
+        u = _apply_weights(W, x)
+        if I is not None:
+            u += I
+        u += b
+        self._f_inplace(u)
+        u -= x
+        u /= self.config.tau
+        self.stats.rhs_evals += 1
+        return u
+
+    def _advance_rk4(self, x, I, W, b) -> np.ndarray:
+        h = self.config.dt
+        k1 = self._rhs(x, I, W, b)
+        k2 = self._rhs(x + (0.5 * h) * k1, I, W, b)
+        k3 = self._rhs(x + (0.5 * h) * k2, I, W, b)
+        k4 = self._rhs(x + h * k3, I, W, b)
+        self.stats.substeps += 1
+        return x + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+
+    def _advance_heun(self, x, I, W, b) -> np.ndarray:
+        cfg = self.config
+        h = cfg.dt
+        f0 = self._rhs(x, I, W, b)
+        noise = None
+        predictor = x + h * f0
+        if cfg.noise_scale > 0.0:
+            noise = self._rng.standard_normal(x.shape)
+            noise *= cfg.noise_scale * math.sqrt(h)
+            predictor += noise
+        f1 = self._rhs(predictor, I, W, b)
+        x_next = x + (0.5 * h) * (f0 + f1)
+        if noise is not None:
+            x_next += noise
+        self.stats.substeps += 1
+        return x_next
+
+    def _advance_dopri5(self, x, I, W, b) -> np.ndarray:
+        """Integrate over one output interval dt with adaptive substeps."""
+        cfg = self.config
+        remaining = cfg.dt
+        h_next = self._h or cfg.dt  # proposed substep, carried across output steps
+        k1 = self._rhs(x, I, W, b)
+        for _ in range(cfg.max_substeps):
+            h = min(h_next, remaining)
+            k = [k1]
+            for a in _DP_A[1:]:
+                y = x.copy()
+                for a_j, k_j in zip(a, k):
+                    y += (h * a_j) * k_j
+                k.append(self._rhs(y, I, W, b))
+            x_new = x.copy()
+            for b_j, k_j in zip(_DP_B5, k):
+                if b_j:
+                    x_new += (h * b_j) * k_j
+            k7 = self._rhs(x_new, I, W, b)  # FSAL: first stage of the next substep
+
+            err = np.zeros_like(x)
+            for e_j, k_j in zip(_DP_E, k + [k7]):
+                if e_j:
+                    err += (h * e_j) * k_j
+            scale = cfg.atol + cfg.rtol * np.maximum(np.abs(x), np.abs(x_new))
+            err_norm = float(np.sqrt(np.mean((err / scale) ** 2)))
+            factor = 5.0 if err_norm == 0.0 else min(5.0, max(0.2, 0.9 * err_norm ** -0.2))
+
+            if err_norm <= 1.0:
+                self.stats.substeps += 1
+                remaining -= h
+                x, k1 = x_new, k7
+                # a substep shortened to hit the interval end says nothing about h_next
+                h_next = max(h_next, h * factor) if h < h_next else h * factor
+                if remaining <= 1e-12 * cfg.dt:
+                    self._h = h_next
+                    return x
+            else:
+                self.stats.rejected += 1
+                h_next = h * factor
+        raise RuntimeError(
+            f"dopri5 exceeded max_substeps={cfg.max_substeps} within one dt; "
+            "loosen rtol/atol or reduce dt"
+        )
+
+    _ADVANCE = {
+        "rk4": _advance_rk4,
+        "heun": _advance_heun,
+        "dopri5": _advance_dopri5,
+    }
+
+    def _step_into(
+        self,
+        x: np.ndarray,
+        I: Optional[np.ndarray],
+        out: np.ndarray,
+        u: Optional[np.ndarray] = None,
+        W: Optional[np.ndarray] = None,
+        b: Optional[np.ndarray] = None,
+    ) -> None:
+        """NumPy integration step writing x_next into out (out must not alias x).
+
+        x may be a single state (n,) or a batch of states (batch, n); u is a
+        scratch buffer of the same shape (defaults to the core's own buffer).
+        Euler-Maruyama runs fully in place; the other integrators allocate
+        their stage vectors.
+        """
+        W = self._W if W is None else W
+        cfg = self.config
+        self.stats.steps += 1
+        if cfg.integrator != "euler":
+            out[...] = self._ADVANCE[cfg.integrator](self, x, I, W, self.b if b is None else b)
+            if cfg.clip_state is not None:
+                np.clip(out, -cfg.clip_state, cfg.clip_state, out=out)
+            return
+
+        self.stats.substeps += 1
+        self.stats.rhs_evals += 1
+        if u is None:
+            u = self._u
+        _apply_weights(W, x, out=u)
+        if I is not None:
+            u += I
+        u += self.b if b is None else b
+        self._f_inplace(u)
+
+        # out = x + (dt/tau) * (f(u) - x)
+        np.subtract(u, x, out=u)
+        u *= cfg.dt / cfg.tau
+        np.add(x, u, out=out)
+
+        if cfg.noise_scale > 0.0:
+            self._rng.standard_normal(out=u)
+            u *= cfg.noise_scale * math.sqrt(cfg.dt)
+            out += u
+        if cfg.clip_state is not None:
+            np.clip(out, -cfg.clip_state, cfg.clip_state, out=out)
+
     def step(
         self,
         x: Sequence[float],
         I: Optional[Sequence[float]] = None,
-    ) -> Vector:
-        """One Euler-Maruyama step."""
+    ):
+        """One integration step of length dt (config.integrator, default Euler-Maruyama)."""
+        if self._numpy or self.config.integrator != "euler":
+            x_arr = self._as_vector(x, "x")
+            I_arr = None if I is None else self._as_vector(I, "I")
+            x_next = np.empty(self.n)
+            if self._numpy:
+                self._step_into(x_arr, I_arr, x_next)
+                return x_next
+            # Python backend: higher-order integrators use NumPy stage arithmetic
+            self._step_into(
+                x_arr, I_arr, x_next,
+                W=np.array(self._W, dtype=float), b=np.array(self.b, dtype=float),
+            )
+            return x_next.tolist()
+
         if len(x) != self.n:
             raise ValueError("x must have length n")
         if I is None:
@@ -153,13 +510,19 @@ class NeuralDynamicsCore:
         tau = self.config.tau
         k = dt / tau
 
+        self.stats.steps += 1
+        self.stats.substeps += 1
+        self.stats.rhs_evals += 1
+        noise = None
+        if self.config.noise_scale > 0.0:
+            noise = (self._rng.standard_normal(self.n) * (self.config.noise_scale * math.sqrt(dt))).tolist()
         x_next = [0.0] * self.n
         for i in range(self.n):
             drift = -x[i] + fx[i]
             v = x[i] + k * drift
 
-            if self.config.noise_scale > 0.0:
-                v += random.gauss(0.0, self.config.noise_scale * math.sqrt(dt))
+            if noise is not None:
+                v += noise[i]
 
             if self.config.clip_state is not None:
                 c = self.config.clip_state
@@ -188,10 +551,14 @@ class NeuralDynamicsCore:
             input_schedule: optional callable mapping step_idx -> I vector
             stop_tol: stop early when ||x_{t+1}-x_t||_inf < stop_tol
             return_trajectory: if True returns list of x; else returns final x
+                (NumPy backend: a (steps_taken + 1, n) array / final ndarray)
         """
         if steps <= 0:
             raise ValueError("steps must be > 0")
 
+        if self._numpy:
+            return self._run_numpy(x0, steps, input_schedule, stop_tol, return_trajectory)
+
         x = list(x0)
         if len(x) != self.n:
             raise ValueError("x0 must have length n")
@@ -216,11 +583,142 @@ class NeuralDynamicsCore:
 
         return traj if return_trajectory else x
 
+    def _run_numpy(
+        self,
+        x0: Sequence[float],
+        steps: int,
+        input_schedule: Optional[Callable[[int], Sequence[float]]],
+        stop_tol: Optional[float],
+        return_trajectory: bool,
+    ) -> np.ndarray:
+        x = self._as_vector(x0, "x0")
+        if return_trajectory:
+            # each step writes straight into the next trajectory row
+            traj = np.empty((steps + 1, self.n))
+            traj[0] = x
+        else:
+            buffers = (x.copy(), np.empty(self.n))
+
+        cur = traj[0] if return_trajectory else buffers[0]
+        taken = steps
+        for t in range(steps):
+            I = None if input_schedule is None else self._as_vector(input_schedule(t), "I")
+            nxt = traj[t + 1] if return_trajectory else buffers[(t + 1) % 2]
+            self._step_into(cur, I, nxt)
+
+            if stop_tol is not None:
+                np.subtract(nxt, cur, out=self._delta)
+                np.abs(self._delta, out=self._delta)
+                if self._delta.max() < stop_tol:
+                    cur = nxt
+                    taken = t + 1
+                    break
+            cur = nxt
+
+        if not return_trajectory:
+            return cur.copy()
+        # early stop: don't keep the unused tail of the preallocated buffer alive
+        return traj if taken == steps else traj[: taken + 1].copy()
+
+    def run_batch(
+        self,
+        X0: Sequence[Sequence[float]],
+        steps: int,
+        input_schedule: Optional[Callable[[int], Sequence[float]]] = None,
+        stop_tol: Optional[float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Integrate many initial conditions of the same network at once.
+
+        Rows are integrated together as a (batch, n) matrix. With stop_tol,
+        each row stops as soon as its own ||x_{t+1}-x_t||_inf < stop_tol and
+        is removed from the active set, so later steps only cost the rows
+        that are still moving. Works with either backend.
+
+        Args:
+            X0: initial states, shape (batch, n)
+            steps: maximum number of integration steps
+            input_schedule: optional callable mapping step_idx -> I, either
+                one (n,) vector shared by all rows or a (batch, n) matrix
+            stop_tol: per-row early stopping tolerance
+
+        Returns:
+            (final states (batch, n), convergence step per row; -1 if the
+            row did not meet stop_tol within steps)
+        """
+        if steps <= 0:
+            raise ValueError("steps must be > 0")
+        X = np.array(X0, dtype=float)
+        if X.ndim != 2 or X.shape[1] != self.n:
+            raise ValueError("X0 must have shape (batch, n)")
+        batch = X.shape[0]
+        converged_at = np.full(batch, -1, dtype=np.int64)
+        if batch == 0:
+            return X, converged_at
+
+        W = self._W if self._numpy else np.array(self._W, dtype=float)
+        b = self.b if self._numpy else np.array(self.b, dtype=float)
+
+        # active rows live at the front of two ping-pong buffers
+        active = np.arange(batch)
+        cur, nxt, u = X.copy(), np.empty_like(X), np.empty_like(X)
+        delta = np.empty(batch)
+        m = batch
+        for t in range(steps):
+            I = None
+            if input_schedule is not None:
+                I = np.asarray(input_schedule(t), dtype=float)
+                if I.shape == (batch, self.n):
+                    I = I[active]
+                elif I.shape != (self.n,):
+                    raise ValueError("I must have shape (n,) or (batch, n)")
+            self._step_into(cur[:m], I, nxt[:m], u=u[:m], W=W, b=b)
+
+            if stop_tol is not None:
+                np.subtract(nxt[:m], cur[:m], out=u[:m])
+                np.abs(u[:m], out=u[:m])
+                np.max(u[:m], axis=1, out=delta[:m])
+                done = delta[:m] < stop_tol
+                if done.any():
+                    X[active[done]] = nxt[:m][done]
+                    converged_at[active[done]] = t + 1
+                    keep = ~done
+                    active = active[keep]
+                    m = len(active)
+                    nxt[:m] = nxt[:len(keep)][keep]
+                    if m == 0:
+                        break
+            cur, nxt = nxt, cur
+
+        X[active] = cur[:m]
+        return X, converged_at
+
+    def fixed_points(
+        self,
+        X0: Optional[Sequence[Sequence[float]]] = None,
+        num_starts: int = 64,
+        I: Optional[Sequence[float]] = None,
+        config=None,
+        seed: Optional[int] = None,
+    ) -> list:
+        """Solve -x + f(Wx + I + b) = 0 directly from many starts.
+
+        Shortcut for fixed_points.find_fixed_points(self, ...): returns the
+        distinct fixed points (FixedPoint) with their Jacobian eigenvalues
+        and stability, most frequently reached first.
+        """
+        from .fixed_points import find_fixed_points
+
+        return find_fixed_points(self, X0, num_starts=num_starts, I=I, config=config, seed=seed)
+
     def hopfield_energy(self, x: Sequence[float]) -> float:
         """Optional energy for symmetric W (Hopfield-style, rate-coded).
 
         Note: meaningful primarily when W is symmetric and f is monotone.
         """
+        if self._numpy:
+            x_arr = self._as_vector(x, "x")
+            return float(-0.5 * (x_arr @ _apply_weights(self._W, x_arr)) - self.b @ x_arr)
+
         if len(x) != self.n:
             raise ValueError("x must have length n")
         e = 0.0
@@ -231,5 +729,3 @@ class NeuralDynamicsCore:
         for i in range(self.n):
             e -= self.b[i] * x[i]
         return e
-
-
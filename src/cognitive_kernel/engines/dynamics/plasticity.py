@@ -2,6 +2,8 @@
 
 This module intentionally starts minimal:
 - Hebbian (rate-based) update with optional weight decay + clipping.
+- In-place NumPy variants (optionally masked or on sparse CSR synapses) and
+  a batched variant applying a sequence of activity vectors in one call.
 
 It is meant to connect the continuous-time dynamics core to learning/adaptation.
 """
@@ -9,7 +11,11 @@ It is meant to connect the continuous-time dynamics core to learning/adaptation.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Sequence, Optional
+from typing import List, Sequence, Optional, Tuple, Union
+
+import numpy as np
+
+from .sparse import CSRMatrix, as_csr
 
 Matrix = List[List[float]]
 
@@ -32,59 +38,168 @@ class HebbianPlasticityConfig:
 
 
 def hebbian_update(
-    W: Matrix,
+    W: Union[Matrix, CSRMatrix],
     pre: Sequence[float],
     post: Optional[Sequence[float]] = None,
     config: Optional[HebbianPlasticityConfig] = None,
-) -> Matrix:
+) -> Union[Matrix, CSRMatrix]:
     """Apply a single Hebbian update: Δw_ij = η * pre_i * post_j - decay*w_ij.
 
     Args:
-        W: weight matrix (n x n)
+        W: weight matrix (n x n), or a sparse CSRMatrix (SciPy sparse is
+            converted); sparse matrices only update existing synapses
         pre: presynaptic activity vector (length n)
         post: postsynaptic activity vector (length n). If None, uses pre (symmetric).
         config: HebbianPlasticityConfig
 
     Returns:
-        Updated weight matrix (new copy).
+        Updated weight matrix (new copy; CSRMatrix for sparse input).
+        Use hebbian_update_inplace() to avoid the copy.
     """
-    cfg = config or HebbianPlasticityConfig()
-    cfg.validate()
+    sparse = as_csr(W)
+    if sparse is not None:
+        return hebbian_update_inplace(sparse.copy(), pre, post, config)
 
     n = len(W)
     if n == 0 or any(len(row) != n for row in W):
         raise ValueError("W must be a non-empty square matrix")
-    if len(pre) != n:
-        raise ValueError("pre must have length n")
-    if post is None:
-        post_vec = list(pre)
-    else:
-        if len(post) != n:
-            raise ValueError("post must have length n")
-        post_vec = list(post)
-
-    eta = cfg.eta
-    decay = cfg.weight_decay
-
-    W_new: Matrix = [list(row) for row in W]
-    for i in range(n):
-        for j in range(n):
-            dw = eta * pre[i] * post_vec[j]
-            if decay > 0.0:
-                dw -= decay * W_new[i][j]
-            W_new[i][j] += dw
-
-    if cfg.clip_weight is not None:
-        c = cfg.clip_weight
-        for i in range(n):
-            for j in range(n):
-                v = W_new[i][j]
-                if v > c:
-                    v = c
-                elif v < -c:
-                    v = -c
-                W_new[i][j] = v
-
-    return W_new
+    W_new = np.array(W, dtype=float)
+    hebbian_update_inplace(W_new, pre, post, config)
+    return W_new.tolist()
+
+
+def _prepare(
+    W: Union[np.ndarray, CSRMatrix],
+    mask: Optional[np.ndarray],
+) -> Tuple[int, Optional[np.ndarray], Optional[np.ndarray]]:
+    """Validate W for in-place updates; returns (n, rows, cols) of the updated
+    subset (rows/cols None for a full dense update)."""
+    if isinstance(W, CSRMatrix):
+        if mask is not None:
+            raise ValueError("mask is not supported for sparse W (only stored synapses are updated)")
+        return W.n, W.rows, W.indices
+    if not isinstance(W, np.ndarray) or W.dtype != np.float64:
+        raise ValueError("in-place updates need a float64 numpy array or CSRMatrix")
+    if W.ndim != 2 or W.shape[0] == 0 or W.shape[0] != W.shape[1]:
+        raise ValueError("W must be a non-empty square matrix")
+    if mask is None:
+        return W.shape[0], None, None
+    mask = np.asarray(mask, dtype=bool)
+    if mask.shape != W.shape:
+        raise ValueError("mask must have the same shape as W")
+    rows, cols = np.nonzero(mask)
+    return W.shape[0], rows, cols
+
+
+def _activity(v: Optional[Sequence], n: int, name: str, ndim: int) -> Optional[np.ndarray]:
+    if v is None:
+        return None
+    arr = np.asarray(v, dtype=float)
+    if arr.ndim != ndim or arr.shape[-1] != n:
+        raise ValueError(f"{name} must have length n" if ndim == 1 else f"{name} must have shape (T, n)")
+    return arr
+
+
+def hebbian_update_inplace(
+    W: Union[np.ndarray, CSRMatrix],
+    pre: Sequence[float],
+    post: Optional[Sequence[float]] = None,
+    config: Optional[HebbianPlasticityConfig] = None,
+    mask: Optional[np.ndarray] = None,
+) -> Union[np.ndarray, CSRMatrix]:
+    """hebbian_update() applied in place with NumPy (no copy of W).
+
+    Args:
+        W: float64 ndarray (n x n) or CSRMatrix (stored synapses only)
+        pre: presynaptic activity vector (length n)
+        post: postsynaptic activity vector (length n). If None, uses pre.
+        config: HebbianPlasticityConfig
+        mask: optional boolean (n x n) array for dense W; only masked
+            entries learn, decay and are clipped
+
+    Returns:
+        W itself (updated).
+    """
+    pre_vec = np.asarray(pre, dtype=float)
+    post_vec = None if post is None else np.asarray(post, dtype=float)
+    return hebbian_update_batch(
+        W,
+        pre_vec[np.newaxis],
+        None if post_vec is None else post_vec[np.newaxis],
+        config,
+        mask,
+    )
+
+
+def hebbian_update_batch(
+    W: Union[np.ndarray, CSRMatrix],
+    pres: Sequence[Sequence[float]],
+    posts: Optional[Sequence[Sequence[float]]] = None,
+    config: Optional[HebbianPlasticityConfig] = None,
+    mask: Optional[np.ndarray] = None,
+) -> Union[np.ndarray, CSRMatrix]:
+    """Apply T Hebbian updates in order, in place, in one call.
+
+    Equivalent to calling hebbian_update_inplace() for each (pre_t, post_t).
+    Without clipping the sequence has the closed form
 
+        W_T = (1-decay)^T W_0 + η Σ_t (1-decay)^(T-1-t) pre_t ⊗ post_t
+
+    which a dense, unmasked W computes with a single matrix product;
+    otherwise the updates run step by step on the (masked / sparse) values.
+
+    Args:
+        W: float64 ndarray (n x n) or CSRMatrix (stored synapses only)
+        pres: presynaptic activities, shape (T, n)
+        posts: postsynaptic activities, shape (T, n). If None, uses pres.
+        config: HebbianPlasticityConfig
+        mask: optional boolean (n x n) array for dense W
+
+    Returns:
+        W itself (updated).
+    """
+    cfg = config or HebbianPlasticityConfig()
+    cfg.validate()
 
+    n, rows, cols = _prepare(W, mask)
+    P = _activity(pres, n, "pres", 2)
+    Q = P if posts is None else _activity(posts, n, "posts", 2)
+    if Q.shape != P.shape:
+        raise ValueError("pres and posts must have the same shape")
+    steps = P.shape[0]
+    if steps == 0:
+        return W
+
+    eta, keep = cfg.eta, 1.0 - cfg.weight_decay
+    clip = cfg.clip_weight
+
+    if rows is None:
+        # dense, every synapse
+        if clip is None:
+            # closed form: one (n x T) @ (T x n) product
+            weights = eta * keep ** np.arange(steps - 1, -1, -1, dtype=float)
+            if keep != 1.0:
+                W *= keep ** steps
+            W += (P.T * weights) @ Q
+            return W
+        buf = np.empty_like(W)
+        for t in range(steps):
+            if keep != 1.0:
+                W *= keep
+            np.outer(P[t], Q[t], out=buf)
+            buf *= eta
+            W += buf
+            np.clip(W, -clip, clip, out=W)
+        return W
+
+    # masked dense entries or stored sparse synapses: update a 1-D value array
+    values = W.data if isinstance(W, CSRMatrix) else W[rows, cols]
+    for t in range(steps):
+        if keep != 1.0:
+            values *= keep
+        values += eta * P[t, rows] * Q[t, cols]
+        if clip is not None:
+            np.clip(values, -clip, clip, out=values)
+    if not isinstance(W, CSRMatrix):
+        W[rows, cols] = values
+    return W
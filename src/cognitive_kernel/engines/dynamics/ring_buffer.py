@@ -0,0 +1,227 @@
+"""
+Ring Buffer
+고정 용량 NumPy 링 버퍼
+
+동역학 히스토리(엔트로피/코어 강도, HPA 코르티솔 기록)를 위한 고정 용량 버퍼.
+
+- append: O(1), 추가 할당 없음 (가득 차면 가장 오래된 값을 덮어씀)
+- window(k)/view(): 최근 k개를 시간 순서의 연속 배열 뷰로 반환 (복사 없음)
+  값을 두 번(i, i + capacity) 기록하는 이중 배열이라 경계에서도 연속
+- 누적 통계: 창 평균/분산 (제거 값 반영 Welford), 지수 이동 평균(EWMA)을
+  추가할 때마다 갱신 → 상태 보고 시 전체 재계산 불필요
+
+width를 주면 한 행이 여러 값(예: (시간, 코르티솔, 스트레스))이며
+통계도 열별 배열이 된다.
+
+Author: GNJz (Qquarts)
+Version: 2.0.3+
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+# extend()가 배열 일괄 기록으로 전환하는 최소 개수 (이하면 append 반복이 더 빠름)
+_BULK_MIN = 32
+
+
+class RingBuffer:
+    """
+    고정 용량 링 버퍼 + 누적 통계
+
+    사용 예시:
+        buf = RingBuffer(100, ewma_alpha=0.1)
+        buf.append(0.5)
+        buf.window(10)    # 최근 10개 (복사 없는 뷰)
+        buf.stats()       # {"count", "size", "mean", "var", "std", "ewma", "last"}
+    """
+
+    def __init__(self, capacity: int, width: Optional[int] = None, ewma_alpha: float = 0.1):
+        """
+        Args:
+            capacity: 최대 보관 개수
+            width: 행당 값 개수 (None이면 스칼라)
+            ewma_alpha: 지수 이동 평균 가중치 (0 < α <= 1)
+        """
+        assert capacity > 0, "capacity must be positive"
+        assert width is None or width > 0, "width must be positive"
+        assert 0.0 < ewma_alpha <= 1.0, "ewma_alpha must be in (0, 1]"
+        self.capacity = int(capacity)
+        self.width = width
+        self.ewma_alpha = float(ewma_alpha)
+        shape = (2 * self.capacity,) if width is None else (2 * self.capacity, width)
+        self._data = np.zeros(shape, dtype=float)
+        self.clear()
+
+    def clear(self) -> None:
+        """모든 값과 통계 초기화 (저장 공간은 재사용)"""
+        self._head = 0  # 다음에 쓸 위치 (0 ~ capacity-1)
+        self._size = 0
+        self.count = 0  # 지금까지 추가된 총 개수
+        zero = 0.0 if self.width is None else np.zeros(self.width)
+        self._mean = zero
+        self._m2 = zero
+        self._ewma: Any = None
+
+    # ------------------------------------------------------------------
+    # 추가
+    # ------------------------------------------------------------------
+    def append(self, value: Union[float, Sequence[float]]) -> None:
+        """값 하나 추가 (가득 차면 가장 오래된 값 제거)"""
+        x = float(value) if self.width is None else np.asarray(value, dtype=float)
+        head, cap = self._head, self.capacity
+
+        if self._size == cap:
+            # 창에서 빠지는 값을 제거하며 평균/제곱합 갱신
+            old = self._data[head]
+            if self.width is not None:
+                old = old.copy()
+            mean = self._mean + (x - old) / cap
+            self._m2 = self._m2 + (x - old) * (x - mean + old - self._mean)
+            self._mean = mean
+        else:
+            self._size += 1
+            delta = x - self._mean
+            self._mean = self._mean + delta / self._size
+            self._m2 = self._m2 + delta * (x - self._mean)
+
+        self._data[head] = x
+        self._data[head + cap] = x
+        self._head = (head + 1) % cap
+        self.count += 1
+        a = self.ewma_alpha
+        self._ewma = x if self._ewma is None else a * x + (1.0 - a) * self._ewma
+
+    def extend(self, values: Sequence[Any]) -> None:
+        """
+        여러 값 추가 (append를 차례로 호출한 것과 같음)
+
+        많은 값을 한 번에 추가하면 남을 값만 배열로 기록하고 창 통계는
+        남은 창에서 다시 계산, EWMA는 가중합 한 번으로 갱신한다.
+        """
+        if len(values) <= _BULK_MIN:
+            for value in values:
+                self.append(value)
+            return
+
+        rows = np.asarray(values, dtype=float)
+        expected = (len(rows),) if self.width is None else (len(rows), self.width)
+        if rows.shape != expected:
+            raise ValueError(f"values must have shape {expected}, got {rows.shape}")
+        m, cap = len(rows), self.capacity
+
+        # 남을 (최근 capacity개) 행만 이중 배열에 기록
+        kept = rows[-cap:]
+        start = (self._head + m - len(kept)) % cap
+        index = (start + np.arange(len(kept))) % cap
+        self._data[index] = kept
+        self._data[index + cap] = kept
+        self._head = (start + len(kept)) % cap
+        self._size = min(cap, self._size + m)
+        self.count += m
+
+        window = self.window()
+        self._mean = window.mean(axis=0)
+        self._m2 = ((window - self._mean) ** 2).sum(axis=0)
+        if self.width is None:
+            self._mean, self._m2 = float(self._mean), float(self._m2)
+
+        # EWMA_m = (1-α)^m · EWMA_0 + α · Σ (1-α)^(m-1-i) · x_i
+        a = self.ewma_alpha
+        if self._ewma is None:
+            self._ewma, rows = rows[0], rows[1:]
+        weights = (1.0 - a) ** np.arange(len(rows) - 1, -1, -1, dtype=float)
+        self._ewma = (1.0 - a) ** len(rows) * self._ewma + a * (weights @ rows)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._size
+
+    def window(self, k: Optional[int] = None) -> np.ndarray:
+        """
+        최근 k개 (None이면 전체)를 오래된 것부터 담은 읽기 전용 뷰
+
+        다음 append 이후에는 내용이 바뀔 수 있으므로 보관하려면 복사할 것.
+        """
+        k = self._size if k is None else max(0, min(int(k), self._size))
+        end = self._head + self.capacity
+        view = self._data[end - k:end]
+        view.flags.writeable = False
+        return view
+
+    def view(self) -> np.ndarray:
+        """전체 내용 (window()와 같음)"""
+        return self.window()
+
+    def tolist(self) -> List[Any]:
+        """전체 내용의 리스트 복사본"""
+        return self.window().tolist()
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.window())
+
+    def __getitem__(self, index):
+        return self.window()[index]
+
+    @property
+    def last(self) -> Any:
+        """가장 최근 값 (비어 있으면 None)"""
+        if self._size == 0:
+            return None
+        value = self._data[self._head + self.capacity - 1]
+        return float(value) if self.width is None else value.copy()
+
+    @property
+    def mean(self) -> Any:
+        return self._mean
+
+    @property
+    def var(self) -> Any:
+        """창 모분산"""
+        if self._size == 0:
+            return self._m2
+        return np.maximum(self._m2 / self._size, 0.0)  # 반올림 오차로 인한 음수 방지
+
+    @property
+    def ewma(self) -> Any:
+        return self._ewma
+
+    def stats(self) -> Dict[str, Any]:
+        """상태 보고용 누적 통계 (재계산 없음, 열별 값은 리스트)"""
+        var = self.var
+        std = np.sqrt(var)
+        result = {
+            "count": self.count,
+            "size": self._size,
+            "mean": self._mean if self._size else None,
+            "var": var if self._size else None,
+            "std": std if self._size else None,
+            "ewma": self._ewma,
+            "last": self.last,
+        }
+        if self.width is not None:
+            result = {k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in result.items()}
+        else:
+            result = {k: float(v) if isinstance(v, np.floating) else v for k, v in result.items()}
+        return result
+
+    def resize(self, capacity: int) -> None:
+        """용량 변경 (최근 값 유지, 통계는 남은 값으로 다시 계산)"""
+        assert capacity > 0, "capacity must be positive"
+        if capacity == self.capacity:
+            return
+        kept = self.window(capacity).copy()
+        count, ewma = self.count, self._ewma
+        self.capacity = int(capacity)
+        shape = (2 * self.capacity,) if self.width is None else (2 * self.capacity, self.width)
+        self._data = np.zeros(shape, dtype=float)
+        self.clear()
+        self.extend(kept)
+        self.count, self._ewma = count, ewma
+
+    def __repr__(self) -> str:
+        return f"RingBuffer(size={self._size}, capacity={self.capacity})"
@@ -0,0 +1,170 @@
+"""Sparse recurrent weights (CSR) for continuous dynamics.
+
+A minimal compressed-sparse-row matrix built on NumPy arrays, so that large,
+sparsely connected rate networks (1-5% connectivity) fit in memory and cost
+O(nnz) per step. No SciPy dependency; SciPy sparse matrices are accepted by
+as_csr() through their .tocsr() conversion.
+
+Layout (row i = postsynaptic unit, as in dense W[i][j]):
+- data[k]    : weight of the k-th stored synapse
+- indices[k] : its column (presynaptic unit j)
+- indptr[i]  : start of row i in data/indices (indptr[n] == nnz)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class CSRMatrix:
+    """Square CSR matrix with the operations NeuralDynamicsCore needs."""
+
+    def __init__(self, data: Sequence[float], indices: Sequence[int], indptr: Sequence[int], n: int):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.n = int(n)
+        if self.n <= 0:
+            raise ValueError("W must be non-empty")
+        if self.indptr.shape != (self.n + 1,) or self.indptr[0] != 0:
+            raise ValueError("indptr must have length n + 1 and start at 0")
+        if np.any(np.diff(self.indptr) < 0) or self.indptr[-1] != len(self.data):
+            raise ValueError("indptr must be non-decreasing and end at nnz")
+        if self.indices.shape != self.data.shape:
+            raise ValueError("indices and data must have the same length")
+        if len(self.indices) and (self.indices.min() < 0 or self.indices.max() >= self.n):
+            raise ValueError("column indices out of range")
+        self._rows: Optional[np.ndarray] = None
+        # reduceat segments run from one start to the next, so only non-empty
+        # rows may contribute a start; empty rows are zero-filled separately
+        counts = np.diff(self.indptr)
+        self._nonempty_rows = np.flatnonzero(counts > 0)
+        self._empty_rows = np.flatnonzero(counts == 0)
+        self._starts = self.indptr[:-1][self._nonempty_rows]
+
+    # ------------------------------------------------------------------
+    # construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_coo(
+        cls,
+        rows: Sequence[int],
+        cols: Sequence[int],
+        data: Sequence[float],
+        n: int,
+    ) -> "CSRMatrix":
+        """Build from (row, col, value) triplets; duplicate entries are summed."""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        data = np.asarray(data, dtype=float)
+        if not (rows.shape == cols.shape == data.shape):
+            raise ValueError("rows, cols and data must have the same length")
+        if len(rows) and (rows.min() < 0 or rows.max() >= n or cols.min() < 0 or cols.max() >= n):
+            raise ValueError("indices out of range")
+        keys, inverse = np.unique(rows * n + cols, return_inverse=True)
+        values = np.bincount(inverse, weights=data, minlength=len(keys))
+        key_rows = keys // n
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(key_rows, minlength=n), out=indptr[1:])
+        return cls(values, keys % n, indptr, n)
+
+    @classmethod
+    def from_dense(cls, W: Any) -> "CSRMatrix":
+        """Store the non-zero entries of a dense square matrix."""
+        W = np.asarray(W, dtype=float)
+        if W.ndim != 2 or W.shape[0] != W.shape[1]:
+            raise ValueError("W must be a square matrix")
+        rows, cols = np.nonzero(W)
+        return cls.from_coo(rows, cols, W[rows, cols], W.shape[0])
+
+    @classmethod
+    def random(
+        cls,
+        n: int,
+        density: float,
+        scale: float = 1.0,
+        rng: Optional[np.random.Generator] = None,
+    ) -> "CSRMatrix":
+        """Random connectivity: each row gets round(density * n) distinct
+        presynaptic partners with N(0, scale^2 / (density * n)) weights."""
+        if not 0.0 < density <= 1.0:
+            raise ValueError("density must be in (0, 1]")
+        rng = rng if rng is not None else np.random.default_rng()
+        k = max(1, int(round(density * n)))
+        cols = np.empty((n, k), dtype=np.int64)
+        for i in range(n):
+            cols[i] = rng.choice(n, size=k, replace=False)
+        cols.sort(axis=1)
+        data = rng.standard_normal(n * k) * (scale / np.sqrt(k))
+        indptr = np.arange(0, n * k + 1, k, dtype=np.int64)
+        return cls(data, cols.ravel(), indptr, n)
+
+    def copy(self) -> "CSRMatrix":
+        return CSRMatrix(self.data.copy(), self.indices, self.indptr, self.n)
+
+    def to_dense(self) -> np.ndarray:
+        W = np.zeros((self.n, self.n))
+        np.add.at(W, (self.rows, self.indices), self.data)
+        return W
+
+    # ------------------------------------------------------------------
+    # properties
+    # ------------------------------------------------------------------
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.n, self.n)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Row index of every stored entry (built on first use)."""
+        if self._rows is None:
+            self._rows = np.repeat(
+                np.arange(self.n, dtype=np.int32), np.diff(self.indptr)
+            )
+        return self._rows
+
+    # ------------------------------------------------------------------
+    # products
+    # ------------------------------------------------------------------
+    def dot(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """W @ x for a state (n,), or X @ W.T for a batch of states (batch, n)."""
+        if out is None:
+            out = np.empty(x.shape)
+        if self.nnz == 0:
+            out[...] = 0.0
+            return out
+        prod = x[..., self.indices]
+        prod *= self.data
+        if not len(self._empty_rows):
+            np.add.reduceat(prod, self._starts, axis=-1, out=out)
+            return out
+        out[..., self._empty_rows] = 0.0
+        out[..., self._nonempty_rows] = np.add.reduceat(prod, self._starts, axis=-1)
+        return out
+
+    def quadratic(self, x: np.ndarray) -> float:
+        """x^T W x."""
+        return float(x @ self.dot(x))
+
+    def __repr__(self) -> str:
+        return f"CSRMatrix(n={self.n}, nnz={self.nnz})"
+
+
+def as_csr(W: Any) -> Optional[CSRMatrix]:
+    """Return W as a CSRMatrix if it is sparse (CSRMatrix or SciPy sparse), else None."""
+    if isinstance(W, CSRMatrix):
+        return W
+    tocsr = getattr(W, "tocsr", None)
+    if tocsr is None:
+        return None
+    csr = tocsr()
+    if csr.shape[0] != csr.shape[1]:
+        raise ValueError("W must be a square matrix")
+    csr.sum_duplicates()
+    return CSRMatrix(csr.data, csr.indices, csr.indptr, csr.shape[0])
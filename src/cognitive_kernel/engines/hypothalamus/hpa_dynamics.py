@@ -33,6 +33,17 @@ HPA Axis Dynamics Module
        - 코르티솔이 높아지면 CRH, ACTH 분비 억제
        - 수식의 `(1 - C/C_max)` 항이 이 피드백을 반영
 
+⏱️ 적분기 (HPAConfig.integrator):
+
+    - "euler": 명시적 오일러 (기본, 기존 동작)
+    - "exact": 스트레스 S가 구간 상수이면 ODE가 선형이므로 정확한 지수 해 사용
+        C(t) = C* + (C₀ - C*) × exp(-b t),  b = k₁ + k₂S/C_max,  C* = k₂S / b
+      상수 스트레스 구간은 한 번에 건너뛰고(구간 경계에서 [c_min, c_max] 클램핑),
+      구간 사상 x ↦ clip(A x + B, lo, hi)의 합성이 닫혀 있으므로 구간들을
+      배치 누적 합성(scan)으로 이어 붙인다 → simulate_batch()로 여러 프로파일 동시 실행.
+      만성 스트레스 부하와 기저 수준도 같은 방식(구간 내 선형 + 클램핑)으로 계산하며,
+      기저 수준은 연속 시간 해에 맞춰 [0.3, 0.6] 범위로 제한된다.
+
 ⚠️ 모델 한계:
 
     이 모델은 HPA 축의 단순화된 표현이다:
@@ -57,10 +68,24 @@ License: MIT License
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 import math
 import time
 
+import numpy as np
+
+from ..dynamics.ring_buffer import RingBuffer
+
+# 연구용 기록 기본 용량 (HPAConfig.history_size)
+DEFAULT_HISTORY_SIZE = 10000
+
+# 적분기 종류 (HPAConfig.integrator)
+INTEGRATORS = ("euler", "exact")
+
+# 기저 수준 범위 (exact 적분기)
+BASELINE_FLOOR = 0.3
+BASELINE_CEILING = 0.6
+
 
 @dataclass
 class HPAState:
@@ -72,15 +97,15 @@ class HPAState:
         baseline: 기저 코르티솔 수준 (개인차)
         chronic_stress_load: 만성 스트레스 누적 (장기 노출 효과)
         last_update: 마지막 업데이트 시간
+        history: 최근 (timestamp, cortisol, stress_input) 기록 (고정 용량 링 버퍼)
     """
     cortisol: float = 0.3  # 기본 안정 상태
     baseline: float = 0.3  # 개인별 기저 수준
     chronic_stress_load: float = 0.0  # 만성 스트레스
     last_update: float = field(default_factory=time.time)
     
-    # 연구용 기록
-    history: List[Tuple[float, float, float]] = field(default_factory=list)
-    # (timestamp, cortisol, stress_input)
+    # 연구용 기록: (timestamp, cortisol, stress_input) 행, 용량 초과 시 오래된 것부터 덮어씀
+    history: RingBuffer = field(default_factory=lambda: RingBuffer(DEFAULT_HISTORY_SIZE, width=3))
 
 
 @dataclass
@@ -118,6 +143,8 @@ class HPAConfig:
     
     # 시뮬레이션 설정
     dt_default: float = 0.1  # 기본 시간 간격 (초)
+    history_size: int = DEFAULT_HISTORY_SIZE  # 연구용 기록 최대 행 수
+    integrator: str = "euler"  # "euler" | "exact" (모듈 설명 참고)
 
 
 class HPADynamics:
@@ -160,7 +187,14 @@ class HPADynamics:
     
     def __init__(self, config: Optional[HPAConfig] = None):
         self.config = config or HPAConfig()
-        self.state = HPAState()
+        if self.config.integrator not in INTEGRATORS:
+            raise ValueError(
+                f"integrator must be one of {INTEGRATORS}, got {self.config.integrator!r}"
+            )
+        self.state = HPAState(history=self._new_history())
+    
+    def _new_history(self) -> RingBuffer:
+        return RingBuffer(self.config.history_size, width=3)
         
     def step(
         self, 
@@ -213,8 +247,15 @@ class HPADynamics:
         # 총 변화율
         dC_dt = clearance_term + production_term
         
-        # 오일러 적분
-        C_new = C + dt * dC_dt
+        if self.config.integrator == "exact":
+            # 정확한 지수 해: dt 동안 S가 상수이면 C* 로 지수 수렴
+            b = k1 + k2 * S / c_max
+            C0 = max(self.config.c_min, min(c_max, C))
+            c_star = k2 * S / b if b > 0 else C0
+            C_new = c_star + (C0 - c_star) * math.exp(-b * dt)
+        else:
+            # 오일러 적분
+            C_new = C + dt * dC_dt
         
         # 범위 제한
         C_new = max(self.config.c_min, min(c_max, C_new))
@@ -250,6 +291,8 @@ class HPADynamics:
             # 회복 시 기저 수준 정상화
             if self.state.baseline > 0.3:
                 self.state.baseline -= self.config.baseline_drift_rate * 0.5 * dt
+                if self.config.integrator == "exact":
+                    self.state.baseline = max(BASELINE_FLOOR, self.state.baseline)
         
         return {
             'cortisol': C_new,
@@ -276,6 +319,9 @@ class HPADynamics:
         Returns:
             시뮬레이션 결과 (cortisol_trace, statistics)
         """
+        if self.config.integrator == "exact":
+            return self._simulate_exact(stress_profile, dt)
+        
         cortisol_trace = []
         
         for S in stress_profile:
@@ -310,6 +356,123 @@ class HPADynamics:
             'baseline': self.state.baseline
         }
     
+    def _simulate_exact(self, stress_profile: Sequence[float], dt: float) -> Dict:
+        """simulate()의 exact 적분기 경로 (상태/기록 갱신 포함)"""
+        S = np.clip(np.asarray(stress_profile, dtype=float), 0.0, 1.0)
+        start = time.time()
+        result = self.simulate_batch(S[np.newaxis, :], dt)
+        cortisol = result['cortisol_trace'][0]
+        
+        self.state.cortisol = float(result['final_cortisol'][0])
+        self.state.chronic_stress_load = float(result['chronic_stress_load'][0])
+        self.state.baseline = float(result['baseline'][0])
+        self.state.last_update = time.time()
+        # 기록 시각: 시작 시각 + 경과 시뮬레이션 시간
+        times = start + dt * np.arange(1, len(S) + 1)
+        self.state.history.extend(np.column_stack((times, cortisol, S)))
+        
+        recovery_time = float(result['recovery_time'][0])
+        return {
+            'cortisol_trace': cortisol.tolist(),
+            'peak_cortisol': float(result['peak_cortisol'][0]),
+            'mean_cortisol': float(result['mean_cortisol'][0]),
+            'final_cortisol': self.state.cortisol,
+            'recovery_time': None if math.isnan(recovery_time) else recovery_time,
+            'chronic_stress_load': self.state.chronic_stress_load,
+            'baseline': self.state.baseline
+        }
+    
+    def simulate_batch(
+        self,
+        stress_profiles: Sequence[Sequence[float]],
+        dt: Optional[float] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        여러 스트레스 프로파일을 exact 적분기로 동시에 시뮬레이션
+        
+        모든 프로파일은 현재 상태(코르티솔/만성 부하/기저 수준)에서 시작하며,
+        이 메서드는 상태와 기록을 바꾸지 않는다. 상수 스트레스 구간은 정확한 해로
+        한 번에 건너뛰고 구간들은 배치 누적 합성으로 이어 붙이므로, 단계 수에
+        대한 Python 반복이 없다 (하루 × 0.1초 해상도도 배열 연산 몇 번).
+        
+        Args:
+            stress_profiles: (B, T) 스트레스 입력 (0~1로 클리핑)
+            dt: 각 스텝의 시간 간격 (None이면 config.dt_default)
+        
+        Returns:
+            Dict with:
+                - cortisol_trace: (B, T) 각 스텝 후 코르티솔
+                - peak_cortisol / mean_cortisol / final_cortisol: (B,)
+                - recovery_time: (B,) simulate()와 같은 정의, 회복하지 못하면 NaN
+                - chronic_stress_load / baseline: (B,) 마지막 값
+        """
+        if dt is None:
+            dt = self.config.dt_default
+        S = np.clip(np.asarray(stress_profiles, dtype=float), 0.0, 1.0)
+        if S.ndim != 2 or S.shape[1] == 0:
+            raise ValueError("stress_profiles must be a non-empty (batch, steps) array")
+        batch, steps = S.shape
+        config = self.config
+        
+        # 만성 스트레스 부하: 구간 내 선형, [0, 1] 클램핑
+        chronic_rate = np.where(
+            S > 0.5, config.chronic_accumulation_rate * (S - 0.5), -config.chronic_decay_rate
+        ) * dt
+        chronic = _piecewise_trace(
+            chronic_rate,
+            np.full(batch, self.state.chronic_stress_load),
+            lambda d, k: (1.0, d * k, 0.0, 1.0),
+        )
+        
+        # 기저 수준: 만성 부하가 임계값을 넘는 동안 상승, 아니면 하강
+        baseline_rate = np.where(
+            chronic > config.chronic_threshold,
+            config.baseline_drift_rate * dt,
+            -config.baseline_drift_rate * 0.5 * dt,
+        )
+        baseline0 = min(BASELINE_CEILING, max(BASELINE_FLOOR, self.state.baseline))
+        baseline = _piecewise_trace(
+            baseline_rate,
+            np.full(batch, baseline0),
+            lambda d, k: (1.0, d * k, BASELINE_FLOOR, BASELINE_CEILING),
+        )
+        
+        # 코르티솔: 구간별 정확한 지수 해
+        k1, k2, c_max = config.k1_clearance, config.k2_production, config.c_max
+        
+        def cortisol_power(S_run, k):
+            b = k1 + k2 * S_run / c_max
+            safe_b = np.where(b > 0, b, 1.0)
+            c_star = np.where(b > 0, k2 * S_run / safe_b, 0.0)
+            decay = np.exp(-b * (dt * k))
+            return decay, c_star * (1.0 - decay), config.c_min, c_max
+        
+        C0 = min(c_max, max(config.c_min, self.state.cortisol))
+        cortisol = _piecewise_trace(S, np.full(batch, C0), cortisol_power)
+        
+        # 회복 시간: 첫 저스트레스(S < 0.1) 스텝 이후 기저 수준 + 0.1 아래로 내려온 첫 스텝
+        low = S < 0.1
+        stress_end = np.where(low.any(axis=1), low.argmax(axis=1), steps - 1)
+        final_baseline = baseline[:, -1]
+        recovered = (cortisol < final_baseline[:, np.newaxis] + 0.1) & (
+            np.arange(steps) >= stress_end[:, np.newaxis]
+        )
+        recovery_time = np.where(
+            recovered.any(axis=1),
+            (recovered.argmax(axis=1) - stress_end) * dt,
+            np.nan,
+        )
+        
+        return {
+            'cortisol_trace': cortisol,
+            'peak_cortisol': cortisol.max(axis=1),
+            'mean_cortisol': cortisol.mean(axis=1),
+            'final_cortisol': cortisol[:, -1].copy(),
+            'recovery_time': recovery_time,
+            'chronic_stress_load': chronic[:, -1].copy(),
+            'baseline': final_baseline.copy(),
+        }
+    
     def get_stress_response_type(self) -> str:
         """
         현재 상태 기반 스트레스 반응 유형 분류
@@ -345,20 +508,97 @@ class HPADynamics:
         self.state = HPAState(
             cortisol=baseline,
             baseline=baseline,
-            chronic_stress_load=chronic
+            chronic_stress_load=chronic,
+            history=self._new_history(),
         )
     
     def get_state_summary(self) -> Dict:
-        """상태 요약 반환"""
+        """상태 요약 반환 (코르티솔 통계는 기록 버퍼의 누적 값, 재계산 없음)"""
+        history = self.state.history
+        recorded = len(history) > 0
         return {
             'cortisol': self.state.cortisol,
             'baseline': self.state.baseline,
             'chronic_stress_load': self.state.chronic_stress_load,
             'response_type': self.get_stress_response_type(),
-            'history_length': len(self.state.history)
+            'history_length': len(history),
+            'cortisol_mean': float(history.mean[1]) if recorded else None,
+            'cortisol_std': float(math.sqrt(history.var[1])) if recorded else None,
+            'cortisol_ewma': float(history.ewma[1]) if recorded else None,
         }
 
 
+# ----------------------------------------------------------------------
+# exact 적분기: 구간 사상 x ↦ clip(A·x + B, lo, hi)의 배치 합성
+# ----------------------------------------------------------------------
+# 사상의 합성 (f 다음 g, A ≥ 0)도 같은 꼴이다:
+#   g∘f: A = A_g·A_f,  B = A_g·B_f + B_g,
+#        lo = clip(A_g·lo_f + B_g, lo_g, hi_g),  hi = clip(A_g·hi_f + B_g, lo_g, hi_g)
+# → 스텝 수에 대한 반복 대신 구간 수에 대한 로그 단계 누적 합성으로 계산.
+
+PowerFn = Callable[[np.ndarray, np.ndarray], Tuple]
+
+
+def _runs(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(B, T) 배열을 평탄화한 뒤 값이 같은 연속 구간의 (시작 위치, 길이), 행 경계에서 끊음"""
+    flat = keys.ravel()
+    change = np.empty(flat.shape, dtype=bool)
+    change[0] = True
+    np.not_equal(flat[1:], flat[:-1], out=change[1:])
+    change[::keys.shape[1]] = True
+    starts = np.flatnonzero(change)
+    lengths = np.diff(np.append(starts, flat.size))
+    return starts, lengths
+
+
+def _scan_clip_affine(A: np.ndarray, B: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> None:
+    """구간 사상의 포함 누적 합성 (Hillis–Steele, 제자리): i번째 = f_i ∘ … ∘ f_0"""
+    shift = 1
+    while shift < len(A):
+        A_g, B_g, lo_g, hi_g = A[shift:], B[shift:], lo[shift:], hi[shift:]
+        A_f, B_f, lo_f, hi_f = A[:-shift], B[:-shift], lo[:-shift], hi[:-shift]
+        new_lo = np.clip(A_g * lo_f + B_g, lo_g, hi_g)
+        new_hi = np.clip(A_g * hi_f + B_g, lo_g, hi_g)
+        new_B = A_g * B_f + B_g
+        new_A = A_g * A_f
+        A[shift:], B[shift:], lo[shift:], hi[shift:] = new_A, new_B, new_lo, new_hi
+        shift *= 2
+
+
+def _piecewise_trace(keys: np.ndarray, x0: np.ndarray, power: PowerFn) -> np.ndarray:
+    """
+    구간 상수 입력에 대한 (B, T) 궤적
+    
+    Args:
+        keys: (B, T) 스텝별 입력 (값이 같은 연속 스텝이 한 구간)
+        x0: (B,) 행별 초기 상태
+        power: (구간 입력, 스텝 수 k) → k 스텝 사상의 (A, B, lo, hi)
+    """
+    batch, steps = keys.shape
+    starts, lengths = _runs(keys)
+    run_keys = keys.ravel()[starts]
+    A, B, lo, hi = (
+        np.array(np.broadcast_to(v, starts.shape), dtype=float)
+        for v in power(run_keys, lengths)
+    )
+    
+    # 행의 첫 구간은 초기 상태를 적용한 상수 사상 (A = 0) → 합성이 행 경계에서 초기화됨
+    first = starts % steps == 0
+    x_first = x0[starts[first] // steps]
+    value = np.clip(A[first] * x_first + B[first], lo[first], hi[first])
+    A[first], B[first], lo[first], hi[first] = 0.0, value, value, value
+    _scan_clip_affine(A, B, lo, hi)
+    
+    # 구간 시작 상태 = 앞 구간의 끝 상태, 구간 내부는 정확한 k 스텝 사상
+    run_start = np.empty(len(starts))
+    run_start[1:] = np.clip(B[:-1], lo[:-1], hi[:-1])
+    run_start[first] = x_first
+    step_run = np.repeat(np.arange(len(starts)), lengths)
+    k = np.arange(keys.size) - starts[step_run] + 1
+    A, B, lo, hi = power(run_keys[step_run], k)
+    return np.clip(A * run_start[step_run] + B, lo, hi).reshape(batch, steps)
+
+
 def demonstrate_hpa_dynamics():
     """
     HPA 동역학 시연
@@ -82,8 +82,9 @@ Blockchain: PHAM v4 (Signed)
 
 import math
 import time
-import random
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Union
+
+import numpy as np
 
 from .config import HypothalamusConfig
 from .data_types import InternalState, DriveSignal, DriveType
@@ -128,12 +129,15 @@ class HypothalamusEngine:
         print(f"각성 수준: {arousal:.2f}")
     """
     
-    def __init__(self, config: Optional[HypothalamusConfig] = None):
+    def __init__(self,
+                 config: Optional[HypothalamusConfig] = None,
+                 seed: Union[None, int, np.random.SeedSequence, np.random.Generator] = None):
         """
         시상하부 엔진 초기화
         
         Args:
             config: 설정 객체 (None이면 기본값 사용)
+            seed: 메시지 선택 난수 (정수/SeedSequence/Generator, None이면 OS 엔트로피)
         
         Note:
             - 기본값 = 선천적 성향 (Stem Code 철학)
@@ -142,6 +146,9 @@ class HypothalamusEngine:
         # 설정 적용
         self.config = config or HypothalamusConfig()
         
+        # 엔진 전용 난수 생성기
+        self._rng = np.random.default_rng(seed)
+        
         # 내부 상태 초기화
         self.state = InternalState()
         
@@ -468,7 +475,8 @@ class HypothalamusEngine:
             max_urgency = 0.1
         
         # 메시지 선택
-        message = random.choice(self.drive_messages[max_drive])
+        messages = self.drive_messages[max_drive]
+        message = messages[self._rng.integers(len(messages))]
         
         # 행동 제안
         action_suggestions = {
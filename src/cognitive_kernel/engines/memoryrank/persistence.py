@@ -54,6 +54,12 @@ class MemoryRankPersistence:
         Returns:
             {"nodes": 노드 수, "edges": 엣지 수}
         """
+        data = self.to_dict()
+        Path(path).write_text(json.dumps(data, indent=indent, ensure_ascii=False))
+        return {"nodes": data["node_count"], "edges": data["edge_count"]}
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """그래프와 랭크 벡터를 JSON 직렬화 가능한 딕셔너리로 변환"""
         engine = self.engine
         
         # 노드 목록
@@ -99,9 +105,7 @@ class MemoryRankPersistence:
             "personalization": personalization,
             "ranks": ranks,
         }
-        
-        Path(path).write_text(json.dumps(data, indent=indent, ensure_ascii=False))
-        return {"nodes": len(nodes), "edges": len(edges)}
+        return data
     
     def load_json(self, path: str) -> Dict[str, int]:
         """JSON에서 그래프와 랭크 벡터 로드
@@ -5,7 +5,7 @@ import math
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 
 
 from .config import PanoramaConfig
@@ -319,6 +319,36 @@ class PanoramaMemoryEngine:
         """저장된 이벤트 수."""
         return len(self._events)
 
+    def remove_events(self, event_ids: Iterable[str]) -> int:
+        """여러 이벤트를 한 번에 삭제 (보존 정책 등에서 사용).
+
+        타임라인과 에피소드 인덱스를 한 번의 순회로 다시 만들며,
+        비게 된 에피소드는 인덱스에서 제거한다.
+
+        Args:
+            event_ids: 삭제할 이벤트 ID들 (없는 ID는 무시)
+
+        Returns:
+            실제로 삭제된 이벤트 수
+        """
+        doomed = {eid for eid in event_ids if eid in self._event_map}
+        if not doomed:
+            return 0
+
+        self._events = [e for e in self._events if e.id not in doomed]
+        self._timestamps = [e.timestamp for e in self._events]
+        for eid in doomed:
+            del self._event_map[eid]
+
+        for episode_id in list(self._episode_index):
+            remaining = [eid for eid in self._episode_index[episode_id] if eid not in doomed]
+            if remaining:
+                self._episode_index[episode_id] = remaining
+            else:
+                del self._episode_index[episode_id]
+
+        return len(doomed)
+
     def clear(self) -> None:
         """모든 이벤트 삭제."""
         self._events.clear()
@@ -355,19 +385,20 @@ class PanoramaMemoryEngine:
         from .persistence import load_from_json as _load
         return _load(self, path, clear_existing)
     
-    def save_to_sqlite(self, path: str) -> int:
+    def save_to_sqlite(self, path: str, vacuum: bool = False) -> int:
         """이벤트를 SQLite DB로 저장 (장기 기억)
         
         대용량 이벤트에 적합.
         
         Args:
             path: SQLite 파일 경로
+            vacuum: True면 저장 후 삭제된 행의 디스크 공간 반환
             
         Returns:
             저장된 이벤트 수
         """
         from .persistence import save_to_sqlite as _save
-        return _save(self, path)
+        return _save(self, path, vacuum)
     
     def load_from_sqlite(self, path: str, clear_existing: bool = True) -> int:
         """SQLite DB에서 이벤트 로드
@@ -53,6 +53,12 @@ class PanoramaPersistence:
         Returns:
             저장된 이벤트 수
         """
+        data = self.to_dict()
+        Path(path).write_text(json.dumps(data, indent=indent, ensure_ascii=False))
+        return data["event_count"]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """모든 이벤트를 JSON 직렬화 가능한 딕셔너리로 변환"""
         events_data = []
         for event in self.engine._events:
             events_data.append({
@@ -70,9 +76,7 @@ class PanoramaPersistence:
             "event_count": len(events_data),
             "events": events_data,
         }
-        
-        Path(path).write_text(json.dumps(data, indent=indent, ensure_ascii=False))
-        return len(events_data)
+        return data
     
     def load_json(self, path: str, clear_existing: bool = True) -> int:
         """JSON 파일에서 이벤트 로드
@@ -105,11 +109,13 @@ class PanoramaPersistence:
     # ------------------------------------------------------------------
     # SQLite 저장/로드
     # ------------------------------------------------------------------
-    def save_sqlite(self, db_path: str) -> int:
+    def save_sqlite(self, db_path: str, vacuum: bool = False) -> int:
         """모든 이벤트를 SQLite DB로 저장
         
         Args:
             db_path: SQLite 파일 경로
+            vacuum: True면 저장 후 VACUUM으로 삭제된 행의 디스크 공간 반환
+                (보존 정책으로 기억을 정리한 뒤 사용)
             
         Returns:
             저장된 이벤트 수
@@ -156,6 +162,8 @@ class PanoramaPersistence:
             count += 1
         
         conn.commit()
+        if vacuum:
+            conn.execute("VACUUM")
         conn.close()
         return count
     
@@ -213,9 +221,9 @@ def load_from_json(engine: "PanoramaMemoryEngine", path: str, clear_existing: bo
     return PanoramaPersistence(engine).load_json(path, clear_existing)
 
 
-def save_to_sqlite(engine: "PanoramaMemoryEngine", path: str) -> int:
+def save_to_sqlite(engine: "PanoramaMemoryEngine", path: str, vacuum: bool = False) -> int:
     """PanoramaMemoryEngine의 편의 메서드"""
-    return PanoramaPersistence(engine).save_sqlite(path)
+    return PanoramaPersistence(engine).save_sqlite(path, vacuum)
 
 
 def load_from_sqlite(engine: "PanoramaMemoryEngine", path: str, clear_existing: bool = True) -> int:
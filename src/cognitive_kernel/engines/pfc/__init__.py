@@ -1,5 +1,12 @@
 from .config import PFCConfig
-from .models import WorkingMemorySlot, Action, ActionResult, ActionStatus
+from .models import (
+    WorkingMemorySlot,
+    Action,
+    ActionResult,
+    ActionStatus,
+    ActionArrays,
+    ArrayDecision,
+)
 from .pfc_engine import PFCEngine
 
 __all__ = [
@@ -9,4 +16,6 @@ __all__ = [
     "Action",
     "ActionResult",
     "ActionStatus",
+    "ActionArrays",
+    "ArrayDecision",
 ]
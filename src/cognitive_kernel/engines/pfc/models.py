@@ -3,6 +3,8 @@ from typing import Any, Optional, List
 from enum import Enum
 import uuid
 
+import numpy as np
+
 
 class ActionStatus(Enum):
     """행동 상태."""
@@ -85,3 +87,79 @@ class ActionResult:
     inhibited: bool
     conflict_signal: float
     selection_probability: float
+
+
+@dataclass
+class ActionArrays:
+    """행동 후보의 구조-배열(Structure-of-Arrays) 표현.
+
+    수백 개 후보를 Action 객체 없이 한 번에 평가하기 위한 표현.
+    Action과 동일하게 모든 값은 0~1로 클리핑된다.
+
+    - rewards: 기대 보상 배열 (N,)
+    - costs: 노력 비용 배열 (N,)
+    - risks: 위험도 배열 (N,)
+    - actions: 원본 Action 리스트 (선택, 결과 반환 시 그대로 사용)
+    - names: 행동 이름 리스트 (actions가 없을 때 Action 생성용)
+    """
+
+    rewards: np.ndarray
+    costs: np.ndarray
+    risks: np.ndarray
+    actions: Optional[List[Action]] = None
+    names: Optional[List[str]] = None
+
+    def __post_init__(self):
+        self.rewards = np.clip(np.asarray(self.rewards, dtype=float), 0.0, 1.0)
+        self.costs = np.clip(np.asarray(self.costs, dtype=float), 0.0, 1.0)
+        self.risks = np.clip(np.asarray(self.risks, dtype=float), 0.0, 1.0)
+        n = self.rewards.shape[0] if self.rewards.ndim == 1 else -1
+        if n < 0 or self.costs.shape != (n,) or self.risks.shape != (n,):
+            raise ValueError("rewards, costs, risks must be 1-D arrays of equal length")
+        if self.actions is not None and len(self.actions) != n:
+            raise ValueError("actions must have the same length as the arrays")
+        if self.names is not None and len(self.names) != n:
+            raise ValueError("names must have the same length as the arrays")
+
+    @staticmethod
+    def from_actions(actions: List[Action]) -> "ActionArrays":
+        """Action 리스트를 구조-배열로 변환."""
+        n = len(actions)
+        return ActionArrays(
+            rewards=np.fromiter((a.expected_reward for a in actions), dtype=float, count=n),
+            costs=np.fromiter((a.effort_cost for a in actions), dtype=float, count=n),
+            risks=np.fromiter((a.risk for a in actions), dtype=float, count=n),
+            actions=list(actions),
+        )
+
+    def action_at(self, index: int) -> Action:
+        """index 위치의 Action 반환 (없으면 배열 값으로 생성)."""
+        if self.actions is not None:
+            return self.actions[index]
+        name = self.names[index] if self.names is not None else f"action_{index}"
+        return Action(
+            id=f"action_{index}",
+            name=name,
+            expected_reward=float(self.rewards[index]),
+            effort_cost=float(self.costs[index]),
+            risk=float(self.risks[index]),
+        )
+
+    def __len__(self) -> int:
+        return int(self.rewards.shape[0])
+
+
+@dataclass
+class ArrayDecision:
+    """배열 기반 의사결정 결과.
+
+    - result: ActionResult (select_action과 동일)
+    - utilities: 전체 후보의 효용 배열
+    - probabilities: 전체 후보의 softmax 확률 배열
+    - index: 선택된 후보 인덱스 (후보가 없으면 -1)
+    """
+
+    result: ActionResult
+    utilities: np.ndarray
+    probabilities: np.ndarray
+    index: int = -1
@@ -7,6 +7,11 @@
 2. Action Evaluator: 행동의 기대 효용 계산 (U = reward - cost - risk*κ)
 3. Inhibitor: 위험한 행동 억제 (Go/No-Go gate)
 4. Selector: Softmax 확률적 행동 선택
+
+배열 기반 경로:
+    후보 행동을 구조-배열(ActionArrays)로 받아 효용, softmax, 샘플링,
+    갈등 신호를 같은 배열에서 한 번에 계산한다 (decide_arrays).
+    select_action/process도 내부적으로 이 경로를 사용한다.
 """
 
 from __future__ import annotations
@@ -14,17 +19,30 @@ from __future__ import annotations
 import math
 import time
 import uuid
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Any, Union
+
+import numpy as np
 
 from .config import PFCConfig
-from .models import WorkingMemorySlot, Action, ActionResult
+from .models import WorkingMemorySlot, Action, ActionResult, ActionArrays, ArrayDecision
 
 
 class PFCEngine:
     """PFC Engine v1.0 - 작업 기억 + 행동 선택 + 억제 엔진."""
 
-    def __init__(self, config: Optional[PFCConfig] = None):
+    def __init__(
+        self,
+        config: Optional[PFCConfig] = None,
+        seed: Union[None, int, np.random.SeedSequence, np.random.Generator] = None,
+    ):
+        """
+        Args:
+            config: PFC 설정
+            seed: softmax 샘플링 난수 (정수/SeedSequence/Generator, None이면 OS 엔트로피).
+                엔진마다 독립 생성기를 가지므로 병렬 실행에서도 재현 가능하다.
+        """
         self.config = config or PFCConfig()
+        self._rng = np.random.default_rng(seed)
         self._working_memory: List[WorkingMemorySlot] = []
         self._current_goal: Optional[str] = None
         self._current_goal_priority: float = 0.5
@@ -144,6 +162,13 @@ class PFCEngine:
         """여러 행동의 효용 계산."""
         return [(a, self.evaluate_action(a)) for a in actions]
 
+    def evaluate_arrays(self, arrays: ActionArrays) -> np.ndarray:
+        """구조-배열 전체의 효용을 한 번에 계산.
+
+        U = rewards - costs - risks × risk_aversion
+        """
+        return arrays.rewards - arrays.costs - arrays.risks * self.config.risk_aversion
+
     # ------------------------------------------------------------------
     # Inhibition
     # ------------------------------------------------------------------
@@ -208,6 +233,17 @@ class PFCEngine:
 
         return [e / total for e in exp_values]
 
+    def softmax_array(self, utilities: np.ndarray) -> np.ndarray:
+        """softmax_probabilities의 배열 버전."""
+        n = utilities.shape[0]
+        if n == 0:
+            return np.zeros(0, dtype=float)
+        exp_values = np.exp(self.config.decision_temperature * (utilities - utilities.max()))
+        total = exp_values.sum()
+        if total == 0:
+            return np.full(n, 1.0 / n)
+        return exp_values / total
+
     def select_action(
         self,
         actions: List[Action],
@@ -223,57 +259,184 @@ class PFCEngine:
             ActionResult (선택된 행동, 효용, 억제 여부 등)
         """
         if not actions:
-            return ActionResult(
-                action=None,
-                utility=0.0,
-                inhibited=False,
-                conflict_signal=0.0,
-                selection_probability=0.0,
-            )
+            return self._empty_result()
+        return self.decide_arrays(ActionArrays.from_actions(actions), deterministic).result
+
+    def decide_arrays(
+        self,
+        arrays: ActionArrays,
+        deterministic: bool = False,
+    ) -> ArrayDecision:
+        """구조-배열 기반 행동 선택.
+
+        효용, softmax, 샘플링, 갈등 신호를 같은 배열에서 계산한다.
+        결과는 select_action과 동일한 ActionResult이며,
+        전체 효용/확률 배열도 함께 반환해 재계산이 필요 없다.
+
+        Args:
+            arrays: 후보 행동 구조-배열
+            deterministic: True면 argmax, False면 softmax 샘플링
+
+        Returns:
+            ArrayDecision (ActionResult + 효용/확률 배열)
+        """
+        n = len(arrays)
+        if n == 0:
+            empty = np.zeros(0, dtype=float)
+            return ArrayDecision(self._empty_result(), empty, empty, -1)
 
-        # 효용 계산
-        utilities = [self.evaluate_action(a) for a in actions]
-        probabilities = self.softmax_probabilities(utilities)
+        utilities = self.evaluate_arrays(arrays)
+        probabilities = self.softmax_array(utilities)
 
         # 선택
         if deterministic:
-            max_idx = max(range(len(utilities)), key=lambda i: utilities[i])
+            idx = int(np.argmax(utilities))
         else:
-            # 확률적 샘플링
-            import random
-            r = random.random()
-            cumsum = 0.0
-            max_idx = len(actions) - 1
-            for i, p in enumerate(probabilities):
-                cumsum += p
-                if r < cumsum:
-                    max_idx = i
-                    break
-
-        selected_action = actions[max_idx]
-        selected_utility = utilities[max_idx]
-        selected_prob = probabilities[max_idx]
-
-        # 억제 체크
-        other_actions = [a for i, a in enumerate(actions) if i != max_idx]
-        inhibit, conflict_signal = self.should_inhibit(selected_action, other_actions)
-
-        if inhibit:
-            return ActionResult(
-                action=None,
-                utility=selected_utility,
-                inhibited=True,
-                conflict_signal=conflict_signal,
-                selection_probability=selected_prob,
-            )
+            # 확률적 샘플링 (누적합에서 r을 처음 넘는 위치)
+            r = self._rng.random()
+            idx = int(np.searchsorted(np.cumsum(probabilities), r, side="right"))
+            if idx >= n:
+                idx = n - 1
+
+        selected_utility = float(utilities[idx])
+        selected_prob = float(probabilities[idx])
+
+        # 억제 체크: conflict = max(risk, max(competing_U) - U)
+        conflict_signal = float(arrays.risks[idx])
+        if n > 1:
+            max_competing = float(np.concatenate((utilities[:idx], utilities[idx + 1:])).max())
+            if max_competing > selected_utility:
+                conflict_signal = max(conflict_signal, max_competing - selected_utility)
+        conflict_signal = min(1.0, conflict_signal)
+        inhibit = conflict_signal > self.config.inhibition_threshold
 
-        return ActionResult(
-            action=selected_action,
+        result = ActionResult(
+            action=None if inhibit else arrays.action_at(idx),
             utility=selected_utility,
-            inhibited=False,
+            inhibited=inhibit,
             conflict_signal=conflict_signal,
             selection_probability=selected_prob,
         )
+        return ArrayDecision(result, utilities, probabilities, idx)
+
+    def evaluate_padded(
+        self,
+        rewards: np.ndarray,
+        costs: np.ndarray,
+        risks: np.ndarray,
+        lengths: Sequence[int],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """패딩된 (B, K) 후보 배열의 효용과 행별 softmax 확률 계산.
+
+        행 b에서는 앞의 lengths[b]개 열만 유효하며,
+        패딩 위치의 확률은 0이다.
+
+        Returns:
+            (utilities, probabilities) 각각 (B, K) 배열
+        """
+        R = np.clip(np.asarray(rewards, dtype=float), 0.0, 1.0)
+        C = np.clip(np.asarray(costs, dtype=float), 0.0, 1.0)
+        Rk = np.clip(np.asarray(risks, dtype=float), 0.0, 1.0)
+        lengths = np.asarray(lengths, dtype=int)
+        valid = np.arange(R.shape[1])[None, :] < lengths[:, None]
+
+        utilities = R - C - Rk * self.config.risk_aversion
+        row_max = np.where(valid, utilities, -np.inf).max(axis=1, initial=-np.inf)
+        row_max[lengths == 0] = 0.0
+
+        shifted = np.where(valid, utilities - row_max[:, None], 0.0)
+        exp_values = np.exp(self.config.decision_temperature * shifted) * valid
+        totals = exp_values.sum(axis=1)
+        totals[totals == 0] = 1.0
+        return utilities, exp_values / totals[:, None]
+
+    def decide_padded(
+        self,
+        rewards: np.ndarray,
+        costs: np.ndarray,
+        risks: np.ndarray,
+        lengths: Sequence[int],
+        names: Optional[List[List[str]]] = None,
+        deterministic: bool = False,
+    ) -> List[ArrayDecision]:
+        """여러 독립 후보 집합을 패딩된 (B, K) 배열로 한 번에 결정.
+
+        각 행은 decide_arrays와 같은 규칙(효용 → softmax → 샘플링 → 갈등 신호)
+        으로 처리되며, 샘플링 난수는 엔진 생성기에서 행마다 하나씩 뽑는다.
+
+        Args:
+            rewards, costs, risks: (B, K) 배열
+            lengths: 행별 유효 후보 수
+            names: 행별 행동 이름 리스트 (없으면 "action_i")
+            deterministic: True면 argmax, False면 softmax 샘플링
+
+        Returns:
+            행 순서대로의 ArrayDecision 리스트
+        """
+        utilities, probabilities = self.evaluate_padded(rewards, costs, risks, lengths)
+        R = np.clip(np.asarray(rewards, dtype=float), 0.0, 1.0)
+        C = np.clip(np.asarray(costs, dtype=float), 0.0, 1.0)
+        Rk = np.clip(np.asarray(risks, dtype=float), 0.0, 1.0)
+        lengths = np.asarray(lengths, dtype=int)
+        B, K = utilities.shape
+        valid = np.arange(K)[None, :] < lengths[:, None]
+        rows = np.arange(B)
+
+        # 선택
+        if deterministic:
+            indices = np.where(valid, utilities, -np.inf).argmax(axis=1)
+        else:
+            r = self._rng.random(B)
+            r[lengths == 0] = 0.0
+            cumsum = np.cumsum(probabilities, axis=1)
+            indices = (cumsum <= r[:, None]).sum(axis=1)
+        indices = np.minimum(indices, np.maximum(lengths - 1, 0))
+
+        # 갈등 신호: max(risk, max(competing_U) - U)
+        selected_u = utilities[rows, indices]
+        competing = np.where(valid, utilities, -np.inf)
+        competing[rows, indices] = -np.inf
+        max_competing = competing.max(axis=1, initial=-np.inf)
+        conflict = np.maximum(Rk[rows, indices], np.maximum(max_competing - selected_u, 0.0))
+        conflict = np.minimum(1.0, conflict)
+        inhibit = conflict > self.config.inhibition_threshold
+
+        decisions = []
+        empty = np.zeros(0, dtype=float)
+        for b in range(B):
+            n = int(lengths[b])
+            if n == 0:
+                decisions.append(ArrayDecision(self._empty_result(), empty, empty, -1))
+                continue
+            idx = int(indices[b])
+            action = None
+            if not inhibit[b]:
+                action = Action(
+                    id=f"action_{idx}",
+                    name=names[b][idx] if names is not None else f"action_{idx}",
+                    expected_reward=float(R[b, idx]),
+                    effort_cost=float(C[b, idx]),
+                    risk=float(Rk[b, idx]),
+                )
+            result = ActionResult(
+                action=action,
+                utility=float(selected_u[b]),
+                inhibited=bool(inhibit[b]),
+                conflict_signal=float(conflict[b]),
+                selection_probability=float(probabilities[b, idx]),
+            )
+            decisions.append(ArrayDecision(result, utilities[b, :n], probabilities[b, :n], idx))
+        return decisions
+
+    @staticmethod
+    def _empty_result() -> ActionResult:
+        return ActionResult(
+            action=None,
+            utility=0.0,
+            inhibited=False,
+            conflict_signal=0.0,
+            selection_probability=0.0,
+        )
 
     # ------------------------------------------------------------------
     # Integrated Pipeline
@@ -303,6 +466,23 @@ class PFCEngine:
         Returns:
             ActionResult
         """
+        return self.process_arrays(
+            ActionArrays.from_actions(candidate_actions),
+            top_memories=top_memories,
+            goal=goal,
+            goal_priority=goal_priority,
+            deterministic=deterministic,
+        ).result
+
+    def process_arrays(
+        self,
+        arrays: ActionArrays,
+        top_memories: Optional[List[Tuple[str, float]]] = None,
+        goal: Optional[str] = None,
+        goal_priority: float = 0.5,
+        deterministic: bool = False,
+    ) -> ArrayDecision:
+        """process()의 구조-배열 버전 (효용/확률 배열 포함 반환)."""
         # 1. 목표 설정
         if goal:
             self.set_goal(goal, goal_priority)
@@ -315,7 +495,7 @@ class PFCEngine:
         self.update_decay()
 
         # 4. 행동 선택
-        return self.select_action(candidate_actions, deterministic)
+        return self.decide_arrays(arrays, deterministic)
 
     # ------------------------------------------------------------------
     # Utility
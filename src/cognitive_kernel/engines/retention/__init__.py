@@ -0,0 +1,18 @@
+"""Retention Engine Package
+
+기억 보존/망각 정책 엔진.
+- MemoryRank 점수와 Panorama 감쇠 중요도로 보존 점수 계산
+- 오래되고 중요도 낮은 기억 선별, 보존 수 상한
+- 삭제된 기억의 엣지 제거 및 중복 엣지 병합 (그래프 압축)
+"""
+
+from .config import RetentionConfig
+from .retention_engine import RetentionEngine, RetentionPlan
+
+__all__ = [
+    "RetentionConfig",
+    "RetentionEngine",
+    "RetentionPlan",
+]
+
+__version__ = "1.0.0"
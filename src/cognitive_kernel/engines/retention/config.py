@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class RetentionConfig:
+    """Retention(망각/보존) 엔진 설정값.
+
+    보존 점수 s = rank_weight × (MemoryRank 점수 / 최대 점수)
+                 + (1 - rank_weight) × Panorama 감쇠 중요도
+
+    - min_age: 이보다 최근 기억은 점수와 무관하게 보존 (초)
+    - min_score: min_age보다 오래된 기억 중 보존 점수가 이보다 낮으면 삭제
+    - protect_importance: 베이스 중요도가 이 이상이면 항상 보존
+    - max_memories: 보존 기억 수 상한 (None이면 제한 없음).
+      초과분은 보호되지 않은 기억 중 점수가 낮은 것부터 삭제 (나이 무관)
+    - rank_weight: 보존 점수에서 MemoryRank 점수 비중 (0~1)
+    - check_interval: remember() n회마다 자동 정리 (0이면 수동 호출만)
+    """
+
+    min_age: float = 7 * 86400.0   # 7일
+    min_score: float = 0.05
+    protect_importance: float = 0.8
+    max_memories: Optional[int] = None
+    rank_weight: float = 0.5
+    check_interval: int = 1000
+
+    def validate(self) -> None:
+        """설정 유효성 검증"""
+        assert self.min_age >= 0, "min_age must be non-negative"
+        assert 0.0 <= self.min_score <= 1.0, "min_score must be in [0, 1]"
+        assert 0.0 <= self.protect_importance <= 1.0, "protect_importance must be in [0, 1]"
+        assert self.max_memories is None or self.max_memories > 0, "max_memories must be positive"
+        assert 0.0 <= self.rank_weight <= 1.0, "rank_weight must be in [0, 1]"
+        assert self.check_interval >= 0, "check_interval must be non-negative"
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .config import RetentionConfig
+from ..panorama import Event
+
+# 고립 기억 재연결 가중치 (커널의 기본 시간 순 연결과 같음)
+ORPHAN_LINK_WEIGHT = 0.5
+
+
+@dataclass
+class RetentionPlan:
+    """한 번의 보존 판정 결과.
+
+    - prune_ids: 삭제할 기억 ID
+    - examined: 판정한 기억 수
+    - protected: 중요도 보호로 제외된 기억 수
+    """
+
+    prune_ids: Set[str] = field(default_factory=set)
+    examined: int = 0
+    protected: int = 0
+
+
+class RetentionEngine:
+    """Retention Engine v1.0
+
+    - 입력:
+        * Panorama 이벤트 (timestamp, importance)
+        * Panorama 감쇠 중요도 {id: score}
+        * MemoryRank 랭크 벡터 {id: score}
+
+    - 출력:
+        * plan(): 삭제할 기억 ID (RetentionPlan)
+        * compact_edges(): 보존 기억 사이의 엣지만 남기고 (src, dst) 중복 병합
+
+    엔진은 상태를 바꾸지 않으며, 실제 삭제는 호출자(CognitiveKernel)가 수행한다.
+    """
+
+    def __init__(self, config: Optional[RetentionConfig] = None):
+        self.config = config or RetentionConfig()
+        self.config.validate()
+
+    # ------------------------------------------------------------------
+    # 보존 판정
+    # ------------------------------------------------------------------
+    def scores(
+        self,
+        events: Sequence[Event],
+        decayed_importance: Dict[str, float],
+        ranks: Dict[str, float],
+    ) -> np.ndarray:
+        """이벤트 순서대로의 보존 점수 (0~1)."""
+        rank = np.fromiter((ranks.get(e.id, 0.0) for e in events), dtype=float, count=len(events))
+        decayed = np.fromiter(
+            (decayed_importance.get(e.id, 0.0) for e in events), dtype=float, count=len(events)
+        )
+        max_rank = rank.max() if len(rank) else 0.0
+        if max_rank > 0:
+            rank /= max_rank
+        w = self.config.rank_weight
+        return w * rank + (1.0 - w) * decayed
+
+    def plan(
+        self,
+        events: Sequence[Event],
+        decayed_importance: Dict[str, float],
+        ranks: Dict[str, float],
+        now: float,
+    ) -> RetentionPlan:
+        """삭제할 기억 선별.
+
+        1) min_age보다 오래되고, 보호 중요도 미만이며, 점수가 min_score 미만인 기억
+        2) 남은 기억이 max_memories를 넘으면 보호되지 않은 기억 중 점수가 낮은 순
+        """
+        n = len(events)
+        if n == 0:
+            return RetentionPlan()
+
+        cfg = self.config
+        score = self.scores(events, decayed_importance, ranks)
+        age = now - np.fromiter((e.timestamp for e in events), dtype=float, count=n)
+        importance = np.fromiter((e.importance for e in events), dtype=float, count=n)
+
+        protected = importance >= cfg.protect_importance
+        prune = ~protected & (age >= cfg.min_age) & (score < cfg.min_score)
+
+        if cfg.max_memories is not None:
+            excess = n - int(prune.sum()) - cfg.max_memories
+            if excess > 0:
+                candidates = np.flatnonzero(~protected & ~prune)
+                order = candidates[np.argsort(score[candidates], kind="stable")]
+                prune[order[:excess]] = True
+
+        return RetentionPlan(
+            prune_ids={events[i].id for i in np.flatnonzero(prune)},
+            examined=n,
+            protected=int(protected.sum()),
+        )
+
+    # ------------------------------------------------------------------
+    # 그래프 압축
+    # ------------------------------------------------------------------
+    @staticmethod
+    def compact_edges(
+        edges: Iterable[Tuple[str, str, float]],
+        keep_ids: Sequence[str],
+    ) -> Tuple[List[Tuple[str, str, float]], int, int]:
+        """보존 기억 사이의 양수 가중치 엣지만 남기고 같은 (src, dst)는 가중치 합으로 병합.
+
+        MemoryRank는 같은 방향 엣지의 가중치를 더해 전이 행렬을 만들므로
+        병합 전후의 랭킹은 같다. 엣지가 모두 끊겨 고립된 보존 기억은
+        (그래프 밖으로 빠져 회상되지 않으므로) 시간 순 직전 보존 기억과
+        기본 연결 가중치로 다시 잇는다.
+
+        Args:
+            edges: (src, dst, weight) 엣지들
+            keep_ids: 보존 기억 ID (시간 순)
+
+        Returns:
+            (압축된 엣지 리스트, 제거된 엣지 수, 다시 이은 고립 기억 수)
+        """
+        keep = set(keep_ids)
+        merged: Dict[Tuple[str, str], float] = {}
+        linked: Set[str] = set()
+        removed = 0
+        for src, dst, w in edges:
+            if w <= 0 or src not in keep or dst not in keep:
+                linked.update(x for x in (src, dst) if x in keep)
+                removed += 1
+                continue
+            key = (src, dst)
+            merged[key] = merged.get(key, 0.0) + float(w)
+
+        connected = {x for key in merged for x in key}
+        orphans = [i for i, eid in enumerate(keep_ids) if eid in linked and eid not in connected]
+        for i in orphans:
+            prev = keep_ids[i - 1] if i > 0 else keep_ids[i + 1] if len(keep_ids) > 1 else keep_ids[i]
+            merged[(prev, keep_ids[i])] = merged.get((prev, keep_ids[i]), 0.0) + ORPHAN_LINK_WEIGHT
+        return [(src, dst, w) for (src, dst), w in merged.items()], removed, len(orphans)
@@ -4,14 +4,25 @@
 의사결정 파이프라인 패턴 구현.
 알고리즘 순서 변경 및 단계 추가/제거 용이.
 
+단계가 reads/writes/effects를 선언하면 의존성 그래프(DAG)를 만들어
+독립 단계를 스레드 풀 또는 asyncio 태스크로 동시에 실행할 수 있다.
+기본 실행기는 순차 실행이다.
+
 Author: GNJz (Qquarts)
 Version: 2.0.1+
 """
 
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field
 
+import numpy as np
+
+from .exceptions import ConfigurationError
+
 
 @dataclass
 class PipelineContext:
@@ -26,16 +37,54 @@ class PipelineContext:
     auto_torque: Dict[str, float] = field(default_factory=dict)
     result: Optional[Dict[str, Any]] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    action_arrays: Any = None  # 토크 반영 전 ActionArrays (재사용용)
+    memory_arrays: Any = None  # 열 지향 회상 결과 (MemoryArrays, 있으면 코어 강도에 사용)
+
+
+def get_context_field(context: PipelineContext, name: str) -> Any:
+    """컨텍스트 필드 조회 ("metadata.<key>"는 메타데이터 항목)"""
+    if name.startswith("metadata."):
+        return context.metadata.get(name[9:])
+    return getattr(context, name)
+
+
+def set_context_field(context: PipelineContext, name: str, value: Any) -> None:
+    """컨텍스트 필드 설정 ("metadata.<key>"는 메타데이터 항목)"""
+    if name.startswith("metadata."):
+        context.metadata[name[9:]] = value
+    else:
+        setattr(context, name, value)
 
 
 class PipelineStep(ABC):
-    """파이프라인 단계 추상 클래스"""
+    """
+    파이프라인 단계 추상 클래스
+    
+    reads/writes: 단계가 읽고 쓰는 컨텍스트 필드 이름
+        (메타데이터 항목은 "metadata.<key>"). 선언하지 않으면 빈 튜플.
+    effects: 컨텍스트 밖에서 상태를 바꾸거나 읽는 공유 자원 이름
+        (예: "pfc", "dynamics"). 같은 자원을 쓰는 단계는 순서대로 실행된다.
+    memoize: True면 cache_key()가 직전 실행과 같을 때 process()를
+        건너뛰고 직전 출력(writes)을 재사용한다. 부수효과 없는 단계만 사용.
+    
+    reads/writes/effects를 하나도 선언하지 않은 단계는 병렬 실행 시
+    장벽(barrier)으로 취급된다 (앞뒤 모든 단계와 순서 유지).
+    """
+    
+    reads: Tuple[str, ...] = ()
+    writes: Tuple[str, ...] = ()
+    effects: Tuple[str, ...] = ()
+    memoize: bool = False
     
     @abstractmethod
     def process(self, context: PipelineContext) -> PipelineContext:
         """단계 처리"""
         pass
     
+    def cache_key(self, context: PipelineContext) -> Any:
+        """재사용 판단 키 (기본: reads 필드 값 튜플)"""
+        return tuple(_freeze(get_context_field(context, name)) for name in self.reads)
+    
     def __repr__(self) -> str:
         return self.__class__.__name__
 
@@ -43,19 +92,30 @@ class PipelineStep(ABC):
 class MemoryLoadStep(PipelineStep):
     """기억 로드 단계"""
     
+    writes = ("memories", "memory_arrays")
+    effects = ("memoryrank",)
+    
     def __init__(self, memory_engine, working_memory_capacity: int = 7):
         self.memory_engine = memory_engine
         self.working_memory_capacity = working_memory_capacity
     
     def process(self, context: PipelineContext) -> PipelineContext:
-        """기억 로드"""
-        context.memories = self.memory_engine.recall(k=self.working_memory_capacity)
+        """기억 로드 (recall_arrays()가 있으면 열 지향 결과도 함께 보관)"""
+        recall_arrays = getattr(self.memory_engine, "recall_arrays", None)
+        if recall_arrays is None:
+            context.memories = self.memory_engine.recall(k=self.working_memory_capacity)
+            return context
+        context.memory_arrays = recall_arrays(k=self.working_memory_capacity)
+        context.memories = context.memory_arrays.to_dicts()
         return context
 
 
 class WorkingMemoryStep(PipelineStep):
     """Working Memory 로드 단계"""
     
+    reads = ("memories",)
+    effects = ("pfc",)
+    
     def __init__(self, pfc_engine):
         self.pfc_engine = pfc_engine
     
@@ -68,8 +128,41 @@ class WorkingMemoryStep(PipelineStep):
         return context
 
 
+class KeywordExtractionStep(PipelineStep):
+    """
+    옵션 키워드 추출 단계
+    
+    회상과 독립적이므로 병렬 실행 시 MemoryLoadStep과 동시에 실행된다.
+    """
+    
+    reads = ("options",)
+    writes = ("metadata.option_keywords",)
+    memoize = True
+    
+    def __init__(self, extract_keywords: Callable):
+        self.extract_keywords = extract_keywords
+    
+    def process(self, context: PipelineContext) -> PipelineContext:
+        """옵션별 키워드 추출"""
+        context.metadata["option_keywords"] = [
+            self.extract_keywords(opt) for opt in context.options
+        ]
+        return context
+
+
 class ActionCreationStep(PipelineStep):
-    """Action 생성 단계"""
+    """
+    Action 생성 단계
+    
+    관련도는 옵션 문자열, 회상된 기억 내용(ID로 고정)과 기억 중요도에만
+    의존하므로, 옵션/기억 ID/중요도가 직전과 같으면 직전 Action/배열을 재사용한다.
+    (중요도는 MemoryRank 점수라 최신성/그래프 변경에 따라 같은 ID에서도 바뀐다.)
+    KeywordExtractionStep이 앞에 있으면 추출된 키워드를 사용한다.
+    """
+    
+    reads = ("options", "memories", "metadata.option_keywords")
+    writes = ("actions", "action_arrays")
+    memoize = True
     
     def __init__(
         self,
@@ -85,12 +178,15 @@ class ActionCreationStep(PipelineStep):
     
     def process(self, context: PipelineContext) -> PipelineContext:
         """Action 생성"""
-        from .engines.pfc import Action
+        from .engines.pfc import Action, ActionArrays
+        
+        keywords = context.metadata.get("option_keywords")
+        if keywords is None or len(keywords) != len(context.options):
+            keywords = [self.extract_keywords(opt) for opt in context.options]
         
         actions = []
         for i, opt in enumerate(context.options):
-            opt_keywords = self.extract_keywords(opt)
-            memory_relevance = self.calculate_relevance(opt_keywords, context.memories)
+            memory_relevance = self.calculate_relevance(keywords[i], context.memories)
             expected_reward = 0.5 + self.alpha * memory_relevance
             
             actions.append(Action(
@@ -102,29 +198,45 @@ class ActionCreationStep(PipelineStep):
             ))
         
         context.actions = actions
+        context.action_arrays = ActionArrays.from_actions(actions)
         return context
+    
+    def cache_key(self, context: PipelineContext) -> Any:
+        return (
+            tuple(context.options),
+            tuple(m["id"] for m in context.memories),
+            tuple(m["importance"] for m in context.memories),
+        )
 
 
 class PFCDecisionStep(PipelineStep):
     """PFC 의사결정 단계"""
     
+    reads = ("actions",)
+    writes = ("utilities", "probabilities", "metadata.pfc_result")
+    effects = ("pfc",)
+    
     def __init__(self, pfc_engine):
         self.pfc_engine = pfc_engine
     
     def process(self, context: PipelineContext) -> PipelineContext:
-        """PFC 결정"""
-        pfc_result = self.pfc_engine.process(context.actions)
-        context.utilities = [
-            self.pfc_engine.evaluate_action(a) for a in context.actions
-        ]
-        context.probabilities = self.pfc_engine.softmax_probabilities(context.utilities)
-        context.metadata["pfc_result"] = pfc_result
+        """PFC 결정 (효용/확률은 결정에 쓰인 배열을 그대로 사용)"""
+        from .engines.pfc import ActionArrays
+        
+        decision = self.pfc_engine.process_arrays(ActionArrays.from_actions(context.actions))
+        context.utilities = decision.utilities.tolist()
+        context.probabilities = decision.probabilities.tolist()
+        context.metadata["pfc_result"] = decision.result
         return context
 
 
 class EntropyCalculationStep(PipelineStep):
     """엔트로피 계산 단계"""
     
+    reads = ("probabilities",)
+    writes = ("entropy",)
+    effects = ("dynamics",)  # dynamics.state.entropy 갱신
+    
     def __init__(self, dynamics_engine):
         """
         Args:
@@ -143,6 +255,11 @@ class EntropyCalculationStep(PipelineStep):
 class CoreStrengthStep(PipelineStep):
     """코어 강도 계산 단계 (Core Decay 포함)"""
     
+    # memory_arrays는 memories와 같은 회상 결과이므로 캐시 키는 memories로 충분
+    reads = ("memories", "entropy", "options")
+    writes = ("core_strength", "metadata.cognitive_distress", "metadata.distress_message")
+    effects = ("dynamics",)
+    
     def __init__(self, dynamics_engine, kernel):
         """
         Args:
@@ -155,11 +272,23 @@ class CoreStrengthStep(PipelineStep):
     def process(self, context: PipelineContext) -> PipelineContext:
         """코어 강도 계산 (Core Decay 동역학 적용)"""
         # DynamicsEngine을 사용하여 코어 강도 계산
-        context.core_strength = self.dynamics_engine.calculate_core_strength(
-            context.memories,
-            memory_update_failure=self.kernel.mode_config.memory_update_failure,
-            alpha=self.dynamics_engine.config.memory_alpha,
-        )
+        # (열 지향 회상 결과가 있으면 배열 경로, 없으면 기억 딕셔너리 경로)
+        memory_failure = self.kernel.mode_config.memory_update_failure
+        alpha = self.dynamics_engine.config.memory_alpha
+        arrays = context.memory_arrays
+        if arrays is not None:
+            context.core_strength = self.dynamics_engine.calculate_core_strength_arrays(
+                arrays.importances,
+                arrays.timestamps,
+                memory_update_failure=memory_failure,
+                alpha=alpha,
+            )
+        else:
+            context.core_strength = self.dynamics_engine.calculate_core_strength(
+                context.memories,
+                memory_update_failure=memory_failure,
+                alpha=alpha,
+            )
         
         # 인지적 절규 확인
         distress, message = self.dynamics_engine.check_cognitive_distress(
@@ -176,22 +305,30 @@ class CoreStrengthStep(PipelineStep):
 class TorqueGenerationStep(PipelineStep):
     """회전 토크 생성 단계"""
     
-    def __init__(self, dynamics_engine, mode):
+    reads = ("options", "entropy")
+    writes = ("auto_torque", "metadata.precession_phi")
+    effects = ("dynamics",)
+    
+    def __init__(self, dynamics_engine, mode=None, kernel=None):
         """
         Args:
             dynamics_engine: DynamicsEngine 인스턴스
-            mode: 인지 모드 (CognitiveMode)
+            mode: 인지 모드 (CognitiveMode, kernel이 없을 때 사용하는 고정 모드)
+            kernel: CognitiveKernel 인스턴스 (주면 실행 시점의 kernel.mode 사용,
+                    set_mode() 후에도 파이프라인을 다시 만들 필요 없음)
         """
         self.dynamics_engine = dynamics_engine
         self.mode = mode
+        self.kernel = kernel
     
     def process(self, context: PipelineContext) -> PipelineContext:
         """회전 토크 생성"""
+        mode = self.kernel.mode if self.kernel is not None else self.mode
         # DynamicsEngine을 사용하여 회전 토크 생성
         context.auto_torque = self.dynamics_engine.generate_torque(
             context.options,
             context.entropy,
-            self.mode,
+            mode,
         )
         
         # 위상 저장 (메타데이터에)
@@ -201,7 +338,11 @@ class TorqueGenerationStep(PipelineStep):
 
 
 class UtilityRecalculationStep(PipelineStep):
-    """Utility 재계산 단계"""
+    """Utility 재계산 단계 (기본 파이프라인은 TorqueDecisionStep 사용)"""
+    
+    reads = ("options", "memories", "auto_torque")
+    writes = ("actions", "utilities", "probabilities", "metadata.pfc_result")
+    effects = ("pfc",)
     
     def __init__(
         self,
@@ -217,7 +358,7 @@ class UtilityRecalculationStep(PipelineStep):
     
     def process(self, context: PipelineContext) -> PipelineContext:
         """Utility 재계산 (토크 반영)"""
-        from .engines.pfc import Action
+        from .engines.pfc import Action, ActionArrays
         
         if context.auto_torque:
             actions = []
@@ -240,78 +381,423 @@ class UtilityRecalculationStep(PipelineStep):
             
             context.actions = actions
             # PFC 재결정
-            pfc_result = self.pfc_engine.process(actions)
-            context.utilities = [
-                self.pfc_engine.evaluate_action(a) for a in actions
-            ]
-            context.probabilities = self.pfc_engine.softmax_probabilities(context.utilities)
-            context.metadata["pfc_result"] = pfc_result
+            decision = self.pfc_engine.process_arrays(ActionArrays.from_actions(actions))
+            context.utilities = decision.utilities.tolist()
+            context.probabilities = decision.probabilities.tolist()
+            context.metadata["pfc_result"] = decision.result
         
         return context
 
 
-class ResultAssemblyStep(PipelineStep):
-    """결과 조립 단계"""
+class UtilityEvaluationStep(PipelineStep):
+    """
+    효용/확률 계산 단계 (선택 없음)
     
-    def __init__(self, pfc_engine, basal_ganglia_engine=None):
+    PFCDecisionStep과 같은 효용/확률을 계산하지만 샘플링과
+    Working Memory 감쇠를 하지 않는다. 실제 선택은 TorqueDecisionStep에서
+    한 번만 수행한다.
+    """
+    
+    reads = ("action_arrays",)
+    writes = ("utilities", "probabilities")
+    
+    def __init__(self, pfc_engine):
         self.pfc_engine = pfc_engine
-        self.basal_ganglia_engine = basal_ganglia_engine
     
     def process(self, context: PipelineContext) -> PipelineContext:
-        """최종 결과 조립"""
-        pfc_result = context.metadata.get("pfc_result")
+        """효용/확률 계산"""
+        utilities = self.pfc_engine.evaluate_arrays(context.action_arrays)
+        context.utilities = utilities.tolist()
+        context.probabilities = self.pfc_engine.softmax_array(utilities).tolist()
+        return context
+
+
+class TorqueDecisionStep(PipelineStep):
+    """
+    토크 반영 의사결정 단계 (PFCDecisionStep + UtilityRecalculationStep 통합)
+    
+    ActionCreationStep이 만든 배열에 토크만 더해 PFC 결정을 한 번 수행한다.
+    """
+    
+    reads = ("options", "action_arrays", "auto_torque")
+    writes = ("action_arrays", "utilities", "probabilities", "metadata.pfc_result")
+    effects = ("pfc",)
+    
+    def __init__(self, pfc_engine):
+        self.pfc_engine = pfc_engine
+    
+    def process(self, context: PipelineContext) -> PipelineContext:
+        """토크 주입 후 PFC 결정"""
+        from .engines.pfc import ActionArrays
         
-        probability_distribution = {
-            opt: prob for opt, prob in zip(context.options, context.probabilities)
-        }
+        arrays = context.action_arrays
+        if context.auto_torque:
+            torque = np.fromiter(
+                (context.auto_torque.get(opt, 0.0) for opt in context.options),
+                dtype=float,
+                count=len(context.options),
+            )
+            arrays = ActionArrays(
+                rewards=arrays.rewards + torque,
+                costs=arrays.costs,
+                risks=arrays.risks,
+                names=list(context.options),
+            )
+            context.action_arrays = arrays
         
+        decision = self.pfc_engine.process_arrays(arrays)
+        context.utilities = decision.utilities.tolist()
+        context.probabilities = decision.probabilities.tolist()
+        context.metadata["pfc_result"] = decision.result
+        return context
+
+
+class HabitLookupStep(PipelineStep):
+    """
+    습관 조회 단계 (BasalGanglia)
+    
+    엔트로피/토크와 독립적이므로 병렬 실행 시 다른 단계와 동시에 실행된다.
+    """
+    
+    reads = ("options", "metadata.context")
+    writes = ("metadata.habit_action",)
+    effects = ("basal_ganglia",)
+    
+    def __init__(self, basal_ganglia_engine):
+        self.basal_ganglia_engine = basal_ganglia_engine
+    
+    def process(self, context: PipelineContext) -> PipelineContext:
+        """컨텍스트가 있으면 습관 행동 조회"""
         habit_action = None
         if self.basal_ganglia_engine and context.metadata.get("context"):
             habit_action = self.basal_ganglia_engine.select_action(
                 context.metadata["context"],
                 context.options,
             )
+        context.metadata["habit_action"] = habit_action
+        return context
+
+
+class ResultAssemblyStep(PipelineStep):
+    """결과 조립 단계 (HabitLookupStep이 없으면 습관도 직접 조회)"""
+    
+    reads = (
+        "options",
+        "probabilities",
+        "entropy",
+        "core_strength",
+        "metadata.pfc_result",
+        "metadata.context",
+        "metadata.habit_action",
+        "metadata.cognitive_distress",
+        "metadata.distress_message",
+    )
+    writes = ("result",)
+    effects = ("basal_ganglia",)
+    
+    def __init__(self, pfc_engine, basal_ganglia_engine=None):
+        self.pfc_engine = pfc_engine
+        self.basal_ganglia_engine = basal_ganglia_engine
+    
+    def process(self, context: PipelineContext) -> PipelineContext:
+        """최종 결과 조립"""
+        pfc_result = context.metadata.get("pfc_result")
         
-        # 인지적 절규 상태 확인
-        cognitive_distress = context.metadata.get("cognitive_distress", False)
-        distress_message = context.metadata.get("distress_message", "")
+        if "habit_action" in context.metadata:
+            habit_action = context.metadata["habit_action"]
+        else:
+            habit_action = None
+            if self.basal_ganglia_engine and context.metadata.get("context"):
+                habit_action = self.basal_ganglia_engine.select_action(
+                    context.metadata["context"],
+                    context.options,
+                )
         
-        context.result = {
-            "action": pfc_result.action.name if pfc_result and pfc_result.action else None,
-            "utility": pfc_result.utility if pfc_result else 0.0,
-            "probability": pfc_result.selection_probability if pfc_result else 0.0,
-            "probability_distribution": probability_distribution,
-            "entropy": context.entropy,
-            "core_strength": context.core_strength,
-            "habit_suggestion": habit_action,
-            "conflict": (
-                pfc_result.action.name != habit_action
-                if (pfc_result and pfc_result.action and habit_action)
-                else False
-            ),
-            "cognitive_distress": cognitive_distress,  # 인지적 절규 상태
-            "distress_message": distress_message,  # 절규 메시지
-        }
+        context.result = build_decision_result(
+            options=context.options,
+            probabilities=context.probabilities,
+            pfc_result=pfc_result,
+            entropy=context.entropy,
+            core_strength=context.core_strength,
+            habit_action=habit_action,
+            cognitive_distress=context.metadata.get("cognitive_distress", False),
+            distress_message=context.metadata.get("distress_message", ""),
+        )
         
         return context
 
 
+def _freeze(value: Any) -> Any:
+    """캐시 키 비교용 불변 값 변환 (리스트/딕셔너리는 튜플로)"""
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def _is_barrier(step: PipelineStep) -> bool:
+    return not (step.reads or step.writes or step.effects)
+
+
+def _conflicts(before: PipelineStep, after: PipelineStep) -> bool:
+    """before 단계가 after 단계보다 먼저 실행돼야 하는지 여부"""
+    before_writes = set(before.writes)
+    after_writes = set(after.writes)
+    return bool(
+        before_writes.intersection(after.reads)
+        or before_writes.intersection(after_writes)
+        or after_writes.intersection(before.reads)
+        or set(before.effects).intersection(after.effects)
+    )
+
+
+def build_decision_result(
+    options: List[str],
+    probabilities: List[float],
+    pfc_result: Any,
+    entropy: float,
+    core_strength: float,
+    habit_action: Any = None,
+    cognitive_distress: bool = False,
+    distress_message: str = "",
+) -> Dict[str, Any]:
+    """의사결정 결과 딕셔너리 조립 (decide / decide_batch 공통)"""
+    probability_distribution = {
+        opt: prob for opt, prob in zip(options, probabilities)
+    }
+    
+    return {
+        "action": pfc_result.action.name if pfc_result and pfc_result.action else None,
+        "utility": pfc_result.utility if pfc_result else 0.0,
+        "probability": pfc_result.selection_probability if pfc_result else 0.0,
+        "probability_distribution": probability_distribution,
+        "entropy": entropy,
+        "core_strength": core_strength,
+        "habit_suggestion": habit_action,
+        "conflict": (
+            pfc_result.action.name != habit_action
+            if (pfc_result and pfc_result.action and habit_action)
+            else False
+        ),
+        "cognitive_distress": cognitive_distress,  # 인지적 절규 상태
+        "distress_message": distress_message,  # 절규 메시지
+    }
+
+
 class DecisionPipeline:
-    """의사결정 파이프라인"""
+    """
+    의사결정 파이프라인
+    
+    executor:
+        "sequential": 단계를 순서대로 실행 (기본)
+        "threads": reads/writes/effects 의존성 그래프에 따라
+            독립 단계를 스레드 풀에서 동시에 실행
+    execute_async()는 실행기 설정과 무관하게 같은 그래프를 asyncio로 실행한다.
+    """
+    
+    EXECUTORS = ("sequential", "threads")
     
-    def __init__(self, steps: List[PipelineStep]):
+    def __init__(
+        self,
+        steps: List[PipelineStep],
+        profiler: Optional[Any] = None,
+        executor: str = "sequential",
+        max_workers: Optional[int] = None,
+    ):
         """
         Args:
             steps: 파이프라인 단계 리스트 (순서대로 실행)
+            profiler: 단계별 계측기 (PipelineProfiler, None이면 계측 없음)
+            executor: 실행기 ("sequential" 또는 "threads")
+            max_workers: 스레드 풀 크기 (None이면 ThreadPoolExecutor 기본값)
+        
+        Raises:
+            ConfigurationError: 알 수 없는 실행기인 경우
         """
+        if executor not in self.EXECUTORS:
+            raise ConfigurationError(
+                f"executor must be one of {self.EXECUTORS}, got {executor!r}"
+            )
         self.steps = steps
+        self.profiler = profiler
+        self.executor = executor
+        self.max_workers = max_workers
+        self.memo_hits = 0
+        self._memo: Dict[PipelineStep, Tuple[Any, Dict[str, Any]]] = {}
+        self._memo_lock = threading.Lock()  # 스레드 실행기의 작업 스레드가 함께 갱신
+        self._pool: Optional[ThreadPoolExecutor] = None
     
     def execute(self, context: PipelineContext) -> PipelineContext:
         """파이프라인 실행"""
-        for step in self.steps:
+        profiler = self.profiler
+        if (
+            profiler is None
+            and self.executor == "sequential"
+            and not any(step.memoize for step in self.steps)
+        ):
+            for step in self.steps:
+                context = step.process(context)
+            return context
+        
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        if self.executor == "threads":
+            context = self._execute_threads(context)
+        else:
+            for step in self.steps:
+                context = self._run_step(step, context)
+        if profiler is not None:
+            profiler.record(
+                profiler.TOTAL_KEY,
+                time.perf_counter() - wall_start,
+                time.thread_time() - cpu_start,
+            )
+        return context
+    
+    async def execute_async(self, context: PipelineContext) -> PipelineContext:
+        """
+        파이프라인 비동기 실행 (독립 단계는 asyncio 태스크로 동시 실행)
+        
+        각 단계는 실행기 스레드에서 돌고, 이벤트 루프는 막히지 않는다.
+        """
+        import asyncio  # 비동기 경로에서만 필요 (패키지 임포트 시간 절약)
+        
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool() if self.executor == "threads" else None
+        deps = [set(d) for d in self.dependency_graph()]
+        remaining = list(range(len(self.steps)))
+        done: set = set()
+        running: Dict[Any, int] = {}
+        error: Optional[BaseException] = None
+        wall_start = time.perf_counter()
+        
+        while remaining or running:
+            ready = [i for i in remaining if deps[i] <= done] if error is None else []
+            for i in ready:
+                remaining.remove(i)
+                future = loop.run_in_executor(pool, self._run_in_place, self.steps[i], context)
+                running[future] = i
+            if not running:
+                break
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for future in finished:
+                done.add(running.pop(future))
+                if future.exception() is not None and error is None:
+                    error = future.exception()
+        
+        if error is not None:
+            raise error
+        if self.profiler is not None:
+            self.profiler.record(self.profiler.TOTAL_KEY, time.perf_counter() - wall_start, 0.0)
+        return context
+    
+    def dependency_graph(self) -> List[List[int]]:
+        """
+        단계별 선행 단계 인덱스 목록
+        
+        앞 단계가 쓴 필드를 읽거나(RAW), 앞 단계가 읽거나 쓴 필드를 쓰거나
+        (WAR/WAW), 같은 effects 자원을 쓰면 선행 관계가 생긴다.
+        아무것도 선언하지 않은 단계는 장벽으로 취급한다.
+        """
+        graph: List[List[int]] = []
+        for i, step in enumerate(self.steps):
+            if _is_barrier(step):
+                graph.append(list(range(i)))
+                continue
+            graph.append([
+                j for j in range(i)
+                if _is_barrier(self.steps[j]) or _conflicts(self.steps[j], step)
+            ])
+        return graph
+    
+    def _execute_threads(self, context: PipelineContext) -> PipelineContext:
+        """의존성 그래프에 따라 독립 단계를 스레드 풀에서 동시 실행"""
+        pool = self._get_pool()
+        deps = [set(d) for d in self.dependency_graph()]
+        remaining = list(range(len(self.steps)))
+        done: set = set()
+        running: Dict[Any, int] = {}
+        error: Optional[BaseException] = None
+        
+        while remaining or running:
+            ready = [i for i in remaining if deps[i] <= done] if error is None else []
+            for i in ready:
+                remaining.remove(i)
+            
+            # 실행 가능한 단계가 하나뿐이면 스레드 전환 없이 직접 실행
+            if len(ready) == 1 and not running:
+                self._run_in_place(self.steps[ready[0]], context)
+                done.add(ready[0])
+                continue
+            
+            for i in ready:
+                running[pool.submit(self._run_in_place, self.steps[i], context)] = i
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                done.add(running.pop(future))
+                if future.exception() is not None and error is None:
+                    error = future.exception()
+        
+        if error is not None:
+            raise error
+        return context
+    
+    def _run_in_place(self, step: PipelineStep, context: PipelineContext) -> None:
+        """동시 실행용: 단계는 같은 컨텍스트 객체를 갱신해야 한다"""
+        if self._run_step(step, context) is not context:
+            raise ConfigurationError(
+                f"{step!r} returned a new context; concurrent execution "
+                "requires steps to update the context in place"
+            )
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="decision-pipeline",
+            )
+        return self._pool
+    
+    def close(self) -> None:
+        """스레드 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+    
+    def _run_step(self, step: PipelineStep, context: PipelineContext) -> PipelineContext:
+        """단계 하나 실행 (memoize 단계는 입력이 같으면 직전 출력 재사용)"""
+        key = None
+        if step.memoize:
+            key = step.cache_key(context)
+            with self._memo_lock:
+                cached = self._memo.get(step)
+                hit = cached is not None and cached[0] == key
+                if hit:
+                    self.memo_hits += 1
+            if hit:
+                for name, value in cached[1].items():
+                    set_context_field(context, name, value)
+                return context
+        
+        if self.profiler is None:
             context = step.process(context)
+        else:
+            context = self.profiler.run_step(step, context)
+        
+        if step.memoize:
+            outputs = {name: get_context_field(context, name) for name in step.writes}
+            with self._memo_lock:
+                self._memo[step] = (key, outputs)
         return context
     
+    def clear_cache(self) -> None:
+        """재사용 캐시 비우기"""
+        with self._memo_lock:
+            self._memo.clear()
+    
     def add_step(self, step: PipelineStep, index: Optional[int] = None):
         """단계 추가"""
         if index is None:
@@ -323,11 +809,15 @@ class DecisionPipeline:
         """단계 제거"""
         if step in self.steps:
             self.steps.remove(step)
+        with self._memo_lock:
+            self._memo.pop(step, None)
     
     def replace_step(self, old_step: PipelineStep, new_step: PipelineStep):
         """단계 교체"""
         index = self.steps.index(old_step)
         self.steps[index] = new_step
+        with self._memo_lock:
+            self._memo.pop(old_step, None)
     
     def __repr__(self) -> str:
         step_names = [step.__class__.__name__ for step in self.steps]
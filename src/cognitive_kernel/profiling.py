@@ -0,0 +1,175 @@
+"""
+⏱️ Pipeline Profiling
+
+의사결정 파이프라인 단계별 계측.
+
+- 단계별 wall/CPU 시간, 호출 수
+- 할당량 (tracemalloc 사용 시 바이트/피크, 블록 수)
+- 로그 간격 히스토그램으로 집계
+- kernel.status() 조회 또는 JSON 파일 덤프
+
+계측기를 연결하지 않은 파이프라인은 단계 루프만 실행한다 (오버헤드 없음).
+
+사용 예시:
+    from cognitive_kernel.profiling import PipelineProfiler
+
+    profiler = PipelineProfiler(track_allocations=True)
+    pipeline = DecisionPipeline([...], profiler=profiler)
+    ...
+    profiler.snapshot()["MemoryLoadStep"]["wall_mean_ms"]
+    profiler.dump("profile.json")
+
+Author: GNJz (Qquarts)
+Version: 2.0.3+
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 히스토그램 버킷 상한 (밀리초, 로그 간격). 마지막 버킷은 상한 없음.
+HISTOGRAM_BOUNDS_MS = (0.01, 0.03, 0.1, 0.3, 1.0, 3.0, 10.0, 30.0, 100.0, 300.0, 1000.0)
+
+
+@dataclass
+class StepStats:
+    """단계별 누적 통계"""
+    calls: int = 0
+    wall_total: float = 0.0
+    wall_max: float = 0.0
+    cpu_total: float = 0.0
+    alloc_bytes: int = 0
+    alloc_peak_bytes: int = 0
+    alloc_blocks: int = 0
+    histogram: List[int] = field(
+        default_factory=lambda: [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+    )
+
+    def record(self, wall: float, cpu: float) -> None:
+        self.calls += 1
+        self.wall_total += wall
+        self.cpu_total += cpu
+        if wall > self.wall_max:
+            self.wall_max = wall
+        self.histogram[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, wall * 1000.0)] += 1
+
+    def to_dict(self, track_allocations: bool) -> Dict[str, Any]:
+        labels = [f"<={b:g}ms" for b in HISTOGRAM_BOUNDS_MS]
+        labels.append(f">{HISTOGRAM_BOUNDS_MS[-1]:g}ms")
+        data = {
+            "calls": self.calls,
+            "wall_total_ms": self.wall_total * 1000.0,
+            "wall_mean_ms": self.wall_total * 1000.0 / self.calls if self.calls else 0.0,
+            "wall_max_ms": self.wall_max * 1000.0,
+            "cpu_total_ms": self.cpu_total * 1000.0,
+            "histogram": dict(zip(labels, self.histogram)),
+        }
+        if track_allocations:
+            data["alloc_bytes"] = self.alloc_bytes
+            data["alloc_peak_bytes"] = self.alloc_peak_bytes
+            data["alloc_blocks"] = self.alloc_blocks
+        return data
+
+
+class PipelineProfiler:
+    """
+    파이프라인 단계별 계측기
+
+    DecisionPipeline에 연결하면 각 단계를 run_step()으로 감싸 실행한다.
+    전체 실행 시간은 "__total__" 항목으로 집계된다.
+    """
+
+    TOTAL_KEY = "__total__"
+
+    def __init__(self, track_allocations: bool = False):
+        """
+        Args:
+            track_allocations: True면 tracemalloc으로 단계별 할당량 측정
+                (tracemalloc이 꺼져 있으면 켜고, close() 시 끈다)
+        """
+        self.track_allocations = track_allocations
+        self._stats: Dict[str, StepStats] = {}
+        self._lock = threading.Lock()  # 스레드 실행기의 작업 스레드가 동시에 기록
+        self._started_tracemalloc = False
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def run_step(self, step: Any, context: Any) -> Any:
+        """단계 하나를 계측하며 실행"""
+        if self.track_allocations:
+            return self._run_with_allocations(repr(step), step.process, context)
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        context = step.process(context)
+        self.record(repr(step), time.perf_counter() - wall_start, time.thread_time() - cpu_start)
+        return context
+
+    def _run_with_allocations(self, name: str, func: Any, context: Any) -> Any:
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        mem_start, _ = tracemalloc.get_traced_memory()
+        blocks_start = sys.getallocatedblocks()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+
+        context = func(context)
+
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        mem_end, mem_peak = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks() - blocks_start
+        with self._lock:
+            stats = self._record(name, wall, cpu)
+            stats.alloc_bytes += mem_end - mem_start
+            stats.alloc_peak_bytes = max(stats.alloc_peak_bytes, mem_peak - mem_start)
+            stats.alloc_blocks += blocks
+        return context
+
+    def record(self, name: str, wall: float, cpu: float) -> StepStats:
+        """측정값 기록 (외부 실행기에서 직접 기록할 때도 사용)"""
+        with self._lock:
+            return self._record(name, wall, cpu)
+
+    def _record(self, name: str, wall: float, cpu: float) -> StepStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = StepStats()
+        stats.record(wall, cpu)
+        return stats
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """단계별 집계 결과 (단계 이름 → 통계 딕셔너리)"""
+        with self._lock:
+            return {
+                name: stats.to_dict(self.track_allocations)
+                for name, stats in self._stats.items()
+            }
+
+    def dump(self, path: str, indent: Optional[int] = 2) -> Dict[str, Dict[str, Any]]:
+        """집계 결과를 JSON 파일로 저장"""
+        data = self.snapshot()
+        Path(path).write_text(json.dumps(data, indent=indent))
+        return data
+
+    def reset(self) -> None:
+        """집계 초기화"""
+        with self._lock:
+            self._stats.clear()
+
+    def close(self) -> None:
+        """이 계측기가 켠 tracemalloc 종료"""
+        if self._started_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracemalloc = False
+
+    def __repr__(self) -> str:
+        return f"PipelineProfiler(steps={len(self._stats)}, track_allocations={self.track_allocations})"
@@ -0,0 +1,539 @@
+"""
+🔌 Kernel Server
+
+같은 호스트의 여러 워커 프로세스가 세션을 공유하도록 CognitiveKernel을
+Unix 도메인 소켓으로 노출하는 독립 서버 프로세스.
+
+- 세션 상주는 SessionManager가 관리 (LRU, 지연 로드, 백그라운드 저장)
+- 같은 세션에 동시에 들어온 요청은 서버에서 묶어서 처리 (micro-batching)
+    - 연속된 decide → decide_batch 한 번
+    - 연속된 같은 k의 recall → recall 한 번
+- 세션별 요청 순서는 도착 순서대로 보존
+- KernelClient: 스레드 안전한 연결 풀 기반 동기 클라이언트
+
+프로토콜 (NDJSON, 한 줄에 JSON 하나):
+    요청: {"id": 1, "op": "decide", "session": "user-42", "args": {"options": ["a", "b"]}}
+    응답: {"id": 1, "ok": true, "result": {...}}
+          {"id": 1, "ok": false, "error": {"type": "ValidationError", "message": "..."}}
+
+    op: ping, remember, recall, decide, status, save, stats
+    한 연결에서 여러 요청을 보낼 수 있으며 응답은 완료 순서로 온다 (id로 매칭).
+
+실행:
+    python -m cognitive_kernel.server --socket /tmp/ck.sock --storage-dir .cognitive_kernel
+
+클라이언트:
+    from cognitive_kernel.server import KernelClient
+
+    with KernelClient("/tmp/ck.sock") as client:
+        memory_id = client.remember("user-42", "meeting", {"topic": "project"}, importance=0.9)
+        memories = client.recall("user-42", k=5)
+        decision = client.decide("user-42", ["rest", "work"])
+
+Author: GNJz (Qquarts)
+Version: 2.0.3+
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import queue
+import signal
+import socket
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .core import CognitiveConfig, CognitiveKernel
+from . import exceptions
+from .exceptions import CognitiveKernelError, ValidationError
+from .session_manager import SessionManager
+
+
+# 한 줄(요청/응답) 최대 크기
+MAX_LINE_BYTES = 16 * 1024 * 1024
+
+# 세션이 필요 없는 요청
+_SERVER_OPS = frozenset({"ping", "stats"})
+_SESSION_OPS = frozenset({"remember", "recall", "decide", "status", "save"})
+
+
+def _json_default(value: Any) -> Any:
+    """NumPy 값 직렬화"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    return json.dumps(message, ensure_ascii=False, default=_json_default).encode("utf-8") + b"\n"
+
+
+def _error_payload(error: BaseException) -> Dict[str, str]:
+    return {"type": type(error).__name__, "message": str(error)}
+
+
+@dataclass
+class _Request:
+    """세션 큐에 대기 중인 요청"""
+    op: str
+    args: Dict[str, Any]
+    future: "asyncio.Future[Any]" = field(repr=False)
+
+
+# ======================================================================
+# 서버
+# ======================================================================
+
+class KernelServer:
+    """
+    🔌 Unix 소켓 커널 서버
+
+    세션마다 요청 큐를 두고, 큐를 비우는 작업이 한 번에 최대 max_batch개를
+    꺼내 연속된 같은 종류의 요청을 묶어 실행한다. 커널 연산은 스레드 풀에서
+    수행하므로 이벤트 루프는 막히지 않는다.
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        config: Optional[CognitiveConfig] = None,
+        max_resident: int = 128,
+        batch_window: float = 0.001,
+        max_batch: int = 64,
+    ):
+        """
+        Args:
+            socket_path: Unix 소켓 경로
+            config: 세션 공유 설정 (None이면 auto_save=False 기본 설정)
+            max_resident: 최대 상주 세션 수
+            batch_window: 세션 큐의 첫 요청 후 다른 요청을 기다리는 시간 (초)
+            max_batch: 한 번에 묶을 최대 요청 수
+        """
+        if batch_window < 0:
+            raise ValidationError(f"batch_window must be >= 0, got {batch_window}")
+        if max_batch < 1:
+            raise ValidationError(f"max_batch must be >= 1, got {max_batch}")
+        self.socket_path = socket_path
+        self.manager = SessionManager(
+            config or CognitiveConfig(auto_save=False), max_resident=max_resident
+        )
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._queues: Dict[str, List[_Request]] = {}
+        self._drainers: set = set()
+
+        self.requests = 0
+        self.batches = 0
+        self.batched_requests = 0  # 다른 요청과 묶여 처리된 요청 수
+
+    # ------------------------------------------------------------------
+    # 수명 관리
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """소켓 열기 (기존 소켓 파일은 교체)"""
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=self.socket_path, limit=MAX_LINE_BYTES
+        )
+
+    async def serve_forever(self) -> None:
+        """start() 후 종료될 때까지 서비스"""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+
+    async def aclose(self) -> None:
+        """새 연결 중단, 대기 중인 요청 완료 후 세션 저장"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._drainers:
+            await asyncio.gather(*self._drainers, return_exceptions=True)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.manager.close)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def stats(self) -> Dict[str, Any]:
+        """서버/세션 관리자 지표"""
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "batched_requests": self.batched_requests,
+            "queued_sessions": len(self._queues),
+            "sessions": self.manager.metrics(),
+        }
+
+    # ------------------------------------------------------------------
+    # 연결 처리
+    # ------------------------------------------------------------------
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        write_lock = asyncio.Lock()
+        pending: set = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+                    break
+                if not line:
+                    break
+                task = asyncio.ensure_future(self._respond(line, writer, write_lock))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter, write_lock: asyncio.Lock) -> None:
+        request_id = None
+        try:
+            message = json.loads(line)
+            if not isinstance(message, dict):
+                raise ValidationError("request must be a JSON object")
+            request_id = message.get("id")
+            result = await self.submit(
+                message.get("op"), message.get("session"), message.get("args") or {}
+            )
+            response = {"id": request_id, "ok": True, "result": result}
+        except json.JSONDecodeError as e:
+            response = {"id": request_id, "ok": False, "error": _error_payload(ValidationError(f"invalid JSON: {e}"))}
+        except Exception as e:
+            response = {"id": request_id, "ok": False, "error": _error_payload(e)}
+
+        try:
+            data = _encode(response)
+        except (TypeError, ValueError) as e:
+            data = _encode({"id": request_id, "ok": False, "error": _error_payload(e)})
+        async with write_lock:
+            try:
+                writer.write(data)
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    async def submit(self, op: Any, session: Any, args: Dict[str, Any]) -> Any:
+        """
+        요청 하나 처리 (연결 없이 같은 루프에서 직접 호출 가능)
+
+        Raises:
+            ValidationError: 알 수 없는 op, 세션 이름/인자 형식 오류
+        """
+        self.requests += 1
+        if op in _SERVER_OPS:
+            return "pong" if op == "ping" else self.stats()
+        if op not in _SESSION_OPS:
+            raise ValidationError(f"unknown op {op!r}")
+        if not isinstance(session, str) or not session:
+            raise ValidationError(f"session must be a non-empty string, got {session!r}")
+        if not isinstance(args, dict):
+            raise ValidationError("args must be a JSON object")
+
+        future = asyncio.get_running_loop().create_future()
+        queued = self._queues.get(session)
+        if queued is None:
+            queued = self._queues[session] = []
+            drainer = asyncio.ensure_future(self._drain(session))
+            self._drainers.add(drainer)
+            drainer.add_done_callback(self._drainers.discard)
+        queued.append(_Request(op, args, future))
+        return await future
+
+    # ------------------------------------------------------------------
+    # 세션 큐 / micro-batching
+    # ------------------------------------------------------------------
+
+    async def _drain(self, session: str) -> None:
+        # 같은 세션의 큐는 이 작업 하나만 비운다 (세션별 순서 보존)
+        try:
+            await asyncio.sleep(self.batch_window)
+            while True:
+                queued = self._queues[session]
+                if not queued:
+                    break
+                batch = queued[:self.max_batch]
+                del queued[:self.max_batch]
+                for run in _group_runs(batch):
+                    await self._execute(session, run)
+        finally:
+            del self._queues[session]
+
+    async def _execute(self, session: str, run: List[_Request]) -> None:
+        self.batches += 1
+        if len(run) > 1:
+            self.batched_requests += len(run)
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(None, self._run_on_kernel, session, run)
+        except Exception as e:
+            if len(run) > 1:
+                # 묶음 전체가 실패하면 개별 실행으로 각자의 오류를 돌려준다
+                for request in run:
+                    await self._execute(session, [request])
+                return
+            results = [e]
+        for request, result in zip(run, results):
+            if request.future.done():
+                continue
+            if isinstance(result, BaseException):
+                request.future.set_exception(result)
+            else:
+                request.future.set_result(result)
+
+    def _run_on_kernel(self, session: str, run: List[_Request]) -> List[Any]:
+        with self.manager.session(session) as kernel:
+            return _run_requests(kernel, run)
+
+
+def _batch_key(request: _Request) -> Any:
+    """같은 키를 가진 연속 요청은 한 번에 실행 (None이면 단독 실행)"""
+    args = request.args
+    if request.op == "decide":
+        rest = {k: v for k, v in args.items() if k not in ("options", "context")}
+        if set(rest) - {"use_habit"}:
+            return None  # external_torque/use_pipeline 등은 decide_batch 미지원
+        return ("decide", rest.get("use_habit", True) is not False)
+    if request.op == "recall":
+        return ("recall", json.dumps(args, sort_keys=True, default=repr))
+    return None
+
+
+def _group_runs(batch: List[_Request]) -> List[List[_Request]]:
+    runs: List[List[_Request]] = []
+    last_key = None
+    for request in batch:
+        key = _batch_key(request)
+        if key is not None and runs and key == last_key:
+            runs[-1].append(request)
+        else:
+            runs.append([request])
+        last_key = key
+    return runs
+
+
+def _run_requests(kernel: CognitiveKernel, run: List[_Request]) -> List[Any]:
+    first = run[0]
+    if len(run) > 1 and first.op == "decide":
+        return kernel.decide_batch(
+            [request.args.get("options") for request in run],
+            contexts=[request.args.get("context") for request in run],
+            use_habit=first.args.get("use_habit", True) is not False,
+        )
+    if len(run) > 1 and first.op == "recall":
+        memories = kernel.recall(**first.args)
+        return [memories] * len(run)  # 응답마다 따로 직렬화됨
+    return [_SESSION_HANDLERS[first.op](kernel, first.args)]
+
+
+_SESSION_HANDLERS: Dict[str, Callable[[CognitiveKernel, Dict[str, Any]], Any]] = {
+    "remember": lambda kernel, args: kernel.remember(**args),
+    "recall": lambda kernel, args: kernel.recall(**args),
+    "decide": lambda kernel, args: kernel.decide(**args),
+    "status": lambda kernel, args: kernel.status(),
+    "save": lambda kernel, args: kernel.save(),
+}
+
+
+# ======================================================================
+# 클라이언트
+# ======================================================================
+
+class KernelClient:
+    """
+    🔌 KernelServer 동기 클라이언트
+
+    연결 풀을 사용하므로 여러 스레드에서 하나의 클라이언트를 공유해도 된다.
+    한 연결에는 한 번에 한 요청만 보낸다.
+    """
+
+    def __init__(self, socket_path: str, pool_size: int = 4, timeout: Optional[float] = 30.0):
+        """
+        Args:
+            socket_path: 서버 소켓 경로
+            pool_size: 최대 연결 수
+            timeout: 요청당 소켓 타임아웃 (초, None이면 무제한)
+        """
+        if pool_size < 1:
+            raise ValidationError(f"pool_size must be >= 1, got {pool_size}")
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._ids = itertools.count(1)
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    def ping(self) -> str:
+        return self.call("ping")
+
+    def remember(self, session: str, event_type: str, content: Optional[Dict[str, Any]] = None, **kwargs) -> str:
+        """기억 저장 (CognitiveKernel.remember와 같은 인자)"""
+        return self.call("remember", session, event_type=event_type, content=content, **kwargs)
+
+    def recall(self, session: str, k: int = 5) -> List[Dict[str, Any]]:
+        """중요한 기억 회상 (Top-k)"""
+        return self.call("recall", session, k=k)
+
+    def decide(self, session: str, options: Sequence[str], **kwargs) -> Dict[str, Any]:
+        """의사결정 (CognitiveKernel.decide와 같은 인자)"""
+        return self.call("decide", session, options=list(options), **kwargs)
+
+    def status(self, session: str) -> Dict[str, Any]:
+        return self.call("status", session)
+
+    def save(self, session: str) -> Dict[str, int]:
+        return self.call("save", session)
+
+    def stats(self) -> Dict[str, Any]:
+        """서버 지표"""
+        return self.call("stats")
+
+    def call(self, op: str, session: Optional[str] = None, **args) -> Any:
+        """
+        요청 전송 후 응답 대기
+
+        Raises:
+            CognitiveKernelError: 서버 측 오류 (가능하면 같은 예외 타입으로 재발생)
+            ConnectionError: 서버 연결 실패
+        """
+        if self._closed:
+            raise ConnectionError("KernelClient is closed")
+        request_id = next(self._ids)
+        data = _encode({"id": request_id, "op": op, "session": session, "args": args})
+
+        self._slots.acquire()
+        conn = None
+        try:
+            conn = self._checkout()
+            sock, stream = conn
+            sock.sendall(data)
+            line = stream.readline(MAX_LINE_BYTES + 1)
+            if not line:
+                raise ConnectionError("server closed the connection")
+            response = json.loads(line)
+            if response.get("id") != request_id:
+                raise ConnectionError("response id mismatch")
+        except BaseException:
+            if conn is not None:
+                _close_connection(conn)
+            raise
+        else:
+            self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+        if response.get("ok"):
+            return response.get("result")
+        raise _remote_error(response.get("error") or {})
+
+    # ------------------------------------------------------------------
+    # 연결 풀
+    # ------------------------------------------------------------------
+
+    def _checkout(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+            except BaseException:
+                sock.close()
+                raise
+            return sock, sock.makefile("rb")
+
+    def close(self) -> None:
+        """유휴 연결 모두 닫기"""
+        self._closed = True
+        while True:
+            try:
+                _close_connection(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def __enter__(self) -> "KernelClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __repr__(self) -> str:
+        return f"KernelClient(socket_path='{self.socket_path}')"
+
+
+def _close_connection(conn) -> None:
+    sock, stream = conn
+    stream.close()
+    sock.close()
+
+
+def _remote_error(error: Dict[str, Any]) -> CognitiveKernelError:
+    error_type = getattr(exceptions, str(error.get("type")), None)
+    message = str(error.get("message", ""))
+    if isinstance(error_type, type) and issubclass(error_type, CognitiveKernelError):
+        return error_type(message)
+    return CognitiveKernelError(f"{error.get('type')}: {message}")
+
+
+# ======================================================================
+# 실행
+# ======================================================================
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """python -m cognitive_kernel.server"""
+    parser = argparse.ArgumentParser(description="Cognitive Kernel Unix socket server")
+    parser.add_argument("--socket", required=True, help="Unix socket path")
+    parser.add_argument("--storage-dir", default=".cognitive_kernel", help="session storage directory")
+    parser.add_argument("--max-resident", type=int, default=128, help="max resident sessions")
+    parser.add_argument("--batch-window", type=float, default=0.001, help="micro-batch window (seconds)")
+    parser.add_argument("--max-batch", type=int, default=64, help="max requests per batch")
+    args = parser.parse_args(argv)
+
+    server = KernelServer(
+        args.socket,
+        CognitiveConfig(storage_dir=args.storage_dir, auto_save=False),
+        max_resident=args.max_resident,
+        batch_window=args.batch_window,
+        max_batch=args.max_batch,
+    )
+
+    async def run() -> None:
+        # 소켓이 보이기 전에 종료 신호 처리기를 먼저 설치
+        loop = asyncio.get_running_loop()
+        stop = loop.create_future()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, lambda: stop.done() or stop.set_result(None))
+        await server.start()
+        print(f"Cognitive Kernel server listening on {args.socket}")
+        await stop
+        await server.aclose()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
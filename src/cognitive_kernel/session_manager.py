@@ -0,0 +1,326 @@
+"""
+🗂️ Session Manager
+
+한 프로세스에서 다수 세션을 서비스하기 위한 CognitiveKernel 관리자.
+
+- 상주 커널 수를 max_resident로 제한 (LRU)
+- 첫 접근 시 지연 로드 (세션 파일이 있으면 load)
+- 축출 시 저장만 예약하고 스냅샷(커널 읽기 잠금)과 디스크 쓰기는 백그라운드 워커에서 수행
+- 기록 대기 중인 세션에 다시 접근하면 디스크를 읽지 않고 그 커널을 복귀
+- 저장에 실패한 축출 세션은 버리지 않고 복귀 가능하게 남겨 다음 flush_all()/close()에서 재시도
+- 모든 세션이 설정 객체, 모드 프리셋(CognitiveModePresets.shared_config),
+  편도체 키워드 표 등 불변 자원을 공유
+- 상주/적중률 지표 제공 (metrics())
+
+사용 예시:
+    from cognitive_kernel.session_manager import SessionManager
+
+    manager = SessionManager(CognitiveConfig(auto_save=False), max_resident=1000)
+
+    with manager.session("user-42") as kernel:
+        kernel.remember("meeting", {"topic": "project"}, importance=0.9)
+
+    manager.metrics()  # {"hits": ..., "misses": ..., "hit_rate": ...}
+    manager.close()    # 변경된 세션 모두 저장
+
+Author: GNJz (Qquarts)
+Version: 2.0.3+
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .core import CognitiveKernel, CognitiveConfig
+from .cognitive_modes import CognitiveMode
+from .exceptions import ConfigurationError, ValidationError
+
+
+class SessionManager:
+    """
+    🗂️ LRU 세션 관리자
+
+    get()/session()으로 얻은 커널은 관리자가 소유한다. session() 블록 안에
+    있는 커널은 축출되지 않으며(고정), get()으로 얻은 커널은 이후 축출될 수
+    있으므로 오래 보관하지 말 것.
+
+    세션마다 auto_save를 켜면 remember() 때마다 디스크에 쓰므로, 관리자를 쓸
+    때는 auto_save=False로 두고 축출/flush_all()/close()에 저장을 맡기는 것을
+    권장한다.
+    """
+
+    def __init__(
+        self,
+        config: Optional[CognitiveConfig] = None,
+        max_resident: int = 128,
+        mode: Optional[CognitiveMode] = None,
+    ):
+        """
+        Args:
+            config: 모든 세션이 공유하는 설정 (None이면 기본값)
+            max_resident: 최대 상주 커널 수
+            mode: 새 세션의 인지 모드 (저장된 세션은 저장된 모드로 복원)
+
+        Raises:
+            ConfigurationError: max_resident가 1 미만인 경우
+        """
+        if not isinstance(max_resident, int) or max_resident < 1:
+            raise ConfigurationError(
+                f"max_resident must be a positive integer, got {max_resident}"
+            )
+        self.config = config or CognitiveConfig()
+        self.max_resident = max_resident
+        self.mode = mode
+
+        # 재진입 가능: 이미 끝난 기록의 완료 콜백은 잠금 보유 스레드에서 즉시 실행됨
+        self._lock = threading.RLock()
+        self._resident: "OrderedDict[str, CognitiveKernel]" = OrderedDict()
+        self._pins: Dict[str, int] = {}
+        # 축출 후 기록 대기 중인 세션: 이름 → (커널, 기록 Future)
+        self._flushing: Dict[str, Tuple[CognitiveKernel, Future]] = {}
+        # 단일 워커: 같은 세션의 기록이 제출 순서대로 끝나도록
+        self._flush_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ck-sessions-flush"
+        )
+        self._closed = False
+
+        self._hits = 0
+        self._misses = 0
+        self._revived = 0
+        self._evictions = 0
+        self._flushes = 0
+        self._flush_errors: List[BaseException] = []
+
+    # ==================================================================
+    # 세션 접근
+    # ==================================================================
+
+    def get(self, session_name: str) -> CognitiveKernel:
+        """
+        세션 커널 반환 (없으면 로드/생성 후 상주)
+
+        Raises:
+            ValidationError: 세션 이름이 비어 있는 경우
+            ConfigurationError: 관리자가 이미 닫힌 경우
+        """
+        return self._acquire(session_name, pin=False)
+
+    @contextmanager
+    def session(self, session_name: str) -> Iterator[CognitiveKernel]:
+        """블록 동안 축출되지 않는 세션 커널 컨텍스트"""
+        kernel = self._acquire(session_name, pin=True)
+        try:
+            yield kernel
+        finally:
+            with self._lock:
+                remaining = self._pins[session_name] - 1
+                if remaining:
+                    self._pins[session_name] = remaining
+                else:
+                    del self._pins[session_name]
+                self._evict_over_capacity()
+
+    def _acquire(self, session_name: str, pin: bool) -> CognitiveKernel:
+        if not isinstance(session_name, str) or not session_name.strip():
+            raise ValidationError(f"session_name must be a non-empty string, got {session_name!r}")
+
+        with self._lock:
+            self._check_open()
+            kernel = self._resident.get(session_name)
+            if kernel is not None:
+                self._hits += 1
+                self._resident.move_to_end(session_name)
+                if pin:
+                    self._pin(session_name)
+                return kernel
+
+            self._misses += 1
+            pending = self._flushing.get(session_name)
+            if pending is not None:
+                # 기록 중(또는 기록 실패)인 커널 복귀 (디스크 재로드 불필요)
+                self._revived += 1
+                if pending[1].done():
+                    # 실패한 기록: 다시 상주하므로 이후 저장은 상주 세션으로 처리
+                    del self._flushing[session_name]
+                return self._admit(session_name, pending[0], pin)
+
+        # 파일 읽기는 관리자 잠금 밖에서 (다른 세션 접근을 막지 않음)
+        loaded = CognitiveKernel(session_name, self.config, auto_load=True, mode=self.mode)
+
+        with self._lock:
+            self._check_open()
+            kernel = self._resident.get(session_name)
+            if kernel is not None:
+                # 동시에 다른 스레드가 먼저 적재함: 변경 없는 우리 쪽 커널은 버림
+                self._resident.move_to_end(session_name)
+                if pin:
+                    self._pin(session_name)
+                return kernel
+            pending = self._flushing.get(session_name)
+            if pending is not None:
+                # 로드하는 사이 축출된 커널이 더 최신
+                self._revived += 1
+                return self._admit(session_name, pending[0], pin)
+            return self._admit(session_name, loaded, pin)
+
+    def _admit(self, session_name: str, kernel: CognitiveKernel, pin: bool) -> CognitiveKernel:
+        # self._lock 보유 상태에서 호출
+        self._resident[session_name] = kernel
+        if pin:
+            self._pin(session_name)
+        self._evict_over_capacity(keep=session_name)
+        return kernel
+
+    def _pin(self, session_name: str) -> None:
+        self._pins[session_name] = self._pins.get(session_name, 0) + 1
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ConfigurationError("SessionManager is closed")
+
+    # ==================================================================
+    # 축출 / 저장
+    # ==================================================================
+
+    def _evict_over_capacity(self, keep: Optional[str] = None) -> None:
+        # self._lock 보유 상태에서 호출. 고정된 세션(과 방금 요청된 keep)은
+        # 건너뛰므로 모두 고정되어 있으면 일시적으로 max_resident를 넘을 수 있다.
+        excess = len(self._resident) - self.max_resident
+        if excess <= 0:
+            return
+        victims = [
+            name for name in self._resident
+            if name not in self._pins and name != keep
+        ][:excess]
+        for name in victims:
+            self._evict(name)
+
+    def _evict(self, session_name: str) -> None:
+        kernel = self._resident.pop(session_name)
+        self._evictions += 1
+        if kernel._is_dirty:
+            self._schedule_flush(session_name, kernel)
+
+    def _schedule_flush(self, session_name: str, kernel: CognitiveKernel) -> Future:
+        # self._lock 보유 상태에서 호출: 예약만 하고 직렬화/디스크 쓰기는 워커에서.
+        # save()는 커널 읽기 잠금 아래 스냅샷을 뜨므로 쓰기 작업과 겹치지 않는다.
+        future = self._flush_executor.submit(kernel.save)
+        self._flushing[session_name] = (kernel, future)
+        future.add_done_callback(
+            lambda f, name=session_name: self._flush_done(name, f)
+        )
+        return future
+
+    def _flush_done(self, session_name: str, future: Future) -> None:
+        with self._lock:
+            self._flushes += 1
+            error = future.exception()
+            if error is not None:
+                self._flush_errors.append(error)
+            pending = self._flushing.get(session_name)
+            if pending is None or pending[1] is not future:
+                return
+            if error is not None and session_name not in self._resident:
+                # 저장 실패: 커널(변경된 상태)을 남겨 재접근 시 복귀,
+                # 다음 flush_all()/close()에서 다시 저장
+                return
+            del self._flushing[session_name]
+
+    def evict(self, session_name: str) -> bool:
+        """
+        세션 즉시 축출 (변경 사항은 백그라운드 저장)
+
+        Returns:
+            축출 여부 (상주하지 않거나 고정된 세션이면 False)
+        """
+        with self._lock:
+            if session_name not in self._resident or session_name in self._pins:
+                return False
+            self._evict(session_name)
+            return True
+
+    def flush_all(self, wait: bool = True) -> int:
+        """
+        상주 세션 중 변경된 세션 저장 (저장에 실패한 축출 세션도 재시도)
+
+        Args:
+            wait: True면 대기 중인 기록까지 모두 끝날 때까지 대기
+
+        Returns:
+            저장을 예약한 세션 수
+        """
+        with self._lock:
+            dirty = [(name, kernel) for name, kernel in self._resident.items() if kernel._is_dirty]
+            # 저장에 실패한 축출 세션 재시도
+            dirty += [
+                (name, kernel) for name, (kernel, future) in self._flushing.items()
+                if future.done() and future.exception() is not None
+            ]
+            for name, kernel in dirty:
+                self._schedule_flush(name, kernel)
+            futures = [future for _, future in self._flushing.values()]
+        count = len(dirty)
+        if wait:
+            for future in futures:
+                future.exception()  # 완료 대기 (오류는 metrics()에 기록)
+        return count
+
+    def close(self) -> None:
+        """변경된 세션을 모두 저장하고 백그라운드 워커 종료"""
+        if self._closed:
+            return
+        self.flush_all(wait=True)
+        with self._lock:
+            self._closed = True
+            self._resident.clear()
+            self._pins.clear()
+        self._flush_executor.shutdown(wait=True)
+
+    # ==================================================================
+    # 지표
+    # ==================================================================
+
+    def metrics(self) -> Dict[str, Any]:
+        """상주/적중률 지표"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "resident": len(self._resident),
+                "max_resident": self.max_resident,
+                "pinned": len(self._pins),
+                "pending_flushes": len(self._flushing),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "revived": self._revived,
+                "evictions": self._evictions,
+                "flushes": self._flushes,
+                "flush_errors": len(self._flush_errors),
+            }
+
+    def resident_sessions(self) -> List[str]:
+        """상주 세션 이름 (오래된 순)"""
+        with self._lock:
+            return list(self._resident)
+
+    def __contains__(self, session_name: str) -> bool:
+        with self._lock:
+            return session_name in self._resident
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._resident)
+
+    def __enter__(self) -> "SessionManager":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __repr__(self) -> str:
+        return f"SessionManager(resident={len(self._resident)}, max_resident={self.max_resident})"
@@ -0,0 +1,299 @@
+"""
+🧪 Mode Sweep
+
+같은 이벤트 기록을 여러 인지 모드(와 ModeConfig 파라미터 격자)로 재생해
+결정/엔트로피/코어 강도 궤적을 비교하는 병렬 시뮬레이션 도구.
+
+- 이벤트 기록은 한 번만 만들어 모든 작업 프로세스가 공유
+  (fork 가능한 플랫폼에서는 복사-시 쓰기 상속, 그 외에는 작업자당 한 번 전달)
+- 변형(모드 × 격자)마다 독립 커널을 임시 저장소에서 만들어 프로세스 풀에서 실행
+- 결과는 변형 × 결정 단계의 열 지향 NumPy 배열로 수집 (SweepResult)
+
+기록 형식 (steps):
+    - 기억 단계: {"event_type": ..., "content": {...}, "importance": 0.5,
+                 "emotion": 0.0, "related_to": [이전 기억 단계 번호, ...]}
+    - 결정 단계: {"options": [...], "context": None}
+    related_to는 기억 ID 대신 기록 안의 기억 순번(0부터)을 쓴다.
+
+사용 예시:
+    from cognitive_kernel.sweep import run_mode_sweep
+
+    steps = [
+        {"event_type": "work", "content": {"task": "report"}, "importance": 0.9},
+        {"options": ["rest", "work"]},
+        {"event_type": "stress", "content": {"level": "high"}, "related_to": [0]},
+        {"options": ["rest", "work"]},
+    ]
+    result = run_mode_sweep(steps, modes=["normal", "adhd"],
+                            grid={"decision_temperature": [0.5, 1.0]}, seed=7)
+    result.entropy[result.index("adhd", decision_temperature=0.5)]
+
+Author: GNJz (Qquarts)
+Version: 2.0.3+
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .cognitive_modes import CognitiveMode, ModeConfig
+from .core import CognitiveConfig, CognitiveKernel
+from .exceptions import ConfigurationError, ValidationError
+
+# 작업 프로세스가 공유하는 이벤트 기록 (fork 시 상속, spawn 시 초기화 함수로 전달)
+_SHARED_STEPS: Tuple[Dict[str, Any], ...] = ()
+
+
+@dataclass
+class SweepResult:
+    """
+    모드 스윕 결과 (열 지향)
+
+    행은 변형(모드 × 격자), 열은 기록 안의 결정 단계 순서.
+    actions는 해당 단계 options의 인덱스이며 결정이 없으면 -1,
+    probabilities는 옵션 수가 가장 많은 단계에 맞춰 NaN으로 채운다.
+    """
+
+    modes: List[str]
+    overrides: List[Dict[str, Any]]
+    options: List[List[str]]
+    actions: np.ndarray  # (V, D) int
+    entropy: np.ndarray  # (V, D)
+    core_strength: np.ndarray  # (V, D)
+    probabilities: np.ndarray  # (V, D, K_max)
+    elapsed: np.ndarray  # (V,) 변형별 실행 시간 (초)
+
+    def __len__(self) -> int:
+        return len(self.modes)
+
+    def index(self, mode: CognitiveMode | str, **overrides: Any) -> int:
+        """
+        모드와 격자 값으로 변형 행 번호 조회
+
+        Raises:
+            KeyError: 해당 변형이 없는 경우
+        """
+        mode_value = _mode_value(mode)
+        for i, (m, o) in enumerate(zip(self.modes, self.overrides)):
+            if m == mode_value and o == overrides:
+                return i
+        raise KeyError(f"No sweep variant for mode={mode_value!r}, overrides={overrides!r}")
+
+    def action_names(self, variant: int) -> List[Optional[str]]:
+        """변형 한 행의 선택 행동 이름 (결정이 없으면 None)"""
+        return [
+            opts[a] if a >= 0 else None
+            for opts, a in zip(self.options, self.actions[variant].tolist())
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 딕셔너리로 변환"""
+        return {
+            "modes": list(self.modes),
+            "overrides": [dict(o) for o in self.overrides],
+            "options": [list(o) for o in self.options],
+            "actions": self.actions.tolist(),
+            "entropy": self.entropy.tolist(),
+            "core_strength": self.core_strength.tolist(),
+            "elapsed": self.elapsed.tolist(),
+        }
+
+
+def _mode_value(mode: CognitiveMode | str) -> str:
+    if isinstance(mode, CognitiveMode):
+        return mode.value
+    try:
+        return CognitiveMode(str(mode).strip().lower()).value
+    except ValueError:
+        raise ConfigurationError(f"Invalid mode '{mode}'")
+
+
+def _normalize_steps(steps: Sequence[Dict[str, Any]]) -> Tuple[Dict[str, Any], ...]:
+    """기록 검증 후 불변 튜플로 정규화 (작업자에서 다시 검증하지 않도록)"""
+    normalized = []
+    memory_count = 0
+    for i, step in enumerate(steps):
+        if not isinstance(step, dict):
+            raise ValidationError(f"steps[{i}] must be dict, got {type(step).__name__}")
+        if "options" in step:
+            options = step["options"]
+            if not isinstance(options, list) or not options:
+                raise ValidationError(f"steps[{i}].options must be a non-empty list")
+            normalized.append({"options": list(options), "context": step.get("context")})
+            continue
+        if "event_type" not in step:
+            raise ValidationError(f"steps[{i}] must have 'event_type' or 'options'")
+        related = list(step.get("related_to") or [])
+        for ref in related:
+            if not isinstance(ref, int) or not 0 <= ref < memory_count:
+                raise ValidationError(
+                    f"steps[{i}].related_to must reference earlier memory steps, got {ref!r}"
+                )
+        normalized.append({
+            "event_type": step["event_type"],
+            "content": step.get("content"),
+            "importance": step.get("importance", 0.5),
+            "emotion": step.get("emotion", 0.0),
+            "related_to": related,
+        })
+        memory_count += 1
+    return tuple(normalized)
+
+
+def _expand_variants(
+    modes: Sequence[CognitiveMode | str],
+    grid: Optional[Dict[str, Sequence[Any]]],
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """모드 × 격자 곱으로 변형 목록 생성"""
+    grid = grid or {}
+    fields = {f.name for f in dataclasses.fields(ModeConfig)}
+    unknown = set(grid) - fields
+    if unknown:
+        raise ConfigurationError(f"Unknown ModeConfig fields in grid: {', '.join(sorted(unknown))}")
+    names = sorted(grid)
+    for name in names:
+        if not grid[name]:
+            raise ConfigurationError(f"grid['{name}'] must not be empty")
+    combos = [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+    return [(_mode_value(mode), combo) for mode in modes for combo in combos]
+
+
+def _init_worker(steps: Tuple[Dict[str, Any], ...]) -> None:
+    global _SHARED_STEPS
+    _SHARED_STEPS = steps
+
+
+def _run_variant(task: Tuple[str, Dict[str, Any], np.random.SeedSequence]) -> Dict[str, Any]:
+    """변형 하나 실행: 임시 저장소의 새 커널에 공유 기록 재생"""
+    mode, overrides, seed = task
+    started = time.perf_counter()
+
+    actions: List[int] = []
+    entropy: List[float] = []
+    core_strength: List[float] = []
+    probabilities: List[List[float]] = []
+    with tempfile.TemporaryDirectory(prefix="ck-sweep-") as storage_dir:
+        kernel = CognitiveKernel(
+            "sweep",
+            CognitiveConfig(storage_dir=storage_dir, auto_save=False, seed=seed),
+            auto_load=False,
+        )
+        kernel.set_mode(mode, overrides=overrides)
+        memory_ids: List[str] = []
+        for step in _SHARED_STEPS:
+            if "options" not in step:
+                memory_ids.append(kernel.remember(
+                    step["event_type"],
+                    step["content"],
+                    importance=step["importance"],
+                    emotion=step["emotion"],
+                    related_to=[memory_ids[r] for r in step["related_to"]] or None,
+                ))
+                continue
+            options = step["options"]
+            result = kernel.decide(options, context=step["context"])
+            action = result["action"]
+            actions.append(options.index(action) if action in options else -1)
+            entropy.append(result["entropy"])
+            core_strength.append(result["core_strength"])
+            distribution = result["probability_distribution"]
+            probabilities.append([distribution.get(opt, 0.0) for opt in options])
+
+    return {
+        "actions": actions,
+        "entropy": entropy,
+        "core_strength": core_strength,
+        "probabilities": probabilities,
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+def _pool_context() -> Tuple[Any, bool]:
+    """(multiprocessing 컨텍스트, 기록을 상속으로 공유하는지)"""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork"), True
+    return multiprocessing.get_context("spawn"), False
+
+
+def run_mode_sweep(
+    steps: Sequence[Dict[str, Any]],
+    modes: Optional[Sequence[CognitiveMode | str]] = None,
+    grid: Optional[Dict[str, Sequence[Any]]] = None,
+    processes: Optional[int] = None,
+    seed: int = 0,
+) -> SweepResult:
+    """
+    이벤트 기록을 모드 × 파라미터 격자 변형마다 재생
+
+    Args:
+        steps: 기억/결정 단계 기록 (모듈 설명 참고)
+        modes: 비교할 인지 모드 (None이면 모든 모드)
+        grid: ModeConfig 필드별 후보 값 (예: {"tau": [0.3, 0.8]}), 모드 프리셋 위에 덮어씀
+        processes: 작업 프로세스 수 (None이면 CPU 수, 1 이하면 현재 프로세스에서 순차 실행)
+        seed: 기준 난수 시드 (변형 i는 SeedSequence(seed)의 i번째 자식 스트림 사용,
+            실행 방식과 무관하게 재현 가능)
+
+    Returns:
+        SweepResult: 변형 × 결정 단계 배열
+
+    Raises:
+        ValidationError: 기록 형식이 잘못된 경우
+        ConfigurationError: 알 수 없는 모드/격자 필드인 경우
+    """
+    global _SHARED_STEPS
+
+    shared = _normalize_steps(steps)
+    variants = _expand_variants(list(CognitiveMode) if modes is None else modes, grid)
+    if not variants:
+        raise ConfigurationError("modes must not be empty")
+    seeds = np.random.SeedSequence(seed).spawn(len(variants))
+    tasks = [(mode, overrides, s) for (mode, overrides), s in zip(variants, seeds)]
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    workers = min(processes, len(tasks))
+    previous = _SHARED_STEPS
+    _SHARED_STEPS = shared
+    try:
+        if workers <= 1:
+            outputs = [_run_variant(task) for task in tasks]
+        else:
+            context, inherits = _pool_context()
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=None if inherits else _init_worker,
+                initargs=() if inherits else (shared,),
+            ) as pool:
+                outputs = list(pool.map(_run_variant, tasks))
+    finally:
+        _SHARED_STEPS = previous
+
+    options = [step["options"] for step in shared if "options" in step]
+    num_variants, num_decisions = len(variants), len(options)
+    max_options = max((len(o) for o in options), default=0)
+    probabilities = np.full((num_variants, num_decisions, max_options), np.nan)
+    for i, output in enumerate(outputs):
+        for j, row in enumerate(output["probabilities"]):
+            probabilities[i, j, :len(row)] = row
+
+    return SweepResult(
+        modes=[mode for mode, _ in variants],
+        overrides=[overrides for _, overrides in variants],
+        options=options,
+        actions=np.array([o["actions"] for o in outputs], dtype=np.int64).reshape(num_variants, num_decisions),
+        entropy=np.array([o["entropy"] for o in outputs], dtype=float).reshape(num_variants, num_decisions),
+        core_strength=np.array([o["core_strength"] for o in outputs], dtype=float).reshape(num_variants, num_decisions),
+        probabilities=probabilities,
+        elapsed=np.array([o["elapsed"] for o in outputs], dtype=float),
+    )
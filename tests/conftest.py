@@ -0,0 +1,58 @@
+"""
+공용 테스트 픽스처
+
+- make_config / kernel_config: 임시 저장 경로, 자동 저장 끔
+- make_kernel: 위 설정의 커널 (선택적으로 기본 기억 채움)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel import CognitiveConfig, CognitiveKernel
+
+# fill="notes": 서로 연결되지 않은 기억 4개 (중요도 0.2 ~ 0.8)
+NOTES = ["work deadline", "rest after run", "read a book", "work review"]
+
+
+@pytest.fixture
+def make_config(tmp_path):
+    """tmp_path에 저장하는 설정 팩토리: make_config(**필드)"""
+    def make(**overrides):
+        return CognitiveConfig(storage_dir=str(tmp_path), auto_save=False, **overrides)
+    return make
+
+
+@pytest.fixture
+def kernel_config(make_config):
+    """tmp_path에 저장하는 기본 설정"""
+    return make_config()
+
+
+@pytest.fixture
+def make_kernel(make_config):
+    """
+    커널 팩토리: make_kernel(name, mode=None, fill=None, **설정 필드)
+
+    fill:
+        None: 빈 커널
+        "notes": NOTES 기억 4개
+        "linked": "work deadline" → "rest" 로 연결된 기억 2개
+    """
+    def make(name="kernel", mode=None, fill=None, **config):
+        kernel = CognitiveKernel(name, make_config(**config), mode=mode)
+        if fill == "notes":
+            for i, text in enumerate(NOTES):
+                kernel.remember("note", {"text": text}, importance=0.2 + 0.2 * i)
+        elif fill == "linked":
+            first = kernel.remember("note", {"text": "work deadline"}, importance=0.8)
+            kernel.remember("note", {"text": "rest"}, importance=0.4, related_to=[first])
+        elif fill is not None:
+            raise ValueError(f"unknown fill {fill!r}")
+        return kernel
+    return make
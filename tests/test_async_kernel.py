@@ -0,0 +1,198 @@
+"""
+AsyncCognitiveKernel 테스트
+
+테스트 범위:
+- remember/recall/decide 비동기 API
+- 동시 recall 공유 (같은 세대는 한 번만 계산)
+- 쓰기 이후 요청된 recall은 쓰기 결과 반영
+- 느린 연산 중에도 이벤트 루프 비차단
+- save/load 왕복
+- 기록 실패/스냅샷 이후 변경 시 변경된 상태 유지 (다음 저장 대상)
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel import AsyncCognitiveKernel, CognitiveKernel
+
+
+def test_basic_api(kernel_config):
+    async def run():
+        async with await AsyncCognitiveKernel.open("basic", kernel_config) as kernel:
+            await kernel.remember("note", {"text": "work deadline"}, importance=0.9)
+            await kernel.remember("note", {"text": "rest"}, importance=0.3)
+            memories = await kernel.recall(k=2)
+            decision = await kernel.decide(["rest", "work"])
+            batch = await kernel.decide_batch([["rest", "work"], ["read", "walk"]])
+            status = await kernel.status()
+            return memories, decision, batch, status
+
+    memories, decision, batch, status = asyncio.run(run())
+    assert len(memories) == 2
+    assert decision["action"] in ("rest", "work", None)
+    assert len(batch) == 2
+    assert status["event_count"] == 2
+
+
+def test_concurrent_recalls_are_coalesced(kernel_config):
+    kernel = CognitiveKernel("coalesce", kernel_config)
+    for i in range(5):
+        kernel.remember("note", {"text": f"item {i}"}, importance=0.5)
+
+    calls = []
+    original = kernel.recall
+
+    def slow_recall(k=5):
+        calls.append(k)
+        time.sleep(0.05)
+        return original(k)
+
+    kernel.recall = slow_recall
+
+    async def run():
+        facade = AsyncCognitiveKernel(kernel)
+        results = await asyncio.gather(*[facade.recall(k=3) for _ in range(10)])
+        other_k = await facade.recall(k=2)
+        await facade.aclose(save=False)
+        return facade, results, other_k
+
+    facade, results, other_k = asyncio.run(run())
+    assert calls == [3, 2]
+    assert facade.coalesced_recalls == 9
+    assert all(r == results[0] for r in results)
+    assert results[0] is not results[1]  # 호출자별 복사본
+    results[0][0]["content"]["text"] = "changed"
+    assert results[1][0]["content"]["text"] != "changed"  # 중첩 content도 분리
+    assert len(other_k) == 2
+
+
+def test_recall_after_write_sees_write(kernel_config):
+    async def run():
+        facade = await AsyncCognitiveKernel.open("ryw", kernel_config)
+        first_id = await facade.remember("note", {"text": "first"}, importance=0.5)
+        first = asyncio.ensure_future(facade.recall(k=10))
+        write = asyncio.ensure_future(
+            facade.remember("note", {"text": "second"}, importance=0.5, related_to=[first_id])
+        )
+        second = asyncio.ensure_future(facade.recall(k=10))
+        results = await asyncio.gather(first, write, second)
+        await facade.aclose(save=False)
+        return results
+
+    first, _, second = asyncio.run(run())
+    assert len(first) == 1
+    assert len(second) == 2
+
+
+def test_event_loop_not_blocked(kernel_config):
+    kernel = CognitiveKernel("nonblocking", kernel_config)
+    kernel.remember("note", {"text": "x"})
+    original = kernel.recall
+    kernel.recall = lambda k=5: time.sleep(0.2) or original(k)
+
+    async def run():
+        facade = AsyncCognitiveKernel(kernel)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.ensure_future(ticker())
+        await facade.recall(k=1)
+        task.cancel()
+        await facade.aclose(save=False)
+        return ticks
+
+    assert asyncio.run(run()) >= 5
+
+
+def test_save_writes_on_io_worker_and_roundtrips(kernel_config, tmp_path):
+    writer_threads = []
+
+    async def run():
+        facade = await AsyncCognitiveKernel.open("persist", kernel_config)
+        await facade.remember("note", {"text": "keep me"}, importance=0.8)
+        await facade.recall(k=1)
+
+        original = facade.kernel._write_files
+
+        def recording_write(files):
+            writer_threads.append(threading.current_thread().name)
+            return original(files)
+
+        facade.kernel._write_files = recording_write
+        stats = await facade.save()
+        await facade.aclose()
+        return stats
+
+    stats = asyncio.run(run())
+    assert stats["events"] == 1
+    assert writer_threads and writer_threads[0].startswith("ck-persist-io")
+    assert not list((tmp_path / "persist").glob("*.tmp"))
+
+    reloaded = CognitiveKernel("persist", kernel_config)
+    assert len(reloaded) == 1
+    assert reloaded.recall(k=1)[0]["content"]["text"] == "keep me"
+
+
+def test_failed_write_keeps_kernel_dirty(kernel_config):
+    kernel = CognitiveKernel("failing", kernel_config)
+    kernel.remember("note", {"text": "unsaved"}, importance=0.5)
+    original = kernel._write_files
+
+    def failing_write(files):
+        raise OSError("disk full")
+
+    kernel._write_files = failing_write
+    with pytest.raises(OSError):
+        kernel.save()
+    assert kernel._is_dirty
+
+    kernel._write_files = original
+    with kernel:
+        pass  # __exit__에서 다시 저장
+    assert not kernel._is_dirty
+    assert len(CognitiveKernel("failing", kernel_config)) == 1
+
+
+def test_async_save_keeps_writes_after_snapshot_dirty(kernel_config):
+    async def run():
+        facade = await AsyncCognitiveKernel.open("racing", kernel_config)
+        await facade.remember("note", {"text": "first"}, importance=0.5)
+
+        written = threading.Event()
+        release = threading.Event()
+        original = facade.kernel._write_files
+
+        def slow_write(files):
+            written.set()
+            release.wait(2.0)
+            original(files)
+
+        facade.kernel._write_files = slow_write
+        save = asyncio.ensure_future(facade.save())
+        while not written.is_set():
+            await asyncio.sleep(0.01)
+        await facade.remember("note", {"text": "after snapshot"}, importance=0.5)
+        release.set()
+        await save
+        dirty_after_save = facade.kernel._is_dirty
+
+        facade.kernel._write_files = original
+        await facade.aclose()  # 남은 변경 저장
+        return dirty_after_save
+
+    assert asyncio.run(run())
+    assert len(CognitiveKernel("racing", kernel_config)) == 2
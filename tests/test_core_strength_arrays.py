@@ -0,0 +1,121 @@
+"""
+배열 기반 코어 강도 계산 테스트
+
+테스트 범위:
+- calculate_core_strength_arrays()는 기억 딕셔너리 경로와 같은 값 (치매/알츠하이머 감쇠 포함)
+- core_strength_raw_batch()의 (B, N) 에피소드 일괄 계산, NaN 타임스탬프, 빈 입력
+- recall_arrays()는 recall()과 같은 기억을 열 지향으로 반환
+- 파이프라인 CoreStrengthStep은 열 지향 회상 결과를 사용
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel import MemoryArrays
+from cognitive_kernel.engines.dynamics import DynamicsEngine, DynamicsConfig
+
+
+def _memories(now, rng, n=50):
+    importances = rng.random(n)
+    # 새 기억(임계값 이내)과 오래된 기억이 섞이도록
+    timestamps = now - rng.uniform(0.0, 7200.0, n)
+    memories = [
+        {"id": f"m{i}", "importance": float(imp), "timestamp": float(ts)}
+        for i, (imp, ts) in enumerate(zip(importances, timestamps))
+    ]
+    return memories, importances, timestamps
+
+
+@pytest.mark.parametrize("old_rate, new_rate", [(0.0, 0.0), (0.0001, 0.0), (0.0001, 0.1)])
+def test_arrays_match_dict_path(old_rate, new_rate):
+    config = DynamicsConfig(old_memory_decay_rate=old_rate, new_memory_decay_rate=new_rate)
+    now = time.time()
+    memories, importances, timestamps = _memories(now, np.random.default_rng(0))
+
+    expected = DynamicsEngine(config).calculate_core_strength(memories, memory_update_failure=0.3)
+    engine = DynamicsEngine(config)
+    actual = engine.calculate_core_strength_arrays(importances, timestamps, memory_update_failure=0.3)
+
+    assert actual == pytest.approx(expected, rel=1e-6, abs=1e-12)
+    assert engine.state.core_strength == actual
+
+
+def test_core_decay_applied_to_array_path():
+    config = DynamicsConfig(core_decay_rate=0.01)
+    engine = DynamicsEngine(config)
+    first = engine.calculate_core_strength_arrays([0.8, 0.6], [time.time()] * 2)
+    assert engine.state.persistent_core is not None
+    engine.state.last_decay_time -= 10.0
+    second = engine.calculate_core_strength_arrays([0.8, 0.6], [time.time()] * 2)
+    assert second == pytest.approx(first * np.exp(-0.1), rel=1e-3)
+
+
+def test_raw_batch_rows_and_defaults():
+    config = DynamicsConfig(old_memory_decay_rate=0.0001, new_memory_decay_rate=0.1)
+    engine = DynamicsEngine(config)
+    now = 1_000_000.0
+    rng = np.random.default_rng(1)
+    importances = rng.random((4, 30))
+    timestamps = now - rng.uniform(0.0, 7200.0, (4, 30))
+
+    batch = engine.core_strength_raw_batch(importances, timestamps, now=now)
+    rows = [engine.core_strength_raw_batch(i, t, now=now) for i, t in zip(importances, timestamps)]
+    assert batch.shape == (4,)
+    assert np.allclose(batch, rows)
+
+    # NaN 타임스탬프 = 현재 시각 (나이 0 → 새 기억 감쇠 계수 1)
+    nan_ts = np.full(3, np.nan)
+    assert engine.core_strength_raw_batch([0.2, 0.4, 0.6], nan_ts, now=now) == pytest.approx(0.5 * 0.4)
+    assert engine.core_strength_raw_batch([0.2, 0.4, 0.6], now=now) == pytest.approx(0.5 * 0.4)
+
+    assert engine.core_strength_raw_batch(np.empty(0)) == 0.0
+    assert engine.core_strength_raw_batch(np.empty((3, 0))).shape == (3,)
+    with pytest.raises(ValueError):
+        engine.core_strength_raw_batch([0.1, 0.2], [now])
+    with pytest.raises(ValueError):
+        engine.calculate_core_strength_arrays([[0.1, 0.2]])
+
+
+def test_recall_arrays_matches_recall(make_kernel):
+    kernel = make_kernel("columns")
+    for i in range(6):
+        kernel.remember("note", {"text": f"n{i}"}, importance=0.1 * (i + 1))
+
+    arrays = kernel.recall_arrays(k=4)
+    assert isinstance(arrays, MemoryArrays)
+    assert len(arrays) == 4
+    assert arrays.importances.dtype == float and arrays.timestamps.shape == (4,)
+    memories = kernel.recall(k=4)
+    # 점수에 최신성 항이 있으므로 두 회상 사이의 시간 차만큼은 다를 수 있음
+    assert arrays.ids == [m["id"] for m in memories]
+    assert arrays.event_types == [m["event_type"] for m in memories]
+    assert arrays.timestamps.tolist() == [m["timestamp"] for m in memories]
+    assert np.allclose(arrays.importances, [m["importance"] for m in memories], rtol=1e-6)
+    assert [set(m) for m in arrays.to_dicts()] == [set(m) for m in memories]
+
+
+def test_pipeline_uses_memory_arrays(make_kernel, monkeypatch):
+    kernel = make_kernel("pipe")
+    kernel.set_mode("alzheimer")
+    for i in range(5):
+        kernel.remember("note", {"text": f"n{i}"}, importance=0.5)
+
+    calls = []
+    original = kernel.dynamics.calculate_core_strength_arrays
+
+    def spy(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(kernel.dynamics, "calculate_core_strength_arrays", spy)
+    result = kernel.decide(["rest", "work"])
+    assert len(calls) == 1
+    assert 0.0 <= result["core_strength"] <= 1.0
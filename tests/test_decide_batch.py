@@ -0,0 +1,88 @@
+"""
+decide_batch() API 테스트
+
+테스트 범위:
+- 결과 형식/순서가 decide()와 동일
+- 확률 분포/엔트로피가 decide() 루프와 일치
+- 세차 위상이 항목별로 결정론적으로 진행
+- 입력 검증
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel import CognitiveMode
+from cognitive_kernel.exceptions import ValidationError
+
+
+OPTION_SETS = [
+    ["rest", "work", "exercise", "read", "sleep"],
+    ["choose_work", "choose_rest"],
+    ["single"],
+    ["read", "walk", "work"],
+    ["rest", "work", "exercise", "read", "sleep"],
+]
+
+
+@pytest.mark.parametrize("mode", [CognitiveMode.NORMAL, CognitiveMode.ADHD])
+def test_batch_matches_decide_loop(make_kernel, mode):
+    loop_kernel = make_kernel("loop", mode, fill="notes")
+    batch_kernel = make_kernel("batch", mode, fill="notes")
+
+    expected = [loop_kernel.decide(options) for options in OPTION_SETS]
+    results = batch_kernel.decide_batch(OPTION_SETS)
+
+    assert len(results) == len(OPTION_SETS)
+    for options, exp, res in zip(OPTION_SETS, expected, results):
+        assert set(res.keys()) == set(exp.keys())
+        assert res["action"] is None or res["action"] in options
+        assert res["entropy"] == pytest.approx(exp["entropy"], rel=1e-5)
+        assert res["core_strength"] == pytest.approx(exp["core_strength"], rel=1e-5)
+        assert list(res["probability_distribution"]) == list(exp["probability_distribution"])
+        for opt in options:
+            assert res["probability_distribution"][opt] == pytest.approx(
+                exp["probability_distribution"][opt], rel=1e-5
+            )
+
+    # 세차 위상: 옵션 2개 이상인 항목마다 한 번씩 진행
+    assert batch_kernel.dynamics.state.precession_phi == pytest.approx(
+        loop_kernel.dynamics.state.precession_phi, abs=1e-12
+    )
+    assert len(batch_kernel.dynamics.state.entropy_history) == len(OPTION_SETS)
+
+
+def test_batch_uses_single_recall(make_kernel, monkeypatch):
+    kernel = make_kernel("recall", fill="notes")
+    calls = []
+    original = kernel.recall
+    monkeypatch.setattr(kernel, "recall", lambda k=5: calls.append(k) or original(k))
+
+    kernel.decide_batch([["a", "b"]] * 50)
+    assert len(calls) == 1
+
+
+def test_batch_habit_lookup_per_context(make_kernel):
+    kernel = make_kernel("habit", fill="notes")
+    results = kernel.decide_batch(
+        [["rest", "work"], ["rest", "work"]],
+        contexts=["tired", None],
+    )
+    assert results[0]["habit_suggestion"] is not None
+    assert results[1]["habit_suggestion"] is None
+
+
+def test_batch_validation(make_kernel):
+    kernel = make_kernel("validate", fill="notes")
+    assert kernel.decide_batch([]) == []
+    with pytest.raises(ValidationError):
+        kernel.decide_batch([["a"], []])
+    with pytest.raises(ValidationError):
+        kernel.decide_batch("not a list")
+    with pytest.raises(ValidationError):
+        kernel.decide_batch([["a", "b"]], contexts=["x", "y"])
@@ -0,0 +1,69 @@
+"""
+Loop Integrity Decay 엣지 소실 마스크 테스트
+
+테스트 범위:
+- 같은 시드의 커널은 같은 엣지를 잃음 (재현 가능)
+- 기본은 회상마다 마스크 재추출
+- cache_edge_mask: 그래프 세대 안에서는 마스크 재사용, 새 기억 후 다시 추출
+- 소실률이 0이면 마스크를 만들지 않음
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel import CognitiveMode
+
+
+def _kernel(make_kernel, name, seed, decay=0.5, **config):
+    kernel = make_kernel(name, CognitiveMode.ALZHEIMER, seed=seed, **config)
+    kernel.set_mode(CognitiveMode.ALZHEIMER, overrides={"loop_integrity_decay": decay})
+    ids = [kernel.remember("note", {"i": i}, importance=0.5) for i in range(3)]
+    for i in range(3, 40):
+        ids.append(kernel.remember("note", {"i": i}, importance=0.5, related_to=ids[i - 3:i]))
+    return kernel
+
+
+def test_seeded_dropout_is_reproducible(make_kernel):
+    a = _kernel(make_kernel, "a", seed=5)
+    b = _kernel(make_kernel, "b", seed=5)
+    a.recall(k=3)
+    b.recall(k=3)
+    mask_a, mask_b = a._edge_mask[1], b._edge_mask[1]
+    assert mask_a.shape == (len(a._edges),)
+    np.testing.assert_array_equal(mask_a, mask_b)
+    assert 0 < mask_a.sum() < len(mask_a)
+
+
+def test_mask_resampled_per_recall_by_default(make_kernel):
+    kernel = _kernel(make_kernel, "r", seed=1)
+    kernel.recall(k=3)
+    first = kernel._edge_mask[1]
+    kernel.recall(k=3)
+    second = kernel._edge_mask[1]
+    assert second is not first
+    assert not np.array_equal(first, second)
+
+
+def test_mask_cached_per_generation(make_kernel):
+    kernel = _kernel(make_kernel, "c", seed=1, cache_edge_mask=True)
+    kernel.recall(k=3)
+    mask = kernel._edge_mask[1]
+    kernel.recall(k=3)
+    assert kernel._edge_mask[1] is mask  # 같은 세대: 재사용
+
+    kernel.remember("note", {"i": "new"}, related_to=[kernel.recall(k=1)[0]["id"]])
+    kernel.recall(k=3)
+    assert kernel._edge_mask[1] is not mask
+    assert len(kernel._edge_mask[1]) == len(kernel._edges)
+
+
+def test_no_mask_without_decay(make_kernel):
+    kernel = _kernel(make_kernel, "d", seed=1, decay=0.0)
+    assert len(kernel.recall(k=3)) == 3
+    assert kernel._edge_mask is None
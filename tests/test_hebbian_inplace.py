@@ -0,0 +1,103 @@
+"""
+In-place / batched Hebbian plasticity tests.
+
+We test:
+- hebbian_update_inplace matches hebbian_update and does not copy W
+- hebbian_update_batch equals sequential single updates (closed form and clipped loop)
+- masked and sparse (CSR) updates only touch the selected synapses
+- input validation
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel.engines.dynamics import (
+    CSRMatrix,
+    HebbianPlasticityConfig,
+    hebbian_update,
+    hebbian_update_batch,
+    hebbian_update_inplace,
+)
+
+
+def _setup(n=12, steps=20, seed=0):
+    rng = np.random.default_rng(seed)
+    W = rng.standard_normal((n, n)) * 0.3
+    pres = rng.uniform(-1.0, 1.0, (steps, n))
+    posts = rng.uniform(-1.0, 1.0, (steps, n))
+    return W, pres, posts
+
+
+def test_inplace_matches_copying_update():
+    W, pres, posts = _setup()
+    cfg = HebbianPlasticityConfig(eta=0.05, weight_decay=0.01, clip_weight=0.5)
+    expected = np.array(hebbian_update(W.tolist(), pres[0], posts[0], cfg))
+
+    W_inplace = W.copy()
+    result = hebbian_update_inplace(W_inplace, pres[0], posts[0], cfg)
+    assert result is W_inplace
+    np.testing.assert_allclose(W_inplace, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("clip", [None, 0.4])
+def test_batch_equals_sequential(clip):
+    W, pres, posts = _setup()
+    cfg = HebbianPlasticityConfig(eta=0.02, weight_decay=0.05, clip_weight=clip)
+    sequential = W.copy()
+    for pre, post in zip(pres, posts):
+        hebbian_update_inplace(sequential, pre, post, cfg)
+
+    batched = hebbian_update_batch(W.copy(), pres, posts, cfg)
+    np.testing.assert_allclose(batched, sequential, atol=1e-12)
+
+    # post=None is symmetric (pre ⊗ pre)
+    symmetric = hebbian_update_batch(np.zeros_like(W), pres, None, cfg)
+    np.testing.assert_allclose(symmetric, symmetric.T, atol=1e-12)
+
+
+def test_mask_only_updates_selected_entries():
+    W, pres, posts = _setup()
+    mask = np.random.default_rng(1).random(W.shape) < 0.3
+    cfg = HebbianPlasticityConfig(eta=0.1, weight_decay=0.02, clip_weight=0.6)
+
+    updated = hebbian_update_batch(W.copy(), pres, posts, cfg, mask=mask)
+    full = hebbian_update_batch(W.copy(), pres, posts, cfg)
+    np.testing.assert_array_equal(updated[~mask], W[~mask])
+    np.testing.assert_allclose(updated[mask], full[mask], atol=1e-12)
+
+
+def test_sparse_updates_stored_synapses_in_place():
+    W, pres, posts = _setup()
+    W[np.abs(W) < 0.3] = 0.0
+    sparse = CSRMatrix.from_dense(W)
+    data = sparse.data
+    cfg = HebbianPlasticityConfig(eta=0.05, weight_decay=0.01, clip_weight=0.8)
+
+    assert hebbian_update_batch(sparse, pres, posts, cfg) is sparse
+    assert sparse.data is data  # updated in place, no new array
+    dense = hebbian_update_batch(W.copy(), pres, posts, cfg, mask=W != 0.0)
+    np.testing.assert_allclose(sparse.to_dense(), dense, atol=1e-12)
+
+
+def test_validation():
+    W, pres, posts = _setup(n=4, steps=3)
+    with pytest.raises(ValueError):
+        hebbian_update_inplace(W.tolist(), pres[0])  # lists cannot be updated in place
+    with pytest.raises(ValueError):
+        hebbian_update_inplace(W.astype(np.float32), pres[0])
+    with pytest.raises(ValueError):
+        hebbian_update_inplace(W, pres[0][:3])
+    with pytest.raises(ValueError):
+        hebbian_update_batch(W, pres, posts[:2])
+    with pytest.raises(ValueError):
+        hebbian_update_batch(W, pres, mask=np.ones((3, 3), dtype=bool))
+    with pytest.raises(ValueError):
+        hebbian_update_batch(CSRMatrix.from_dense(W), pres, mask=np.ones((4, 4), dtype=bool))
+    assert hebbian_update_batch(W, np.empty((0, 4))) is W
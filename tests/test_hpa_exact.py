@@ -0,0 +1,113 @@
+"""
+HPA exact 적분기 테스트
+
+테스트 범위:
+- 상수 스트레스에서 정확한 지수 해, 작은 dt 오일러로 수렴
+- simulate(exact)는 exact step() 반복과 같은 궤적/만성 부하/기저 수준
+- c_min 클램핑 (구간 경계에서 처리, 아래로 내려가지 않음)
+- simulate_batch(): 행별 결과가 단일 simulate와 같고 상태를 바꾸지 않음
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel.engines.hypothalamus import HPAConfig, HPADynamics
+
+
+def _profile(seed=0, segments=30):
+    rng = np.random.default_rng(seed)
+    levels = rng.choice([0.0, 0.3, 0.8, 1.0], segments)
+    return np.repeat(levels, rng.integers(1, 150, segments))
+
+
+def _config(**overrides):
+    # 만성 부하/기저 수준이 짧은 기록 안에서도 임계값을 넘도록 빠르게
+    params = dict(integrator="exact", chronic_accumulation_rate=0.5, baseline_drift_rate=0.01)
+    params.update(overrides)
+    return HPAConfig(**params)
+
+
+def test_constant_stress_matches_closed_form():
+    config = _config()
+    hpa = HPADynamics(config)
+    S, t = 0.8, 5.0
+    hpa.simulate([S] * 50, dt=0.1)
+
+    b = config.k1_clearance + config.k2_production * S / config.c_max
+    c_star = config.k2_production * S / b
+    expected = c_star + (0.3 - c_star) * math.exp(-b * t)
+    assert hpa.state.cortisol == pytest.approx(expected, rel=1e-12)
+
+    # 같은 구간을 한 스텝으로 건너뛰어도 같은 값
+    jump = HPADynamics(config)
+    jump.step(S, dt=t)
+    assert jump.state.cortisol == pytest.approx(expected, rel=1e-12)
+
+
+def test_exact_converges_to_fine_euler():
+    profile = _profile(segments=10)
+    exact = HPADynamics(_config()).simulate(profile.tolist(), dt=0.1)
+    euler = HPADynamics(_config(integrator="euler")).simulate(np.repeat(profile, 200).tolist(), dt=0.0005)
+    fine = np.array(euler["cortisol_trace"])[199::200]
+    assert np.abs(fine - exact["cortisol_trace"]).max() < 1e-4
+
+
+def test_simulate_matches_exact_steps():
+    profile = _profile()
+    bulk = HPADynamics(_config())
+    result = bulk.simulate(profile.tolist(), dt=0.1)
+    stepped = HPADynamics(_config())
+    trace = [stepped.step(S, dt=0.1)["cortisol"] for S in profile]
+
+    assert np.allclose(result["cortisol_trace"], trace, rtol=0, atol=1e-12)
+    assert bulk.state.chronic_stress_load == pytest.approx(stepped.state.chronic_stress_load, abs=1e-12)
+    assert bulk.state.baseline == pytest.approx(stepped.state.baseline, abs=1e-12)
+    assert bulk.state.chronic_stress_load > bulk.config.chronic_threshold  # 기저 수준 상승 구간 포함
+    assert len(bulk.state.history) == len(profile)
+    assert bulk.state.history.last[1] == pytest.approx(bulk.state.cortisol)
+
+
+def test_clamped_at_c_min():
+    hpa = HPADynamics(_config())
+    result = hpa.simulate([1.0] * 20 + [0.0] * 2000, dt=0.5)
+    trace = np.array(result["cortisol_trace"])
+    assert trace.min() == hpa.config.c_min
+    assert np.all(trace[-100:] == hpa.config.c_min)
+    assert result["recovery_time"] is not None
+
+
+def test_batch_rows_match_single_runs():
+    first = _profile(0)
+    profiles = np.stack([first, np.resize(_profile(1), len(first)), np.full(len(first), 0.9)])
+    hpa = HPADynamics(_config())
+    hpa.state.cortisol = 0.5
+    before = (hpa.state.cortisol, hpa.state.baseline, hpa.state.chronic_stress_load)
+    batch = hpa.simulate_batch(profiles, dt=0.1)
+    assert (hpa.state.cortisol, hpa.state.baseline, hpa.state.chronic_stress_load) == before
+    assert len(hpa.state.history) == 0
+    assert batch["cortisol_trace"].shape == profiles.shape
+
+    for row, profile in enumerate(profiles):
+        single = HPADynamics(_config())
+        single.state.cortisol = 0.5
+        result = single.simulate(profile.tolist(), dt=0.1)
+        assert np.allclose(batch["cortisol_trace"][row], result["cortisol_trace"], atol=1e-12)
+        assert batch["final_cortisol"][row] == pytest.approx(result["final_cortisol"])
+        assert batch["baseline"][row] == pytest.approx(result["baseline"])
+        expected_recovery = np.nan if result["recovery_time"] is None else result["recovery_time"]
+        assert np.allclose(batch["recovery_time"][row], expected_recovery, equal_nan=True)
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        HPADynamics(HPAConfig(integrator="rk4"))
+    with pytest.raises(ValueError):
+        HPADynamics(_config()).simulate_batch([0.1, 0.2])
@@ -0,0 +1,111 @@
+"""
+패키지 임포트 비용 테스트
+
+테스트 범위:
+- `import cognitive_kernel`은 NumPy/엔진/코어를 불러오지 않음 (PEP 562 지연 로딩)
+- 코어 API 임포트는 쓰지 않는 엔진/선택적 통합/asyncio를 불러오지 않음
+- 코어 API 콜드 임포트 시간 예산 (별도 프로세스에서 측정, NumPy 임포트 기준선 대비)
+- 하위 모듈 속성 접근 (cognitive_kernel.core, cognitive_kernel.engines.dynamics 등)
+
+예산(기준선 대비 추가 허용 시간)은 COGNITIVE_KERNEL_IMPORT_BUDGET_MS 환경 변수로
+조정할 수 있다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+import cognitive_kernel
+
+# 같은 환경의 `import numpy` 콜드 임포트 대비 추가 허용 시간
+# (측정: NumPy 약 80ms, 코어 API 약 160ms → 패키지 자체 비용 약 80ms)
+IMPORT_BUDGET_MS = float(os.environ.get("COGNITIVE_KERNEL_IMPORT_BUDGET_MS", "150"))
+
+
+def _run_fresh(statement):
+    """새 인터프리터에서 statement 실행 후 (소요 ms, 로드된 모듈) 반환"""
+    code = (
+        "import json, sys, time\n"
+        f"sys.path.insert(0, {str(project_root / 'src')!r})\n"
+        "t0 = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = (time.perf_counter() - t0) * 1000\n"
+        "print(json.dumps({'ms': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        cwd=str(project_root / "tests"),  # 저장소 루트의 cognitive_kernel.py 가림 방지
+    )
+    data = json.loads(out.stdout)
+    return data["ms"], set(data["modules"])
+
+
+def test_bare_import_is_lazy():
+    _, modules = _run_fresh("import cognitive_kernel")
+    assert "numpy" not in modules
+    assert "cognitive_kernel.core" not in modules
+    assert not any(m.startswith("cognitive_kernel.engines") for m in modules)
+
+
+def test_core_api_loads_only_needed_modules():
+    _, modules = _run_fresh("from cognitive_kernel import CognitiveKernel, CognitiveConfig")
+    for name in (
+        "asyncio",
+        "cognitive_kernel.async_kernel",
+        "cognitive_kernel.server",
+        "cognitive_kernel.vector_integration",
+        "cognitive_kernel.engines.irrational_algebra",
+        "cognitive_kernel.engines.dynamics.neural_dynamics",
+    ):
+        assert name not in modules, name
+
+
+def _median_ms(statement, runs=5):
+    return sorted(_run_fresh(statement)[0] for _ in range(runs))[runs // 2]
+
+
+def test_core_api_cold_import_budget():
+    baseline = _median_ms("import numpy")
+    elapsed = _median_ms("from cognitive_kernel import CognitiveKernel")
+    overhead = elapsed - baseline
+    assert overhead < IMPORT_BUDGET_MS, (
+        f"median {elapsed:.0f}ms (numpy baseline {baseline:.0f}ms, "
+        f"+{overhead:.0f}ms) > budget +{IMPORT_BUDGET_MS:.0f}ms"
+    )
+
+
+def test_lazy_attributes_resolve():
+    assert cognitive_kernel.NeuralDynamicsCore.__name__ == "NeuralDynamicsCore"
+    assert isinstance(cognitive_kernel.VECTOR_DB_AVAILABLE, bool)
+    assert set(cognitive_kernel.__all__) <= set(dir(cognitive_kernel))
+    with pytest.raises(AttributeError):
+        cognitive_kernel.DoesNotExist
+
+
+def test_submodule_attributes_resolve():
+    import cognitive_kernel.engines
+
+    assert cognitive_kernel.core.CognitiveKernel is cognitive_kernel.CognitiveKernel
+    assert cognitive_kernel.exceptions.ValidationError.__name__ == "ValidationError"
+    assert cognitive_kernel.pipeline.DecisionPipeline.__name__ == "DecisionPipeline"
+    assert cognitive_kernel.engines.dynamics.DynamicsEngine is cognitive_kernel.DynamicsEngine
+    assert cognitive_kernel.engines.dynamics.ring_buffer.RingBuffer.__name__ == "RingBuffer"
+    with pytest.raises(AttributeError):
+        cognitive_kernel.engines.does_not_exist
+
+
+def test_submodule_attribute_access_is_lazy():
+    _, modules = _run_fresh(
+        "import cognitive_kernel\n"
+        "assert cognitive_kernel.exceptions.CognitiveKernelError"
+    )
+    assert "cognitive_kernel.exceptions" in modules
+    assert "cognitive_kernel.core" not in modules
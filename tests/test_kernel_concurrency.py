@@ -0,0 +1,165 @@
+"""
+커널 동시성 테스트
+
+테스트 범위:
+- ReadWriteLock: 다수 읽기 동시 진입, 쓰기 단독 진입, 쓰기 우선
+- 그래프 재구축 중에도 읽기/쓰기가 막히지 않음 (copy-on-write)
+- 엔진 교체 이후 오래된 재구축 결과는 발행되지 않음
+- 다중 스레드 remember/recall/decide/status 일관성
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel import CognitiveMode, MemoryRankEngine
+from cognitive_kernel.concurrency import ReadWriteLock
+
+
+def test_rwlock_readers_share_writers_exclusive():
+    lock = ReadWriteLock()
+    inside = []
+    max_readers = []
+
+    def reader():
+        with lock.read_locked():
+            inside.append(1)
+            max_readers.append(lock.readers)
+            time.sleep(0.05)
+            inside.pop()
+
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    for t in threads:
+        t.start()
+    time.sleep(0.01)
+    with lock.write_locked():
+        assert lock.readers == 0
+        assert not inside
+    for t in threads:
+        t.join()
+    assert max(max_readers) > 1
+
+
+def test_rwlock_prefers_waiting_writer():
+    lock = ReadWriteLock()
+    order = []
+    lock.acquire_read()
+
+    writer = threading.Thread(target=lambda: (lock.acquire_write(), order.append("w"), lock.release_write()))
+    writer.start()
+    time.sleep(0.02)
+
+    reader = threading.Thread(target=lambda: (lock.acquire_read(), order.append("r"), lock.release_read()))
+    reader.start()
+    time.sleep(0.02)
+    assert order == []  # 새 읽기는 대기 중인 쓰기 뒤로
+
+    lock.release_read()
+    writer.join()
+    reader.join()
+    assert order == ["w", "r"]
+
+
+def test_rebuild_does_not_block_readers_or_writers(make_kernel, monkeypatch):
+    kernel = make_kernel("concurrent", fill="linked")
+    kernel.recall(k=2)  # 발행된 그래프 준비
+
+    started = threading.Event()
+    release = threading.Event()
+    original = MemoryRankEngine.calculate_importance
+
+    def slow_calculate(self, *args, **kwargs):
+        if not started.is_set():
+            started.set()
+            release.wait(2.0)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(MemoryRankEngine, "calculate_importance", slow_calculate)
+    published = kernel.memoryrank
+
+    slow = threading.Thread(target=kernel.recall, kwargs={"k": 2})
+    slow.start()
+    assert started.wait(2.0)
+
+    t0 = time.perf_counter()
+    status = kernel.status()
+    kernel.remember("note", {"text": "during rebuild"}, importance=0.5)
+    assert time.perf_counter() - t0 < 0.5
+    assert status["event_count"] == 2
+    assert kernel.memoryrank is published  # 재구축 중에는 기존 스냅샷 유지
+
+    release.set()
+    slow.join()
+    assert kernel.memoryrank is not published
+    assert len(kernel) == 3
+
+
+def test_stale_rebuild_not_published_after_mode_change(make_kernel, monkeypatch):
+    kernel = make_kernel("concurrent", fill="linked")
+    started = threading.Event()
+    release = threading.Event()
+    original = MemoryRankEngine.calculate_importance
+
+    def slow_calculate(self, *args, **kwargs):
+        if not started.is_set():
+            started.set()
+            release.wait(2.0)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(MemoryRankEngine, "calculate_importance", slow_calculate)
+    slow = threading.Thread(target=kernel.recall, kwargs={"k": 2})
+    slow.start()
+    assert started.wait(2.0)
+
+    kernel.set_mode(CognitiveMode.ADHD)
+    new_engine = kernel.memoryrank
+    release.set()
+    slow.join()
+    assert kernel.memoryrank is new_engine
+
+
+def test_many_threads(make_kernel):
+    kernel = make_kernel("concurrent", fill="linked")
+    errors = []
+    decisions = []
+
+    def run(fn):
+        try:
+            fn()
+        except Exception as exc:  # pragma: no cover - 실패 시 보고용
+            errors.append(exc)
+
+    def writer():
+        for i in range(20):
+            kernel.remember("note", {"text": f"item {i}"}, importance=0.5)
+
+    def reader():
+        for _ in range(20):
+            kernel.recall(k=3)
+            kernel.status()
+
+    def decider():
+        for _ in range(10):
+            decisions.append(kernel.decide(["rest", "work", "read"]))
+
+    threads = [threading.Thread(target=run, args=(writer,))]
+    threads += [threading.Thread(target=run, args=(reader,)) for _ in range(4)]
+    threads += [threading.Thread(target=run, args=(decider,)) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(kernel) == 22
+    assert len(decisions) == 20
+    assert len(kernel.dynamics.state.entropy_history) == 20
+    for decision in decisions:
+        assert sum(decision["probability_distribution"].values()) == pytest.approx(1.0)
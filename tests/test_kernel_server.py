@@ -0,0 +1,130 @@
+"""
+KernelServer / KernelClient 테스트
+
+테스트 범위:
+- Unix 소켓 왕복 (remember/recall/decide/status)
+- 서버 오류의 예외 타입 복원
+- 같은 세션 동시 decide의 서버 측 묶음 처리
+- 종료 시 세션 저장
+- 독립 프로세스 실행 (python -m cognitive_kernel.server)
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel import CognitiveConfig, CognitiveKernel
+from cognitive_kernel.exceptions import ValidationError
+from cognitive_kernel.server import KernelClient, KernelServer
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="Unix domain sockets required")
+
+
+class _ServerThread:
+    """테스트용: 별도 스레드의 이벤트 루프에서 서버 실행"""
+
+    def __init__(self, server):
+        self.server = server
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self.loop).result(5)
+        return self.server
+
+    def __exit__(self, *exc):
+        asyncio.run_coroutine_threadsafe(self.server.aclose(), self.loop).result(10)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+        self.loop.close()
+        return False
+
+
+def _server(tmp_path, **kwargs):
+    config = CognitiveConfig(storage_dir=str(tmp_path / "store"), auto_save=False)
+    return KernelServer(str(tmp_path / "ck.sock"), config, **kwargs)
+
+
+def test_roundtrip_and_errors(tmp_path):
+    with _ServerThread(_server(tmp_path)) as server:
+        with KernelClient(server.socket_path) as client:
+            assert client.ping() == "pong"
+            first = client.remember("alice", "note", {"text": "work deadline"}, importance=0.9)
+            client.remember("alice", "note", {"text": "rest"}, importance=0.3, related_to=[first])
+
+            memories = client.recall("alice", k=2)
+            assert [m["content"]["text"] for m in memories][0] == "work deadline"
+            decision = client.decide("alice", ["rest", "work"])
+            assert sum(decision["probability_distribution"].values()) == pytest.approx(1.0)
+            assert client.status("alice")["event_count"] == 2
+            assert client.status("bob")["event_count"] == 0
+
+            with pytest.raises(ValidationError):
+                client.decide("alice", [])
+            with pytest.raises(ValidationError):
+                client.call("explode", "alice")
+            assert client.ping() == "pong"  # 오류 후에도 연결 재사용 가능
+
+
+def test_concurrent_decides_are_batched(tmp_path):
+    with _ServerThread(_server(tmp_path, batch_window=0.05)) as server:
+        with KernelClient(server.socket_path, pool_size=8) as client:
+            client.remember("alice", "note", {"text": "work"}, importance=0.7)
+            with ThreadPoolExecutor(8) as pool:
+                results = list(pool.map(
+                    lambda i: client.decide("alice", ["rest", "work", f"option_{i}"]), range(8)
+                ))
+            stats = client.stats()
+
+    assert len(results) == 8
+    for i, result in enumerate(results):
+        assert f"option_{i}" in result["probability_distribution"]
+    assert stats["batched_requests"] >= 2
+    assert stats["batches"] < stats["requests"]
+
+
+def test_sessions_saved_on_close(tmp_path):
+    with _ServerThread(_server(tmp_path)) as server:
+        with KernelClient(server.socket_path) as client:
+            client.remember("carol", "note", {"text": "persist me"}, importance=0.8)
+
+    assert not (tmp_path / "ck.sock").exists()
+    kernel = CognitiveKernel("carol", CognitiveConfig(storage_dir=str(tmp_path / "store"), auto_save=False))
+    assert kernel.recall(k=1)[0]["content"]["text"] == "persist me"
+
+
+def test_standalone_process(tmp_path):
+    socket_path = str(tmp_path / "proc.sock")
+    env = dict(os.environ, PYTHONPATH=str(project_root / "src"))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "cognitive_kernel.server",
+         "--socket", socket_path, "--storage-dir", str(tmp_path / "store")],
+        env=env, cwd=str(tmp_path),  # 저장소 루트의 cognitive_kernel.py 가림 방지
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    try:
+        deadline = time.time() + 20
+        while not os.path.exists(socket_path):
+            assert proc.poll() is None, proc.stderr.read().decode()
+            assert time.time() < deadline
+            time.sleep(0.05)
+        with KernelClient(socket_path) as client:
+            client.remember("dave", "note", {"text": "from another process"})
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        assert proc.wait(20) == 0
+
+    assert (tmp_path / "store" / "dave" / "meta.json").exists()
@@ -0,0 +1,114 @@
+"""
+엔진 지연 생성 테스트
+
+테스트 범위:
+- 커널 생성 시 엔진을 만들지 않음
+- remember/recall은 Panorama/MemoryRank만 생성
+- set_mode는 엔진을 만들지 않고, 이후 생성 시 새 모드 설정 사용
+- 저장된 Q-값은 BasalGanglia를 만들지 않아도 다음 저장에 유지
+- 동시 첫 접근은 엔진을 한 번만 생성 (로드된 Q-값 유지)
+- status()는 DynamicsEngine을 만들지 않음
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel import CognitiveKernel, CognitiveMode, CognitiveModePresets
+
+
+def test_engines_built_on_first_access(kernel_config):
+    kernel = CognitiveKernel("lazy", kernel_config)
+    assert kernel.engines_loaded == []
+
+    kernel.remember("note", {"text": "x"})
+    kernel.recall(k=1)
+    assert kernel.engines_loaded == ["panorama", "memoryrank"]
+
+    pfc = kernel.pfc
+    assert kernel.pfc is pfc  # 한 번만 생성
+    kernel.decide(["rest", "work"])
+    assert "dynamics" in kernel.engines_loaded
+
+
+def test_set_mode_does_not_build_engines(kernel_config):
+    kernel = CognitiveKernel("lazy_mode", kernel_config)
+    kernel.set_mode(CognitiveMode.ADHD)
+    assert kernel.engines_loaded == []
+
+    adhd = CognitiveModePresets.get_config(CognitiveMode.ADHD)
+    assert kernel.pfc.config.decision_temperature == adhd.decision_temperature
+    assert kernel.memoryrank.config.damping == adhd.damping
+
+
+def test_saved_q_values_kept_without_basal_ganglia(kernel_config, tmp_path):
+    kernel = CognitiveKernel("lazy_q", kernel_config)
+    kernel.remember("note", {"text": "x"})
+    kernel.save()
+    q_path = tmp_path / "lazy_q" / "q_values.json"
+    q_path.write_text(json.dumps({"ctx": {"work": 0.75}}))
+
+    reloaded = CognitiveKernel("lazy_q", kernel_config)
+    reloaded.remember("note", {"text": "y"})
+    reloaded.save()  # 엔진을 만들지 않아도 로드된 Q-값 유지
+    assert "basal_ganglia" not in reloaded.engines_loaded
+    assert json.loads(q_path.read_text()) == {"ctx": {"work": 0.75}}
+
+
+def test_concurrent_first_access_builds_once(kernel_config, tmp_path, monkeypatch):
+    kernel = CognitiveKernel("lazy_race", kernel_config)
+    kernel.remember("note", {"text": "x"})
+    kernel.save()
+    (tmp_path / "lazy_race" / "q_values.json").write_text(json.dumps({"ctx": {"work": 0.75}}))
+    reloaded = CognitiveKernel("lazy_race", kernel_config)
+
+    calls = []
+    snapshots = []
+    original = reloaded._build_basal_ganglia
+
+    def slow_build():
+        calls.append(1)
+        engine = original()
+        # 생성 중(저장 전) 스냅샷은 여전히 로드된 Q-값을 본다
+        snapshots.append(json.loads(reloaded._snapshot_files()[0]["q_values.json"]))
+        time.sleep(0.05)
+        return engine
+
+    applied = []
+    monkeypatch.setattr(reloaded, "_build_basal_ganglia", slow_build)
+    monkeypatch.setattr(reloaded, "_apply_q_values", lambda engine, q: applied.append((engine, q)))
+    engines = []
+    threads = [
+        threading.Thread(target=lambda: engines.append(reloaded.basal_ganglia)) for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(engine is engines[0] for engine in engines)
+    assert applied == [(engines[0], {"ctx": {"work": 0.75}})]  # 저장된 엔진에 Q-값 적용
+    assert snapshots == [{"ctx": {"work": 0.75}}]
+    assert reloaded._pending_q_values is None
+
+
+def test_status_does_not_build_dynamics(kernel_config):
+    kernel = CognitiveKernel("lazy_status", kernel_config)
+    kernel.remember("note", {"text": "x"})
+    status = kernel.status()
+    assert "dynamics" not in kernel.engines_loaded
+    assert status["dynamics"] == {
+        "core_decay_rate": kernel.mode_config.core_decay_rate,
+        "memory_update_failure": kernel.mode_config.memory_update_failure,
+        "loop_integrity_decay": kernel.mode_config.loop_integrity_decay,
+    }
+
+    kernel.decide(["rest", "work"])
+    assert "entropy" in kernel.status()["dynamics"]
@@ -0,0 +1,93 @@
+"""
+모드 스윕 테스트
+
+테스트 범위:
+- 모드 × ModeConfig 격자 변형별 열 지향 결과 배열
+- 프로세스 풀 실행과 순차 실행의 결과 일치 (같은 시드)
+- processes가 1 이하(0, 음수 포함)면 프로세스 풀 없이 순차 실행
+- 격자 값이 커널 설정에 반영됨 (set_mode overrides)
+- 잘못된 기록/격자 검증
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel import CognitiveMode, run_mode_sweep
+from cognitive_kernel.exceptions import ConfigurationError, ModeError, ValidationError
+
+STEPS = [
+    {"event_type": "work", "content": {"task": "report"}, "importance": 0.9},
+    {"options": ["rest", "work"]},
+    {"event_type": "stress", "content": {"level": "high"}, "emotion": 0.7, "related_to": [0]},
+    {"options": ["rest", "work", "walk"], "context": "evening"},
+]
+
+
+def test_sweep_shapes_and_lookup():
+    result = run_mode_sweep(
+        STEPS, modes=["normal", CognitiveMode.ADHD],
+        grid={"decision_temperature": [0.5, 2.0]}, processes=1, seed=3,
+    )
+    assert len(result) == 4
+    assert result.modes == ["normal", "normal", "adhd", "adhd"]
+    assert result.options == [["rest", "work"], ["rest", "work", "walk"]]
+    assert result.actions.shape == result.entropy.shape == result.core_strength.shape == (4, 2)
+    assert result.probabilities.shape == (4, 2, 3)
+    assert np.isnan(result.probabilities[:, 0, 2]).all()  # 옵션이 2개인 단계는 패딩
+    np.testing.assert_allclose(np.nansum(result.probabilities, axis=2), 1.0)
+
+    row = result.index("adhd", decision_temperature=2.0)
+    assert row == 3
+    assert len(result.action_names(row)) == 2
+    with pytest.raises(KeyError):
+        result.index("ptsd")
+
+
+def test_process_pool_matches_sequential():
+    grid = {"tau": [0.3, 0.9]}
+    pooled = run_mode_sweep(STEPS * 2, modes=["normal", "ptsd"], grid=grid, processes=2, seed=11)
+    serial = run_mode_sweep(STEPS * 2, modes=["normal", "ptsd"], grid=grid, processes=1, seed=11)
+    np.testing.assert_array_equal(pooled.actions, serial.actions)
+    np.testing.assert_allclose(pooled.entropy, serial.entropy)
+    np.testing.assert_allclose(pooled.core_strength, serial.core_strength)
+    assert pooled.to_dict()["actions"] == serial.to_dict()["actions"]
+
+
+@pytest.mark.parametrize("processes", [0, -1])
+def test_non_positive_processes_run_sequentially(monkeypatch, processes):
+    import cognitive_kernel.sweep as sweep
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool must not be used")
+
+    monkeypatch.setattr(sweep, "ProcessPoolExecutor", no_pool)
+    result = run_mode_sweep(STEPS, modes=["normal", "adhd"], processes=processes, seed=5)
+    serial = run_mode_sweep(STEPS, modes=["normal", "adhd"], processes=1, seed=5)
+    np.testing.assert_array_equal(result.actions, serial.actions)
+
+
+def test_set_mode_overrides(make_kernel):
+    kernel = make_kernel("ovr")
+    kernel.set_mode("adhd", overrides={"decision_temperature": 0.25})
+    assert kernel.mode_config.decision_temperature == 0.25
+    assert kernel.pfc.config.decision_temperature == 0.25
+    with pytest.raises(ModeError):
+        kernel.set_mode("adhd", overrides={"nope": 1})
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValidationError):
+        run_mode_sweep([{"event_type": "x", "related_to": [0]}], processes=1)
+    with pytest.raises(ValidationError):
+        run_mode_sweep([{"options": []}], processes=1)
+    with pytest.raises(ConfigurationError):
+        run_mode_sweep(STEPS, grid={"nope": [1]}, processes=1)
+    with pytest.raises(ConfigurationError):
+        run_mode_sweep(STEPS, modes=["sleepy"], processes=1)
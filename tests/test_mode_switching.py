@@ -0,0 +1,135 @@
+"""
+모드 전환 테스트 (학습 상태 유지)
+
+테스트 범위:
+- set_mode 후 기억/엣지/Working Memory/Q-테이블/동역학 히스토리 유지
+- 엔진 객체는 그대로, 모드가 정하는 설정 필드만 교체
+- 랭킹만 무효화되어 다음 회상 때 새 damping으로 재계산
+- 줄어든 Working Memory 용량 즉시 반영
+- 기존 파이프라인의 회전 토크도 새 모드 사용
+- load(): 저장된 모드/overrides를 이미 생성된 엔진에도 적용
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel import CognitiveKernel, CognitiveMode, CognitiveModePresets
+
+
+def test_set_mode_keeps_learned_state(make_kernel):
+    kernel = make_kernel("modes", fill="linked")
+    for _ in range(3):
+        kernel.decide(["rest", "work"], context="evening")
+    kernel.basal_ganglia.learn("evening", "rest", 1.0)
+
+    engines = {name: getattr(kernel, name) for name in kernel.engines_loaded}
+    edges = list(kernel._edges)
+    history = list(kernel.dynamics.state.entropy_history)
+    q_table = {ctx: dict(actions) for ctx, actions in kernel.basal_ganglia.q_table.items()}
+
+    kernel.set_mode("adhd")
+
+    assert all(getattr(kernel, name) is engine for name, engine in engines.items())
+    assert len(kernel) == 2
+    assert kernel._edges == edges
+    assert kernel.dynamics.state.entropy_history == history
+    assert {ctx: dict(a) for ctx, a in kernel.basal_ganglia.q_table.items()} == q_table
+
+    # 제자리 적용 결과는 새 모드로 만든 커널의 엔진 설정과 같다
+    fresh = make_kernel("fresh", CognitiveMode.ADHD)
+    for name in ("memoryrank", "pfc", "basal_ganglia", "thalamus", "dynamics"):
+        assert getattr(kernel, name).config == getattr(fresh, name).config, name
+    # 공유 프리셋/다른 세션 설정은 바뀌지 않음
+    assert kernel.pfc.config is not CognitiveModePresets.shared_config(CognitiveMode.NORMAL)
+
+
+def test_ranking_recomputed_with_new_mode(make_kernel):
+    kernel = make_kernel("modes", fill="linked")
+    kernel.recall(k=2)
+    generation = kernel.status()["graph_generation"]
+
+    kernel.set_mode(CognitiveMode.ASD)
+    assert kernel.status()["graph_generation"] > generation
+    memories = kernel.recall(k=2)
+    assert len(memories) == 2
+    assert kernel.memoryrank.config.damping == pytest.approx(
+        CognitiveModePresets.get_config(CognitiveMode.ASD).damping
+    )
+
+
+def test_working_memory_shrinks_to_new_capacity(make_kernel):
+    kernel = make_kernel("modes", fill="linked")
+    for i in range(7):
+        kernel.pfc.load_to_working_memory(f"item {i}", relevance=i / 10)
+
+    kernel.set_mode(CognitiveMode.ALZHEIMER)
+    capacity = CognitiveModePresets.get_config(CognitiveMode.ALZHEIMER).working_memory_capacity
+    assert len(kernel.pfc._working_memory) == capacity
+    assert kernel.pfc._working_memory[0].content == "item 6"  # relevance 높은 항목 유지
+
+
+def test_torque_follows_mode_after_switch(make_kernel, monkeypatch):
+    kernel = make_kernel("modes", fill="linked")
+    options = ["rest", "work"]
+    calls = []
+    original = kernel.dynamics.generate_torque
+
+    def spy(opts, entropy, mode=None, *args, **kwargs):
+        kernel.dynamics.state.precession_phi = 0.0  # 첫 옵션 토크 = γ · E / E_max
+        torque = original(opts, entropy, mode, *args, **kwargs)
+        calls.append((mode, torque[opts[0]] * math.log(len(opts)) / entropy))
+        return torque
+
+    monkeypatch.setattr(kernel.dynamics, "generate_torque", spy)
+    kernel.decide(options)  # 파이프라인 생성 (NORMAL)
+    kernel.set_mode(CognitiveMode.ADHD)
+    kernel.decide(options)  # 같은 파이프라인 재사용
+
+    base_gamma = kernel.dynamics.config.base_gamma
+    (normal_mode, normal_gamma), (adhd_mode, adhd_gamma) = calls
+    assert normal_mode == CognitiveMode.NORMAL
+    assert adhd_mode == CognitiveMode.ADHD
+    assert normal_gamma == pytest.approx(base_gamma)
+    assert adhd_gamma == pytest.approx(base_gamma * 1.5)
+
+
+def test_load_applies_saved_mode_to_built_engines(kernel_config):
+    saved = CognitiveKernel("saved", kernel_config, mode=CognitiveMode.DEMENTIA)
+    saved.remember("note", {"text": "x"}, importance=0.5)
+    saved.save()
+
+    kernel = CognitiveKernel("saved", kernel_config, auto_load=False)
+    kernel.pfc.load_to_working_memory("item", relevance=0.5)  # NORMAL 설정으로 엔진 생성
+    assert kernel.pfc.config.decision_temperature == pytest.approx(1.0)
+
+    kernel.load()
+    expected = CognitiveModePresets.get_config(CognitiveMode.DEMENTIA)
+    assert kernel.mode == CognitiveMode.DEMENTIA
+    assert kernel.pfc.config.decision_temperature == pytest.approx(expected.decision_temperature)
+    assert kernel.pfc.config.working_memory_capacity == expected.working_memory_capacity
+
+
+def test_mode_overrides_survive_save_and_load(kernel_config):
+    kernel = CognitiveKernel("overrides", kernel_config)
+    kernel.set_mode("adhd", overrides={"decision_temperature": 0.123})
+    kernel.remember("note", {"text": "x"}, importance=0.5)
+    kernel.save()
+
+    reloaded = CognitiveKernel("overrides", kernel_config)
+    assert reloaded.mode == CognitiveMode.ADHD
+    assert reloaded.mode_config.decision_temperature == pytest.approx(0.123)
+    assert reloaded.pfc.config.decision_temperature == pytest.approx(0.123)
+
+    # 프리셋 모드로 돌아가면 overrides도 저장에서 빠짐
+    reloaded.set_mode("adhd")
+    reloaded.save()
+    assert CognitiveKernel("overrides", kernel_config).mode_config.decision_temperature == pytest.approx(
+        CognitiveModePresets.get_config(CognitiveMode.ADHD).decision_temperature
+    )
@@ -0,0 +1,68 @@
+"""
+NeuralDynamicsCore.run_batch tests.
+
+We test:
+- each row matches a single run() (final state and convergence step)
+- per-row early stopping (converged rows frozen, -1 for rows that never converge)
+- shared and per-row input schedules, both backends
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel.engines.dynamics import ContinuousDynamicsConfig, NeuralDynamicsCore
+
+W = [[1.6, -1.2], [-1.2, 1.6]]
+STARTS = [[0.7, -0.4], [-0.6, 0.6], [0.2, 0.1], [0.05, -0.3], [0.9, 0.8]]
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_rows_match_single_runs(backend):
+    core = NeuralDynamicsCore(W, config=ContinuousDynamicsConfig(backend=backend))
+    finals, converged_at = core.run_batch(STARTS, steps=5000, stop_tol=1e-7)
+    assert finals.shape == (5, 2)
+
+    for row, x0 in enumerate(STARTS):
+        traj = core.run(x0, 5000, stop_tol=1e-7)
+        assert converged_at[row] == len(traj) - 1
+        np.testing.assert_allclose(finals[row], traj[-1], atol=1e-9)
+
+
+def test_unconverged_rows_and_fixed_steps():
+    core = NeuralDynamicsCore(W, config=ContinuousDynamicsConfig(backend="numpy"))
+    finals, converged_at = core.run_batch(STARTS, steps=50, stop_tol=1e-7)
+    assert (converged_at == -1).all()
+    expected = [core.run(x0, 50, return_trajectory=False) for x0 in STARTS]
+    np.testing.assert_allclose(finals, expected, atol=1e-12)
+
+    _, no_tol = core.run_batch(STARTS, steps=50)
+    assert (no_tol == -1).all()
+
+
+def test_input_schedules():
+    core = NeuralDynamicsCore(W, config=ContinuousDynamicsConfig(backend="numpy"))
+
+    def shared(t):
+        return [1.2, 0.0] if t < 300 else [0.0, 0.0]
+
+    finals, _ = core.run_batch(STARTS, steps=600, input_schedule=shared)
+    expected = [core.run(x0, 600, input_schedule=shared, return_trajectory=False) for x0 in STARTS]
+    np.testing.assert_allclose(finals, expected, atol=1e-12)
+
+    per_row = np.zeros((5, 2))
+    per_row[0] = [-3.0, 3.0]
+    finals, converged_at = core.run_batch(STARTS, steps=4000, input_schedule=lambda t: per_row, stop_tol=1e-9)
+    assert finals[0, 0] < 0 < finals[0, 1]  # only row 0 is pushed to the other attractor
+    assert (converged_at > 0).all()
+
+    with pytest.raises(ValueError):
+        core.run_batch(STARTS, steps=10, input_schedule=lambda t: [0.0, 0.0, 0.0])
+    with pytest.raises(ValueError):
+        core.run_batch([[0.0, 0.0, 0.0]], steps=10)
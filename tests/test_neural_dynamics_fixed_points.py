@@ -0,0 +1,116 @@
+"""
+Fixed-point solver tests.
+
+We test:
+- bistable 2-unit network: 4 attractors, 4 saddles and the unstable origin (newton / broyden)
+- solved attractors match long simulations and their eigenvalues
+- constant input shifts the fixed point; sigmoid / sparse / python backend
+- validation
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel.engines.dynamics import (
+    ContinuousDynamicsConfig,
+    CSRMatrix,
+    FixedPointConfig,
+    NeuralDynamicsCore,
+    find_fixed_points,
+)
+
+
+def _bistable(backend="numpy", **kwargs):
+    cfg = ContinuousDynamicsConfig(backend=backend, **kwargs)
+    return NeuralDynamicsCore([[2.0, 0.0], [0.0, 2.0]], config=cfg, seed=0)
+
+
+@pytest.mark.parametrize("method", ["newton", "broyden"])
+def test_bistable_network_all_fixed_points(method):
+    core = _bistable()
+    points = core.fixed_points(num_starts=300, config=FixedPointConfig(method=method), seed=1)
+
+    kinds = sorted(p.stability for p in points)
+    assert kinds == ["saddle"] * 4 + ["stable"] * 4 + ["unstable"]
+    assert sum(p.count for p in points) <= 300
+    assert [p.count for p in points] == sorted((p.count for p in points), reverse=True)
+
+    # x* = tanh(2 x*) -> x* ≈ ±0.9575
+    for p in points:
+        assert p.residual < 1e-10
+        np.testing.assert_allclose(p.x, np.tanh(2.0 * p.x), atol=1e-10)
+        if p.is_stable:
+            assert np.all(np.abs(p.x) > 0.95)
+
+
+def test_attractors_match_simulation_and_eigenvalues():
+    rng = np.random.default_rng(3)
+    n = 30
+    patterns = np.sign(rng.standard_normal((2, n)))
+    W = 2.0 * patterns.T @ patterns / n
+    np.fill_diagonal(W, 0.0)
+    core = NeuralDynamicsCore(W, config=ContinuousDynamicsConfig(backend="numpy", tau=0.2), seed=0)
+
+    points = find_fixed_points(core, X0=0.8 * patterns)
+    assert len(points) == 2 and all(p.is_stable for p in points)
+
+    finals, converged = core.run_batch(0.8 * patterns, 20000, stop_tol=1e-12)
+    assert np.all(converged > 0)
+    for final in finals:
+        assert min(np.abs(p.x - final).max() for p in points) < 1e-8
+
+    # eigenvalues are those of (-Id + diag(f'(u)) W) / tau
+    p = points[0]
+    u = W @ p.x
+    J = (-np.eye(n) + (1.0 - np.tanh(u) ** 2)[:, None] * W) / 0.2
+    np.testing.assert_allclose(np.sort(p.eigenvalues.real), np.sort(np.linalg.eigvals(J).real), atol=1e-8)
+
+
+def test_input_sigmoid_sparse_and_python_backend():
+    # single unit with constant input: x = tanh(0.5 x + 0.3)
+    core = NeuralDynamicsCore([[0.5]], config=ContinuousDynamicsConfig(backend="numpy"))
+    (point,) = core.fixed_points(num_starts=10, I=[0.3], seed=0)
+    assert point.is_stable and point.count == 10
+    assert point.x[0] == pytest.approx(np.tanh(0.5 * point.x[0] + 0.3), abs=1e-12)
+
+    sig = NeuralDynamicsCore(
+        [[1.0, -0.5], [-0.5, 1.0]], b=[0.1, -0.2],
+        config=ContinuousDynamicsConfig(backend="numpy", activation="sigmoid"),
+    )
+    for p in sig.fixed_points(num_starts=50, seed=0):
+        u = sig.W @ p.x + sig.b
+        np.testing.assert_allclose(p.x, 1.0 / (1.0 + np.exp(-u)), atol=1e-10)
+
+    sparse = NeuralDynamicsCore(
+        CSRMatrix.from_dense([[2.0, 0.0], [0.0, 2.0]]),
+        config=ContinuousDynamicsConfig(backend="numpy"),
+    )
+    python = _bistable(backend="python")
+    assert len(sparse.fixed_points(num_starts=200, seed=1)) == 9
+    assert len(python.fixed_points(num_starts=200, seed=1)) == 9
+
+
+def test_chunked_solve_and_validation():
+    core = _bistable()
+    small_chunks = FixedPointConfig(max_jacobian_elements=4)  # one start per chunk
+    chunked = core.fixed_points(num_starts=100, config=small_chunks, seed=2)
+    whole = core.fixed_points(num_starts=100, seed=2)
+    assert [p.count for p in chunked] == [p.count for p in whole]
+    for a, b in zip(chunked, whole):
+        np.testing.assert_allclose(a.x, b.x, atol=1e-12)
+
+    with pytest.raises(ValueError):
+        FixedPointConfig(method="bisection").validate()
+    with pytest.raises(ValueError):
+        core.fixed_points(X0=[[0.0, 0.0, 0.0]])
+    with pytest.raises(ValueError):
+        core.fixed_points(I=[1.0])
+    with pytest.raises(ValueError):
+        core.fixed_points(num_starts=0)
@@ -0,0 +1,105 @@
+"""
+NeuralDynamicsCore integrator tests (euler / rk4 / dopri5 / heun).
+
+We test:
+- convergence order against a fine reference solution with far fewer RHS evaluations
+- dopri5 adaptive substeps, rejected-step statistics, output interval larger than tau
+- stochastic Heun: seeded reproducibility and Ornstein-Uhlenbeck stationary variance
+- identical results on both backends, config validation
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel.engines.dynamics import ContinuousDynamicsConfig, NeuralDynamicsCore
+
+RNG = np.random.default_rng(1)
+W = RNG.standard_normal((20, 20)) / 3
+X0 = RNG.standard_normal(20)
+T = 1.0
+
+
+def _final(integrator, dt, backend="numpy", **cfg):
+    core = NeuralDynamicsCore(W, config=ContinuousDynamicsConfig(
+        backend=backend, integrator=integrator, dt=dt, tau=0.05, **cfg
+    ))
+    x = core.run(X0, int(round(T / dt)), return_trajectory=False)
+    return np.asarray(x), core.stats
+
+
+REFERENCE, _ = _final("rk4", 1e-4)
+
+
+def test_higher_order_beats_euler_with_fewer_evaluations():
+    euler, euler_stats = _final("euler", 1e-4)
+    rk4, rk4_stats = _final("rk4", 1e-2)
+    heun, heun_stats = _final("heun", 1e-3)
+
+    euler_err = np.abs(euler - REFERENCE).max()
+    assert np.abs(rk4 - REFERENCE).max() < euler_err / 10
+    assert rk4_stats.rhs_evals * 10 < euler_stats.rhs_evals
+    assert np.abs(heun - REFERENCE).max() < euler_err
+    assert heun_stats.rhs_evals == 2 * heun_stats.steps
+
+
+def test_dopri5_adapts_within_output_interval():
+    x, stats = _final("dopri5", 0.5, rtol=1e-7, atol=1e-10)
+    assert np.abs(x - REFERENCE).max() < 1e-5
+    assert stats.steps == 2
+    assert stats.substeps > stats.steps  # 0.5 >> tau: needs internal substeps
+    assert stats.rejected >= 1
+    assert stats.rhs_evals == 6 * (stats.substeps + stats.rejected) + stats.steps
+
+    # looser tolerances trade accuracy for fewer evaluations
+    loose, loose_stats = _final("dopri5", 0.5, rtol=1e-3, atol=1e-6)
+    assert loose_stats.rhs_evals < stats.rhs_evals
+    assert np.abs(loose - REFERENCE).max() < 1e-2
+
+
+@pytest.mark.parametrize("integrator", ["rk4", "dopri5", "heun"])
+def test_backends_agree(integrator):
+    a, _ = _final(integrator, 0.01, backend="numpy")
+    b, _ = _final(integrator, 0.01, backend="python")
+    np.testing.assert_allclose(a, b, atol=1e-12)
+
+
+def test_stochastic_heun_ou_variance():
+    sigma, tau = 0.5, 0.1
+    cfg = ContinuousDynamicsConfig(
+        dt=0.01, tau=tau, activation="linear", noise_scale=sigma, integrator="heun", backend="numpy"
+    )
+    core = NeuralDynamicsCore([[0.0]], config=cfg, seed=4)
+    finals, _ = core.run_batch(np.zeros((4000, 1)), steps=200)
+    # dx = -x/tau dt + sigma dW  ->  stationary variance sigma^2 tau / 2
+    assert finals.var() == pytest.approx(sigma ** 2 * tau / 2, rel=0.1)
+
+    again = NeuralDynamicsCore([[0.0]], config=cfg, seed=4).run_batch(np.zeros((4000, 1)), steps=200)[0]
+    np.testing.assert_array_equal(finals, again)
+
+
+def test_stats_reset_and_validation():
+    core = NeuralDynamicsCore([[0.5]], config=ContinuousDynamicsConfig(integrator="rk4"))
+    core.run([0.1], 5)
+    assert (core.stats.steps, core.stats.rhs_evals) == (5, 20)
+    core.reset_stats()
+    assert core.stats.steps == 0
+
+    with pytest.raises(ValueError):
+        ContinuousDynamicsConfig(integrator="rk4", noise_scale=0.1).validate()
+    with pytest.raises(ValueError):
+        ContinuousDynamicsConfig(integrator="midpoint").validate()
+    with pytest.raises(ValueError):
+        ContinuousDynamicsConfig(integrator="dopri5", rtol=0.0).validate()
+
+    strict = NeuralDynamicsCore([[0.5]], config=ContinuousDynamicsConfig(
+        integrator="dopri5", dt=1.0, tau=0.001, max_substeps=3,
+    ))
+    with pytest.raises(RuntimeError):
+        strict.step([1.0])
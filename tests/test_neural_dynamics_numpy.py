@@ -0,0 +1,79 @@
+"""
+NeuralDynamicsCore NumPy backend tests.
+
+We test:
+- numerical agreement with the pure-Python backend (all activations, inputs, clipping)
+- trajectory preallocation shape, early stopping and final-state mode
+- W assignment conversion and validation
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel.engines.dynamics import ContinuousDynamicsConfig, NeuralDynamicsCore
+
+
+def _pair(W, **cfg):
+    python = NeuralDynamicsCore(W, config=ContinuousDynamicsConfig(**cfg))
+    numpy_ = NeuralDynamicsCore(W, config=ContinuousDynamicsConfig(backend="numpy", **cfg))
+    return python, numpy_
+
+
+@pytest.mark.parametrize("activation", ["tanh", "sigmoid", "relu", "linear"])
+def test_matches_python_backend(activation):
+    rng = np.random.default_rng(0)
+    W = (rng.standard_normal((12, 12)) / 4).tolist()
+    x0 = rng.standard_normal(12).tolist()
+    python, numpy_ = _pair(W, activation=activation, clip_state=2.0)
+
+    def pulse(t):
+        return [0.5 if 10 <= t < 40 else 0.0] * 12
+
+    expected = np.array(python.run(x0, 200, input_schedule=pulse))
+    traj = numpy_.run(x0, 200, input_schedule=pulse)
+    assert isinstance(traj, np.ndarray) and traj.shape == (201, 12)
+    np.testing.assert_allclose(traj, expected, atol=1e-12)
+
+    np.testing.assert_allclose(numpy_.step(x0), python.step(x0), atol=1e-12)
+    assert numpy_.hopfield_energy(x0) == pytest.approx(python.hopfield_energy(x0))
+
+
+def test_early_stop_and_final_state():
+    W = [[1.6, -1.2], [-1.2, 1.6]]
+    python, numpy_ = _pair(W, dt=0.01, tau=0.1)
+
+    expected = python.run([0.7, -0.4], 5000, stop_tol=1e-7)
+    traj = numpy_.run([0.7, -0.4], 5000, stop_tol=1e-7)
+    assert traj.shape == (len(expected), 2)
+    np.testing.assert_allclose(traj[-1], expected[-1], atol=1e-12)
+
+    final = numpy_.run([0.7, -0.4], 5000, stop_tol=1e-7, return_trajectory=False)
+    np.testing.assert_allclose(final, traj[-1])
+
+
+def test_noise_is_seeded():
+    W = [[0.5, 0.1], [0.1, 0.5]]
+    cfg = dict(noise_scale=0.2, backend="numpy")
+    a = NeuralDynamicsCore(W, config=ContinuousDynamicsConfig(**cfg), seed=3).run([0.0, 0.0], 50)
+    b = NeuralDynamicsCore(W, config=ContinuousDynamicsConfig(**cfg), seed=3).run([0.0, 0.0], 50)
+    np.testing.assert_array_equal(a, b)
+    assert np.abs(np.diff(a, axis=0)).max() > 0
+
+
+def test_weight_assignment_and_validation():
+    core = NeuralDynamicsCore([[0.0, 0.0], [0.0, 0.0]], config=ContinuousDynamicsConfig(backend="numpy"))
+    core.W = [[1.0, 0.0], [0.0, 1.0]]
+    assert isinstance(core.W, np.ndarray)
+    with pytest.raises(ValueError):
+        core.W = [[1.0]]
+    with pytest.raises(ValueError):
+        core.step([0.0])
+    with pytest.raises(ValueError):
+        ContinuousDynamicsConfig(backend="cuda").validate()
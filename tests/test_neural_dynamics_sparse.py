@@ -0,0 +1,118 @@
+"""
+Sparse (CSR) recurrent weights tests.
+
+We test:
+- CSRMatrix construction (dense / COO with duplicates / SciPy-like .tocsr()) and products
+- products with empty leading / interior / trailing rows
+- NeuralDynamicsCore with sparse W matches dense W (run, run_batch, energy, integrators)
+- hebbian_update on CSR only touches existing synapses
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel.engines.dynamics import (
+    ContinuousDynamicsConfig,
+    CSRMatrix,
+    HebbianPlasticityConfig,
+    NeuralDynamicsCore,
+    hebbian_update,
+)
+
+
+def _sparse_dense(n=60, density=0.05, seed=0):
+    rng = np.random.default_rng(seed)
+    dense = rng.standard_normal((n, n)) * (rng.random((n, n)) < density)
+    dense[3] = 0.0  # an empty row
+    return CSRMatrix.from_dense(dense), dense
+
+
+def test_csr_construction_and_products():
+    W, dense = _sparse_dense()
+    assert W.shape == (60, 60) and W.nnz == np.count_nonzero(dense)
+    np.testing.assert_array_equal(W.to_dense(), dense)
+
+    x = np.linspace(-1.0, 1.0, 60)
+    np.testing.assert_allclose(W.dot(x), dense @ x, atol=1e-12)
+    X = np.stack([x, -x, x ** 2])
+    np.testing.assert_allclose(W.dot(X), X @ dense.T, atol=1e-12)
+    assert W.quadratic(x) == pytest.approx(x @ dense @ x)
+
+    coo = CSRMatrix.from_coo([0, 0, 2], [1, 1, 0], [0.5, 0.25, -1.0], 3)
+    np.testing.assert_array_equal(coo.to_dense(), [[0, 0.75, 0], [0, 0, 0], [-1.0, 0, 0]])
+
+    class FakeScipy:  # anything with .tocsr() is converted
+        shape = (3, 3)
+        data, indices, indptr = coo.data, coo.indices, coo.indptr
+
+        def tocsr(self):
+            return self
+
+        def sum_duplicates(self):
+            pass
+
+    core = NeuralDynamicsCore(FakeScipy(), config=ContinuousDynamicsConfig(backend="numpy"))
+    assert isinstance(core.W, CSRMatrix)
+
+    with pytest.raises(ValueError):
+        CSRMatrix([1.0], [5], [0, 1, 1], 2)
+
+
+@pytest.mark.parametrize("empty", [[1, 2], [0, 2], [1], [0, 3], [2, 3]])
+def test_csr_products_with_empty_rows(empty):
+    dense = np.arange(1.0, 17.0).reshape(4, 4)
+    dense[empty] = 0.0
+    W = CSRMatrix.from_dense(dense)
+    x = np.array([1.0, -2.0, 0.5, 3.0])
+    np.testing.assert_allclose(W.dot(x), dense @ x, atol=1e-12)
+    X = np.stack([x, np.ones(4)])
+    np.testing.assert_allclose(W.dot(X), X @ dense.T, atol=1e-12)
+
+
+def test_csr_trailing_empty_rows():
+    W = CSRMatrix.from_dense([[1.0, 2.0, 3.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
+    np.testing.assert_array_equal(W.dot(np.ones(3)), [6.0, 0.0, 0.0])
+
+
+@pytest.mark.parametrize("integrator", ["euler", "rk4", "dopri5"])
+def test_sparse_matches_dense(integrator):
+    W, dense = _sparse_dense()
+    cfg = ContinuousDynamicsConfig(backend="numpy", integrator=integrator, clip_state=3.0)
+    sparse_core = NeuralDynamicsCore(W, b=[0.1] * 60, config=cfg)
+    dense_core = NeuralDynamicsCore(dense, b=[0.1] * 60, config=cfg)
+    x0 = np.random.default_rng(1).standard_normal(60)
+
+    np.testing.assert_allclose(sparse_core.run(x0, 100), dense_core.run(x0, 100), atol=1e-10)
+    X0 = np.random.default_rng(2).standard_normal((5, 60))
+    np.testing.assert_allclose(
+        sparse_core.run_batch(X0, 50)[0], dense_core.run_batch(X0, 50)[0], atol=1e-10
+    )
+    assert sparse_core.hopfield_energy(x0) == pytest.approx(dense_core.hopfield_energy(x0))
+
+
+def test_sparse_requires_numpy_backend():
+    W, _ = _sparse_dense()
+    with pytest.raises(ValueError):
+        NeuralDynamicsCore(W)
+
+
+def test_hebbian_updates_existing_synapses_only():
+    W, dense = _sparse_dense()
+    pre = np.random.default_rng(3).standard_normal(60)
+    cfg = HebbianPlasticityConfig(eta=0.1, weight_decay=0.01, clip_weight=0.8)
+
+    updated = hebbian_update(W, pre=pre, config=cfg)
+    assert isinstance(updated, CSRMatrix) and updated.nnz == W.nnz
+    np.testing.assert_array_equal(W.to_dense(), dense)  # input untouched
+
+    expected = np.array(hebbian_update(dense.tolist(), pre=pre, config=cfg))
+    mask = dense != 0
+    np.testing.assert_allclose(updated.to_dense()[mask], expected[mask], atol=1e-12)
+    assert not updated.to_dense()[~mask].any()
@@ -0,0 +1,137 @@
+"""
+PFC 배열 기반 의사결정 테스트
+
+테스트 범위:
+- 구조-배열 효용/softmax가 스칼라 경로와 일치
+- 샘플링/argmax 선택 인덱스가 기존 구현과 동일
+- 갈등 신호/억제 여부가 should_inhibit과 동일
+"""
+
+import math
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel.engines.pfc import (
+    PFCEngine,
+    PFCConfig,
+    Action,
+    ActionArrays,
+)
+
+
+def _make_actions(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        Action(
+            id=f"a{i}",
+            name=f"tool_{i}",
+            expected_reward=rng.random(),
+            effort_cost=rng.random() * 0.5,
+            risk=rng.random() * 0.4,
+        )
+        for i in range(n)
+    ]
+
+
+def _reference_select(pfc, actions, deterministic, rng):
+    """배열 경로 도입 전의 스칼라 구현 (비교 기준, 난수는 rng에서)"""
+    utilities = [pfc.evaluate_action(a) for a in actions]
+    probabilities = pfc.softmax_probabilities(utilities)
+    if deterministic:
+        idx = max(range(len(utilities)), key=lambda i: utilities[i])
+    else:
+        r = rng.random()
+        cumsum = 0.0
+        idx = len(actions) - 1
+        for i, p in enumerate(probabilities):
+            cumsum += p
+            if r < cumsum:
+                idx = i
+                break
+    others = [a for i, a in enumerate(actions) if i != idx]
+    inhibit, conflict = pfc.should_inhibit(actions[idx], others)
+    return idx, utilities[idx], probabilities[idx], inhibit, conflict
+
+
+def test_utilities_and_probabilities_match_scalar_path():
+    pfc = PFCEngine(PFCConfig(decision_temperature=3.0))
+    actions = _make_actions(300)
+
+    arrays = ActionArrays.from_actions(actions)
+    utilities = pfc.evaluate_arrays(arrays)
+    probabilities = pfc.softmax_array(utilities)
+
+    expected_u = [pfc.evaluate_action(a) for a in actions]
+    expected_p = pfc.softmax_probabilities(expected_u)
+
+    assert utilities.tolist() == expected_u
+    assert probabilities == pytest.approx(expected_p, rel=1e-12, abs=1e-15)
+    assert math.isclose(float(probabilities.sum()), 1.0, rel_tol=1e-12)
+
+
+@pytest.mark.parametrize("deterministic", [True, False])
+def test_select_action_matches_reference(deterministic):
+    config = PFCConfig(decision_temperature=2.0, inhibition_threshold=0.3)
+
+    for seed in range(20):
+        actions = _make_actions(25, seed=seed)
+        pfc = PFCEngine(config, seed=seed)  # 엔진 전용 생성기
+
+        idx, utility, prob, inhibit, conflict = _reference_select(
+            pfc, actions, deterministic, np.random.default_rng(seed)
+        )
+
+        decision = pfc.decide_arrays(ActionArrays.from_actions(actions), deterministic)
+        result = decision.result
+
+        assert decision.index == idx
+        assert result.utility == utility
+        assert result.selection_probability == pytest.approx(prob, rel=1e-12)
+        assert result.inhibited == inhibit
+        assert result.conflict_signal == pytest.approx(conflict, abs=1e-15)
+        if inhibit:
+            assert result.action is None
+        else:
+            assert result.action is actions[idx]
+
+
+def test_arrays_without_action_objects():
+    pfc = PFCEngine()
+    arrays = ActionArrays(
+        rewards=[0.9, 0.2, 1.5],
+        costs=[0.1, 0.1, 0.1],
+        risks=[0.0, 0.0, -1.0],
+        names=["work", "rest", "play"],
+    )
+
+    # Action과 동일하게 0~1로 클리핑
+    assert arrays.rewards.tolist() == [0.9, 0.2, 1.0]
+    assert arrays.risks.tolist() == [0.0, 0.0, 0.0]
+
+    decision = pfc.decide_arrays(arrays, deterministic=True)
+    assert decision.result.action.name == "play"
+    assert len(decision.utilities) == 3
+
+
+def test_empty_candidates():
+    pfc = PFCEngine()
+    result = pfc.select_action([])
+    assert result.action is None
+    assert result.selection_probability == 0.0
+
+    decision = pfc.process_arrays(ActionArrays.from_actions([]))
+    assert decision.index == -1
+    assert len(decision.probabilities) == 0
+
+
+def test_mismatched_lengths_rejected():
+    with pytest.raises(ValueError):
+        ActionArrays(rewards=[0.1, 0.2], costs=[0.1], risks=[0.1, 0.2])
@@ -0,0 +1,183 @@
+"""
+파이프라인 동시 실행 테스트
+
+테스트 범위:
+- reads/writes/effects 기반 의존성 그래프
+- 스레드 풀 / asyncio 실행기에서 독립 단계 동시 실행
+- 순차 실행과 동일한 결정 분포
+- 예외 전파, 잘못된 실행기 설정
+- 동역학 상태를 바꾸는 단계의 effects 선언, 작업 스레드에서의 계측 집계
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel.exceptions import ConfigurationError
+from cognitive_kernel.profiling import PipelineProfiler
+from cognitive_kernel.pipeline import (
+    DecisionPipeline,
+    PipelineContext,
+    PipelineStep,
+    MemoryLoadStep,
+    KeywordExtractionStep,
+    EntropyCalculationStep,
+    CoreStrengthStep,
+    TorqueGenerationStep,
+    HabitLookupStep,
+    ResultAssemblyStep,
+)
+
+
+class _SleepStep(PipelineStep):
+    """지정 필드에 값을 쓰는 느린 단계"""
+
+    def __init__(self, name, reads=(), writes=(), delay=0.1):
+        self.name = name
+        self.reads = reads
+        self.writes = writes
+        self.delay = delay
+
+    def process(self, context):
+        time.sleep(self.delay)
+        for field_name in self.writes:
+            context.metadata[field_name.split(".", 1)[1]] = threading.current_thread().name
+        return context
+
+    def __repr__(self):
+        return self.name
+
+
+class _BarrierStep(PipelineStep):
+    def process(self, context):
+        return context
+
+
+class _FailingStep(PipelineStep):
+    writes = ("metadata.fail",)
+
+    def process(self, context):
+        raise RuntimeError("boom")
+
+
+def _independent_pipeline(executor):
+    return DecisionPipeline(
+        [
+            _SleepStep("a", writes=("metadata.a",)),
+            _SleepStep("b", writes=("metadata.b",)),
+            _SleepStep("c", writes=("metadata.c",)),
+            _SleepStep("join", reads=("metadata.a", "metadata.b", "metadata.c"),
+                       writes=("metadata.join",), delay=0.0),
+        ],
+        executor=executor,
+    )
+
+
+def test_dependency_graph():
+    pipeline = DecisionPipeline([
+        MemoryLoadStep(None),
+        KeywordExtractionStep(str.split),
+        _BarrierStep(),
+        HabitLookupStep(None),
+        ResultAssemblyStep(None),
+    ])
+    assert pipeline.dependency_graph() == [[], [], [0, 1], [2], [2, 3]]
+
+
+def test_threads_run_independent_steps_concurrently():
+    pipeline = _independent_pipeline("threads")
+    start = time.perf_counter()
+    context = pipeline.execute(PipelineContext(options=["x"]))
+    elapsed = time.perf_counter() - start
+    pipeline.close()
+
+    assert elapsed < 0.25  # 순차 실행이면 0.3초 이상
+    assert {"a", "b", "c", "join"} <= set(context.metadata)
+
+
+def test_sequential_is_default():
+    pipeline = _independent_pipeline("sequential")
+    assert DecisionPipeline([]).executor == "sequential"
+    start = time.perf_counter()
+    pipeline.execute(PipelineContext(options=["x"]))
+    assert time.perf_counter() - start >= 0.3
+
+
+def test_execute_async():
+    pipeline = _independent_pipeline("sequential")
+
+    async def run():
+        start = time.perf_counter()
+        context = await pipeline.execute_async(PipelineContext(options=["x"]))
+        return context, time.perf_counter() - start
+
+    context, elapsed = asyncio.run(run())
+    assert elapsed < 0.25
+    assert "join" in context.metadata
+
+
+def test_errors_propagate():
+    pipeline = DecisionPipeline(
+        [_SleepStep("a", writes=("metadata.a",), delay=0.01), _FailingStep()],
+        executor="threads",
+    )
+    with pytest.raises(RuntimeError, match="boom"):
+        pipeline.execute(PipelineContext(options=["x"]))
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(pipeline.execute_async(PipelineContext(options=["x"])))
+    pipeline.close()
+
+
+def test_invalid_executor():
+    with pytest.raises(ConfigurationError):
+        DecisionPipeline([], executor="processes")
+
+
+def test_dynamics_steps_share_effect():
+    # 모두 dynamics.state를 갱신하므로 스레드 실행기에서도 순서대로 실행
+    for step_class in (EntropyCalculationStep, CoreStrengthStep, TorqueGenerationStep):
+        assert "dynamics" in step_class.effects
+
+
+def test_profiler_counts_under_threads():
+    steps = [_SleepStep(f"s{i}", writes=(f"metadata.s{i}",), delay=0.0) for i in range(8)]
+    profiler = PipelineProfiler()
+    pipeline = DecisionPipeline(steps, profiler=profiler, executor="threads", max_workers=8)
+    for _ in range(50):
+        pipeline.execute(PipelineContext(options=["a"]))
+    pipeline.close()
+
+    snapshot = profiler.snapshot()
+    assert snapshot[PipelineProfiler.TOTAL_KEY]["calls"] == 50
+    assert sum(data["calls"] for name, data in snapshot.items() if name != PipelineProfiler.TOTAL_KEY) == 400
+
+
+def test_threaded_kernel_matches_sequential(make_kernel):
+    def make(name, executor):
+        kernel = make_kernel(name, pipeline_executor=executor)
+        for text in ["work deadline", "rest after run", "read a book"]:
+            kernel.remember("note", {"text": text}, importance=0.6)
+        return kernel
+
+    sequential = make("seq", "sequential")
+    threaded = make("thr", "threads")
+    options = ["rest", "work", "read"]
+
+    for _ in range(3):
+        a = sequential.decide(options, context="tired")
+        b = threaded.decide(options, context="tired")
+        assert a["entropy"] == pytest.approx(b["entropy"], rel=1e-6)
+        assert (a["habit_suggestion"] is None) == (b["habit_suggestion"] is None)
+        for opt in options:
+            assert a["probability_distribution"][opt] == pytest.approx(
+                b["probability_distribution"][opt], rel=1e-6
+            )
+    threaded._pipeline.close()
@@ -0,0 +1,162 @@
+"""
+파이프라인 단계 재사용 / 통합 결정 단계 테스트
+
+테스트 범위:
+- reads/writes 선언과 memoize 단계 재사용 (기억 중요도가 바뀌면 재계산)
+- TorqueDecisionStep이 기존 두 단계 구성과 같은 분포를 생성
+- Working Memory 감쇠는 결정당 한 번
+- 모드 변경 시 기본 파이프라인 재생성
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel import CognitiveMode
+from cognitive_kernel.pipeline import (
+    DecisionPipeline,
+    PipelineContext,
+    PipelineStep,
+    MemoryLoadStep,
+    WorkingMemoryStep,
+    ActionCreationStep,
+    PFCDecisionStep,
+    EntropyCalculationStep,
+    CoreStrengthStep,
+    TorqueGenerationStep,
+    UtilityRecalculationStep,
+    ResultAssemblyStep,
+    TorqueDecisionStep,
+)
+
+
+OPTIONS = ["rest", "work", "exercise", "read", "sleep"]
+
+
+def _two_pass_pipeline(kernel):
+    """통합 전 기본 파이프라인 (PFC 결정 2회)"""
+    return DecisionPipeline([
+        MemoryLoadStep(kernel, kernel.config.working_memory_capacity),
+        WorkingMemoryStep(kernel.pfc),
+        ActionCreationStep(kernel.pfc, kernel._calculate_memory_relevance, kernel._extract_keywords),
+        PFCDecisionStep(kernel.pfc),
+        EntropyCalculationStep(kernel.dynamics),
+        CoreStrengthStep(kernel.dynamics, kernel),
+        TorqueGenerationStep(kernel.dynamics, kernel=kernel),
+        UtilityRecalculationStep(kernel.pfc, kernel._calculate_memory_relevance, kernel._extract_keywords),
+        ResultAssemblyStep(kernel.pfc, kernel.basal_ganglia),
+    ])
+
+
+class _CountingStep(PipelineStep):
+    reads = ("options",)
+    writes = ("metadata.count",)
+    memoize = True
+
+    def __init__(self):
+        self.calls = 0
+
+    def process(self, context):
+        self.calls += 1
+        context.metadata["count"] = len(context.options)
+        return context
+
+
+def test_memoized_step_reused_when_inputs_unchanged():
+    step = _CountingStep()
+    pipeline = DecisionPipeline([step])
+
+    first = pipeline.execute(PipelineContext(options=["a", "b"]))
+    second = pipeline.execute(PipelineContext(options=["a", "b"]))
+    third = pipeline.execute(PipelineContext(options=["a", "b", "c"]))
+
+    assert step.calls == 2
+    assert pipeline.memo_hits == 1
+    assert first.metadata["count"] == second.metadata["count"] == 2
+    assert third.metadata["count"] == 3
+
+    pipeline.clear_cache()
+    pipeline.execute(PipelineContext(options=["a", "b", "c"]))
+    assert step.calls == 3
+
+
+def test_action_creation_recomputed_when_importance_changes():
+    def relevance(keywords, memories):
+        return sum(m["importance"] for m in memories) / len(memories)
+
+    step = ActionCreationStep(None, relevance, lambda opt: [opt])
+    pipeline = DecisionPipeline([step])
+
+    def run(importance):
+        memories = [{"id": "m1", "importance": importance}, {"id": "m2", "importance": 0.5}]
+        context = pipeline.execute(PipelineContext(options=["a", "b"], memories=memories))
+        return context.action_arrays.rewards.tolist()
+
+    first = run(0.9)
+    second = run(0.7)  # 같은 ID, 다른 중요도 → 재계산
+    assert pipeline.memo_hits == 0
+    assert second != first
+    assert run(0.7) == second
+    assert pipeline.memo_hits == 1
+
+
+def test_default_steps_declare_fields(make_kernel):
+    kernel = make_kernel("declare", fill="notes")
+    for step in kernel.get_default_pipeline().steps:
+        assert isinstance(step.reads, tuple)
+        assert isinstance(step.writes, tuple)
+    assert "action_arrays" in ActionCreationStep.writes
+    assert TorqueDecisionStep.writes[-1] == "metadata.pfc_result"
+
+
+@pytest.mark.parametrize("mode", [CognitiveMode.NORMAL, CognitiveMode.ADHD])
+def test_fused_pipeline_matches_two_pass(make_kernel, mode):
+    fused = make_kernel("fused", mode, fill="notes")
+    legacy = make_kernel("legacy", mode, fill="notes")
+    legacy.set_pipeline(_two_pass_pipeline(legacy))
+
+    for _ in range(5):
+        a = fused.decide(OPTIONS)
+        b = legacy.decide(OPTIONS)
+        assert a["entropy"] == pytest.approx(b["entropy"], rel=1e-6)
+        assert a["core_strength"] == pytest.approx(b["core_strength"], rel=1e-6)
+        for opt in OPTIONS:
+            assert a["probability_distribution"][opt] == pytest.approx(
+                b["probability_distribution"][opt], rel=1e-6
+            )
+
+    assert fused.dynamics.state.precession_phi == pytest.approx(
+        legacy.dynamics.state.precession_phi
+    )
+    # KeywordExtractionStep은 첫 결정 이후 재사용 (ActionCreationStep은
+    # 회상 점수의 최신성 항이 결정마다 달라지면 다시 계산)
+    assert fused._pipeline.memo_hits >= 4
+
+
+def test_working_memory_decay_once_per_decision(make_kernel, monkeypatch):
+    kernel = make_kernel("decay", CognitiveMode.ADHD, fill="notes")
+    calls = []
+    original = kernel.pfc.update_decay
+    monkeypatch.setattr(kernel.pfc, "update_decay", lambda *a, **kw: calls.append(1) or original(*a, **kw))
+
+    kernel.decide(OPTIONS)
+    assert len(calls) == 1
+
+
+def test_set_mode_keeps_pipeline_and_clears_cache(make_kernel):
+    kernel = make_kernel("mode", fill="notes")
+    kernel.decide(OPTIONS)
+    pipeline = kernel._pipeline
+    assert pipeline._memo
+
+    kernel.set_mode(CognitiveMode.ADHD)
+    assert kernel._pipeline is pipeline
+    assert not pipeline._memo
+    wm_step = next(step for step in pipeline.steps if isinstance(step, WorkingMemoryStep))
+    assert wm_step.pfc_engine is kernel.pfc
+    assert kernel.decide(OPTIONS)["action"] in OPTIONS + [None]
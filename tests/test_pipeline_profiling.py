@@ -0,0 +1,107 @@
+"""
+파이프라인 계측 테스트
+
+테스트 범위:
+- 단계별 호출 수/시간/히스토그램 집계
+- tracemalloc 할당량 측정
+- kernel.status() 노출 및 파일 덤프
+- 계측기 없는 파이프라인은 기존 동작 유지
+"""
+
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel.exceptions import ConfigurationError
+from cognitive_kernel.pipeline import DecisionPipeline, PipelineContext, PipelineStep
+from cognitive_kernel.profiling import PipelineProfiler, HISTOGRAM_BOUNDS_MS
+
+
+class _AllocStep(PipelineStep):
+    def process(self, context):
+        context.metadata["buf"] = [0] * 10000
+        return context
+
+
+class _NoopStep(PipelineStep):
+    def process(self, context):
+        return context
+
+
+def test_profiler_counts_and_histogram():
+    profiler = PipelineProfiler()
+    pipeline = DecisionPipeline([_NoopStep(), _AllocStep()], profiler=profiler)
+    for _ in range(5):
+        pipeline.execute(PipelineContext(options=["a"]))
+
+    snap = profiler.snapshot()
+    assert set(snap) == {"_NoopStep", "_AllocStep", PipelineProfiler.TOTAL_KEY}
+    for stats in snap.values():
+        assert stats["calls"] == 5
+        assert sum(stats["histogram"].values()) == 5
+        assert len(stats["histogram"]) == len(HISTOGRAM_BOUNDS_MS) + 1
+        assert stats["wall_max_ms"] >= stats["wall_mean_ms"] >= 0.0
+    assert "alloc_bytes" not in snap["_AllocStep"]
+
+
+def test_profiler_tracks_allocations():
+    was_tracing = tracemalloc.is_tracing()
+    profiler = PipelineProfiler(track_allocations=True)
+    pipeline = DecisionPipeline([_AllocStep()], profiler=profiler)
+    pipeline.execute(PipelineContext(options=["a"]))
+
+    stats = profiler.snapshot()["_AllocStep"]
+    assert stats["alloc_bytes"] >= 10000 * 8
+    assert stats["alloc_peak_bytes"] >= stats["alloc_bytes"]
+
+    profiler.close()
+    assert tracemalloc.is_tracing() == was_tracing
+
+
+def test_pipeline_without_profiler_unchanged():
+    pipeline = DecisionPipeline([_AllocStep()])
+    context = pipeline.execute(PipelineContext(options=["a"]))
+    assert len(context.metadata["buf"]) == 10000
+    assert pipeline.profiler is None
+
+
+def test_kernel_status_and_dump(make_kernel, tmp_path):
+    kernel = make_kernel("profiled", profile_pipeline=True)
+    kernel.remember("note", {"text": "work deadline"}, importance=0.8)
+    for _ in range(3):
+        kernel.decide(["rest", "work"])
+
+    profile = kernel.status()["pipeline_profile"]
+    assert profile["MemoryLoadStep"]["calls"] == 3
+    assert profile["TorqueDecisionStep"]["calls"] == 3
+    assert profile[PipelineProfiler.TOTAL_KEY]["calls"] == 3
+
+    path = tmp_path / "profile.json"
+    kernel.dump_pipeline_profile(str(path))
+    assert json.loads(path.read_text())["MemoryLoadStep"]["calls"] == 3
+
+    kernel.disable_profiling()
+    assert "pipeline_profile" not in kernel.status()
+    with pytest.raises(ConfigurationError):
+        kernel.dump_pipeline_profile(str(path))
+
+
+def test_enable_profiling_attaches_to_custom_pipeline(make_kernel):
+    kernel = make_kernel("custom")
+    kernel.remember("note", {"text": "rest"}, importance=0.5)
+    assert "pipeline_profile" not in kernel.status()
+
+    pipeline = kernel.get_default_pipeline()
+    kernel.set_pipeline(pipeline)
+    profiler = kernel.enable_profiling()
+    assert pipeline.profiler is profiler
+
+    kernel.decide(["rest", "work"])
+    assert kernel.status()["pipeline_profile"]["TorqueDecisionStep"]["calls"] == 1
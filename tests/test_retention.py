@@ -0,0 +1,141 @@
+"""
+기억 보존 정책(RetentionEngine) 테스트
+
+테스트 범위:
+- 오래되고 점수 낮은 기억 삭제, 보호 중요도/최소 나이 유지
+- max_memories 상한과 엣지 정리/병합/고립 기억 재연결
+- remember() 주기 자동 정리, 저장 파일 축소
+- max_events로 밀려난 기억의 남은 엣지 정리
+- 랭킹 계산 이후 추가된 기억은 정리 대상에서 제외
+- SQLite VACUUM으로 디스크 공간 반환
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel import RetentionConfig, RetentionEngine
+from cognitive_kernel.engines.panorama import PanoramaMemoryEngine
+
+
+def _fill(kernel, n=40):
+    ids = []
+    for i in range(n):
+        importance = 0.9 if i % 10 == 0 else 0.2
+        ids.append(kernel.remember("note", {"i": i}, importance=importance, related_to=ids[-2:] or None))
+    return ids
+
+
+def test_plan_scores_age_and_protection():
+    panorama = PanoramaMemoryEngine()
+    for i, importance in enumerate([0.1, 0.1, 0.95, 0.1]):
+        panorama.append_event(timestamp=float(i * 100), event_type="x", importance=importance)
+    events = panorama.get_all_events()
+    ranks = {events[0].id: 0.1, events[1].id: 0.9, events[2].id: 0.0, events[3].id: 0.0}
+    decayed = panorama.get_importance_scores(t_now=300.0)
+
+    engine = RetentionEngine(RetentionConfig(min_age=150.0, min_score=0.3))
+    plan = engine.plan(events, decayed, ranks, now=300.0)
+    # 0: 오래됨+저점수 → 삭제, 1: 랭크 높음, 2: 보호, 3: 너무 최근
+    assert plan.prune_ids == {events[0].id}
+    assert plan.protected == 1
+
+    capped = RetentionEngine(RetentionConfig(min_age=1e9, max_memories=2)).plan(events, decayed, ranks, now=300.0)
+    assert len(capped.prune_ids) == 2
+    assert events[2].id not in capped.prune_ids
+
+
+def test_compact_edges_merges_and_relinks():
+    edges = [("a", "b", 0.5), ("a", "b", 0.25), ("b", "x", 1.0), ("c", "x", 1.0), ("b", "a", 0.0)]
+    compacted, removed, relinked = RetentionEngine.compact_edges(edges, ["a", "b", "c"])
+    assert removed == 3
+    assert relinked == 1  # c는 x가 삭제되어 고립 → b와 연결
+    assert sorted(compacted) == [("a", "b", 0.75), ("b", "c", 0.5)]
+
+
+def test_apply_retention_prunes_graph(make_kernel, tmp_path):
+    kernel = make_kernel("ret")
+    ids = _fill(kernel)
+    kernel.save()
+    before = (tmp_path / "ret" / "panorama.json").stat().st_size
+
+    stats = kernel.apply_retention(RetentionConfig(min_age=0.0, min_score=0.0, max_memories=10))
+    assert stats["pruned"] == 30
+    assert stats["events"] == len(kernel) == 10
+    survivors = {e.id for e in kernel.panorama.get_all_events()}
+    assert {ids[i] for i in range(0, 40, 10)} <= survivors  # 보호 중요도
+    assert all(s in survivors and d in survivors for s, d, _ in kernel._edges)
+    assert set(kernel.memoryrank.get_rank_vector()) == survivors
+    assert len(kernel.recall(k=20)) == 10
+
+    kernel.save()
+    assert (tmp_path / "ret" / "panorama.json").stat().st_size < before
+    assert len(make_kernel("ret")) == 10
+
+    # 최소 나이 미만은 점수와 무관하게 유지
+    assert kernel.apply_retention(RetentionConfig(min_score=1.0))["pruned"] == 0
+
+
+def test_retention_runs_every_check_interval(make_kernel):
+    policy = RetentionConfig(min_age=0.0, min_score=0.0, max_memories=5, check_interval=10)
+    kernel = make_kernel("ret", retention=policy)
+    _fill(kernel, 25)
+    assert len(kernel) == 10  # 20번째 remember에서 5개로 정리된 뒤 5개 추가
+
+
+def test_memory_added_during_ranking_is_kept(make_kernel, monkeypatch):
+    kernel = make_kernel("ret")
+    ids = _fill(kernel, 20)
+    added = []
+    original = kernel._rebuild_graph
+
+    def rebuild_then_remember():
+        memoryrank = original()
+        # 랭킹 계산과 정리 사이에 다른 스레드가 기억을 추가한 경우
+        added.append(kernel.remember("note", {"i": "late"}, importance=0.2, related_to=ids[-1:]))
+        return memoryrank
+
+    monkeypatch.setattr(kernel, "_rebuild_graph", rebuild_then_remember)
+    stats = kernel.apply_retention(RetentionConfig(min_age=1e9, max_memories=5))
+    assert stats["examined"] == 20
+    assert added[0] in {e.id for e in kernel.panorama.get_all_events()}
+
+
+def test_dangling_edges_after_max_events(make_kernel):
+    kernel = make_kernel("ret")
+    kernel.panorama.config.max_events = 5
+    _fill(kernel, 12)
+    assert any(s not in kernel.panorama._event_map for s, _, _ in kernel._edges)
+
+    stats = kernel.apply_retention(RetentionConfig(min_age=1e9))
+    assert stats["pruned"] == 0
+    assert stats["edges_removed"] > 0
+    assert all(s in kernel.panorama._event_map and d in kernel.panorama._event_map for s, d, _ in kernel._edges)
+
+
+def test_sqlite_vacuum_reclaims_space(tmp_path):
+    panorama = PanoramaMemoryEngine()
+    ids = [
+        panorama.append_event(timestamp=float(i), event_type="x", payload={"blob": "y" * 500})
+        for i in range(500)
+    ]
+    db_path = tmp_path / "events.db"
+    panorama.save_to_sqlite(str(db_path))
+    full = db_path.stat().st_size
+
+    assert panorama.remove_events(ids[:450] + ["missing"]) == 450
+    panorama.save_to_sqlite(str(db_path), vacuum=True)
+    assert db_path.stat().st_size < full / 2
+
+    restored = PanoramaMemoryEngine()
+    assert restored.load_from_sqlite(str(db_path)) == 50
+
+
+def test_invalid_config():
+    with pytest.raises(AssertionError):
+        RetentionEngine(RetentionConfig(rank_weight=2.0))
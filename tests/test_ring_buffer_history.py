@@ -0,0 +1,122 @@
+"""
+링 버퍼 히스토리 테스트
+
+테스트 범위:
+- RingBuffer: 고정 용량, 시간 순서 창 뷰 (복사 없음), 누적 평균/분산/EWMA
+- 열 단위(width) 버퍼와 용량 변경, 일괄 추가(extend)는 append 반복과 같은 결과
+- DynamicsEngine 히스토리와 상태 통계, HPADynamics 기록 상한
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel.engines.dynamics import DynamicsConfig, DynamicsEngine, RingBuffer
+from cognitive_kernel.engines.hypothalamus import HPAConfig, HPADynamics
+
+
+def test_window_views_and_running_stats():
+    buf = RingBuffer(8, ewma_alpha=0.2)
+    values = np.random.default_rng(0).random(50)
+    ewma = None
+    for i, x in enumerate(values):
+        buf.append(x)
+        ewma = x if ewma is None else 0.2 * x + 0.8 * ewma
+        window = values[max(0, i - 7):i + 1]
+        np.testing.assert_array_equal(buf.view(), window)
+        assert buf.mean == pytest.approx(window.mean(), abs=1e-12)
+        assert buf.var == pytest.approx(window.var(), abs=1e-12)
+        assert buf.ewma == pytest.approx(ewma, abs=1e-12)
+
+    recent = buf.window(3)
+    assert recent.base is not None  # 내부 저장소의 뷰 (복사 없음)
+    assert not recent.flags.writeable
+    np.testing.assert_array_equal(recent, values[-3:])
+    assert buf.window(100).shape == (8,)
+    assert buf.last == values[-1] and buf[-1] == values[-1]
+
+    stats = buf.stats()
+    assert stats["count"] == 50 and stats["size"] == 8
+    assert stats["std"] == pytest.approx(values[-8:].std(), abs=1e-12)
+
+    buf.clear()
+    assert len(buf) == 0 and buf.stats()["mean"] is None and buf.last is None
+
+
+def test_width_and_resize():
+    buf = RingBuffer(4, width=3)
+    for i in range(10):
+        buf.append((i, 2 * i, 3 * i))
+    np.testing.assert_array_equal(buf.window(2), [[8, 16, 24], [9, 18, 27]])
+    assert buf.stats()["mean"] == [7.5, 15.0, 22.5]
+
+    buf.resize(2)
+    assert buf.tolist() == [[8, 16, 24], [9, 18, 27]]
+    assert buf.count == 10
+    np.testing.assert_allclose(buf.mean, [8.5, 17.0, 25.5])
+
+
+@pytest.mark.parametrize("width", [None, 3])
+@pytest.mark.parametrize("prefill, count", [(0, 250), (30, 50), (70, 40)])
+def test_bulk_extend_matches_appends(width, prefill, count):
+    rng = np.random.default_rng(prefill + count)
+    shape = (prefill + count,) if width is None else (prefill + count, width)
+    values = rng.random(shape)
+    appended, extended = RingBuffer(100, width), RingBuffer(100, width)
+    for value in values:
+        appended.append(value)
+    for value in values[:prefill]:
+        extended.append(value)
+    extended.extend(values[prefill:])
+
+    assert np.allclose(appended.view(), extended.view())
+    expected, actual = appended.stats(), extended.stats()
+    for key in expected:
+        assert np.allclose(expected[key], actual[key])
+    appended.append(values[0])  # 이후 append도 같은 누적 통계에서 이어짐
+    extended.append(values[0])
+    assert np.allclose(appended.var, extended.var)
+
+
+def test_dynamics_engine_history_and_status():
+    engine = DynamicsEngine(DynamicsConfig(history_size=5))
+    for i in range(12):
+        engine.update_history(0.1 * i, 1.0 - 0.05 * i)
+
+    assert engine.state.entropy_history == pytest.approx([0.7, 0.8, 0.9, 1.0, 1.1])
+    status = engine.get_status()
+    assert status["entropy_history_length"] == 5
+    assert status["entropy_stats"]["count"] == 12
+    assert status["entropy_stats"]["mean"] == pytest.approx(0.9)
+    assert status["core_strength_stats"]["last"] == pytest.approx(0.45)
+
+    engine.config.history_size = 3  # 설정 교체 후 다음 갱신에서 용량 반영
+    engine.update_history(1.2, 0.4)
+    assert engine.state.entropy_history == pytest.approx([1.0, 1.1, 1.2])
+
+    engine.reset()
+    assert engine.state.entropy_history == [] and engine.state.core_strength_history == []
+
+
+def test_hpa_history_is_bounded():
+    hpa = HPADynamics(HPAConfig(history_size=100))
+    hpa.simulate([0.8] * 300 + [0.0] * 200, dt=0.1)
+
+    history = hpa.state.history
+    assert len(history) == 100 and history.count == 500
+    assert history.window().shape == (100, 3)
+    np.testing.assert_array_equal(history.window()[:, 2], 0.0)  # 마지막 100스텝은 스트레스 0
+
+    summary = hpa.get_state_summary()
+    assert summary["history_length"] == 100
+    assert summary["cortisol_mean"] == pytest.approx(history.window()[:, 1].mean())
+
+    hpa.reset()
+    assert len(hpa.state.history) == 0 and hpa.state.history.capacity == 100
+    assert hpa.get_state_summary()["cortisol_mean"] is None
@@ -0,0 +1,93 @@
+"""
+엔진별 난수 생성기 / 시드 시퀀스 테스트
+
+테스트 범위:
+- NeuralDynamicsCore 잡음은 전역 random 상태를 쓰지 않음 (두 백엔드가 같은 잡음)
+- SeedSequence 자식 시드로 스레드 병렬 실행해도 순차 실행과 같은 결과
+- 같은 시드의 커널은 엔진 생성 순서와 무관하게 같은 엔진 스트림을 가짐
+- spawn_seeds 재현성, SeedSequence 시드의 설정 직렬화
+"""
+
+import json
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel import CognitiveKernel
+from cognitive_kernel.engines.basal_ganglia import BasalGangliaEngine
+from cognitive_kernel.engines.dynamics import ContinuousDynamicsConfig, NeuralDynamicsCore
+
+W = [[1.5, -0.4], [-0.4, 1.5]]
+
+
+def _noisy(backend, seed):
+    cfg = ContinuousDynamicsConfig(noise_scale=0.2, backend=backend)
+    return NeuralDynamicsCore(W, config=cfg, seed=seed)
+
+
+def test_dynamics_noise_does_not_touch_global_random():
+    random.seed(0)
+    expected = random.random()
+    random.seed(0)
+    python = _noisy("python", 3).run([0.1, -0.1], 100)
+    assert random.random() == expected
+
+    numpy = _noisy("numpy", 3).run([0.1, -0.1], 100)
+    np.testing.assert_allclose(numpy, np.array(python), atol=1e-12)
+
+
+def test_spawned_seeds_give_reproducible_parallel_runs():
+    seeds = np.random.SeedSequence(42).spawn(8)
+
+    def simulate(seed):
+        return _noisy("numpy", seed).run([0.0, 0.0], 200, return_trajectory=False)
+
+    serial = [simulate(s) for s in seeds]
+    with ThreadPoolExecutor(4) as pool:
+        threaded = list(pool.map(simulate, np.random.SeedSequence(42).spawn(8)))
+    np.testing.assert_array_equal(np.array(serial), np.array(threaded))
+    assert len({tuple(x) for x in np.array(serial).round(12).tolist()}) == 8  # 독립 스트림
+
+
+def test_kernel_streams_independent_of_build_order(make_kernel):
+    def kernel(name, seed):
+        return make_kernel(name, seed=seed)
+
+    a, b = kernel("a", 7), kernel("b", 7)
+    a.pfc, a.basal_ganglia
+    b.basal_ganglia, b.pfc
+    assert a.pfc._rng.random() == b.pfc._rng.random()
+    assert a.basal_ganglia._rng.random() == b.basal_ganglia._rng.random()
+    assert a.pfc._rng.random() != a.basal_ganglia._rng.random()
+
+    a, b = kernel("a2", 7), kernel("b2", 7)
+    for k in (a, b):
+        k.remember("note", {"text": "work"}, importance=0.8)
+    decisions_a = [a.decide(["rest", "work", "walk"])["action"] for _ in range(10)]
+    decisions_b = [b.decide(["rest", "work", "walk"])["action"] for _ in range(10)]
+    assert decisions_a == decisions_b
+
+    spawned = [s.generate_state(2).tolist() for s in kernel("c", 7).spawn_seeds(3)]
+    assert spawned == [s.generate_state(2).tolist() for s in kernel("d", 7).spawn_seeds(3)]
+    assert len({tuple(s) for s in spawned}) == 3
+
+
+def test_seed_sequence_config_and_engine_seeds(make_config):
+    child = np.random.SeedSequence(5).spawn(1)[0]
+    config = make_config(seed=child)
+    json.dumps(config.to_dict())
+    kernel = CognitiveKernel("ss", config)
+    assert kernel.spawn_seeds(0) == []
+
+    picks = []
+    for _ in range(2):
+        engine = BasalGangliaEngine(seed=11)
+        picks.append([engine.select_action("ctx", ["a", "b", "c"]).action.name for _ in range(20)])
+    assert picks[0] == picks[1]
@@ -0,0 +1,199 @@
+"""
+SessionManager 테스트
+
+테스트 범위:
+- LRU 상주 제한과 축출 시 백그라운드 저장, 재접근 시 지연 로드
+- 기록 대기 중인 세션 복귀
+- 저장 스냅샷은 flush 워커에서 커널 읽기 잠금 아래 수행
+- 저장 실패 시 축출 세션 유지 (복귀/재시도)
+- session() 블록 동안 고정 (축출 제외)
+- 적중률 지표
+- 세션 간 불변 자원 공유
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from cognitive_kernel import (
+    CognitiveKernel,
+    CognitiveMode,
+    CognitiveModePresets,
+    SessionManager,
+)
+from cognitive_kernel.exceptions import ConfigurationError, ValidationError
+
+
+def _manager(config, max_resident=2):
+    return SessionManager(config, max_resident=max_resident)
+
+
+def test_lru_eviction_flushes_and_reloads(kernel_config, tmp_path):
+    manager = _manager(kernel_config)
+    manager.get("a").remember("note", {"text": "from a"}, importance=0.8)
+    manager.get("b").remember("note", {"text": "from b"}, importance=0.8)
+    manager.get("a")  # a가 최근 사용
+    manager.get("c")  # b 축출
+
+    assert manager.resident_sessions() == ["a", "c"]
+    manager.flush_all()
+    assert (tmp_path / "b" / "meta.json").exists()
+
+    reloaded = manager.get("b")
+    assert len(reloaded) == 1
+    assert reloaded.recall(k=1)[0]["content"]["text"] == "from b"
+
+    metrics = manager.metrics()
+    assert metrics["evictions"] == 2
+    assert metrics["hits"] == 1
+    assert metrics["misses"] == 4
+    assert metrics["hit_rate"] == pytest.approx(0.2)
+    assert metrics["resident"] == 2
+    manager.close()
+
+
+def test_revive_pending_flush_without_reload(kernel_config):
+    manager = _manager(kernel_config, max_resident=1)
+    kernel = manager.get("a")
+    kernel.remember("note", {"text": "keep"}, importance=0.5)
+
+    release = threading.Event()
+    original = kernel._write_files
+
+    def slow_write(files):
+        release.wait(2.0)
+        original(files)
+
+    kernel._write_files = slow_write
+
+    manager.get("b")  # a 축출 (기록 대기)
+    assert manager.metrics()["pending_flushes"] == 1
+    assert manager.get("a") is kernel
+    assert manager.metrics()["revived"] == 1
+
+    release.set()
+    manager.close()
+    assert len(CognitiveKernel("a", manager.config)) == 1
+
+
+def test_flush_snapshots_on_worker_under_read_lock(kernel_config, tmp_path):
+    manager = _manager(kernel_config, max_resident=1)
+    kernel = manager.get("a")
+    kernel.remember("note", {"text": "x"}, importance=0.5)
+
+    seen = []
+    original = kernel._snapshot_files
+
+    def spy():
+        seen.append((threading.current_thread().name, kernel._lock.readers))
+        return original()
+
+    kernel._snapshot_files = spy
+    manager.get("b")  # a 축출
+    manager.flush_all()
+
+    assert len(seen) == 1
+    thread_name, readers = seen[0]
+    assert thread_name.startswith("ck-sessions-flush")
+    assert readers > 0
+    assert (tmp_path / "a" / "meta.json").exists()
+    manager.close()
+
+
+def _failing_save(kernel, failures=1):
+    original = kernel.save
+    remaining = [failures]
+
+    def save():
+        if remaining[0]:
+            remaining[0] -= 1
+            raise OSError("disk full")
+        return original()
+
+    kernel.save = save
+
+
+def _drain(manager):
+    # 단일 flush 워커: 앞선 기록과 완료 콜백이 모두 끝난 뒤 실행됨 (재시도 없이 대기)
+    manager._flush_executor.submit(lambda: None).result()
+
+
+def test_failed_flush_is_retried(kernel_config, tmp_path):
+    manager = _manager(kernel_config, max_resident=1)
+    kernel = manager.get("a")
+    kernel.remember("note", {"text": "unsaved"}, importance=0.5)
+    _failing_save(kernel)
+
+    manager.get("b")  # a 축출, 저장 실패
+    _drain(manager)
+    metrics = manager.metrics()
+    assert metrics["flush_errors"] == 1
+    assert metrics["pending_flushes"] == 1
+    assert kernel._is_dirty
+    assert not (tmp_path / "a" / "meta.json").exists()
+
+    assert manager.flush_all() == 1  # 재시도 성공
+    assert manager.metrics()["pending_flushes"] == 0
+    assert not kernel._is_dirty
+    manager.close()
+    assert len(CognitiveKernel("a", manager.config)) == 1
+
+
+def test_failed_flush_session_is_revived(kernel_config):
+    manager = _manager(kernel_config, max_resident=1)
+    kernel = manager.get("a")
+    kernel.remember("note", {"text": "unsaved"}, importance=0.5)
+    _failing_save(kernel)
+
+    manager.get("b")
+    _drain(manager)
+    assert manager.get("a") is kernel  # 디스크의 오래된 상태를 다시 읽지 않음
+    assert len(kernel) == 1 and kernel._is_dirty
+    assert manager.metrics()["pending_flushes"] == 0
+    manager.close()
+    assert len(CognitiveKernel("a", manager.config)) == 1
+
+
+def test_pinned_session_is_not_evicted(kernel_config):
+    manager = _manager(kernel_config, max_resident=1)
+    with manager.session("a") as kernel:
+        manager.get("b")
+        assert "a" in manager
+        assert manager.metrics()["pinned"] == 1
+    # 고정 해제 후 용량 초과분 축출 (a가 가장 오래됨)
+    assert manager.resident_sessions() == ["b"]
+    assert kernel.session_name == "a"
+    manager.close()
+
+
+def test_shared_immutable_resources(kernel_config):
+    manager = _manager(kernel_config)
+    a, b = manager.get("a"), manager.get("b")
+    assert a.config is b.config
+    assert a.mode_config is b.mode_config
+    assert a.amygdala.config.threat_keywords is b.amygdala.config.threat_keywords
+
+    a.set_mode(CognitiveMode.ADHD)
+    assert a.mode_config is not b.mode_config
+    assert b.mode_config is CognitiveModePresets.shared_config(CognitiveMode.NORMAL)
+    manager.close()
+
+
+def test_validation_and_closed_manager(kernel_config, tmp_path):
+    with pytest.raises(ConfigurationError):
+        SessionManager(max_resident=0)
+
+    with _manager(kernel_config) as manager:
+        with pytest.raises(ValidationError):
+            manager.get("")
+        manager.get("a").remember("note", {"text": "x"})
+
+    assert (tmp_path / "a" / "meta.json").exists()
+    with pytest.raises(ConfigurationError):
+        manager.get("a")